@@ -25,7 +25,10 @@ from prowler.lib.check.check import (
     remove_custom_checks_module,
 )
 from prowler.lib.check.checks_loader import load_checks_to_execute
-from prowler.lib.check.compliance import update_checks_metadata_with_compliance
+from prowler.lib.check.compliance import (
+    get_checks_compliance_index,
+    update_checks_metadata_with_compliance,
+)
 from prowler.lib.check.custom_checks_metadata import (
     parse_custom_checks_metadata_file,
     update_checks_metadata,
@@ -33,12 +36,15 @@ from prowler.lib.check.custom_checks_metadata import (
 from prowler.lib.cli.parser import ProwlerArgumentParser
 from prowler.lib.logger import logger, set_logging_config
 from prowler.lib.outputs.compliance import display_compliance_table
-from prowler.lib.outputs.html import add_html_footer, fill_html_overview_statistics
-from prowler.lib.outputs.json import close_json
+from prowler.lib.outputs.html import fill_html_overview_statistics
 from prowler.lib.outputs.outputs import extract_findings_statistics
 from prowler.lib.outputs.slack import send_slack_message
 from prowler.lib.outputs.summary_table import display_summary_table
+from prowler.lib.profiler.profiler import get_profiler, set_profiler
 from prowler.providers.aws.aws_provider import get_available_aws_service_regions
+from prowler.providers.aws.lib.organizations.organization_accounts import (
+    execute_organization_accounts_checks,
+)
 from prowler.providers.aws.lib.s3.s3 import send_to_s3_bucket
 from prowler.providers.aws.lib.security_hub.security_hub import (
     batch_send_to_security_hub,
@@ -87,6 +93,10 @@ def prowler():
         print_services(list_services(provider))
         sys.exit()
 
+    # Profile the scan if --profile-scan, before any service client is created
+    if args.profile_scan:
+        set_profiler(provider)
+
     # Load checks metadata
     logger.debug("Loading checks metadata from .metadata.json files")
     bulk_checks_metadata = bulk_load_checks_metadata(provider)
@@ -100,9 +110,11 @@ def prowler():
     logger.debug("Loading compliance frameworks from .json files")
 
     bulk_compliance_frameworks = bulk_load_compliance_frameworks(provider)
+    # Index the compliance requirements by check in a single pass
+    checks_compliance_index = get_checks_compliance_index(bulk_compliance_frameworks)
     # Complete checks metadata with the compliance framework specification
     bulk_checks_metadata = update_checks_metadata_with_compliance(
-        bulk_compliance_frameworks, bulk_checks_metadata
+        bulk_compliance_frameworks, bulk_checks_metadata, checks_compliance_index
     )
     # Update checks metadata if the --custom-checks-metadata-file is present
     custom_checks_metadata = None
@@ -187,13 +199,22 @@ def prowler():
 
     # Execute checks
     findings = []
-    if len(checks_to_execute):
+    if len(checks_to_execute) and getattr(args, "organization_accounts", False):
+        findings = execute_organization_accounts_checks(
+            checks_to_execute,
+            audit_info,
+            audit_output_options,
+            custom_checks_metadata,
+            args.__dict__,
+        )
+    elif len(checks_to_execute):
         findings = execute_checks(
             checks_to_execute,
             provider,
             audit_info,
             audit_output_options,
             custom_checks_metadata,
+            args.parallel_checks,
         )
     else:
         logger.error(
@@ -219,16 +240,11 @@ def prowler():
             sys.exit(1)
 
     if args.output_modes:
+        # Close the output files, writing the end of the JSON and HTML outputs
+        if audit_output_options.output_writers:
+            audit_output_options.output_writers.close()
         for mode in args.output_modes:
-            # Close json file if exists
-            if "json" in mode:
-                close_json(
-                    audit_output_options.output_filename, args.output_directory, mode
-                )
             if mode == "html":
-                add_html_footer(
-                    audit_output_options.output_filename, args.output_directory
-                )
                 fill_html_overview_statistics(
                     stats, audit_output_options.output_filename, args.output_directory
                 )
@@ -248,6 +264,18 @@ def prowler():
                     mode,
                     output_bucket,
                     bucket_session,
+                    audit_output_options.output_compression,
+                )
+
+    # Write the profile of the scan next to the outputs
+    if args.profile_scan:
+        profile_files = get_profiler().write(
+            audit_output_options.output_directory, audit_output_options.output_filename
+        )
+        if not args.only_logs:
+            for profile_file in profile_files:
+                print(
+                    f"{Style.BRIGHT}Scan profile written to {profile_file}{Style.RESET_ALL}"
                 )
 
     # AWS Security Hub Integration
@@ -51,6 +51,12 @@ aws_services_json_file = "aws_regions_by_service.json"
 
 default_output_directory = getcwd() + "/output"
 
+# Cache of the checks metadata and compliance frameworks
+cache_directory = os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.join(pathlib.Path.home(), ".cache"),
+    "prowler",
+)
+
 output_file_timestamp = timestamp.strftime("%Y%m%d%H%M%S")
 timestamp_iso = timestamp.isoformat(sep=" ", timespec="seconds")
 csv_file_suffix = ".csv"
@@ -58,6 +64,16 @@ json_file_suffix = ".json"
 json_asff_file_suffix = ".asff.json"
 json_ocsf_file_suffix = ".ocsf.json"
 html_file_suffix = ".html"
+# JSON Lines outputs, optionally compressed while they are written
+json_lines_file_suffixes = {
+    "json-lines": ".jsonl",
+    "json-asff-lines": ".asff.jsonl",
+    "json-ocsf-lines": ".ocsf.jsonl",
+}
+output_compression_file_suffixes = {"gzip": ".gz", "zstd": ".zst"}
+# Profile of the scan written with --profile-scan, as JSON and as flamegraph collapsed stacks
+profile_json_file_suffix = ".profile.json"
+profile_collapsed_file_suffix = ".profile.folded"
 default_config_file_path = (
     f"{pathlib.Path(os.path.dirname(os.path.realpath(__file__)))}/config.yaml"
 )
@@ -0,0 +1,101 @@
+import hashlib
+import os
+import pickle
+import sys
+import tempfile
+from typing import Any, Callable
+
+from pydantic import VERSION as pydantic_version
+
+from prowler.config.config import cache_directory, prowler_version
+from prowler.lib.logger import logger
+
+prowler_directory = os.path.dirname(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+)
+
+# Checks catalogues by provider, with every section pickled to return a new copy each time
+checks_catalogues = {}
+
+
+def get_checks_catalogue_key(provider: str) -> str:
+    """get_checks_catalogue_key returns the hash of the Prowler, Python and Pydantic versions, the directories of the provider's checks and the size and mtime of its metadata and compliance files"""
+    catalogue_key = hashlib.sha256(
+        f"{prowler_version}|{sys.version}|{pydantic_version}".encode()
+    )
+    for directory in (
+        f"{prowler_directory}/providers/{provider}/services",
+        f"{prowler_directory}/compliance/{provider}",
+    ):
+        for root, directories, files in os.walk(directory):
+            directories[:] = sorted(
+                directory for directory in directories if directory != "__pycache__"
+            )
+            catalogue_key.update(f"{root}\n".encode())
+            for filename in sorted(files):
+                if filename.endswith(".json"):
+                    file_stat = os.stat(os.path.join(root, filename))
+                    catalogue_key.update(
+                        f"{filename}|{file_stat.st_size}|{file_stat.st_mtime_ns}\n".encode()
+                    )
+    return catalogue_key.hexdigest()
+
+
+def get_checks_catalogue_file(provider: str) -> str:
+    """get_checks_catalogue_file returns the path of the provider's checks catalogue in the cache directory"""
+    return os.path.join(cache_directory, f"checks_catalogue_{provider}.pickle")
+
+
+def read_checks_catalogue(provider: str, catalogue_key: str) -> dict:
+    """read_checks_catalogue returns the provider's checks catalogue from the cache directory, or None if it is missing or stale"""
+    try:
+        with open(get_checks_catalogue_file(provider), "rb") as catalogue_file:
+            checks_catalogue = pickle.load(catalogue_file)
+        if checks_catalogue.get("key") == catalogue_key:
+            return checks_catalogue
+    except FileNotFoundError:
+        pass
+    except Exception as error:
+        logger.debug(
+            f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+        )
+    return None
+
+
+def write_checks_catalogue(provider: str, checks_catalogue: dict):
+    """write_checks_catalogue stores the provider's checks catalogue in the cache directory, replacing it atomically"""
+    try:
+        os.makedirs(cache_directory, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            dir=cache_directory, suffix=".tmp", delete=False
+        ) as catalogue_file:
+            pickle.dump(checks_catalogue, catalogue_file, pickle.HIGHEST_PROTOCOL)
+        os.replace(catalogue_file.name, get_checks_catalogue_file(provider))
+    except Exception as error:
+        logger.warning(
+            f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+        )
+
+
+def get_checks_catalogue_section(
+    provider: str, section: str, build_checks_catalogue: Callable[[str], dict]
+) -> Any:
+    """
+    get_checks_catalogue_section returns a new copy of a section of the provider's checks catalogue.
+
+    The catalogue is loaded from the cache directory, and built again with build_checks_catalogue if the Prowler version or any check or compliance file changed.
+    """
+    catalogue_key = get_checks_catalogue_key(provider)
+    checks_catalogue = checks_catalogues.get(provider)
+    if not checks_catalogue or checks_catalogue["key"] != catalogue_key:
+        checks_catalogue = read_checks_catalogue(provider, catalogue_key)
+        if not checks_catalogue:
+            logger.debug(f"Building the checks catalogue of {provider}")
+            checks_catalogue = {
+                catalogue_section: pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+                for catalogue_section, value in build_checks_catalogue(provider).items()
+            }
+            checks_catalogue["key"] = catalogue_key
+            write_checks_catalogue(provider, checks_catalogue)
+        checks_catalogues[provider] = checks_catalogue
+    return pickle.loads(checks_catalogue[section])
@@ -1,3 +1,4 @@
+import ast
 import functools
 import importlib
 import json
@@ -6,7 +7,11 @@ import re
 import shutil
 import sys
 import traceback
+from concurrent.futures import ThreadPoolExecutor
+from importlib.util import find_spec
 from pkgutil import walk_packages
+from queue import Queue
+from time import perf_counter
 from types import ModuleType
 from typing import Any
 
@@ -15,21 +20,60 @@ from colorama import Fore, Style
 
 import prowler
 from prowler.config.config import orange_color
+from prowler.lib.check.cache import get_checks_catalogue_section
 from prowler.lib.check.compliance_models import load_compliance_framework
 from prowler.lib.check.custom_checks_metadata import update_check_metadata
-from prowler.lib.check.models import Check, load_check_metadata
+from prowler.lib.check.models import (
+    Check,
+    checks_metadata_by_file,
+    load_check_metadata,
+)
 from prowler.lib.logger import logger
 from prowler.lib.outputs.outputs import report
+from prowler.lib.profiler.profiler import get_profiler
 from prowler.lib.utils.utils import open_file, parse_json_file
 from prowler.providers.aws.lib.allowlist.allowlist import allowlist_findings
+from prowler.providers.aws.lib.service.scheduler import get_api_scheduler
 from prowler.providers.common.models import Audit_Metadata
 from prowler.providers.common.outputs import Provider_Output_Options
 
 
 # Load all checks metadata
 def bulk_load_checks_metadata(provider: str) -> dict:
+    bulk_check_metadata = get_checks_catalogue_section(
+        provider, "bulk_checks_metadata", build_checks_catalogue
+    )
+    # Keep the metadata to not parse it again when the checks are instantiated
+    for check_name, check_path in recover_checks_from_provider(provider):
+        if check_name in bulk_check_metadata:
+            checks_metadata_by_file[
+                os.path.abspath(f"{check_path}/{check_name}.metadata.json")
+            ] = bulk_check_metadata[check_name]
+
+    return bulk_check_metadata
+
+
+# Bulk load all compliance frameworks specification
+def bulk_load_compliance_frameworks(provider: str) -> dict:
+    """Bulk load all compliance frameworks specification into a dict"""
+    return get_checks_catalogue_section(
+        provider, "bulk_compliance_frameworks", build_checks_catalogue
+    )
+
+
+def build_checks_catalogue(provider: str) -> dict:
+    """build_checks_catalogue returns the provider's checks, checks metadata and compliance frameworks loaded from their files, to be stored in the cache"""
+    checks = recover_checks_from_modules(provider)
+    return {
+        "checks": checks,
+        "bulk_checks_metadata": load_checks_metadata_files(checks),
+        "bulk_compliance_frameworks": load_compliance_framework_files(provider),
+    }
+
+
+def load_checks_metadata_files(checks: list) -> dict:
+    """load_checks_metadata_files returns the metadata of the checks, with format (check_name, check_path), by CheckID"""
     bulk_check_metadata = {}
-    checks = recover_checks_from_provider(provider)
     # Build list of check's metadata files
     for check_info in checks:
         # Build check path name
@@ -44,9 +88,8 @@ def bulk_load_checks_metadata(provider: str) -> dict:
     return bulk_check_metadata
 
 
-# Bulk load all compliance frameworks specification
-def bulk_load_compliance_frameworks(provider: str) -> dict:
-    """Bulk load all compliance frameworks specification into a dict"""
+def load_compliance_framework_files(provider: str) -> dict:
+    """load_compliance_framework_files returns the provider's compliance frameworks specification by name"""
     try:
         bulk_compliance_frameworks = {}
         available_compliance_framework_modules = list_compliance_modules()
@@ -342,6 +385,18 @@ def recover_checks_from_provider(provider: str, service: str = None) -> list[tup
     """
     Recover all checks from the selected provider and service
 
+    Returns a list of tuples with the following format (check_name, check_path)
+    """
+    if not service:
+        # All the provider's checks are stored in the checks catalogue
+        return get_checks_catalogue_section(provider, "checks", build_checks_catalogue)
+    return recover_checks_from_modules(provider, service)
+
+
+def recover_checks_from_modules(provider: str, service: str = None) -> list[tuple]:
+    """
+    Recover all checks from the selected provider and service walking its modules
+
     Returns a list of tuples with the following format (check_name, check_path)
     """
     try:
@@ -397,13 +452,21 @@ def import_check(check_path: str) -> ModuleType:
     return lib
 
 
-def run_check(check: Check, output_options: Provider_Output_Options) -> list:
+def print_check_header(check: Check):
+    """print_check_header prints the check's ID, service and severity before its findings"""
+    print(
+        f"\nCheck ID: {check.CheckID} - {Fore.MAGENTA}{check.ServiceName}{Fore.YELLOW} [{check.Severity}]{Style.RESET_ALL}"
+    )
+
+
+def run_check(
+    check: Check, output_options: Provider_Output_Options, print_header: bool = True
+) -> list:
     findings = []
-    if output_options.verbose:
-        print(
-            f"\nCheck ID: {check.CheckID} - {Fore.MAGENTA}{check.ServiceName}{Fore.YELLOW} [{check.Severity}]{Style.RESET_ALL}"
-        )
+    if output_options.verbose and print_header:
+        print_check_header(check)
     logger.debug(f"Executing check: {check.CheckID}")
+    start_time = perf_counter()
     try:
         findings = check.execute()
     except Exception as error:
@@ -415,15 +478,160 @@ def run_check(check: Check, output_options: Provider_Output_Options) -> list:
             f"{check.CheckID} -- {error.__class__.__name__}[{traceback.extract_tb(error.__traceback__)[-1].lineno}]: {error}"
         )
     finally:
+        profiler = get_profiler()
+        if profiler:
+            profiler.record_check(
+                check.CheckID,
+                check.ServiceName,
+                perf_counter() - start_time,
+                len(findings),
+            )
         return findings
 
 
+def recover_check_service_clients(provider: str, service: str, check_name: str) -> set:
+    """
+    recover_check_service_clients returns the service client modules (*_client) imported by the given check
+
+    The check's source is parsed instead of imported because importing a client module instantiates its service.
+    """
+    service_clients = set()
+    try:
+        check_module_path = (
+            f"prowler.providers.{provider}.services.{service}.{check_name}.{check_name}"
+        )
+        check_spec = find_spec(check_module_path)
+        if check_spec and check_spec.origin:
+            with open_file(check_spec.origin) as check_source:
+                check_tree = ast.parse(check_source.read())
+            for node in ast.walk(check_tree):
+                if (
+                    isinstance(node, ast.ImportFrom)
+                    and node.module
+                    and node.module.endswith("_client")
+                ):
+                    service_clients.add(node.module)
+    except ModuleNotFoundError:
+        # The check is reported as not found when it is executed
+        pass
+    except Exception as error:
+        logger.error(
+            f"{check_name} - {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+        )
+
+    return service_clients
+
+
+def group_checks_by_service_clients(checks_to_execute: list, provider: str) -> list:
+    """
+    group_checks_by_service_clients groups the checks that depend on the same service clients
+
+    Returns a list of check groups ordered by the first appearance of each group in checks_to_execute.
+    The checks of a group are executed sequentially, so a service is only discovered once.
+    """
+    check_groups = {}
+    for check_name in checks_to_execute:
+        # Recover service from check name
+        service = check_name.split("_")[0]
+        service_clients = frozenset(
+            recover_check_service_clients(provider, service, check_name)
+        )
+        # Checks without service clients can run in their own group
+        group_key = service_clients or check_name
+        check_groups.setdefault(group_key, []).append(check_name)
+
+    return list(check_groups.values())
+
+
+def prefetch_service_clients(
+    checks_to_execute: list, provider: str, max_workers: int
+) -> dict:
+    """
+    prefetch_service_clients discovers concurrently all the services needed by the checks to execute
+
+    Each *_client module instantiates its service when it is imported, so importing all of them
+    from a pool of max_workers threads overlaps the discovery of the services instead of doing it
+    the first time a check of each service is executed.
+
+    Returns a dict with the discovery time in seconds of each service client module.
+    """
+    services_discovery_time = {}
+    try:
+        service_clients = set()
+        for check_name in checks_to_execute:
+            # Recover service from check name
+            service = check_name.split("_")[0]
+            service_clients.update(
+                recover_check_service_clients(provider, service, check_name)
+            )
+
+        def import_service_client(service_client: str) -> float:
+            start_time = perf_counter()
+            importlib.import_module(service_client)
+            return perf_counter() - start_time
+
+        logger.info(
+            f"Prefetching {len(service_clients)} service clients with {max_workers} workers..."
+        )
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(import_service_client, service_client): service_client
+                for service_client in sorted(service_clients)
+            }
+            for future, service_client in futures.items():
+                try:
+                    services_discovery_time[service_client] = future.result()
+                    logger.info(
+                        f"{service_client.split('.')[-1]} discovered in {services_discovery_time[service_client]:.2f} seconds"
+                    )
+                # The error is raised again when the check imports the service client
+                except Exception as error:
+                    logger.error(
+                        f"{service_client} - {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                    )
+    except Exception as error:
+        logger.error(
+            f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+        )
+
+    return services_discovery_time
+
+
+def log_check_error(check_name: str, provider: str, error: Exception):
+    """log_check_error logs the error raised while executing the check"""
+    # If check does not exists in the provider or is from another provider
+    if isinstance(error, ModuleNotFoundError):
+        logger.error(
+            f"Check '{check_name}' was not found for the {provider.upper()} provider"
+        )
+    else:
+        logger.error(
+            f"{check_name} - {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+        )
+
+
+def get_prefetch_max_workers(provider: str, parallel_checks: int = None) -> int:
+    """
+    get_prefetch_max_workers returns the number of services discovered concurrently before the checks are executed
+
+    The AWS services send their API requests through the shared API Scheduler, so their discovery
+    is bounded by its global budget (--aws-max-concurrent-requests). The other providers only
+    prefetch their services with --parallel-checks. Returns 0 if there is no prefetch.
+    """
+    if provider == "aws":
+        return get_api_scheduler().max_concurrent_requests
+    if parallel_checks and parallel_checks > 1:
+        return parallel_checks
+    return 0
+
+
 def execute_checks(
     checks_to_execute: list,
     provider: str,
     audit_info: Any,
     audit_output_options: Provider_Output_Options,
     custom_checks_metadata: Any,
+    parallel_checks: int = None,
 ) -> list:
     # List to store all the check's findings
     all_findings = []
@@ -455,33 +663,61 @@ def execute_checks(
                 f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
             )
 
+    # Discover the services used by the checks before executing them
+    prefetch_max_workers = get_prefetch_max_workers(provider, parallel_checks)
+    # The profiled scans always discover the services before the checks, so the discovery of each service is timed apart
+    profiler = get_profiler()
+    if profiler and not prefetch_max_workers:
+        prefetch_max_workers = 1
+    if prefetch_max_workers:
+        if not audit_output_options.only_logs:
+            print(
+                f"{Style.BRIGHT}Discovering services, please wait...{Style.RESET_ALL}\n"
+            )
+        audit_info.audit_metadata.services_discovery_time = prefetch_service_clients(
+            checks_to_execute, provider, prefetch_max_workers
+        )
+        if profiler:
+            for (
+                service_client,
+                discovery_time,
+            ) in audit_info.audit_metadata.services_discovery_time.items():
+                profiler.record_service_discovery(
+                    service_client.split(".")[-1], discovery_time
+                )
+
     # Execution with the --only-logs flag
     if audit_output_options.only_logs:
-        for check_name in checks_to_execute:
-            # Recover service from check name
-            service = check_name.split("_")[0]
-            try:
-                check_findings = execute(
-                    service,
-                    check_name,
-                    provider,
-                    audit_output_options,
-                    audit_info,
-                    services_executed,
-                    checks_executed,
-                    custom_checks_metadata,
-                )
-                all_findings.extend(check_findings)
+        if parallel_checks and parallel_checks > 1:
+            all_findings = execute_checks_in_parallel(
+                checks_to_execute,
+                provider,
+                audit_info,
+                audit_output_options,
+                services_executed,
+                checks_executed,
+                custom_checks_metadata,
+                parallel_checks,
+            )
+        else:
+            for check_name in checks_to_execute:
+                # Recover service from check name
+                service = check_name.split("_")[0]
+                try:
+                    check_findings = execute(
+                        service,
+                        check_name,
+                        provider,
+                        audit_output_options,
+                        audit_info,
+                        services_executed,
+                        checks_executed,
+                        custom_checks_metadata,
+                    )
+                    all_findings.extend(check_findings)
 
-            # If check does not exists in the provider or is from another provider
-            except ModuleNotFoundError:
-                logger.error(
-                    f"Check '{check_name}' was not found for the {provider.upper()} provider"
-                )
-            except Exception as error:
-                logger.error(
-                    f"{check_name} - {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-                )
+                except Exception as error:
+                    log_check_error(check_name, provider, error)
     else:
         # Default execution
         checks_num = len(checks_to_execute)
@@ -500,49 +736,135 @@ def execute_checks(
             stats=False,
             enrich_print=False,
         ) as bar:
-            for check_name in checks_to_execute:
-                # Recover service from check name
-                service = check_name.split("_")[0]
-                bar.title = (
-                    f"-> Scanning {orange_color}{service}{Style.RESET_ALL} service"
+            if parallel_checks and parallel_checks > 1:
+                bar.title = f"-> Scanning with {orange_color}{parallel_checks}{Style.RESET_ALL} parallel checks"
+                all_findings = execute_checks_in_parallel(
+                    checks_to_execute,
+                    provider,
+                    audit_info,
+                    audit_output_options,
+                    services_executed,
+                    checks_executed,
+                    custom_checks_metadata,
+                    parallel_checks,
+                    bar,
                 )
-                try:
-                    check_findings = execute(
-                        service,
-                        check_name,
-                        provider,
-                        audit_output_options,
-                        audit_info,
-                        services_executed,
-                        checks_executed,
-                        custom_checks_metadata,
+            else:
+                for check_name in checks_to_execute:
+                    # Recover service from check name
+                    service = check_name.split("_")[0]
+                    bar.title = (
+                        f"-> Scanning {orange_color}{service}{Style.RESET_ALL} service"
                     )
-                    all_findings.extend(check_findings)
+                    try:
+                        check_findings = execute(
+                            service,
+                            check_name,
+                            provider,
+                            audit_output_options,
+                            audit_info,
+                            services_executed,
+                            checks_executed,
+                            custom_checks_metadata,
+                        )
+                        all_findings.extend(check_findings)
 
-                # If check does not exists in the provider or is from another provider
-                except ModuleNotFoundError:
-                    logger.error(
-                        f"Check '{check_name}' was not found for the {provider.upper()} provider"
-                    )
-                except Exception as error:
-                    logger.error(
-                        f"{check_name} - {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-                    )
-                bar()
+                    except Exception as error:
+                        log_check_error(check_name, provider, error)
+                    bar()
             bar.title = f"-> {Fore.GREEN}Scan completed!{Style.RESET_ALL}"
     return all_findings
 
 
-def execute(
-    service: str,
-    check_name: str,
+def execute_checks_in_parallel(
+    checks_to_execute: list,
     provider: str,
-    audit_output_options: Provider_Output_Options,
     audit_info: Any,
+    audit_output_options: Provider_Output_Options,
     services_executed: set,
     checks_executed: set,
     custom_checks_metadata: Any,
-):
+    parallel_checks: int,
+    bar: Any = None,
+) -> list:
+    """
+    execute_checks_in_parallel runs the checks in a pool of parallel_checks threads
+
+    Checks sharing the same service clients are executed sequentially by the same worker while
+    the findings are reported from the calling thread following the checks_to_execute order,
+    so the outputs and the Audit_Metadata progress are the same as in the sequential execution.
+    """
+    all_findings = []
+    # Results are sent back through the queue as (check_name, check, check_findings, error)
+    check_results = Queue()
+
+    def run_check_group(check_group: list):
+        for check_name in check_group:
+            # Recover service from check name
+            service = check_name.split("_")[0]
+            try:
+                check = load_check(
+                    service, check_name, provider, custom_checks_metadata
+                )
+                check_findings = run_check(
+                    check, audit_output_options, print_header=False
+                )
+                check_results.put((check_name, check, check_findings, None))
+            # Anything raised must be sent back, otherwise the results would never arrive
+            except BaseException as error:
+                check_results.put((check_name, None, [], error))
+
+    pending_results = {}
+    next_check = 0
+    with ThreadPoolExecutor(max_workers=parallel_checks) as executor:
+        for check_group in group_checks_by_service_clients(checks_to_execute, provider):
+            executor.submit(run_check_group, check_group)
+
+        for _ in checks_to_execute:
+            check_name, check, check_findings, error = check_results.get()
+            pending_results[check_name] = (check, check_findings, error)
+            # Report the finished checks keeping the checks_to_execute order
+            while (
+                next_check < len(checks_to_execute)
+                and checks_to_execute[next_check] in pending_results
+            ):
+                check_name = checks_to_execute[next_check]
+                check, check_findings, error = pending_results.pop(check_name)
+                next_check += 1
+                # Recover service from check name
+                service = check_name.split("_")[0]
+                if bar:
+                    bar.title = (
+                        f"-> Scanning {orange_color}{service}{Style.RESET_ALL} service"
+                    )
+                try:
+                    if error:
+                        raise error
+                    if audit_output_options.verbose:
+                        print_check_header(check)
+                    all_findings.extend(
+                        report_check_findings(
+                            service,
+                            check_name,
+                            check_findings,
+                            audit_output_options,
+                            audit_info,
+                            services_executed,
+                            checks_executed,
+                        )
+                    )
+                except Exception as error:
+                    log_check_error(check_name, provider, error)
+                if bar:
+                    bar()
+
+    return all_findings
+
+
+def load_check(
+    service: str, check_name: str, provider: str, custom_checks_metadata: Any
+) -> Check:
+    """load_check imports the check's module and returns the check instance with its custom metadata applied"""
     # Import check module
     check_module_path = (
         f"prowler.providers.{provider}.services.{service}.{check_name}.{check_name}"
@@ -556,9 +878,45 @@ def execute(
     if custom_checks_metadata and custom_checks_metadata["Checks"].get(c.CheckID):
         c = update_check_metadata(c, custom_checks_metadata["Checks"][c.CheckID])
 
+    return c
+
+
+def execute(
+    service: str,
+    check_name: str,
+    provider: str,
+    audit_output_options: Provider_Output_Options,
+    audit_info: Any,
+    services_executed: set,
+    checks_executed: set,
+    custom_checks_metadata: Any,
+):
+    c = load_check(service, check_name, provider, custom_checks_metadata)
+
     # Run check
     check_findings = run_check(c, audit_output_options)
 
+    return report_check_findings(
+        service,
+        check_name,
+        check_findings,
+        audit_output_options,
+        audit_info,
+        services_executed,
+        checks_executed,
+    )
+
+
+def report_check_findings(
+    service: str,
+    check_name: str,
+    check_findings: list,
+    audit_output_options: Provider_Output_Options,
+    audit_info: Any,
+    services_executed: set,
+    checks_executed: set,
+) -> list:
+    """report_check_findings updates the audit status, applies the allowlist and reports the check's findings"""
     # Update Audit Status
     services_executed.add(service)
     checks_executed.add(check_name)
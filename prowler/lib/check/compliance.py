@@ -7,50 +7,44 @@ from prowler.lib.check.models import Check_Metadata_Model
 from prowler.lib.logger import logger
 
 
+def get_checks_compliance_index(bulk_compliance_frameworks: dict) -> dict:
+    """get_checks_compliance_index returns the compliance requirements of every check in a single pass over the frameworks, {check_id: [Compliance_Base_Model]} with one requirement each and the requirements without checks under manual_check"""
+    checks_compliance_index = {}
+    for framework in bulk_compliance_frameworks.values():
+        for requirement in framework.Requirements:
+            # The requirement is validated when the framework is loaded, so it is not validated again
+            compliance = Compliance_Base_Model.construct(
+                Framework=framework.Framework,
+                Provider=framework.Provider,
+                Version=framework.Version,
+                Description=framework.Description,
+                Requirements=[requirement],
+            )
+            # A check can be listed more than once in the same requirement
+            for check in dict.fromkeys(requirement.Checks or ["manual_check"]):
+                checks_compliance_index.setdefault(check, []).append(compliance)
+    return checks_compliance_index
+
+
 def update_checks_metadata_with_compliance(
-    bulk_compliance_frameworks: dict, bulk_checks_metadata: dict
+    bulk_compliance_frameworks: dict,
+    bulk_checks_metadata: dict,
+    checks_compliance_index: dict = None,
 ):
     """Update the check metadata model with the compliance framework"""
     try:
+        if checks_compliance_index is None:
+            checks_compliance_index = get_checks_compliance_index(
+                bulk_compliance_frameworks
+            )
         for check in bulk_checks_metadata:
-            check_compliance = []
-            for framework in bulk_compliance_frameworks.values():
-                for requirement in framework.Requirements:
-                    compliance_requirements = []
-                    # Verify if check is in the requirement
-                    if check in requirement.Checks:
-                        # Include the requirement into the check's framework requirements
-                        compliance_requirements.append(requirement)
-                        # Create the Compliance_Model
-                        compliance = Compliance_Base_Model(
-                            Framework=framework.Framework,
-                            Provider=framework.Provider,
-                            Version=framework.Version,
-                            Description=framework.Description,
-                            Requirements=compliance_requirements,
-                        )
-                        # Include the compliance framework for the check
-                        check_compliance.append(compliance)
-            # Save it into the check's metadata
-            bulk_checks_metadata[check].Compliance = check_compliance
+            # Save the check's compliance requirements into the check's metadata
+            bulk_checks_metadata[check].Compliance = checks_compliance_index.get(
+                check, []
+            )
 
         # Add requirements of Manual Controls
-        for framework in bulk_compliance_frameworks.values():
-            for requirement in framework.Requirements:
-                compliance_requirements = []
-                # Verify if requirement is Manual
-                if not requirement.Checks:
-                    compliance_requirements.append(requirement)
-                    # Create the Compliance_Model
-                    compliance = Compliance_Base_Model(
-                        Framework=framework.Framework,
-                        Provider=framework.Provider,
-                        Version=framework.Version,
-                        Description=framework.Description,
-                        Requirements=compliance_requirements,
-                    )
-                    # Include the compliance framework for the check
-                    check_compliance.append(compliance)
+        if bulk_compliance_frameworks:
             # Create metadata for Manual Control
             manual_check_metadata = {
                 "Provider": "aws",
@@ -78,7 +72,9 @@ def update_checks_metadata_with_compliance(
             manual_check = parse_obj_as(Check_Metadata_Model, manual_check_metadata)
             # Save it into the check's metadata
             bulk_checks_metadata["manual_check"] = manual_check
-            bulk_checks_metadata["manual_check"].Compliance = check_compliance
+            bulk_checks_metadata["manual_check"].Compliance = (
+                checks_compliance_index.get("manual_check", [])
+            )
 
         return bulk_checks_metadata
     except Exception as e:
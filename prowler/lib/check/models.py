@@ -2,8 +2,9 @@ import os
 import sys
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
+from typing import Optional, Union
 
-from pydantic import BaseModel, ValidationError
+from pydantic import BaseModel, PrivateAttr, ValidationError
 
 from prowler.lib.logger import logger
 
@@ -57,9 +58,26 @@ class Check_Metadata_Model(BaseModel):
     Compliance: list = None
 
 
+class Shared_Check_Metadata_Model(Check_Metadata_Model):
+    """Shared_Check_Metadata_Model holds the check's metadata shared by all its findings, so it cannot be modified"""
+
+    class Config:
+        allow_mutation = False
+
+
+# Checks metadata already loaded by metadata file, to not parse it again when the check is instantiated
+checks_metadata_by_file = {}
+
+# Shared metadata of the findings by the check's metadata JSON
+shared_checks_metadata = {}
+
+
 class Check(ABC, Check_Metadata_Model):
     """Prowler Check"""
 
+    # JSON of the check's metadata, serialized once while it does not change
+    _metadata_json: Optional[str] = PrivateAttr(default=None)
+
     def __init__(self, **data):
         """Check's init function. Calls the CheckMetadataModel init."""
         # Parse the Check's metadata file
@@ -67,14 +85,30 @@ class Check(ABC, Check_Metadata_Model):
             os.path.abspath(sys.modules[self.__module__].__file__)[:-3]
             + ".metadata.json"
         )
-        # Store it to validate them with Pydantic
-        data = Check_Metadata_Model.parse_file(metadata_file).dict()
+        check_metadata = checks_metadata_by_file.get(metadata_file)
+        if check_metadata:
+            # The compliance is added later to the loaded metadata
+            data = check_metadata.dict(exclude={"Compliance"})
+        else:
+            # Store it to validate them with Pydantic
+            data = Check_Metadata_Model.parse_file(metadata_file).dict()
         # Calls parents init function
         super().__init__(**data)
 
-    def metadata(self) -> dict:
-        """Return the JSON representation of the check's metadata"""
-        return self.json()
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        if name in self.__fields__:
+            self._metadata_json = None
+
+    def metadata(self) -> str:
+        """Return the JSON representation of the check's metadata, whose parsed metadata is shared by the check's findings"""
+        if self._metadata_json is None:
+            metadata_json = self.json()
+            shared_checks_metadata[metadata_json] = (
+                Shared_Check_Metadata_Model.parse_raw(metadata_json)
+            )
+            self._metadata_json = metadata_json
+        return self._metadata_json
 
     @abstractmethod
     def execute(self):
@@ -85,15 +119,31 @@ class Check(ABC, Check_Metadata_Model):
 class Check_Report:
     """Contains the Check's finding information."""
 
+    # The __dict__ allows to store other information in the findings
+    __slots__ = (
+        "status",
+        "status_extended",
+        "check_metadata",
+        "resource_details",
+        "resource_tags",
+        "__dict__",
+    )
+
     status: str
     status_extended: str
     check_metadata: Check_Metadata_Model
     resource_details: str
     resource_tags: list
 
-    def __init__(self, metadata):
+    def __init__(self, metadata: Union[str, Check_Metadata_Model]):
         self.status = ""
-        self.check_metadata = Check_Metadata_Model.parse_raw(metadata)
+        if isinstance(metadata, Check_Metadata_Model):
+            self.check_metadata = metadata
+        else:
+            # The metadata returned by Check.metadata() is parsed only once per check
+            self.check_metadata = shared_checks_metadata.get(
+                metadata
+            ) or Check_Metadata_Model.parse_raw(metadata)
         self.status_extended = ""
         self.resource_details = ""
         self.resource_tags = []
@@ -103,6 +153,8 @@ class Check_Report:
 class Check_Report_AWS(Check_Report):
     """Contains the AWS Check's finding information."""
 
+    __slots__ = ("resource_id", "resource_arn", "region")
+
     resource_id: str
     resource_arn: str
     region: str
@@ -118,6 +170,8 @@ class Check_Report_AWS(Check_Report):
 class Check_Report_Azure(Check_Report):
     """Contains the Azure Check's finding information."""
 
+    __slots__ = ("resource_name", "resource_id", "subscription")
+
     resource_name: str
     resource_id: str
     subscription: str
@@ -133,6 +187,8 @@ class Check_Report_Azure(Check_Report):
 class Check_Report_GCP(Check_Report):
     """Contains the GCP Check's finding information."""
 
+    __slots__ = ("resource_name", "resource_id", "project_id", "location")
+
     resource_name: str
     resource_id: str
     project_id: str
@@ -1,12 +1,14 @@
 import argparse
 import sys
 from argparse import RawTextHelpFormatter
+from importlib.util import find_spec
 
 from prowler.config.config import (
     available_compliance_frameworks,
     check_current_version,
     default_config_file_path,
     default_output_directory,
+    output_compression_file_suffixes,
     valid_severities,
 )
 from prowler.providers.common.arguments import (
@@ -91,6 +93,16 @@ Detailed documentation at https://docs.prowler.cloud
                 "A provider is required to see its specific help options."
             )
 
+        # Parallel checks needs at least one worker
+        if args.parallel_checks is not None and args.parallel_checks < 1:
+            self.parser.error("--parallel-checks must be greater than 0")
+
+        # zstd compression is only available with the zstandard package
+        if args.output_compression == "zstd" and not find_spec("zstandard"):
+            self.parser.error(
+                "--output-compression zstd requires the zstandard package, install it with `pip install zstandard`"
+            )
+
         # Only Logging Configuration
         if args.only_logs or args.list_checks_json:
             args.no_banner = True
@@ -127,7 +139,22 @@ Detailed documentation at https://docs.prowler.cloud
             nargs="+",
             help="Output modes, by default csv, html and json",
             default=["csv", "json", "html", "json-ocsf"],
-            choices=["csv", "json", "json-asff", "html", "json-ocsf"],
+            choices=[
+                "csv",
+                "json",
+                "json-asff",
+                "html",
+                "json-ocsf",
+                "json-lines",
+                "json-asff-lines",
+                "json-ocsf-lines",
+            ],
+        )
+        common_outputs_parser.add_argument(
+            "--output-compression",
+            choices=list(output_compression_file_suffixes.keys()),
+            default=None,
+            help="Compress the JSON Lines outputs (json-lines, json-asff-lines and json-ocsf-lines) while they are written. zstd requires the zstandard package",
         )
         common_outputs_parser.add_argument(
             "-F",
@@ -167,6 +194,11 @@ Detailed documentation at https://docs.prowler.cloud
             default=False,
             help="Set the output timestamp format as unix timestamps instead of iso format timestamps (default mode).",
         )
+        common_outputs_parser.add_argument(
+            "--profile-scan",
+            action="store_true",
+            help="Profile the scan, writing its API calls, checks execution and services discovery times as JSON and as flamegraph collapsed stacks next to the outputs",
+        )
 
     def __init_logging_parser__(self):
         # Logging Options
@@ -247,6 +279,12 @@ Detailed documentation at https://docs.prowler.cloud
             nargs="?",
             help="Specify external directory with custom checks (each check must have a folder with the required files, see more in https://docs.prowler.cloud/en/latest/tutorials/misc/#custom-checks).",
         )
+        common_checks_parser.add_argument(
+            "--parallel-checks",
+            type=int,
+            default=None,
+            help="Number of checks to execute in parallel. Checks using the same service clients are executed sequentially by the same worker. By default checks are executed one after another.",
+        )
 
     def __init_list_checks_parser__(self):
         # List checks options
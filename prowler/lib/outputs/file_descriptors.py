@@ -1,3 +1,8 @@
+import atexit
+import gzip
+import json
+import sys
+import threading
 from csv import DictWriter
 from io import TextIOWrapper
 from typing import Any
@@ -7,10 +12,12 @@ from prowler.config.config import (
     html_file_suffix,
     json_asff_file_suffix,
     json_file_suffix,
+    json_lines_file_suffixes,
     json_ocsf_file_suffix,
+    output_compression_file_suffixes,
 )
 from prowler.lib.logger import logger
-from prowler.lib.outputs.html import add_html_header
+from prowler.lib.outputs.html import add_html_footer, add_html_header
 from prowler.lib.outputs.models import (
     Check_Output_CSV_AWS_CIS,
     Check_Output_CSV_AWS_ISO27001_2013,
@@ -19,6 +26,7 @@ from prowler.lib.outputs.models import (
     Check_Output_CSV_GCP_CIS,
     Check_Output_CSV_Generic_Compliance,
     Check_Output_MITRE_ATTACK,
+    Check_Output_Templates,
     generate_csv_fields,
 )
 from prowler.lib.utils.utils import file_exists, open_file
@@ -26,25 +34,23 @@ from prowler.providers.aws.lib.audit_info.models import AWS_Audit_Info
 from prowler.providers.common.outputs import get_provider_output_model
 from prowler.providers.gcp.lib.audit_info.models import GCP_Audit_Info
 
+# Buffer size in bytes of each output file, flushed when full or when the scan finishes
+OUTPUT_BUFFER_SIZE = 1024 * 1024
+
 
 def initialize_file_descriptor(
     filename: str,
     output_mode: str,
     audit_info: Any,
     format: Any = None,
+    buffering: int = -1,
 ) -> TextIOWrapper:
     """Open/Create the output file. If needed include headers or the required format"""
     try:
         if file_exists(filename):
-            file_descriptor = open_file(
-                filename,
-                "a",
-            )
+            file_descriptor = open_file(filename, "a", buffering)
         else:
-            file_descriptor = open_file(
-                filename,
-                "a",
-            )
+            file_descriptor = open_file(filename, "a", buffering)
 
             if output_mode in ("json", "json-asff", "json-ocsf"):
                 file_descriptor.write("[")
@@ -65,7 +71,40 @@ def initialize_file_descriptor(
     return file_descriptor
 
 
-def fill_file_descriptors(output_modes, output_directory, output_filename, audit_info):
+def initialize_json_lines_file_descriptor(
+    filename: str, output_compression: str = None
+) -> TextIOWrapper:
+    """Open/Create the JSON Lines output file, compressing it while it is written if output_compression is set"""
+    try:
+        if output_compression == "gzip":
+            # Each flush writes a complete gzip block, so the file can be read while it is written
+            file_descriptor = gzip.open(filename, "at", encoding="utf-8")
+        elif output_compression == "zstd":
+            import zstandard
+
+            file_descriptor = TextIOWrapper(
+                zstandard.ZstdCompressor().stream_writer(open_file(filename, "ab")),
+                encoding="utf-8",
+            )
+        else:
+            file_descriptor = open_file(filename, "a")
+    except Exception as error:
+        logger.critical(
+            f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+        )
+        sys.exit(1)
+
+    return file_descriptor
+
+
+def fill_file_descriptors(
+    output_modes,
+    output_directory,
+    output_filename,
+    audit_info,
+    buffering=-1,
+    output_compression=None,
+):
     try:
         file_descriptors = {}
         if output_modes:
@@ -80,13 +119,14 @@ def fill_file_descriptors(output_modes, output_directory, output_filename, audit
                         output_mode,
                         audit_info,
                         output_model,
+                        buffering=buffering,
                     )
                     file_descriptors.update({output_mode: file_descriptor})
 
                 elif output_mode == "json":
                     filename = f"{output_directory}/{output_filename}{json_file_suffix}"
                     file_descriptor = initialize_file_descriptor(
-                        filename, output_mode, audit_info
+                        filename, output_mode, audit_info, buffering=buffering
                     )
                     file_descriptors.update({output_mode: file_descriptor})
 
@@ -95,14 +135,24 @@ def fill_file_descriptors(output_modes, output_directory, output_filename, audit
                         f"{output_directory}/{output_filename}{json_ocsf_file_suffix}"
                     )
                     file_descriptor = initialize_file_descriptor(
-                        filename, output_mode, audit_info
+                        filename, output_mode, audit_info, buffering=buffering
                     )
                     file_descriptors.update({output_mode: file_descriptor})
 
                 elif output_mode == "html":
                     filename = f"{output_directory}/{output_filename}{html_file_suffix}"
                     file_descriptor = initialize_file_descriptor(
-                        filename, output_mode, audit_info
+                        filename, output_mode, audit_info, buffering=buffering
+                    )
+                    file_descriptors.update({output_mode: file_descriptor})
+
+                elif output_mode in ("json-lines", "json-ocsf-lines") or (
+                    output_mode == "json-asff-lines"
+                    and isinstance(audit_info, AWS_Audit_Info)
+                ):
+                    filename = f"{output_directory}/{output_filename}{json_lines_file_suffixes[output_mode]}{output_compression_file_suffixes.get(output_compression, '')}"
+                    file_descriptor = initialize_json_lines_file_descriptor(
+                        filename, output_compression
                     )
                     file_descriptors.update({output_mode: file_descriptor})
 
@@ -110,7 +160,11 @@ def fill_file_descriptors(output_modes, output_directory, output_filename, audit
                     if output_mode == "cis_2.0_gcp":
                         filename = f"{output_directory}/{output_filename}_cis_2.0_gcp{csv_file_suffix}"
                         file_descriptor = initialize_file_descriptor(
-                            filename, output_mode, audit_info, Check_Output_CSV_GCP_CIS
+                            filename,
+                            output_mode,
+                            audit_info,
+                            Check_Output_CSV_GCP_CIS,
+                            buffering=buffering,
                         )
                         file_descriptors.update({output_mode: file_descriptor})
 
@@ -118,7 +172,7 @@ def fill_file_descriptors(output_modes, output_directory, output_filename, audit
                     if output_mode == "json-asff":
                         filename = f"{output_directory}/{output_filename}{json_asff_file_suffix}"
                         file_descriptor = initialize_file_descriptor(
-                            filename, output_mode, audit_info
+                            filename, output_mode, audit_info, buffering=buffering
                         )
                         file_descriptors.update({output_mode: file_descriptor})
 
@@ -129,20 +183,29 @@ def fill_file_descriptors(output_modes, output_directory, output_filename, audit
                             output_mode,
                             audit_info,
                             Check_Output_CSV_ENS_RD2022,
+                            buffering=buffering,
                         )
                         file_descriptors.update({output_mode: file_descriptor})
 
                     elif output_mode == "cis_1.5_aws":
                         filename = f"{output_directory}/{output_filename}_cis_1.5_aws{csv_file_suffix}"
                         file_descriptor = initialize_file_descriptor(
-                            filename, output_mode, audit_info, Check_Output_CSV_AWS_CIS
+                            filename,
+                            output_mode,
+                            audit_info,
+                            Check_Output_CSV_AWS_CIS,
+                            buffering=buffering,
                         )
                         file_descriptors.update({output_mode: file_descriptor})
 
                     elif output_mode == "cis_1.4_aws":
                         filename = f"{output_directory}/{output_filename}_cis_1.4_aws{csv_file_suffix}"
                         file_descriptor = initialize_file_descriptor(
-                            filename, output_mode, audit_info, Check_Output_CSV_AWS_CIS
+                            filename,
+                            output_mode,
+                            audit_info,
+                            Check_Output_CSV_AWS_CIS,
+                            buffering=buffering,
                         )
                         file_descriptors.update({output_mode: file_descriptor})
 
@@ -156,6 +219,7 @@ def fill_file_descriptors(output_modes, output_directory, output_filename, audit
                             output_mode,
                             audit_info,
                             Check_Output_CSV_AWS_Well_Architected,
+                            buffering=buffering,
                         )
                         file_descriptors.update({output_mode: file_descriptor})
 
@@ -169,6 +233,7 @@ def fill_file_descriptors(output_modes, output_directory, output_filename, audit
                             output_mode,
                             audit_info,
                             Check_Output_CSV_AWS_Well_Architected,
+                            buffering=buffering,
                         )
                         file_descriptors.update({output_mode: file_descriptor})
 
@@ -179,6 +244,7 @@ def fill_file_descriptors(output_modes, output_directory, output_filename, audit
                             output_mode,
                             audit_info,
                             Check_Output_CSV_AWS_ISO27001_2013,
+                            buffering=buffering,
                         )
                         file_descriptors.update({output_mode: file_descriptor})
 
@@ -189,6 +255,7 @@ def fill_file_descriptors(output_modes, output_directory, output_filename, audit
                             output_mode,
                             audit_info,
                             Check_Output_MITRE_ATTACK,
+                            buffering=buffering,
                         )
                         file_descriptors.update({output_mode: file_descriptor})
 
@@ -200,6 +267,7 @@ def fill_file_descriptors(output_modes, output_directory, output_filename, audit
                             output_mode,
                             audit_info,
                             Check_Output_CSV_Generic_Compliance,
+                            buffering=buffering,
                         )
                         file_descriptors.update({output_mode: file_descriptor})
 
@@ -209,3 +277,108 @@ def fill_file_descriptors(output_modes, output_directory, output_filename, audit
         )
 
     return file_descriptors
+
+
+class Output_Writers:
+    """The Output_Writers class keeps the output files of a scan open until the scan finishes:
+    - The files are created with the first findings reported and written through a buffer of buffer_size bytes
+    - The JSON outputs are written as a JSON array, closed with ] on close()
+    - The JSON Lines outputs get one compact finding per line, flushed as soon as it is written
+    - The HTML output gets its footer on close(), which also runs at exit if the scan is interrupted
+    - The lock serializes the findings reported by concurrent checks
+    - The output_templates keep the CSV and JSON data built once per check, if given
+    """
+
+    def __init__(
+        self,
+        output_modes: list,
+        output_directory: str,
+        output_filename: str,
+        audit_info: Any,
+        buffer_size: int = OUTPUT_BUFFER_SIZE,
+        output_compression: str = None,
+        output_templates: Check_Output_Templates = None,
+    ):
+        self.output_modes = output_modes
+        self.output_directory = output_directory
+        self.output_filename = output_filename
+        self.audit_info = audit_info
+        self.buffer_size = buffer_size
+        self.output_compression = output_compression
+        self.output_templates = output_templates
+        self.file_descriptors = {}
+        # Separator written before the next finding of each JSON output
+        self.json_separators = {}
+        self.lock = threading.RLock()
+        self.closed = False
+        # Flush the buffered findings and close the outputs even if the scan exits early
+        atexit.register(self.close)
+
+    def get_file_descriptors(self) -> dict:
+        """get_file_descriptors returns the output files, creating them the first time"""
+        with self.lock:
+            if not self.file_descriptors and not self.closed:
+                self.file_descriptors = fill_file_descriptors(
+                    self.output_modes,
+                    self.output_directory,
+                    self.output_filename,
+                    self.audit_info,
+                    buffering=self.buffer_size,
+                    output_compression=self.output_compression,
+                )
+                for output_mode, file_descriptor in self.file_descriptors.items():
+                    if output_mode in ("json", "json-asff", "json-ocsf"):
+                        # Files already containing findings only need the separator
+                        self.json_separators[output_mode] = (
+                            "" if file_descriptor.tell() <= 1 else ","
+                        )
+            return self.file_descriptors
+
+    def write_json(self, output_mode: str, finding: dict, **kwargs):
+        """write_json adds the finding to the JSON array of the output_mode"""
+        file_descriptor = self.file_descriptors[output_mode]
+        file_descriptor.write(self.json_separators[output_mode])
+        json.dump(finding, file_descriptor, indent=4, **kwargs)
+        self.json_separators[output_mode] = ","
+
+    def write_json_line(self, output_mode: str, finding: dict, **kwargs):
+        """write_json_line adds the finding as a compact JSON line, flushed so it can be read while the scan runs"""
+        file_descriptor = self.file_descriptors[output_mode]
+        file_descriptor.write(json.dumps(finding, separators=(",", ":"), **kwargs))
+        file_descriptor.write("\n")
+        file_descriptor.flush()
+
+    def close(self):
+        """close writes the end of the JSON and HTML outputs and closes all the output files"""
+        with self.lock:
+            if self.closed:
+                return
+            try:
+                for output_mode, file_descriptor in self.file_descriptors.items():
+                    if output_mode in self.json_separators:
+                        file_descriptor.write("]")
+                    elif output_mode == "html":
+                        add_html_footer(file_descriptor)
+                    file_descriptor.close()
+            except Exception as error:
+                logger.error(
+                    f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                )
+            self.file_descriptors = {}
+            self.closed = True
+
+
+def get_output_writers(output_options: Any, audit_info: Any) -> Output_Writers:
+    """get_output_writers returns the Output_Writers of the scan, creating them the first time"""
+    output_writers = getattr(output_options, "output_writers", None)
+    if not isinstance(output_writers, Output_Writers):
+        output_writers = Output_Writers(
+            output_options.output_modes,
+            output_options.output_directory,
+            output_options.output_filename,
+            audit_info,
+            output_compression=getattr(output_options, "output_compression", None),
+            output_templates=Check_Output_Templates(output_options),
+        )
+        output_options.output_writers = output_writers
+    return output_writers
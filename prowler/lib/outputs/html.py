@@ -17,7 +17,6 @@ from prowler.lib.outputs.models import (
     unroll_dict,
     unroll_tags,
 )
-from prowler.lib.utils.utils import open_file
 from prowler.providers.aws.lib.audit_info.models import AWS_Audit_Info
 from prowler.providers.azure.lib.audit_info.models import Azure_Audit_Info
 from prowler.providers.gcp.lib.audit_info.models import GCP_Audit_Info
@@ -232,17 +231,10 @@ def fill_html_overview_statistics(stats, output_filename, output_directory):
         sys.exit(1)
 
 
-def add_html_footer(output_filename, output_directory):
+def add_html_footer(file_descriptor):
     try:
-        filename = f"{output_directory}/{output_filename}{html_file_suffix}"
-        # Close HTML file if exists
-        if path.isfile(filename):
-            file_descriptor = open_file(
-                filename,
-                "a",
-            )
-            file_descriptor.write(
-                """
+        file_descriptor.write(
+            """
                </tbody>
             </table>
         </div>
@@ -326,8 +318,7 @@ def add_html_footer(output_filename, output_directory):
 
 </html>
 """
-            )
-            file_descriptor.close()
+        )
     except Exception as error:
         logger.critical(
             f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}] -- {error}"
@@ -1,10 +1,4 @@
-import os
-import sys
-
 from prowler.config.config import (
-    json_asff_file_suffix,
-    json_file_suffix,
-    json_ocsf_file_suffix,
     prowler_version,
     timestamp,
     timestamp_utc,
@@ -30,7 +24,7 @@ from prowler.lib.outputs.models import (
     get_check_compliance,
     unroll_dict_to_list,
 )
-from prowler.lib.utils.utils import hash_sha512, open_file, outputs_unix_timestamp
+from prowler.lib.utils.utils import hash_sha512, outputs_unix_timestamp
 from prowler.providers.aws.lib.audit_info.models import AWS_Audit_Info
 
 
@@ -327,32 +321,3 @@ def generate_json_ocsf_severity_id(severity: str):
         json_ocsf_severity_id = 5
 
     return json_ocsf_severity_id
-
-
-def close_json(output_filename, output_directory, mode):
-    """close_json closes the output JSON file replacing the last comma with ]"""
-    try:
-        suffix = json_file_suffix
-        if mode == "json-asff":
-            suffix = json_asff_file_suffix
-        elif mode == "json-ocsf":
-            suffix = json_ocsf_file_suffix
-        filename = f"{output_directory}/{output_filename}{suffix}"
-        # Close JSON file if exists
-        if os.path.isfile(filename):
-            file_descriptor = open_file(
-                filename,
-                "a",
-            )
-            # Replace last comma for square bracket if not empty
-            if file_descriptor.tell() > 0:
-                if file_descriptor.tell() != 1:
-                    file_descriptor.seek(file_descriptor.tell() - 1, os.SEEK_SET)
-                file_descriptor.truncate()
-                file_descriptor.write("]")
-            file_descriptor.close()
-    except Exception as error:
-        logger.critical(
-            f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}] -- {error}"
-        )
-        sys.exit(1)
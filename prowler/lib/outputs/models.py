@@ -37,18 +37,124 @@ def get_check_compliance(finding, provider, output_options):
         sys.exit(1)
 
 
+# Output models by (provider, mode), e.g. ("aws", "csv") -> Aws_Check_Output_CSV
+output_models = {}
+
+
+def get_output_model(provider: str, mode: str):
+    """get_output_model returns the output model of the provider for the given mode, loaded only once"""
+    output_model = output_models.get((provider, mode))
+    if not output_model:
+        # Dynamically load the Provider_Output_Options class
+        finding_output_model = f"{provider.capitalize()}_Check_Output_{mode.upper()}"
+        output_model = output_models[(provider, mode)] = getattr(
+            importlib.import_module(__name__), finding_output_model
+        )
+    return output_model
+
+
+def new_output(output_model, data: dict, output_templates=None):
+    """new_output returns the output of the finding, validated by the output model unless its check's template was already validated"""
+    if output_templates and output_templates.is_validated(output_model, data):
+        return output_model.construct(**data)
+    return output_model(**data)
+
+
+class Check_Output_Templates:
+    """
+    The Check_Output_Templates class keeps the outputs data that is the same for all the findings of a check, built with its first finding:
+    - The CSV row with the check metadata, the assessment start time and the compliance
+    - The JSON output with the check metadata, the assessment start time and the compliance
+    - One CSV writer for each output file
+    The account fields are not in the templates since the findings of several accounts can share them with --organization-accounts.
+    """
+
+    def __init__(self, output_options):
+        self.output_options = output_options
+        self.csv_rows = {}
+        self.json_findings = {}
+        self.validated_checks = set()
+        self.csv_writers = {}
+
+    def get_csv_row(self, provider: str, mode: str, finding) -> dict:
+        """get_csv_row returns a copy of the CSV row of the finding's check to fill it with the finding's data"""
+        key = (provider, mode, finding.check_metadata.CheckID)
+        csv_row = self.csv_rows.get(key)
+        if not csv_row:
+            csv_row = self.csv_rows[key] = fill_common_data_csv(
+                finding, self.output_options.unix_timestamp
+            )
+            csv_row["compliance"] = unroll_dict(
+                get_check_compliance(finding, provider, self.output_options)
+            )
+        return dict(csv_row)
+
+    def is_validated(self, output_model, data: dict) -> bool:
+        """is_validated returns whether the output of the data's check was already validated, recording it as validated otherwise"""
+        key = (output_model, data["check_id"])
+        if key in self.validated_checks:
+            return True
+        self.validated_checks.add(key)
+        return False
+
+    def get_json_finding(self, provider: str, mode: str, finding):
+        """get_json_finding returns a copy of the JSON output of the finding's check to fill it with the finding's data"""
+        key = (provider, mode, finding.check_metadata.CheckID)
+        json_finding = self.json_findings.get(key)
+        if not json_finding:
+            json_finding = self.json_findings[key] = get_output_model(provider, mode)(
+                **finding.check_metadata.dict()
+            )
+            json_finding.AssessmentStartTime = outputs_unix_timestamp(
+                self.output_options.unix_timestamp, timestamp
+            )
+            json_finding.Compliance = get_check_compliance(
+                finding, provider, self.output_options
+            )
+        return json_finding.copy()
+
+    def get_csv_writer(self, fd, output_model) -> DictWriter:
+        """get_csv_writer returns the CSV writer of the output file"""
+        csv_writer = self.csv_writers.get(fd)
+        if not csv_writer:
+            csv_writer = self.csv_writers[fd] = DictWriter(
+                fd,
+                fieldnames=generate_csv_fields(output_model),
+                delimiter=";",
+            )
+        return csv_writer
+
+
 def generate_provider_output_csv(
-    provider: str, finding, audit_info, mode: str, fd, output_options
+    provider: str,
+    finding,
+    audit_info,
+    mode: str,
+    fd,
+    output_options,
+    output_templates=None,
 ):
     """
     set_provider_output_options configures automatically the outputs based on the selected provider and returns the Provider_Output_Options object.
+
+    With the output_templates of the scan, only the fields of the finding are filled and validated once per check.
     """
     try:
-        # Dynamically load the Provider_Output_Options class
-        finding_output_model = f"{provider.capitalize()}_Check_Output_{mode.upper()}"
-        output_model = getattr(importlib.import_module(__name__), finding_output_model)
-        # Fill common data among providers
-        data = fill_common_data_csv(finding, output_options.unix_timestamp)
+        output_model = get_output_model(provider, mode)
+        if output_templates:
+            # Fill the common data and compliance of the check from its template
+            data = output_templates.get_csv_row(provider, mode, finding)
+        else:
+            # Fill common data among providers
+            data = fill_common_data_csv(finding, output_options.unix_timestamp)
+            data["compliance"] = unroll_dict(
+                get_check_compliance(finding, provider, output_options)
+            )
+        # Fill the data of the finding
+        data["status"] = finding.status
+        data["status_extended"] = finding.status_extended
+        data["resource_details"] = finding.resource_details
+        data["resource_tags"] = unroll_tags(finding.resource_tags)
 
         if provider == "azure":
             data["resource_id"] = finding.resource_id
@@ -58,10 +164,7 @@ def generate_provider_output_csv(
             data["finding_unique_id"] = (
                 f"prowler-{provider}-{finding.check_metadata.CheckID}-{finding.subscription}-{finding.resource_id}"
             )
-            data["compliance"] = unroll_dict(
-                get_check_compliance(finding, provider, output_options)
-            )
-            finding_output = output_model(**data)
+            finding_output = new_output(output_model, data, output_templates)
 
         if provider == "gcp":
             data["resource_id"] = finding.resource_id
@@ -71,10 +174,7 @@ def generate_provider_output_csv(
             data["finding_unique_id"] = (
                 f"prowler-{provider}-{finding.check_metadata.CheckID}-{finding.project_id}-{finding.resource_id}"
             )
-            data["compliance"] = unroll_dict(
-                get_check_compliance(finding, provider, output_options)
-            )
-            finding_output = output_model(**data)
+            finding_output = new_output(output_model, data, output_templates)
 
         if provider == "aws":
             data["profile"] = audit_info.profile
@@ -85,10 +185,7 @@ def generate_provider_output_csv(
             data["finding_unique_id"] = (
                 f"prowler-{provider}-{finding.check_metadata.CheckID}-{audit_info.audited_account}-{finding.region}-{finding.resource_id}"
             )
-            data["compliance"] = unroll_dict(
-                get_check_compliance(finding, provider, output_options)
-            )
-            finding_output = output_model(**data)
+            finding_output = new_output(output_model, data, output_templates)
 
             if audit_info.organizations_metadata:
                 finding_output.account_name = (
@@ -107,11 +204,14 @@ def generate_provider_output_csv(
                     audit_info.organizations_metadata.account_details_tags
                 )
 
-        csv_writer = DictWriter(
-            fd,
-            fieldnames=generate_csv_fields(output_model),
-            delimiter=";",
-        )
+        if output_templates:
+            csv_writer = output_templates.get_csv_writer(fd, output_model)
+        else:
+            csv_writer = DictWriter(
+                fd,
+                fieldnames=generate_csv_fields(output_model),
+                delimiter=";",
+            )
 
     except Exception as error:
         logger.error(
@@ -349,21 +449,28 @@ class Gcp_Check_Output_CSV(Check_Output_CSV):
 
 
 def generate_provider_output_json(
-    provider: str, finding, audit_info, mode: str, output_options
+    provider: str, finding, audit_info, mode: str, output_options, output_templates=None
 ):
     """
     generate_provider_output_json configures automatically the outputs based on the selected provider and returns the Check_Output_JSON object.
+
+    With the output_templates of the scan, the check metadata and compliance are copied from the check's template.
     """
     try:
-        # Dynamically load the Provider_Output_Options class for the JSON format
-        finding_output_model = f"{provider.capitalize()}_Check_Output_{mode.upper()}"
-        output_model = getattr(importlib.import_module(__name__), finding_output_model)
-        # Instantiate the class for the cloud provider
-        finding_output = output_model(**finding.check_metadata.dict())
-        # Fill common fields
-        finding_output.AssessmentStartTime = outputs_unix_timestamp(
-            output_options.unix_timestamp, timestamp
-        )
+        if output_templates:
+            finding_output = output_templates.get_json_finding(provider, mode, finding)
+        else:
+            # Instantiate the class for the cloud provider
+            finding_output = get_output_model(provider, mode)(
+                **finding.check_metadata.dict()
+            )
+            # Fill common fields
+            finding_output.AssessmentStartTime = outputs_unix_timestamp(
+                output_options.unix_timestamp, timestamp
+            )
+            finding_output.Compliance = get_check_compliance(
+                finding, provider, output_options
+            )
         finding_output.Status = finding.status
         finding_output.StatusExtended = finding.status_extended
         finding_output.ResourceDetails = finding.resource_details
@@ -374,9 +481,6 @@ def generate_provider_output_json(
             finding_output.ResourceId = finding.resource_id
             finding_output.ResourceName = finding.resource_name
             finding_output.FindingUniqueId = f"prowler-{provider}-{finding.check_metadata.CheckID}-{finding.subscription}-{finding.resource_id}"
-            finding_output.Compliance = get_check_compliance(
-                finding, provider, output_options
-            )
 
         if provider == "gcp":
             finding_output.ProjectId = finding.project_id
@@ -384,9 +488,6 @@ def generate_provider_output_json(
             finding_output.ResourceId = finding.resource_id
             finding_output.ResourceName = finding.resource_name
             finding_output.FindingUniqueId = f"prowler-{provider}-{finding.check_metadata.CheckID}-{finding.project_id}-{finding.resource_id}"
-            finding_output.Compliance = get_check_compliance(
-                finding, provider, output_options
-            )
 
         if provider == "aws":
             finding_output.Profile = audit_info.profile
@@ -396,9 +497,6 @@ def generate_provider_output_json(
             finding_output.ResourceArn = finding.resource_arn
             finding_output.ResourceTags = parse_json_tags(finding.resource_tags)
             finding_output.FindingUniqueId = f"prowler-{provider}-{finding.check_metadata.CheckID}-{audit_info.audited_account}-{finding.region}-{finding.resource_id}"
-            finding_output.Compliance = get_check_compliance(
-                finding, provider, output_options
-            )
 
             if audit_info.organizations_metadata:
                 finding_output.OrganizationsInfo = (
@@ -1,11 +1,9 @@
-import json
-
 from colorama import Fore, Style
 
 from prowler.config.config import available_compliance_frameworks, orange_color
 from prowler.lib.logger import logger
 from prowler.lib.outputs.compliance import add_manual_controls, fill_compliance
-from prowler.lib.outputs.file_descriptors import fill_file_descriptors
+from prowler.lib.outputs.file_descriptors import get_output_writers
 from prowler.lib.outputs.html import fill_html
 from prowler.lib.outputs.json import fill_json_asff, fill_json_ocsf
 from prowler.lib.outputs.models import (
@@ -32,6 +30,7 @@ def stdout_report(finding, color, verbose, is_quiet):
 
 
 def report(check_findings, output_options, audit_info):
+    output_writers = None
     try:
         file_descriptors = {}
         if check_findings:
@@ -42,16 +41,11 @@ def report(check_findings, output_options, audit_info):
             if isinstance(audit_info, Azure_Audit_Info):
                 check_findings.sort(key=lambda x: x.subscription)
 
-            # Generate the required output files
+            # Get the output files of the scan, they are created with the first findings
             if output_options.output_modes:
-                # if isinstance(audit_info, AWS_Audit_Info):
-                # We have to create the required output files
-                file_descriptors = fill_file_descriptors(
-                    output_options.output_modes,
-                    output_options.output_directory,
-                    output_options.output_filename,
-                    audit_info,
-                )
+                output_writers = get_output_writers(output_options, audit_info)
+                output_writers.lock.acquire()
+                file_descriptors = output_writers.get_file_descriptors()
 
             for finding in check_findings:
                 # Print findings by stdout
@@ -82,18 +76,28 @@ def report(check_findings, output_options, audit_info):
 
                         # AWS specific outputs
                         if finding.check_metadata.Provider == "aws":
-                            if "json-asff" in file_descriptors:
+                            if (
+                                "json-asff" in file_descriptors
+                                or "json-asff-lines" in file_descriptors
+                            ):
                                 finding_output = Check_Output_JSON_ASFF()
                                 fill_json_asff(
                                     finding_output, audit_info, finding, output_options
                                 )
-
-                                json.dump(
-                                    finding_output.dict(exclude_none=True),
-                                    file_descriptors["json-asff"],
-                                    indent=4,
+                                json_asff_finding = finding_output.dict(
+                                    exclude_none=True
                                 )
-                                file_descriptors["json-asff"].write(",")
+                                # Keep the JSON ASFF finding to send it to Security Hub without formatting it again
+                                if output_options.security_hub_enabled:
+                                    finding.json_asff = json_asff_finding
+                                if "json-asff" in file_descriptors:
+                                    output_writers.write_json(
+                                        "json-asff", json_asff_finding
+                                    )
+                                if "json-asff-lines" in file_descriptors:
+                                    output_writers.write_json_line(
+                                        "json-asff-lines", json_asff_finding
+                                    )
 
                         # Common outputs
                         if "html" in file_descriptors:
@@ -108,36 +112,46 @@ def report(check_findings, output_options, audit_info):
                                 "csv",
                                 file_descriptors["csv"],
                                 output_options,
+                                output_writers.output_templates,
                             )
                             csv_writer.writerow(finding_output.__dict__)
 
-                        if "json" in file_descriptors:
+                        if (
+                            "json" in file_descriptors
+                            or "json-lines" in file_descriptors
+                        ):
                             finding_output = generate_provider_output_json(
                                 finding.check_metadata.Provider,
                                 finding,
                                 audit_info,
                                 "json",
                                 output_options,
+                                output_writers.output_templates,
                             )
-                            json.dump(
-                                finding_output.dict(),
-                                file_descriptors["json"],
-                                indent=4,
-                            )
-                            file_descriptors["json"].write(",")
+                            json_finding = finding_output.dict()
+                            if "json" in file_descriptors:
+                                output_writers.write_json("json", json_finding)
+                            if "json-lines" in file_descriptors:
+                                output_writers.write_json_line(
+                                    "json-lines", json_finding
+                                )
 
-                        if "json-ocsf" in file_descriptors:
+                        if (
+                            "json-ocsf" in file_descriptors
+                            or "json-ocsf-lines" in file_descriptors
+                        ):
                             finding_output = fill_json_ocsf(
                                 audit_info, finding, output_options
                             )
-
-                            json.dump(
-                                finding_output.dict(),
-                                file_descriptors["json-ocsf"],
-                                indent=4,
-                                default=str,
-                            )
-                            file_descriptors["json-ocsf"].write(",")
+                            json_ocsf_finding = finding_output.dict()
+                            if "json-ocsf" in file_descriptors:
+                                output_writers.write_json(
+                                    "json-ocsf", json_ocsf_finding, default=str
+                                )
+                            if "json-ocsf-lines" in file_descriptors:
+                                output_writers.write_json_line(
+                                    "json-ocsf-lines", json_ocsf_finding, default=str
+                                )
 
         else:  # No service resources in the whole account
             color = set_report_color("INFO")
@@ -146,14 +160,14 @@ def report(check_findings, output_options, audit_info):
         # Separator between findings and bar
         if output_options.verbose:
             print()
-        if file_descriptors:
-            # Close all file descriptors
-            for file_descriptor in file_descriptors:
-                file_descriptors.get(file_descriptor).close()
     except Exception as error:
         logger.error(
             f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
         )
+    finally:
+        # The output files are kept open until the scan finishes
+        if output_writers:
+            output_writers.lock.release()
 
 
 def set_report_color(status: str) -> str:
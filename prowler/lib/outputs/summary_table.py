@@ -8,7 +8,9 @@ from prowler.config.config import (
     html_file_suffix,
     json_asff_file_suffix,
     json_file_suffix,
+    json_lines_file_suffixes,
     json_ocsf_file_suffix,
+    output_compression_file_suffixes,
 )
 from prowler.lib.logger import logger
 from prowler.providers.common.outputs import Provider_Output_Options
@@ -132,6 +134,11 @@ def display_summary_table(
                 print(
                     f" - JSON: {output_directory}/{output_filename}{json_file_suffix}"
                 )
+            for output_mode, json_lines_file_suffix in json_lines_file_suffixes.items():
+                if output_mode in output_options.output_modes:
+                    print(
+                        f" - {output_mode.upper()}: {output_directory}/{output_filename}{json_lines_file_suffix}{output_compression_file_suffixes.get(output_options.output_compression, '')}"
+                    )
 
         else:
             print(
@@ -0,0 +1,256 @@
+import json
+import threading
+from bisect import bisect_left
+from datetime import datetime, timezone
+from time import perf_counter
+from typing import Optional
+
+from prowler.config.config import (
+    profile_collapsed_file_suffix,
+    profile_json_file_suffix,
+)
+from prowler.lib.logger import logger
+from prowler.lib.utils.utils import open_file
+
+# Upper bounds in milliseconds of the buckets of the API calls latency histograms, the last bucket has no bound
+LATENCY_BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+
+class Profiler:
+    """
+    The Profiler class records where the time of the scan goes, when it is enabled with --profile-scan:
+    - The API calls of each (service, operation, region), sent through the hooks of each provider's SDK
+    - The execution time of each check
+    - The discovery time of each service
+    It is shared by all the threads of the scan, so every record is taken under its lock.
+    """
+
+    def __init__(self, provider: str):
+        self.provider = provider
+        self.start_timestamp = datetime.now(timezone.utc)
+        self.start_time = perf_counter()
+        self.lock = threading.Lock()
+        self.api_calls = {}
+        self.checks = {}
+        self.services_discovery = {}
+
+    def record_api_call(
+        self,
+        service: str,
+        operation: str,
+        region: str,
+        latency: float,
+        retries: int = 0,
+        throttles: int = 0,
+        bytes_received: int = 0,
+        error: bool = False,
+    ):
+        """record_api_call records an API call and its latency in seconds"""
+        latency_ms = latency * 1000
+        with self.lock:
+            api_call = self.api_calls.get((service, operation, region))
+            if api_call is None:
+                api_call = self.api_calls[(service, operation, region)] = {
+                    "calls": 0,
+                    "errors": 0,
+                    "retries": 0,
+                    "throttles": 0,
+                    "bytes_received": 0,
+                    "latency_ms": {
+                        "total": 0.0,
+                        "min": latency_ms,
+                        "max": latency_ms,
+                        "histogram": [0] * (len(LATENCY_BUCKETS_MS) + 1),
+                    },
+                }
+            api_call["calls"] += 1
+            api_call["errors"] += int(error)
+            api_call["retries"] += retries
+            api_call["throttles"] += throttles
+            api_call["bytes_received"] += bytes_received
+            api_call["latency_ms"]["total"] += latency_ms
+            api_call["latency_ms"]["min"] = min(
+                api_call["latency_ms"]["min"], latency_ms
+            )
+            api_call["latency_ms"]["max"] = max(
+                api_call["latency_ms"]["max"], latency_ms
+            )
+            api_call["latency_ms"]["histogram"][
+                bisect_left(LATENCY_BUCKETS_MS, latency_ms)
+            ] += 1
+
+    def record_check(self, check_id: str, service: str, duration: float, findings: int):
+        """record_check records the execution time in seconds of a check, added over its executions, e.g. one per account with --organization-accounts"""
+        with self.lock:
+            check = self.checks.setdefault(
+                check_id,
+                {"service": service, "executions": 0, "duration": 0.0, "findings": 0},
+            )
+            check["executions"] += 1
+            check["duration"] += duration
+            check["findings"] += findings
+
+    def record_service_discovery(self, service: str, duration: float):
+        """record_service_discovery records the discovery time in seconds of a service, added over its discoveries"""
+        with self.lock:
+            self.services_discovery[service] = (
+                self.services_discovery.get(service, 0.0) + duration
+            )
+
+    def pop_records(self) -> tuple:
+        """pop_records returns the records taken so far and starts recording again, e.g. to send them from a worker process to the Profiler of the scan"""
+        with self.lock:
+            records = (self.api_calls, self.checks, self.services_discovery)
+            self.api_calls, self.checks, self.services_discovery = {}, {}, {}
+        return records
+
+    def merge_records(self, records: tuple):
+        """merge_records adds the records popped from another Profiler"""
+        api_calls, checks, services_discovery = records
+        with self.lock:
+            for api_call_key, api_call in api_calls.items():
+                merged_api_call = self.api_calls.setdefault(api_call_key, api_call)
+                if merged_api_call is api_call:
+                    continue
+                for field in (
+                    "calls",
+                    "errors",
+                    "retries",
+                    "throttles",
+                    "bytes_received",
+                ):
+                    merged_api_call[field] += api_call[field]
+                merged_latency = merged_api_call["latency_ms"]
+                merged_latency["total"] += api_call["latency_ms"]["total"]
+                merged_latency["min"] = min(
+                    merged_latency["min"], api_call["latency_ms"]["min"]
+                )
+                merged_latency["max"] = max(
+                    merged_latency["max"], api_call["latency_ms"]["max"]
+                )
+                merged_latency["histogram"] = [
+                    merged_count + count
+                    for merged_count, count in zip(
+                        merged_latency["histogram"],
+                        api_call["latency_ms"]["histogram"],
+                    )
+                ]
+            for check_id, check in checks.items():
+                merged_check = self.checks.setdefault(
+                    check_id,
+                    {
+                        "service": check["service"],
+                        "executions": 0,
+                        "duration": 0.0,
+                        "findings": 0,
+                    },
+                )
+                for field in ("executions", "duration", "findings"):
+                    merged_check[field] += check[field]
+            for service, duration in services_discovery.items():
+                self.services_discovery[service] = (
+                    self.services_discovery.get(service, 0.0) + duration
+                )
+
+    def get_profile(self) -> dict:
+        """get_profile returns the machine-readable profile of the scan"""
+        with self.lock:
+            return {
+                "provider": self.provider,
+                "start_timestamp": self.start_timestamp.isoformat(),
+                "duration": perf_counter() - self.start_time,
+                "latency_buckets_ms": list(LATENCY_BUCKETS_MS) + [None],
+                "api_calls": [
+                    {
+                        "service": service,
+                        "operation": operation,
+                        "region": region,
+                        **api_call,
+                        "latency_ms": {
+                            **api_call["latency_ms"],
+                            "histogram": list(api_call["latency_ms"]["histogram"]),
+                        },
+                    }
+                    for (service, operation, region), api_call in sorted(
+                        self.api_calls.items(),
+                        key=lambda api_call: api_call[1]["latency_ms"]["total"],
+                        reverse=True,
+                    )
+                ],
+                "checks": [
+                    {"check_id": check_id, **check}
+                    for check_id, check in sorted(
+                        self.checks.items(),
+                        key=lambda check: check[1]["duration"],
+                        reverse=True,
+                    )
+                ],
+                "services_discovery": [
+                    {"service": service, "duration": duration}
+                    for service, duration in sorted(
+                        self.services_discovery.items(),
+                        key=lambda service: service[1],
+                        reverse=True,
+                    )
+                ],
+            }
+
+    def get_collapsed_stacks(self) -> list:
+        """
+        get_collapsed_stacks returns the profile as flamegraph collapsed stacks, one "frame;frame;... milliseconds" line each
+
+        The API calls run concurrently, so their stacks hold the latency added over all the threads instead of the wall time.
+        """
+        with self.lock:
+            stacks = [
+                f"prowler;discovery;{service} {round(duration * 1000)}"
+                for service, duration in self.services_discovery.items()
+            ]
+            stacks.extend(
+                f"prowler;checks;{check['service']};{check_id} {round(check['duration'] * 1000)}"
+                for check_id, check in self.checks.items()
+            )
+            stacks.extend(
+                f"prowler;api_calls;{self.provider};{service};{operation};{region} {round(api_call['latency_ms']['total'])}"
+                for (service, operation, region), api_call in self.api_calls.items()
+            )
+        return stacks
+
+    def write(self, output_directory: str, output_filename: str) -> list:
+        """write writes the profile as JSON and as flamegraph collapsed stacks next to the outputs, returning the files written"""
+        profile_files = []
+        try:
+            profile_file = (
+                f"{output_directory}/{output_filename}{profile_json_file_suffix}"
+            )
+            with open_file(profile_file, "w") as file:
+                json.dump(self.get_profile(), file, indent=4)
+            profile_files.append(profile_file)
+
+            collapsed_file = (
+                f"{output_directory}/{output_filename}{profile_collapsed_file_suffix}"
+            )
+            with open_file(collapsed_file, "w") as file:
+                file.write("\n".join(self.get_collapsed_stacks()) + "\n")
+            profile_files.append(collapsed_file)
+        except Exception as error:
+            logger.error(
+                f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
+        return profile_files
+
+
+# Process-wide Profiler, only set with --profile-scan
+profiler = None
+
+
+def get_profiler() -> Optional[Profiler]:
+    """get_profiler returns the process-wide Profiler, or None if the scan is not profiled"""
+    return profiler
+
+
+def set_profiler(provider: str) -> Profiler:
+    """set_profiler enables the profiling of the scan with a process-wide Profiler"""
+    global profiler
+    profiler = Profiler(provider)
+    return profiler
@@ -1,13 +1,89 @@
+import re
+from typing import Any, Union
+
 from prowler.lib.logger import logger
 
+# The ARNs are split by ":" and "/", keeping the delimiters as parts
+ARN_DELIMITERS = re.compile(r"([:/])")
+
+
+class Resource_Filter:
+    """The Resource_Filter class indexes the resources to audit (e.g. --resource-arn or --resource-tags) once per scan:
+    - resources: hash set with the resources to audit and their names or IDs, e.g. test_bucket for arn:aws:s3:::test_bucket
+    - arn_prefixes: prefix trie of the ARN parts to match a parent resource, e.g. arn:aws:s3:::test_bucket for arn:aws:s3:::test_bucket/key
+    With substring_match it keeps the behaviour of matching any substring of the resources to audit.
+    """
+
+    def __init__(self, audit_resources: list, substring_match: bool = False):
+        self.audit_resources = audit_resources
+        self.substring_match = substring_match
+        self.resources = set()
+        self.arn_prefixes = {}
+        if substring_match:
+            self.audit_resources_string = str(audit_resources)
+        else:
+            for resource in audit_resources or []:
+                self.add_resource(resource)
+
+    def __bool__(self):
+        return bool(self.audit_resources)
+
+    def add_resource(self, resource: str):
+        """add_resource indexes the resource, its name or ID and its ARN prefixes"""
+        self.resources.add(resource)
+        arn_parts = ARN_DELIMITERS.split(resource)
+        # Name or ID of the resource, e.g. d-1234567890 for arn:aws:ds:us-east-1:123456789012:directory/d-1234567890
+        self.resources.add(arn_parts[-1])
+        # Resource part of the ARN, e.g. user/test_user for arn:aws:iam::123456789012:user/test_user
+        arn_fields = resource.split(":", 5)
+        if len(arn_fields) == 6:
+            self.resources.add(arn_fields[5])
+        node = self.arn_prefixes
+        for arn_part in arn_parts:
+            node = node.setdefault(arn_part, {})
 
-def is_resource_filtered(resource: str, audit_resources: list) -> bool:
+    def is_resource_filtered(self, resource: str) -> bool:
+        """is_resource_filtered returns True if the resource is one of the resources to audit, its name or ID or one of its ARN prefixes"""
+        if self.substring_match:
+            return resource in self.audit_resources_string
+        if resource in self.resources:
+            return True
+        node = self.arn_prefixes
+        for arn_part in ARN_DELIMITERS.split(resource):
+            node = node.get(arn_part)
+            if node is None:
+                return False
+        return True
+
+
+def get_resource_filter(audit_info: Any) -> Resource_Filter:
+    """get_resource_filter returns the Resource_Filter of the audit_info, building it again with the same matching if audit_resources changed"""
+    resource_filter = getattr(audit_info, "audit_resources_filter", None)
+    if not isinstance(resource_filter, Resource_Filter):
+        resource_filter = Resource_Filter(audit_info.audit_resources)
+        audit_info.audit_resources_filter = resource_filter
+    elif resource_filter.audit_resources is not audit_info.audit_resources:
+        resource_filter = Resource_Filter(
+            audit_info.audit_resources,
+            substring_match=resource_filter.substring_match,
+        )
+        audit_info.audit_resources_filter = resource_filter
+    return resource_filter
+
+
+def is_resource_filtered(
+    resource: str, audit_resources: Union[list, Resource_Filter]
+) -> bool:
     """
     Check if the resource passed as argument is present in the audit_resources.
 
+    The audit_resources can be a Resource_Filter or a list, which is matched by substring.
+
     Returns True if it is filtered and False if it does not match the input filters
     """
     try:
+        if isinstance(audit_resources, Resource_Filter):
+            return audit_resources.is_resource_filtered(resource)
         if resource in str(audit_resources):
             return True
         return False
@@ -0,0 +1,171 @@
+import json
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from hashlib import sha256
+from io import StringIO
+from os import cpu_count
+from typing import Optional
+
+from detect_secrets import SecretsCollection
+from detect_secrets.__version__ import VERSION as detect_secrets_version
+from detect_secrets.core.plugins.util import get_mapping_from_secret_type_to_class
+from detect_secrets.core.scan import _is_filtered_out, _process_line_based_plugins
+from detect_secrets.settings import (
+    cache_bust,
+    configure_settings_from_baseline,
+    get_filters,
+    get_plugins,
+)
+from detect_secrets.transformers import get_transformed_file
+
+from prowler.config.config import cache_directory
+from prowler.lib.logger import logger
+
+# Name of the in-memory payloads without a file name, with no extension like the temporary files they replace
+SECRETS_PAYLOAD_NAME = "data"
+# Number of distinct payloads from which a batch is scanned across a process pool
+SECRETS_PROCESS_POOL_THRESHOLD = 64
+
+# Directory of the secrets found by previous scans, by the content hash of what was scanned
+secrets_cache_directory = os.path.join(cache_directory, "secrets")
+
+# Results of the payloads already scanned, by content hash
+secrets_scan_results = {}
+
+
+@lru_cache(maxsize=None)
+def init_secrets_plugins() -> int:
+    """init_secrets_plugins enables once per process all the detect-secrets plugins and default filters, like default_settings, and returns the number of plugins"""
+    cache_bust()
+    settings = configure_settings_from_baseline(
+        {
+            "plugins_used": [
+                {"name": plugin_type.__name__}
+                for plugin_type in get_mapping_from_secret_type_to_class().values()
+            ]
+        }
+    )
+    # The payloads are scanned in memory, so there is no file to check it exists
+    settings.disable_filters("detect_secrets.filters.common.is_invalid_file")
+    get_filters.cache_clear()
+    return len(get_plugins())
+
+
+def get_payload_hash(data: str, filename: str = SECRETS_PAYLOAD_NAME) -> str:
+    """get_payload_hash returns the content hash of the payload, with the file name since it selects the detect-secrets transformers and filters"""
+    return sha256(f"{filename}\0{data}".encode("utf-8", "surrogatepass")).hexdigest()
+
+
+def _scan_payload(payload: tuple) -> Optional[list]:
+    """_scan_payload returns the secrets found in the (data, filename) payload like SecretsCollection.scan_file, reading the lines from memory instead of from a file"""
+    data, filename = payload
+    init_secrets_plugins()
+    if _is_filtered_out(required_filter_parameters=["filename"], filename=filename):
+        return None
+    secrets = SecretsCollection()
+    for use_eager_transformers in (False, True):
+        payload_file = StringIO(data)
+        payload_file.name = filename
+        lines = get_transformed_file(payload_file, use_eager_transformers)
+        if not lines:
+            # The eager transformers are only tried if the others did not find secrets
+            if use_eager_transformers:
+                break
+            lines = payload_file.readlines()
+        for secret in _process_line_based_plugins(
+            lines=list(enumerate(lines, start=1)), filename=filename
+        ):
+            secrets[filename].add(secret)
+        if secrets:
+            break
+    return secrets.json().get(filename)
+
+
+def scan_secrets_batch(payloads: list, processes: Optional[int] = None) -> list:
+    """
+    scan_secrets_batch returns the secrets found in each payload, or None if there are no secrets, like detect_secrets_scan.
+
+    The payloads are strings or (data, filename) tuples, scanned in memory only once per content hash,
+    across a process pool if there are more than SECRETS_PROCESS_POOL_THRESHOLD new distinct payloads.
+    """
+    payloads = [
+        (payload, SECRETS_PAYLOAD_NAME) if isinstance(payload, str) else payload
+        for payload in payloads
+    ]
+    payload_hashes = [get_payload_hash(*payload) for payload in payloads]
+    new_payloads = {
+        payload_hash: payload
+        for payload_hash, payload in zip(payload_hashes, payloads)
+        if payload_hash not in secrets_scan_results
+    }
+    if new_payloads:
+        try:
+            if len(new_payloads) > SECRETS_PROCESS_POOL_THRESHOLD:
+                with ProcessPoolExecutor(
+                    max_workers=processes or cpu_count(),
+                    initializer=init_secrets_plugins,
+                ) as executor:
+                    results = executor.map(
+                        _scan_payload, new_payloads.values(), chunksize=16
+                    )
+                    secrets_scan_results.update(zip(new_payloads.keys(), results))
+            else:
+                for payload_hash, payload in new_payloads.items():
+                    secrets_scan_results[payload_hash] = _scan_payload(payload)
+        except Exception as error:
+            logger.error(
+                f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
+            # Scan the payloads left in this process if the process pool failed
+            for payload_hash, payload in new_payloads.items():
+                if payload_hash not in secrets_scan_results:
+                    secrets_scan_results[payload_hash] = _scan_payload(payload)
+    return [secrets_scan_results[payload_hash] for payload_hash in payload_hashes]
+
+
+def scan_secrets(data: str, filename: str = SECRETS_PAYLOAD_NAME) -> Optional[list]:
+    """scan_secrets returns the secrets found in the data, or None if there are no secrets"""
+    return scan_secrets_batch([(data, filename)])[0]
+
+
+def get_secrets_cache_file(key: str) -> str:
+    """get_secrets_cache_file returns the path of the secrets found for the key in the cache directory, named by its hash since keys like the Lambda CodeSha256 are base64"""
+    return os.path.join(
+        secrets_cache_directory, f"{sha256(key.encode()).hexdigest()}.json"
+    )
+
+
+def read_secrets_cache(key: str) -> Optional[dict]:
+    """read_secrets_cache returns the secrets found by a previous scan for the key, e.g. a Lambda CodeSha256, or None if it is missing or was scanned by another detect-secrets version"""
+    try:
+        with open(get_secrets_cache_file(key)) as secrets_cache_file:
+            secrets_cache = json.load(secrets_cache_file)
+        if secrets_cache.get("detect_secrets_version") == detect_secrets_version:
+            return secrets_cache["secrets"]
+    except FileNotFoundError:
+        pass
+    except Exception as error:
+        logger.debug(
+            f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+        )
+    return None
+
+
+def write_secrets_cache(key: str, secrets: dict):
+    """write_secrets_cache stores the secrets found for the key in the cache directory, replacing them atomically"""
+    try:
+        os.makedirs(secrets_cache_directory, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            "w", dir=secrets_cache_directory, suffix=".tmp", delete=False
+        ) as secrets_cache_file:
+            json.dump(
+                {"detect_secrets_version": detect_secrets_version, "secrets": secrets},
+                secrets_cache_file,
+            )
+        os.replace(secrets_cache_file.name, get_secrets_cache_file(key))
+    except Exception as error:
+        logger.warning(
+            f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+        )
@@ -1,7 +1,5 @@
 import json
-import os
 import sys
-import tempfile
 from datetime import datetime
 from hashlib import sha512
 from io import TextIOWrapper
@@ -9,16 +7,14 @@ from ipaddress import ip_address
 from os.path import exists
 from time import mktime
 
-from detect_secrets import SecretsCollection
-from detect_secrets.settings import default_settings
-
 from prowler.lib.logger import logger
+from prowler.lib.secrets.secrets import scan_secrets
 
 
-def open_file(input_file: str, mode: str = "r") -> TextIOWrapper:
-    """open_file returns a handler to the file using the specified mode."""
+def open_file(input_file: str, mode: str = "r", buffering: int = -1) -> TextIOWrapper:
+    """open_file returns a handler to the file using the specified mode and buffer size."""
     try:
-        f = open(input_file, mode)
+        f = open(input_file, mode, buffering)
     except OSError as os_error:
         if os_error.strerror == "Too many open files":
             logger.critical(
@@ -70,20 +66,8 @@ def hash_sha512(string: str) -> str:
 
 
 def detect_secrets_scan(data):
-    temp_data_file = tempfile.NamedTemporaryFile(delete=False)
-    temp_data_file.write(bytes(data, encoding="raw_unicode_escape"))
-    temp_data_file.close()
-
-    secrets = SecretsCollection()
-    with default_settings():
-        secrets.scan_file(temp_data_file.name)
-    os.remove(temp_data_file.name)
-
-    detect_secrets_output = secrets.json()
-    if detect_secrets_output:
-        return detect_secrets_output[temp_data_file.name]
-    else:
-        return None
+    """detect_secrets_scan returns the secrets found in the data, or None if there are no secrets"""
+    return scan_secrets(data)
 
 
 def validate_ip_address(ip_string):
@@ -1,5 +1,6 @@
 import re
 import sys
+from dataclasses import dataclass, field
 from typing import Any
 
 import yaml
@@ -115,15 +116,138 @@ def parse_allowlist_file(audit_info, allowlist_file):
         sys.exit(1)
 
 
+@dataclass
+class Allowlist_Entry:
+    """Allowlist entry of a check with its regular expressions compiled"""
+
+    check: str
+    check_pattern: re.Pattern
+    regions: list
+    resources: list
+    tags: list
+    # Compiled regular expressions of each excepted field, None if there are no Exceptions
+    exceptions: dict = None
+
+
+@dataclass
+class Allowlist_Account:
+    """Allowlist entries of an account, in the same order as in the Allowlist"""
+
+    entries: list
+    # Indexes of the entries with Exceptions
+    exceptions: list
+    # Indexes of the entries matching each check, filled on demand
+    checks: dict = field(default_factory=dict)
+
+
+@dataclass
+class Allowlist_Index:
+    """Allowlist compiled once to evaluate the findings"""
+
+    accounts: dict
+
+
+def compile_allowlist_items(items: list) -> list:
+    """compile_allowlist_items returns the regular expressions of the items, combined into a single alternation if possible"""
+    patterns = [".*" if item == "*" else item for item in items]
+    # Named groups, backreferences and inline flags are only valid in their own pattern
+    if len(patterns) > 1 and not any(
+        re.search(r"\\\d|\(\?P[<=]|\(\?[aiLmsux]", pattern) for pattern in patterns
+    ):
+        try:
+            return [re.compile("|".join(f"(?:{pattern})" for pattern in patterns))]
+        except re.error:
+            # Any other pattern that is only valid on its own is compiled separately
+            pass
+    return [re.compile(pattern) for pattern in patterns]
+
+
+def compile_allowlist(allowlist: dict) -> Allowlist_Index:
+    """compile_allowlist returns the Allowlist_Index of the given allowlist, keeping the accounts and checks order"""
+    try:
+        accounts = {}
+        for account, account_allowlist in allowlist["Accounts"].items():
+            entries = []
+            exceptions = []
+            for allowlisted_check, allowlisted_check_info in account_allowlist[
+                "Checks"
+            ].items():
+                # map lambda to awslambda
+                allowlisted_check = re.sub("^lambda", "awslambda", allowlisted_check)
+                excepted_items = allowlisted_check_info.get("Exceptions")
+                if excepted_items:
+                    exceptions.append(len(entries))
+                    excepted_items = {
+                        excepted_field: compile_allowlist_items(
+                            excepted_items.get(excepted_field, [])
+                        )
+                        for excepted_field in (
+                            "Accounts",
+                            "Regions",
+                            "Resources",
+                            "Tags",
+                        )
+                    }
+                # We need to set the allowlisted_tags if None, "" or [], so the falsy helps
+                allowlisted_tags = allowlisted_check_info.get("Tags") or ["*"]
+                entries.append(
+                    Allowlist_Entry(
+                        check=allowlisted_check,
+                        check_pattern=(
+                            re.compile(allowlisted_check)
+                            if allowlisted_check != "*"
+                            else None
+                        ),
+                        regions=compile_allowlist_items(
+                            allowlisted_check_info.get("Regions") or []
+                        ),
+                        resources=compile_allowlist_items(
+                            allowlisted_check_info.get("Resources") or []
+                        ),
+                        tags=compile_allowlist_items(allowlisted_tags),
+                        exceptions=excepted_items,
+                    )
+                )
+            accounts[account] = Allowlist_Account(
+                entries=entries, exceptions=exceptions
+            )
+        return Allowlist_Index(accounts=accounts)
+    except Exception as error:
+        logger.critical(
+            f"{error.__class__.__name__} -- {error}[{error.__traceback__.tb_lineno}]"
+        )
+        sys.exit(1)
+
+
+def get_allowlist_index(allowlist) -> Allowlist_Index:
+    """get_allowlist_index returns the Allowlist_Index of the allowlist, compiling it only the first time"""
+    if isinstance(allowlist, Allowlist_Index):
+        return allowlist
+    # The allowlist is kept in the cache so its id cannot be reused by another dict
+    cached_allowlist, allowlist_index = allowlist_index_cache.get(
+        id(allowlist), (None, None)
+    )
+    if cached_allowlist is not allowlist:
+        allowlist_index = compile_allowlist(allowlist)
+        allowlist_index_cache[id(allowlist)] = (allowlist, allowlist_index)
+    return allowlist_index
+
+
+# Allowlist_Index of each parsed allowlist
+allowlist_index_cache = {}
+
+
 def allowlist_findings(
-    allowlist: dict,
+    allowlist,
     audited_account: str,
     check_findings: [Any],
 ):
+    """allowlist_findings sets to WARNING the status of the allowlisted findings. The allowlist can be the parsed allowlist or its Allowlist_Index"""
+    allowlist_index = get_allowlist_index(allowlist)
     # Check if finding is allowlisted
     for finding in check_findings:
-        if is_allowlisted(
-            allowlist,
+        if is_allowlisted_in_index(
+            allowlist_index,
             audited_account,
             finding.check_metadata.CheckID,
             finding.region,
@@ -134,6 +258,119 @@ def allowlist_findings(
     return check_findings
 
 
+def is_allowlisted_in_index(
+    allowlist_index: Allowlist_Index,
+    audited_account: str,
+    check: str,
+    finding_region: str,
+    finding_resource: str,
+    finding_tags,
+) -> bool:
+    """is_allowlisted_in_index returns the same as is_allowlisted but using the Allowlist_Index"""
+    try:
+        # We always check all the accounts present in the allowlist
+        # if one allowlists the finding we set the finding as allowlisted
+        for account, allowlist_account in allowlist_index.accounts.items():
+            if account == audited_account or account == "*":
+                if is_allowlisted_in_account(
+                    allowlist_account,
+                    audited_account,
+                    check,
+                    finding_region,
+                    finding_resource,
+                    finding_tags,
+                ):
+                    return True
+        return False
+    except Exception as error:
+        logger.critical(
+            f"{error.__class__.__name__} -- {error}[{error.__traceback__.tb_lineno}]"
+        )
+        sys.exit(1)
+
+
+def is_allowlisted_in_account(
+    allowlist_account: Allowlist_Account,
+    audited_account: str,
+    check: str,
+    finding_region: str,
+    finding_resource: str,
+    finding_tags,
+) -> bool:
+    """is_allowlisted_in_account returns the same as is_allowlisted_in_check but only evaluating the entries matching the check"""
+    if check not in allowlist_account.checks:
+        # If there is a *, it affects to all checks
+        allowlist_account.checks[check] = [
+            index
+            for index, entry in enumerate(allowlist_account.entries)
+            if entry.check == "*"
+            or entry.check == check
+            or entry.check_pattern.search(check)
+        ]
+    exceptions = iter(allowlist_account.exceptions)
+    next_exception = next(exceptions, None)
+    for index in allowlist_account.checks[check]:
+        # The entries are evaluated in order until one of them excepts the finding,
+        # so the exceptions of the previous entries and the entry itself are checked first
+        while next_exception is not None and next_exception <= index:
+            if is_excepted_in_entry(
+                allowlist_account.entries[next_exception],
+                audited_account,
+                finding_region,
+                finding_resource,
+                finding_tags,
+            ):
+                return False
+            next_exception = next(exceptions, None)
+        entry = allowlist_account.entries[index]
+        if (
+            match_allowlist_items(entry.regions, finding_region)
+            and match_allowlist_items(entry.tags, finding_tags)
+            and match_allowlist_items(entry.resources, finding_resource)
+        ):
+            return True
+    return False
+
+
+def is_excepted_in_entry(
+    entry: Allowlist_Entry,
+    audited_account: str,
+    finding_region: str,
+    finding_resource: str,
+    finding_tags,
+) -> bool:
+    """is_excepted_in_entry returns the same as is_excepted but using the compiled Exceptions of the entry"""
+    excepted_accounts = entry.exceptions["Accounts"]
+    excepted_regions = entry.exceptions["Regions"]
+    excepted_resources = entry.exceptions["Resources"]
+    excepted_tags = entry.exceptions["Tags"]
+    is_account_excepted = match_allowlist_items(excepted_accounts, audited_account)
+    is_region_excepted = match_allowlist_items(excepted_regions, finding_region)
+    is_resource_excepted = match_allowlist_items(excepted_resources, finding_resource)
+    is_tag_excepted = match_allowlist_items(excepted_tags, finding_tags)
+    return (
+        (
+            is_account_excepted
+            or is_region_excepted
+            or is_resource_excepted
+            or is_tag_excepted
+        )
+        and (is_account_excepted or not excepted_accounts)
+        and (is_region_excepted or not excepted_regions)
+        and (is_resource_excepted or not excepted_resources)
+        and (is_tag_excepted or not excepted_tags)
+    )
+
+
+def match_allowlist_items(patterns: list, finding_items) -> bool:
+    """match_allowlist_items returns the same as __is_item_matched__ but using the compiled regular expressions"""
+    if patterns and (finding_items or finding_items == ""):
+        for pattern in patterns:
+            if pattern.search(finding_items):
+                return True
+    return False
+
+
 def is_allowlisted(
     allowlist: dict,
     audited_account: str,
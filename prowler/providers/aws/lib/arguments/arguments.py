@@ -4,6 +4,10 @@ from re import fullmatch, search
 from prowler.providers.aws.aws_provider import get_aws_available_regions
 from prowler.providers.aws.config import ROLE_SESSION_NAME
 from prowler.providers.aws.lib.arn.arn import arn_type
+from prowler.providers.aws.lib.organizations.organization_accounts import (
+    ORGANIZATION_ACCOUNTS_WORKERS,
+)
+from prowler.providers.aws.lib.service.scheduler import MAX_CONCURRENT_REQUESTS
 
 
 def init_parser(self):
@@ -80,6 +84,18 @@ def init_parser(self):
         nargs="?",
         help="Specify AWS Organizations management role ARN to be assumed, to get Organization metadata",
     )
+    aws_orgs_subparser.add_argument(
+        "--organization-accounts",
+        action="store_true",
+        help="Scan all the active accounts of the AWS Organization in a single process, assuming in each account the -R/--role role name or the role with the same name of the -R/--role ARN. The accounts are listed with the -O/--organizations-role or the original credentials",
+    )
+    aws_orgs_subparser.add_argument(
+        "--organization-accounts-workers",
+        nargs="?",
+        default=ORGANIZATION_ACCOUNTS_WORKERS,
+        type=int,
+        help=f"Set the number of accounts scanned concurrently with --organization-accounts (Default: {ORGANIZATION_ACCOUNTS_WORKERS})",
+    )
     # AWS Security Hub
     aws_security_hub_subparser = aws_parser.add_argument_group("AWS Security Hub")
     aws_security_hub_subparser.add_argument(
@@ -159,6 +175,11 @@ def init_parser(self):
         default=None,
         help="Scan only resources with specific AWS Resource ARNs, e.g., arn:aws:iam::012345678910:user/test arn:aws:ec2:us-east-1:123456789012:vpc/vpc-12345678",
     )
+    aws_based_scans_subparser.add_argument(
+        "--resource-substring-match",
+        action="store_true",
+        help="Match the resources found with any substring of the --resource-tags or --resource-arn resources, instead of their ARNs, ARN prefixes, names or IDs",
+    )
 
     # Boto3 Config
     boto3_config_subparser = aws_parser.add_argument_group("Boto3 Config")
@@ -169,6 +190,13 @@ def init_parser(self):
         type=int,
         help="Set the maximum attemps for the Boto3 standard retrier config (Default: 3)",
     )
+    boto3_config_subparser.add_argument(
+        "--aws-max-concurrent-requests",
+        nargs="?",
+        default=None,
+        type=int,
+        help=f"Set the maximum number of in-flight AWS API requests shared by all the services (Default: {MAX_CONCURRENT_REQUESTS})",
+    )
 
     # Ignore Unused Services
     ignore_unused_services_subparser = aws_parser.add_argument_group(
@@ -205,6 +233,33 @@ def validate_arguments(arguments: Namespace) -> tuple[bool, str]:
                 "To use -I/--external-id, -T/--session-duration or --role-session-name options -R/--role option is needed",
             )
 
+    # Handle if the maximum concurrent requests is not valid
+    if (
+        arguments.aws_max_concurrent_requests is not None
+        and arguments.aws_max_concurrent_requests < 1
+    ):
+        return (False, "--aws-max-concurrent-requests must be greater than 0")
+
+    # Handle if the organization accounts scan options are valid
+    if getattr(arguments, "organization_accounts", False):
+        if not arguments.role:
+            return (
+                False,
+                "To use --organization-accounts option -R/--role option is needed",
+            )
+        if (
+            arguments.mfa
+            or arguments.security_hub
+            or arguments.quick_inventory
+            or arguments.resource_tags
+        ):
+            return (
+                False,
+                "--organization-accounts option cannot be used with --mfa, -S/--security-hub, -i/--quick-inventory or --resource-tags options",
+            )
+        if arguments.organization_accounts_workers < 1:
+            return (False, "--organization-accounts-workers must be greater than 0")
+
     return (True, "")
 
 
@@ -55,3 +55,4 @@ class AWS_Audit_Info:
     audit_config: Optional[dict] = None
     ignore_unused_services: bool = False
     enabled_regions: set = field(default_factory=set)
+    audit_resources_filter: Optional[Any] = None
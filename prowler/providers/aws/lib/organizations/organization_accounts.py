@@ -0,0 +1,256 @@
+import multiprocessing
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from copy import copy
+
+from alive_progress import alive_bar
+from boto3 import session
+from colorama import Style
+
+from prowler.config.config import orange_color
+from prowler.lib.check.check import execute_checks
+from prowler.lib.logger import logger
+from prowler.lib.outputs.file_descriptors import get_output_writers
+from prowler.lib.outputs.outputs import report
+from prowler.lib.profiler.profiler import get_profiler
+from prowler.providers.aws.aws_provider import (
+    AWS_Provider,
+    assume_role,
+    get_aws_enabled_regions,
+)
+from prowler.providers.aws.lib.arn.arn import parse_iam_credentials_arn
+from prowler.providers.aws.lib.audit_info.models import (
+    AWS_Assume_Role,
+    AWS_Audit_Info,
+    AWS_Credentials,
+)
+from prowler.providers.aws.lib.organizations.organizations import (
+    get_organization_accounts,
+)
+from prowler.providers.aws.lib.service.scheduler import (
+    get_api_scheduler,
+    set_api_scheduler,
+)
+from prowler.providers.common.models import Audit_Metadata
+
+# Default number of accounts scanned concurrently with --organization-accounts
+ORGANIZATION_ACCOUNTS_WORKERS = 4
+
+# Scan shared by the workers, which inherit it when they are forked so the checks, allowlist and audit info are loaded once
+organization_accounts_scan = {}
+
+
+def get_organization_account_role(role: str, partition: str, account_id: str) -> str:
+    """get_organization_account_role returns the ARN of the role to assume in the account from the -R/--role role name or ARN"""
+    role_name = role
+    if role.startswith("arn:"):
+        role_name = parse_iam_credentials_arn(role).resource
+    return f"arn:{partition}:iam::{account_id}:role/{role_name}"
+
+
+def set_organization_account(
+    audit_info: AWS_Audit_Info, account_id: str
+) -> AWS_Audit_Info:
+    """set_organization_account sets in the audit info the organization account to audit and the role assumed in it"""
+    scan = organization_accounts_scan
+    audit_info.audited_account = account_id
+    audit_info.audited_account_arn = (
+        f"arn:{audit_info.audited_partition}:iam::{account_id}:root"
+    )
+    audit_info.organizations_metadata = scan["organization_accounts"][account_id]
+    audit_info.assumed_role_info = copy(scan["assumed_role_info"])
+    audit_info.assumed_role_info.role_arn = get_organization_account_role(
+        scan["role"], audit_info.audited_partition, account_id
+    )
+    return audit_info
+
+
+def init_organization_accounts_worker():
+    """init_organization_accounts_worker creates again the pool of the API Scheduler, since its threads are not forked"""
+    api_scheduler = get_api_scheduler()
+    set_api_scheduler(
+        max_concurrent_requests=api_scheduler.max_concurrent_requests,
+        max_concurrent_requests_per_region=api_scheduler.max_concurrent_requests_per_region,
+    )
+    # The records forked from the scan are already in its Profiler
+    profiler = get_profiler()
+    if profiler:
+        profiler.pop_records()
+
+
+def scan_organization_account(account_id: str) -> tuple:
+    """scan_organization_account assumes the role in the account and executes the checks, returning the account ID and its findings"""
+    scan = organization_accounts_scan
+    audit_info = scan["audit_info"]
+    try:
+        set_organization_account(audit_info, account_id)
+        # The session of the account refreshes its credentials assuming the account's role again
+        audit_info.credentials = None
+        aws_provider = AWS_Provider(audit_info)
+        assumed_role_response = assume_role(
+            aws_provider.aws_session,
+            aws_provider.role_info,
+            scan["sts_endpoint_region"],
+        )
+        audit_info.credentials = AWS_Credentials(
+            aws_access_key_id=assumed_role_response["Credentials"]["AccessKeyId"],
+            aws_session_token=assumed_role_response["Credentials"]["SessionToken"],
+            aws_secret_access_key=assumed_role_response["Credentials"][
+                "SecretAccessKey"
+            ],
+            expiration=assumed_role_response["Credentials"]["Expiration"],
+        )
+        audit_info.audit_session = aws_provider.set_session(audit_info)
+        audit_info.enabled_regions = get_aws_enabled_regions(audit_info)
+    # assume_role exits if the role cannot be assumed, which must not stop the other accounts
+    except (Exception, SystemExit) as error:
+        logger.error(
+            f"{account_id} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+        )
+        return account_id, []
+
+    # The service clients are module variables, so they are created again for the account when the checks import them
+    for module in list(sys.modules):
+        if module.startswith("prowler.providers.aws.services."):
+            del sys.modules[module]
+
+    return account_id, execute_checks(
+        scan["checks_to_execute"],
+        "aws",
+        audit_info,
+        scan["audit_output_options"],
+        scan["custom_checks_metadata"],
+        scan["parallel_checks"],
+    )
+
+
+def scan_organization_account_in_worker(account_id: str) -> tuple:
+    """scan_organization_account_in_worker scans the account in a worker process, returning also the Profiler records of the account to the scan"""
+    account_id, account_findings = scan_organization_account(account_id)
+    profiler = get_profiler()
+    return account_id, account_findings, profiler.pop_records() if profiler else None
+
+
+def execute_organization_accounts_checks(
+    checks_to_execute: list,
+    audit_info: AWS_Audit_Info,
+    audit_output_options,
+    custom_checks_metadata,
+    arguments: dict,
+) -> list:
+    """
+    execute_organization_accounts_checks executes the checks in all the active accounts of the AWS Organization
+
+    The accounts are scanned by a pool of forked workers, which share the checks, allowlist and audit info already
+    loaded. Each worker assumes the -R/--role role in its account, and its findings are reported here to the outputs
+    of the scan with the audit info of the account.
+    """
+    sts_endpoint_region = arguments.get("sts_endpoint_region")
+    assumed_role_info = AWS_Assume_Role(
+        role_arn=None,
+        session_duration=arguments.get("session_duration"),
+        external_id=arguments.get("external_id"),
+        mfa_enabled=False,
+        role_session_name=arguments.get("role_session_name"),
+    )
+
+    # List the accounts with the -O/--organizations-role or the original credentials
+    organizations_session = audit_info.original_session
+    if arguments.get("organizations_role"):
+        organizations_role_info = copy(assumed_role_info)
+        organizations_role_info.role_arn = arguments.get("organizations_role")
+        assumed_credentials = assume_role(
+            audit_info.original_session, organizations_role_info, sts_endpoint_region
+        )
+        organizations_session = session.Session(
+            aws_access_key_id=assumed_credentials["Credentials"]["AccessKeyId"],
+            aws_secret_access_key=assumed_credentials["Credentials"]["SecretAccessKey"],
+            aws_session_token=assumed_credentials["Credentials"]["SessionToken"],
+            region_name=audit_info.profile_region,
+        )
+    organization_accounts = get_organization_accounts(organizations_session)
+
+    # The workers only return the findings, the outputs of the scan are written here
+    account_output_options = copy(audit_output_options)
+    account_output_options.output_modes = []
+    account_output_options.verbose = False
+    account_output_options.only_logs = True
+    organization_accounts_scan.update(
+        audit_info=audit_info,
+        organization_accounts=organization_accounts,
+        role=arguments.get("role"),
+        assumed_role_info=assumed_role_info,
+        sts_endpoint_region=sts_endpoint_region,
+        checks_to_execute=checks_to_execute,
+        audit_output_options=account_output_options,
+        custom_checks_metadata=custom_checks_metadata,
+        parallel_checks=arguments.get("parallel_checks"),
+    )
+    if audit_output_options.output_modes:
+        get_output_writers(audit_output_options, audit_info)
+
+    all_findings = []
+    workers = (
+        arguments.get("organization_accounts_workers") or ORGANIZATION_ACCOUNTS_WORKERS
+    )
+
+    def report_account_findings(account_id: str, account_findings: list):
+        account_audit_info = set_organization_account(copy(audit_info), account_id)
+        report(account_findings, audit_output_options, account_audit_info)
+        all_findings.extend(account_findings)
+
+    accounts_num = len(organization_accounts)
+    if not audit_output_options.only_logs:
+        print(
+            f"{Style.BRIGHT}Scanning {accounts_num} accounts of the AWS Organization, please wait...{Style.RESET_ALL}\n"
+        )
+    with alive_bar(
+        total=accounts_num,
+        ctrl_c=False,
+        bar="blocks",
+        spinner="classic",
+        stats=False,
+        enrich_print=False,
+        disable=audit_output_options.only_logs,
+    ) as bar:
+        bar.title = f"-> Scanning with {orange_color}{workers}{Style.RESET_ALL} parallel accounts"
+        if workers > 1 and "fork" in multiprocessing.get_all_start_methods():
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("fork"),
+                initializer=init_organization_accounts_worker,
+            ) as executor:
+                futures = {
+                    executor.submit(
+                        scan_organization_account_in_worker, account_id
+                    ): account_id
+                    for account_id in organization_accounts
+                }
+                for future in as_completed(futures):
+                    try:
+                        account_id, account_findings, profiler_records = future.result()
+                        if profiler_records:
+                            get_profiler().merge_records(profiler_records)
+                        report_account_findings(account_id, account_findings)
+                    except Exception as error:
+                        logger.error(
+                            f"{futures[future]} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                        )
+                    bar()
+        else:
+            # The accounts are scanned in this process, so its audit info is restored afterwards
+            original_audit_info = copy(audit_info)
+            try:
+                for account_id in organization_accounts:
+                    report_account_findings(*scan_organization_account(account_id))
+                    bar()
+            finally:
+                audit_info.__dict__.update(original_audit_info.__dict__)
+
+    audit_info.audit_metadata = Audit_Metadata(
+        services_scanned=len({check.split("_")[0] for check in checks_to_execute}),
+        expected_checks=checks_to_execute,
+        completed_checks=len(checks_to_execute),
+        audit_progress=100,
+    )
+    return all_findings
@@ -38,3 +38,33 @@ def get_organizations_metadata(
             account_details_tags=account_details_tags,
         )
         return organizations_info
+
+
+def get_organization_accounts(organizations_session) -> dict:
+    """get_organization_accounts returns the AWS_Organizations_Info of the active accounts of the organization by account ID"""
+    try:
+        organizations_client = organizations_session.client("organizations")
+        organization_accounts = {}
+        for page in organizations_client.get_paginator("list_accounts").paginate():
+            for account in page["Accounts"]:
+                if account["Status"] != "ACTIVE":
+                    continue
+                # Convert Tags dictionary to String
+                account_details_tags = ""
+                for tags_page in organizations_client.get_paginator(
+                    "list_tags_for_resource"
+                ).paginate(ResourceId=account["Id"]):
+                    for tag in tags_page["Tags"]:
+                        account_details_tags += tag["Key"] + ":" + tag["Value"] + ","
+                organization_accounts[account["Id"]] = AWS_Organizations_Info(
+                    account_details_email=account["Email"],
+                    account_details_name=account["Name"],
+                    account_details_arn=account["Arn"],
+                    account_details_org=account["Arn"].split("/")[1],
+                    account_details_tags=account_details_tags,
+                )
+    except Exception as error:
+        logger.critical(f"{error.__class__.__name__} -- {error}")
+        sys.exit(1)
+    else:
+        return organization_accounts
@@ -3,13 +3,20 @@ from prowler.config.config import (
     html_file_suffix,
     json_asff_file_suffix,
     json_file_suffix,
+    json_lines_file_suffixes,
     json_ocsf_file_suffix,
+    output_compression_file_suffixes,
 )
 from prowler.lib.logger import logger
 
 
 def send_to_s3_bucket(
-    output_filename, output_directory, output_mode, output_bucket_name, audit_session
+    output_filename,
+    output_directory,
+    output_mode,
+    output_bucket_name,
+    audit_session,
+    output_compression=None,
 ):
     try:
         filename = ""
@@ -24,6 +31,8 @@ def send_to_s3_bucket(
             filename = f"{output_filename}{json_ocsf_file_suffix}"
         elif output_mode == "html":
             filename = f"{output_filename}{html_file_suffix}"
+        elif output_mode in json_lines_file_suffixes:
+            filename = f"{output_filename}{json_lines_file_suffixes[output_mode]}{output_compression_file_suffixes.get(output_compression, '')}"
         else:  # Compliance output mode
             filename = f"{output_filename}_{output_mode}{csv_file_suffix}"
 
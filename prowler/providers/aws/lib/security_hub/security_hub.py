@@ -1,3 +1,5 @@
+from concurrent.futures import as_completed
+
 from boto3 import session
 
 from prowler.config.config import timestamp_utc
@@ -5,6 +7,7 @@ from prowler.lib.logger import logger
 from prowler.lib.outputs.json import fill_json_asff
 from prowler.lib.outputs.models import Check_Output_JSON_ASFF
 from prowler.providers.aws.lib.audit_info.models import AWS_Audit_Info
+from prowler.providers.aws.lib.service.scheduler import get_api_scheduler
 
 SECURITY_HUB_INTEGRATION_NAME = "prowler/prowler"
 SECURITY_HUB_MAX_BATCH = 100
@@ -37,15 +40,15 @@ def prepare_security_hub_findings(
         # Get the finding region
         region = finding.region
 
-        # Format the finding in the JSON ASFF format
-        finding_json_asff = fill_json_asff(
-            Check_Output_JSON_ASFF(), audit_info, finding, output_options
-        )
+        # Reuse the JSON ASFF format of the finding rendered for the json-asff output, or format it
+        finding_json_asff = getattr(finding, "json_asff", None)
+        if not finding_json_asff:
+            finding_json_asff = fill_json_asff(
+                Check_Output_JSON_ASFF(), audit_info, finding, output_options
+            ).dict(exclude_none=True)
 
         # Include that finding within their region in the JSON format
-        security_hub_findings_per_region[region].append(
-            finding_json_asff.dict(exclude_none=True)
-        )
+        security_hub_findings_per_region[region].append(finding_json_asff)
 
     return security_hub_findings_per_region
 
@@ -93,24 +96,31 @@ def batch_send_to_security_hub(
 ) -> int:
     """
     send_to_security_hub sends findings to Security Hub and returns the number of findings that were successfully sent.
+
+    The batches of all the regions are sent concurrently through the API Scheduler, backing off the throttled regions.
     """
 
     success_count = 0
     try:
-        # Iterate findings by region
+        findings_batches = []
         for region, findings in security_hub_findings_per_region.items():
             # Send findings to Security Hub
             logger.info(f"Sending findings to Security Hub in the region {region}")
 
-            security_hub_client = session.client("securityhub", region_name=region)
+            security_hub_client = __get_security_hub_client__(session, region)
 
-            success_count = __send_findings_to_security_hub__(
-                findings, region, security_hub_client
+            findings_batches.extend(
+                __submit_findings_to_security_hub__(
+                    findings, region, security_hub_client
+                )
             )
 
+        for findings_batch in as_completed(findings_batches):
+            success_count += findings_batch.result()
+
     except Exception as error:
         logger.error(
-            f"{error.__class__.__name__} -- [{error.__traceback__.tb_lineno}]:{error} in region {region}"
+            f"{error.__class__.__name__} -- [{error.__traceback__.tb_lineno}]:{error}"
         )
     return success_count
 
@@ -121,72 +131,120 @@ def resolve_security_hub_previous_findings(
 ) -> list:
     """
     resolve_security_hub_previous_findings archives all the findings that does not appear in the current execution
+
+    The previous findings of each region are retrieved concurrently, and archived as soon as they are retrieved.
     """
     logger.info("Checking previous findings in Security Hub to archive them.")
     success_count = 0
-    for region in security_hub_findings_per_region.keys():
+    api_scheduler = get_api_scheduler()
+    previous_findings = {}
+    for region, current_findings in security_hub_findings_per_region.items():
         try:
-            current_findings = security_hub_findings_per_region[region]
-            # Get current findings IDs
-            current_findings_ids = []
-            for finding in current_findings:
-                current_findings_ids.append(finding["Id"])
-            # Get findings of that region
-            security_hub_client = audit_info.audit_session.client(
-                "securityhub", region_name=region
+            security_hub_client = __get_security_hub_client__(
+                audit_info.audit_session, region
             )
-            findings_filter = {
-                "ProductName": [{"Value": "Prowler", "Comparison": "EQUALS"}],
-                "RecordState": [{"Value": "ACTIVE", "Comparison": "EQUALS"}],
-                "AwsAccountId": [
-                    {"Value": audit_info.audited_account, "Comparison": "EQUALS"}
-                ],
-                "Region": [{"Value": region, "Comparison": "EQUALS"}],
-            }
-            get_findings_paginator = security_hub_client.get_paginator("get_findings")
-            findings_to_archive = []
-            for page in get_findings_paginator.paginate(Filters=findings_filter):
-                # Archive findings that have not appear in this execution
-                for finding in page["Findings"]:
-                    if finding["Id"] not in current_findings_ids:
-                        finding["RecordState"] = "ARCHIVED"
-                        finding["UpdatedAt"] = timestamp_utc.strftime(
-                            "%Y-%m-%dT%H:%M:%SZ"
-                        )
-
-                        findings_to_archive.append(finding)
+            previous_findings[
+                api_scheduler.submit(
+                    "securityhub",
+                    region,
+                    __get_findings_to_archive__,
+                    # Get current findings IDs
+                    {finding["Id"] for finding in current_findings},
+                    region,
+                    audit_info.audited_account,
+                    security_hub_client,
+                )
+            ] = (region, security_hub_client)
+        except Exception as error:
+            logger.error(
+                f"{error.__class__.__name__} -- [{error.__traceback__.tb_lineno}]:{error} in region {region}"
+            )
+
+    findings_batches = []
+    for findings_to_archive in as_completed(previous_findings):
+        region, security_hub_client = previous_findings[findings_to_archive]
+        try:
+            findings_to_archive = findings_to_archive.result()
             logger.info(f"Archiving {len(findings_to_archive)} findings.")
 
             # Send archive findings to SHub
-            success_count += __send_findings_to_security_hub__(
-                findings_to_archive, region, security_hub_client
+            findings_batches.extend(
+                __submit_findings_to_security_hub__(
+                    findings_to_archive, region, security_hub_client
+                )
             )
         except Exception as error:
             logger.error(
                 f"{error.__class__.__name__} -- [{error.__traceback__.tb_lineno}]:{error} in region {region}"
             )
+
+    for findings_batch in as_completed(findings_batches):
+        success_count += findings_batch.result()
     return success_count
 
 
+def __get_security_hub_client__(session: session.Session, region: str):
+    """Private function __get_security_hub_client__ returns the Security Hub client of the region, registered in the API Scheduler to back off when it is throttled"""
+    security_hub_client = session.client("securityhub", region_name=region)
+    get_api_scheduler().register_client("securityhub", region, security_hub_client)
+    return security_hub_client
+
+
+def __get_findings_to_archive__(
+    current_findings_ids: set, region: str, audited_account: str, security_hub_client
+) -> list:
+    """Private function __get_findings_to_archive__ returns the active Prowler findings of the region that are not in the current execution, set to ARCHIVED"""
+    # Get findings of that region
+    findings_filter = {
+        "ProductName": [{"Value": "Prowler", "Comparison": "EQUALS"}],
+        "RecordState": [{"Value": "ACTIVE", "Comparison": "EQUALS"}],
+        "AwsAccountId": [{"Value": audited_account, "Comparison": "EQUALS"}],
+        "Region": [{"Value": region, "Comparison": "EQUALS"}],
+    }
+    get_findings_paginator = security_hub_client.get_paginator("get_findings")
+    findings_to_archive = []
+    for page in get_findings_paginator.paginate(Filters=findings_filter):
+        # Archive findings that have not appear in this execution
+        for finding in page["Findings"]:
+            if finding["Id"] not in current_findings_ids:
+                finding["RecordState"] = "ARCHIVED"
+                finding["UpdatedAt"] = timestamp_utc.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+                findings_to_archive.append(finding)
+    return findings_to_archive
+
+
+def __submit_findings_to_security_hub__(
+    findings: [dict], region: str, security_hub_client
+) -> list:
+    """Private function __submit_findings_to_security_hub__ chunks the findings in groups of 100 findings and submits them to the API Scheduler. It returns the futures of the number of sent findings of each batch."""
+    api_scheduler = get_api_scheduler()
+    return [
+        api_scheduler.submit(
+            "securityhub",
+            region,
+            __send_findings_to_security_hub__,
+            findings[i : i + SECURITY_HUB_MAX_BATCH],
+            region,
+            security_hub_client,
+        )
+        for i in range(0, len(findings), SECURITY_HUB_MAX_BATCH)
+    ]
+
+
 def __send_findings_to_security_hub__(
     findings: [dict], region: str, security_hub_client
 ):
-    """Private function send_findings_to_security_hub chunks the findings in groups of 100 findings and send them to AWS Security Hub. It returns the number of sent findings."""
+    """Private function send_findings_to_security_hub sends a batch of up to 100 findings to AWS Security Hub. It returns the number of sent findings."""
     success_count = 0
     try:
-        list_chunked = [
-            findings[i : i + SECURITY_HUB_MAX_BATCH]
-            for i in range(0, len(findings), SECURITY_HUB_MAX_BATCH)
-        ]
-
-        for findings in list_chunked:
-            batch_import = security_hub_client.batch_import_findings(Findings=findings)
-            if batch_import["FailedCount"] > 0:
-                failed_import = batch_import["FailedFindings"][0]
-                logger.error(
-                    f"Failed to send findings to AWS Security Hub -- {failed_import['ErrorCode']} -- {failed_import['ErrorMessage']}"
-                )
-            success_count += batch_import["SuccessCount"]
+        batch_import = security_hub_client.batch_import_findings(Findings=findings)
+        if batch_import["FailedCount"] > 0:
+            failed_import = batch_import["FailedFindings"][0]
+            logger.error(
+                f"Failed to send findings to AWS Security Hub -- {failed_import['ErrorCode']} -- {failed_import['ErrorMessage']}"
+            )
+        success_count = batch_import["SuccessCount"]
 
     except Exception as error:
         logger.error(
@@ -0,0 +1,84 @@
+from time import perf_counter
+
+from boto3 import session
+
+from prowler.lib.logger import logger
+from prowler.lib.profiler.profiler import get_profiler
+from prowler.providers.aws.lib.service.scheduler import THROTTLING_ERROR_CODES
+
+# Keys of the botocore request context where each API call keeps its profiling data
+PROFILER_START_TIME = "prowler_profiler_start_time"
+PROFILER_THROTTLES = "prowler_profiler_throttles"
+
+
+def register_profiler_handlers(aws_session: session.Session):
+    """register_profiler_handlers records with the Profiler the API calls of the clients created afterwards from the session"""
+    # The unique IDs register each handler only once however many services share the session
+    aws_session.events.register(
+        "before-call", start_api_call, unique_id="prowler-profiler-before-call"
+    )
+    aws_session.events.register(
+        "needs-retry", count_throttled_attempt, unique_id="prowler-profiler-needs-retry"
+    )
+    aws_session.events.register(
+        "after-call", record_api_call, unique_id="prowler-profiler-after-call"
+    )
+    aws_session.events.register(
+        "after-call-error",
+        record_api_call_error,
+        unique_id="prowler-profiler-after-call-error",
+    )
+
+
+def start_api_call(context: dict, **kwargs):
+    context[PROFILER_START_TIME] = perf_counter()
+    context[PROFILER_THROTTLES] = 0
+
+
+def count_throttled_attempt(request_dict: dict, response: tuple = None, **kwargs):
+    # The response is the (HTTP response, parsed response) of each attempt, or None if the attempt raised an exception
+    if (
+        response
+        and response[1].get("Error", {}).get("Code") in THROTTLING_ERROR_CODES
+        and PROFILER_THROTTLES in request_dict.get("context", {})
+    ):
+        request_dict["context"][PROFILER_THROTTLES] += 1
+
+
+def record_api_call(http_response, parsed: dict, model, context: dict, **kwargs):
+    profiler = get_profiler()
+    if profiler and PROFILER_START_TIME in context:
+        try:
+            bytes_received = int(http_response.headers.get("content-length", 0))
+            # The streaming responses are not read here, so only their announced length is known
+            if not bytes_received and not model.has_streaming_output:
+                bytes_received = len(http_response.content or b"")
+            profiler.record_api_call(
+                model.service_model.service_name,
+                model.name,
+                context.get("client_region") or "global",
+                perf_counter() - context[PROFILER_START_TIME],
+                retries=parsed.get("ResponseMetadata", {}).get("RetryAttempts", 0),
+                throttles=context.get(PROFILER_THROTTLES, 0),
+                bytes_received=bytes_received,
+                error=http_response.status_code >= 300,
+            )
+        except Exception as error:
+            logger.error(
+                f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
+
+
+def record_api_call_error(context: dict, event_name: str, **kwargs):
+    # The API calls whose request raised an exception, e.g. a connection error, have no response
+    profiler = get_profiler()
+    if profiler and PROFILER_START_TIME in context:
+        _, service_id, operation = event_name.split(".")
+        profiler.record_api_call(
+            service_id,
+            operation,
+            context.get("client_region") or "global",
+            perf_counter() - context[PROFILER_START_TIME],
+            throttles=context.get(PROFILER_THROTTLES, 0),
+            error=True,
+        )
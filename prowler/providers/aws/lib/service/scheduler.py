@@ -0,0 +1,155 @@
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
+from time import sleep
+
+from prowler.lib.logger import logger
+
+# Maximum number of in-flight API requests for the whole scan
+MAX_CONCURRENT_REQUESTS = 100
+# Maximum number of in-flight API requests for each service and region
+MAX_CONCURRENT_REQUESTS_PER_REGION = 10
+# Delay in seconds added before the next requests of a throttled service and region
+MIN_BACKOFF = 0.1
+MAX_BACKOFF = 20
+# Error codes returned by the AWS APIs when a request is throttled
+THROTTLING_ERROR_CODES = (
+    "Throttling",
+    "ThrottlingException",
+    "ThrottledException",
+    "RequestThrottledException",
+    "TooManyRequestsException",
+    "ProvisionedThroughputExceededException",
+    "RequestLimitExceeded",
+    "BandwidthLimitExceeded",
+    "LimitExceededException",
+    "RequestThrottled",
+    "SlowDown",
+    "EC2ThrottledException",
+)
+
+
+class APIScheduler:
+    """The APIScheduler class offers a process-wide pool of workers shared by all the AWS Services:
+    - Bounds the total number of in-flight API requests with max_concurrent_requests
+    - Bounds the in-flight API requests of each (service, region) with max_concurrent_requests_per_region,
+      queueing the rest so they do not hold the workers needed by other services
+    - Backs off a (service, region) when its requests are throttled, and recovers when they succeed again
+    """
+
+    def __init__(
+        self,
+        max_concurrent_requests: int = MAX_CONCURRENT_REQUESTS,
+        max_concurrent_requests_per_region: int = MAX_CONCURRENT_REQUESTS_PER_REGION,
+    ):
+        self.lock = threading.Lock()
+        self.max_concurrent_requests = max_concurrent_requests
+        self.max_concurrent_requests_per_region = max_concurrent_requests_per_region
+        self.thread_pool = ThreadPoolExecutor(
+            max_workers=max_concurrent_requests, thread_name_prefix="prowler-aws-api"
+        )
+        # The following dicts are keyed by (service, region)
+        self.in_flight_requests = {}
+        self.pending_requests = {}
+        self.backoff = {}
+        self.throttled_requests = {}
+
+    def configure(
+        self,
+        max_concurrent_requests: int = MAX_CONCURRENT_REQUESTS,
+        max_concurrent_requests_per_region: int = MAX_CONCURRENT_REQUESTS_PER_REGION,
+    ):
+        """configure changes the limits in place, so the AWS Services already created keep using the scheduler"""
+        with self.lock:
+            previous_thread_pool = self.thread_pool
+            self.max_concurrent_requests = max_concurrent_requests
+            self.max_concurrent_requests_per_region = max_concurrent_requests_per_region
+            self.thread_pool = ThreadPoolExecutor(
+                max_workers=max_concurrent_requests,
+                thread_name_prefix="prowler-aws-api",
+            )
+        # The requests already sent to the previous pool are completed
+        previous_thread_pool.shutdown(wait=False)
+
+    def submit(self, service: str, region: str, call, *args, **kwargs) -> Future:
+        """submit schedules the call within the limits of the given service and region"""
+        key = (service, region)
+        future = Future()
+        request = (future, call, args, kwargs)
+        with self.lock:
+            if (
+                self.in_flight_requests.get(key, 0)
+                < self.max_concurrent_requests_per_region
+            ):
+                self.in_flight_requests[key] = self.in_flight_requests.get(key, 0) + 1
+                self.thread_pool.submit(self.__run__, key, request)
+            else:
+                self.pending_requests.setdefault(key, deque()).append(request)
+        return future
+
+    def register_client(self, service: str, region: str, client):
+        """register_client tracks the throttled requests of the client to adapt the backoff of its service and region"""
+        client.meta.events.register_first(
+            "needs-retry",
+            partial(self.__handle_retry__, (service, region)),
+            unique_id=f"prowler-api-scheduler-{service}-{region}",
+        )
+
+    def __run__(self, key: tuple, request: tuple):
+        future, call, args, kwargs = request
+        if future.set_running_or_notify_cancel():
+            try:
+                backoff = self.backoff.get(key, 0)
+                if backoff:
+                    sleep(backoff)
+                future.set_result(call(*args, **kwargs))
+            except BaseException as error:
+                future.set_exception(error)
+        # The next pending request of the (service, region) goes to the end of the pool's queue
+        with self.lock:
+            if self.pending_requests.get(key):
+                self.thread_pool.submit(
+                    self.__run__, key, self.pending_requests[key].popleft()
+                )
+            else:
+                self.in_flight_requests[key] -= 1
+
+    def __handle_retry__(self, key: tuple, response=None, **kwargs):
+        # The response is a (http_response, parsed_response) tuple or None if there was a connection error
+        if not response:
+            return
+        error_code = response[1].get("Error", {}).get("Code")
+        with self.lock:
+            if error_code in THROTTLING_ERROR_CODES:
+                self.throttled_requests[key] = self.throttled_requests.get(key, 0) + 1
+                self.backoff[key] = min(
+                    max(self.backoff.get(key, 0) * 2, MIN_BACKOFF), MAX_BACKOFF
+                )
+                logger.warning(
+                    f"{key[0].upper()} - {key[1]} -- {error_code}: requests throttled, backing off {self.backoff[key]} seconds"
+                )
+            elif self.backoff.get(key):
+                # Recover progressively once the requests succeed again
+                self.backoff[key] = (
+                    self.backoff[key] / 2 if self.backoff[key] > MIN_BACKOFF else 0
+                )
+        # Returning None lets botocore's retrier decide if the request is retried
+
+
+# Process-wide API Scheduler
+api_scheduler = APIScheduler()
+
+
+def get_api_scheduler() -> APIScheduler:
+    """get_api_scheduler returns the process-wide API Scheduler"""
+    return api_scheduler
+
+
+def set_api_scheduler(
+    max_concurrent_requests: int = MAX_CONCURRENT_REQUESTS,
+    max_concurrent_requests_per_region: int = MAX_CONCURRENT_REQUESTS_PER_REGION,
+) -> APIScheduler:
+    """set_api_scheduler configures the limits of the process-wide API Scheduler"""
+    api_scheduler.configure(max_concurrent_requests, max_concurrent_requests_per_region)
+    return api_scheduler
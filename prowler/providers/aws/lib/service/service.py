@@ -1,13 +1,15 @@
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import as_completed
 
 from prowler.lib.logger import logger
+from prowler.lib.profiler.profiler import get_profiler
+from prowler.lib.scan_filters.scan_filters import get_resource_filter
 from prowler.providers.aws.aws_provider import (
     generate_regional_clients,
     get_default_region,
 )
 from prowler.providers.aws.lib.audit_info.models import AWS_Audit_Info
-
-MAX_WORKERS = 10
+from prowler.providers.aws.lib.service.profiler import register_profiler_handlers
+from prowler.providers.aws.lib.service.scheduler import get_api_scheduler
 
 
 class AWSService:
@@ -15,10 +17,15 @@ class AWSService:
     - AWS Regional Clients
     - Shared information like the account ID and ARN, the the AWS partition and the checks audited
     - AWS Session
-    - Thread pool for the __threading_call__
+    - Shared API Scheduler for the __threading_call__
     - Also handles if the AWS Service is Global
+    - Skipping the discovery methods whose data is not consumed by any audited check
     """
 
+    # Checks consuming the data of each discovery method, by method name, e.g. {"__get_bucket_policy__": [...]}
+    # The methods run with __threading_call__ are skipped if none of their checks is audited, the rest always run
+    discovery_checks: dict = {}
+
     def __init__(self, service: str, audit_info: AWS_Audit_Info, global_service=False):
         # Audit Information
         self.audit_info = audit_info
@@ -26,11 +33,15 @@ class AWSService:
         self.audited_account_arn = audit_info.audited_account_arn
         self.audited_partition = audit_info.audited_partition
         self.audit_resources = audit_info.audit_resources
+        self.audit_resources_filter = get_resource_filter(audit_info)
         self.audited_checks = audit_info.audit_metadata.expected_checks
         self.audit_config = audit_info.audit_config
 
         # AWS Session
         self.session = audit_info.audit_session
+        # Record the API calls of the clients with the Profiler when the scan is profiled
+        if get_profiler():
+            register_profiler_handlers(self.session)
 
         # We receive the service using __class__.__name__ or the service name in lowercase
         # e.g.: AccessAnalyzer --> we need a lowercase string, so service.lower()
@@ -46,12 +57,26 @@ class AWSService:
         self.region = get_default_region(self.service, audit_info)
         self.client = self.session.client(self.service, self.region)
 
-        # Thread pool for __threading_call__
-        self.thread_pool = ThreadPoolExecutor(max_workers=MAX_WORKERS)
+        # Process-wide API Scheduler for __threading_call__
+        self.api_scheduler = get_api_scheduler()
+        self.api_scheduler.register_client(self.service, self.region, self.client)
+        if not global_service and self.regional_clients:
+            for region, regional_client in self.regional_clients.items():
+                self.api_scheduler.register_client(
+                    self.service, region, regional_client
+                )
 
     def __get_session__(self):
         return self.session
 
+    def __is_discovery_needed__(self, call) -> bool:
+        """__is_discovery_needed__ returns whether any check consuming the data of the discovery method is audited"""
+        consumer_checks = self.discovery_checks.get(call.__name__)
+        # Without audited checks, e.g. when the service is not created for a scan, everything is discovered
+        if not consumer_checks or not self.audited_checks:
+            return True
+        return any(check in self.audited_checks for check in consumer_checks)
+
     def __threading_call__(self, call, iterator=None):
         # Use the provided iterator, or default to self.regional_clients
         items = iterator if iterator is not None else self.regional_clients.values()
@@ -63,6 +88,13 @@ class AWSService:
         # Add Capitalization
         call_name = " ".join([x.capitalize() for x in call_name.split("_")])
 
+        # Skip the discovery if none of the checks consuming its data is audited
+        if not self.__is_discovery_needed__(call):
+            logger.info(
+                f"{self.service.upper()} - Skipping '{call_name}' function, none of its checks is audited"
+            )
+            return
+
         # Print a message based on the call's name, and if its regional or processing a list of items
         if iterator is None:
             logger.info(
@@ -73,8 +105,13 @@ class AWSService:
                 f"{self.service.upper()} - Starting threads for '{call_name}' function to process {item_count} items..."
             )
 
-        # Submit tasks to the thread pool
-        futures = [self.thread_pool.submit(call, item) for item in items]
+        # Submit tasks to the API Scheduler, limited by the region of each item
+        futures = [
+            self.api_scheduler.submit(
+                self.service, getattr(item, "region", None) or self.region, call, item
+            )
+            for item in items
+        ]
 
         # Wait for all tasks to complete
         for future in as_completed(futures):
@@ -26,7 +26,9 @@ class AccessAnalyzer(AWSService):
             for page in list_analyzers_paginator.paginate():
                 for analyzer in page["analyzers"]:
                     if not self.audit_resources or (
-                        is_resource_filtered(analyzer["arn"], self.audit_resources)
+                        is_resource_filtered(
+                            analyzer["arn"], self.audit_resources_filter
+                        )
                     ):
                         analyzer_count += 1
                         self.analyzers.append(
@@ -28,7 +28,7 @@ class ACM(AWSService):
                 for certificate in page["CertificateSummaryList"]:
                     if not self.audit_resources or (
                         is_resource_filtered(
-                            certificate["CertificateArn"], self.audit_resources
+                            certificate["CertificateArn"], self.audit_resources_filter
                         )
                     ):
                         if "NotAfter" in certificate:
@@ -27,7 +27,7 @@ class APIGateway(AWSService):
                 for apigw in page["items"]:
                     arn = f"arn:{self.audited_partition}:apigateway:{regional_client.region}::/restapis/{apigw['id']}"
                     if not self.audit_resources or (
-                        is_resource_filtered(arn, self.audit_resources)
+                        is_resource_filtered(arn, self.audit_resources_filter)
                     ):
                         self.rest_apis.append(
                             RestAPI(
@@ -25,7 +25,7 @@ class ApiGatewayV2(AWSService):
                 for apigw in page["Items"]:
                     arn = f"arn:{self.audited_partition}:apigateway:{regional_client.region}::apis/{apigw['ApiId']}"
                     if not self.audit_resources or (
-                        is_resource_filtered(arn, self.audit_resources)
+                        is_resource_filtered(arn, self.audit_resources_filter)
                     ):
                         self.apis.append(
                             API(
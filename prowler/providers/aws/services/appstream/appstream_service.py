@@ -23,7 +23,7 @@ class AppStream(AWSService):
             for page in describe_fleets_paginator.paginate():
                 for fleet in page["Fleets"]:
                     if not self.audit_resources or (
-                        is_resource_filtered(fleet["Arn"], self.audit_resources)
+                        is_resource_filtered(fleet["Arn"], self.audit_resources_filter)
                     ):
                         self.fleets.append(
                             Fleet(
@@ -27,7 +27,7 @@ class Athena(AWSService):
                     workgroup_name = workgroup["Name"]
                     workgroup_arn = f"arn:{self.audited_partition}:athena:{regional_client.region}:{self.audited_account}:workgroup/{workgroup_name}"
                     if not self.audit_resources or (
-                        is_resource_filtered(workgroup_arn, self.audit_resources)
+                        is_resource_filtered(workgroup_arn, self.audit_resources_filter)
                     ):
                         self.workgroups[workgroup_arn] = WorkGroup(
                             arn=workgroup_arn,
@@ -1,20 +1,24 @@
-import os
-import tempfile
-import zlib
-from base64 import b64decode
-
-from detect_secrets import SecretsCollection
-from detect_secrets.settings import default_settings
-
 from prowler.lib.check.models import Check, Check_Report_AWS
+from prowler.lib.secrets.secrets import scan_secrets_batch
 from prowler.providers.aws.services.autoscaling.autoscaling_client import (
     autoscaling_client,
 )
+from prowler.providers.aws.services.ec2.lib.user_data import decode_user_data
 
 
 class autoscaling_find_secrets_ec2_launch_configuration(Check):
     def execute(self):
         findings = []
+        # Scan all the User Data at once, since the launch configurations usually share it
+        user_data_secrets = iter(
+            scan_secrets_batch(
+                [
+                    decode_user_data(configuration.user_data)
+                    for configuration in autoscaling_client.launch_configurations
+                    if configuration.user_data
+                ]
+            )
+        )
         for configuration in autoscaling_client.launch_configurations:
             report = Check_Report_AWS(self.metadata())
             report.region = configuration.region
@@ -22,32 +26,12 @@ class autoscaling_find_secrets_ec2_launch_configuration(Check):
             report.resource_arn = configuration.arn
 
             if configuration.user_data:
-                temp_user_data_file = tempfile.NamedTemporaryFile(delete=False)
-                user_data = b64decode(configuration.user_data)
-
-                if user_data[0:2] == b"\x1f\x8b":  # GZIP magic number
-                    user_data = zlib.decompress(user_data, zlib.MAX_WBITS | 32).decode(
-                        "utf-8"
-                    )
-                else:
-                    user_data = user_data.decode("utf-8")
-
-                temp_user_data_file.write(
-                    bytes(user_data, encoding="raw_unicode_escape")
-                )
-                temp_user_data_file.close()
-                secrets = SecretsCollection()
-                with default_settings():
-                    secrets.scan_file(temp_user_data_file.name)
-
-                if secrets.json():
+                if next(user_data_secrets):
                     report.status = "FAIL"
                     report.status_extended = f"Potential secret found in autoscaling {configuration.name} User Data."
                 else:
                     report.status = "PASS"
                     report.status_extended = f"No secrets found in autoscaling {configuration.name} User Data."
-
-                os.remove(temp_user_data_file.name)
             else:
                 report.status = "PASS"
                 report.status_extended = f"No secrets found in autoscaling {configuration.name} since User Data is empty."
@@ -26,7 +26,7 @@ class AutoScaling(AWSService):
                     if not self.audit_resources or (
                         is_resource_filtered(
                             configuration["LaunchConfigurationARN"],
-                            self.audit_resources,
+                            self.audit_resources_filter,
                         )
                     ):
                         self.launch_configurations.append(
@@ -55,7 +55,7 @@ class AutoScaling(AWSService):
                     if not self.audit_resources or (
                         is_resource_filtered(
                             group["AutoScalingGroupARN"],
-                            self.audit_resources,
+                            self.audit_resources_filter,
                         )
                     ):
                         self.groups.append(
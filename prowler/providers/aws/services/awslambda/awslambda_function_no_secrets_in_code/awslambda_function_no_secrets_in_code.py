@@ -1,10 +1,9 @@
-import os
-import tempfile
-
-from detect_secrets import SecretsCollection
-from detect_secrets.settings import default_settings
-
 from prowler.lib.check.models import Check, Check_Report_AWS
+from prowler.lib.secrets.secrets import (
+    read_secrets_cache,
+    scan_secrets_batch,
+    write_secrets_cache,
+)
 from prowler.providers.aws.services.awslambda.awslambda_client import awslambda_client
 
 
@@ -12,54 +11,90 @@ class awslambda_function_no_secrets_in_code(Check):
     def execute(self):
         findings = []
         if awslambda_client.functions:
-            for function, function_code in awslambda_client.__get_function_code__():
-                if function_code:
-                    report = Check_Report_AWS(self.metadata())
-                    report.region = function.region
-                    report.resource_id = function.name
-                    report.resource_arn = function.arn
-                    report.resource_tags = function.tags
+            secrets_cache = awslambda_client.audit_config.get(
+                "lambda_code_secrets_cache", True
+            )
+            # Download and scan only once the code shared by several functions, e.g. aliases or copies, by its CodeSha256
+            functions_by_code = {}
+            for function in awslambda_client.functions.values():
+                functions_by_code.setdefault(
+                    function.code_sha256 or function.arn, []
+                ).append(function)
+            functions_to_fetch = []
+            for functions in functions_by_code.values():
+                code_secrets = None
+                if secrets_cache and functions[0].code_sha256:
+                    # Skip the download if the secrets of the same code were found by a previous scan
+                    code_secrets = read_secrets_cache(
+                        f"awslambda_code_{functions[0].code_sha256}"
+                    )
+                if code_secrets is None:
+                    functions_to_fetch.append(functions[0])
+                else:
+                    for function in functions:
+                        findings.append(self.get_report(function, code_secrets))
 
-                    report.status = "PASS"
-                    report.status_extended = (
-                        f"No secrets found in Lambda function {function.name} code."
+            for function, function_code in awslambda_client.__get_function_code__(
+                functions_to_fetch
+            ):
+                code_secrets = get_code_secrets(function_code)
+                if secrets_cache and function.code_sha256:
+                    write_secrets_cache(
+                        f"awslambda_code_{function.code_sha256}", code_secrets
                     )
-                    with tempfile.TemporaryDirectory() as tmp_dir_name:
-                        function_code.code_zip.extractall(tmp_dir_name)
-                        # List all files
-                        files_in_zip = next(os.walk(tmp_dir_name))[2]
-                        secrets_findings = []
-                        for file in files_in_zip:
-                            secrets = SecretsCollection()
-                            with default_settings():
-                                secrets.scan_file(f"{tmp_dir_name}/{file}")
-                            detect_secrets_output = secrets.json()
-                            if detect_secrets_output:
-                                for (
-                                    file_name
-                                ) in (
-                                    detect_secrets_output.keys()
-                                ):  # Appears that only 1 file is being scanned at a time, so could rework this
-                                    output_file_name = file_name.replace(
-                                        f"{tmp_dir_name}/", ""
-                                    )
-                                    secrets_string = ", ".join(
-                                        [
-                                            f"{secret['type']} on line {secret['line_number']}"
-                                            for secret in detect_secrets_output[
-                                                file_name
-                                            ]
-                                        ]
-                                    )
-                                    secrets_findings.append(
-                                        f"{output_file_name}: {secrets_string}"
-                                    )
+                for shared_function in functions_by_code.get(
+                    function.code_sha256 or function.arn, [function]
+                ):
+                    findings.append(self.get_report(shared_function, code_secrets))
 
-                        if secrets_findings:
-                            final_output_string = "; ".join(secrets_findings)
-                            report.status = "FAIL"
-                            report.status_extended = f"Potential {'secrets' if len(secrets_findings) > 1 else 'secret'} found in Lambda function {function.name} code -> {final_output_string}."
+        return findings
 
-                    findings.append(report)
+    def get_report(self, function, code_secrets: dict) -> Check_Report_AWS:
+        """get_report returns the report of the function with the secrets found in each file of its code"""
+        report = Check_Report_AWS(self.metadata())
+        report.region = function.region
+        report.resource_id = function.name
+        report.resource_arn = function.arn
+        report.resource_tags = function.tags
 
-        return findings
+        report.status = "PASS"
+        report.status_extended = (
+            f"No secrets found in Lambda function {function.name} code."
+        )
+        secrets_findings = [
+            f"{file_name}: {secrets_string}"
+            for file_name, secrets_string in code_secrets.items()
+        ]
+        if secrets_findings:
+            final_output_string = "; ".join(secrets_findings)
+            report.status = "FAIL"
+            report.status_extended = f"Potential {'secrets' if len(secrets_findings) > 1 else 'secret'} found in Lambda function {function.name} code -> {final_output_string}."
+        return report
+
+
+def get_code_secrets(function_code) -> dict:
+    """get_code_secrets returns the secrets found in each file in the root of the code zip, scanned in memory skipping the binary files"""
+    files_in_zip = {}
+    for file_info in function_code.code_zip.infolist():
+        if not file_info.is_dir() and "/" not in file_info.filename:
+            try:
+                files_in_zip[file_info.filename] = function_code.code_zip.read(
+                    file_info
+                ).decode("utf-8")
+            except UnicodeDecodeError:
+                continue
+    code_secrets = {}
+    for file_name, detect_secrets_output in zip(
+        files_in_zip.keys(),
+        scan_secrets_batch(
+            [(file_data, file_name) for file_name, file_data in files_in_zip.items()]
+        ),
+    ):
+        if detect_secrets_output:
+            code_secrets[file_name] = ", ".join(
+                [
+                    f"{secret['type']} on line {secret['line_number']}"
+                    for secret in detect_secrets_output
+                ]
+            )
+    return code_secrets
@@ -8,11 +8,16 @@ from typing import Any, Optional
 import requests
 from botocore.client import ClientError
 from pydantic import BaseModel
+from requests.adapters import HTTPAdapter
 
 from prowler.lib.logger import logger
 from prowler.lib.scan_filters.scan_filters import is_resource_filtered
 from prowler.providers.aws.lib.service.service import AWSService
 
+# Size of the chunks to stream the functions code, and connect and read timeouts in seconds
+LAMBDA_CODE_CHUNK_SIZE = 1024 * 1024
+LAMBDA_CODE_DOWNLOAD_TIMEOUT = (10, 60)
+
 
 ################## Lambda
 class Lambda(AWSService):
@@ -20,6 +25,12 @@ class Lambda(AWSService):
         # Call AWSService's __init__
         super().__init__(__class__.__name__, audit_info)
         self.functions = {}
+        # Pooled HTTP session to download the functions code, with a connection per API Scheduler worker
+        self.http_session = requests.Session()
+        self.http_session.mount(
+            "https://",
+            HTTPAdapter(pool_maxsize=self.api_scheduler.max_concurrent_requests),
+        )
         self.__threading_call__(self.__list_functions__)
         self.__list_tags_for_resource__()
         self.__threading_call__(self.__get_policy__)
@@ -33,7 +44,7 @@ class Lambda(AWSService):
                 for function in page["Functions"]:
                     if not self.audit_resources or (
                         is_resource_filtered(
-                            function["FunctionArn"], self.audit_resources
+                            function["FunctionArn"], self.audit_resources_filter
                         )
                     ):
                         lambda_name = function["FunctionName"]
@@ -46,6 +57,8 @@ class Lambda(AWSService):
                                 "SecurityGroupIds", []
                             ),
                             region=regional_client.region,
+                            code_sha256=function.get("CodeSha256"),
+                            code_size=function.get("CodeSize"),
                         )
                         if "Runtime" in function:
                             self.functions[lambda_arn].runtime = function["Runtime"]
@@ -62,15 +75,26 @@ class Lambda(AWSService):
                 f" {error}"
             )
 
-    def __get_function_code__(self):
+    def __get_function_code__(self, functions: list = None):
         logger.info("Lambda - Getting Function Code...")
-        # Use a thread pool handle the queueing and execution of the __fetch_function_code__ tasks, up to max_workers tasks concurrently.
-        lambda_functions_to_fetch = {
-            self.thread_pool.submit(
-                self.__fetch_function_code__, function.name, function.region
-            ): function
-            for function in self.functions.values()
-        }
+        max_code_size = self.__get_max_code_size__()
+        # Use the API Scheduler to handle the queueing and execution of the __fetch_function_code__ tasks, within the limits of each region.
+        lambda_functions_to_fetch = {}
+        for function in functions if functions is not None else self.functions.values():
+            if function.code_size and function.code_size > max_code_size:
+                logger.warning(
+                    f"{function.region} -- Lambda function {function.name} code is not downloaded since it is bigger than {max_code_size} bytes."
+                )
+                continue
+            lambda_functions_to_fetch[
+                self.api_scheduler.submit(
+                    self.service,
+                    function.region,
+                    self.__fetch_function_code__,
+                    function.name,
+                    function.region,
+                )
+            ] = function
 
         for fetched_lambda_code in as_completed(lambda_functions_to_fetch):
             function = lambda_functions_to_fetch[fetched_lambda_code]
@@ -83,6 +107,13 @@ class Lambda(AWSService):
                     f"{function.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
                 )
 
+    def __get_max_code_size__(self) -> int:
+        """__get_max_code_size__ returns the maximum size in bytes of the functions code to download"""
+        max_code_size = 100
+        if self.audit_config:
+            max_code_size = self.audit_config.get("max_lambda_code_size", max_code_size)
+        return max_code_size * 1024 * 1024
+
     def __fetch_function_code__(self, function_name, function_region):
         try:
             regional_client = self.regional_clients[function_region]
@@ -91,10 +122,30 @@ class Lambda(AWSService):
             )
             if "Location" in function_information["Code"]:
                 code_location_uri = function_information["Code"]["Location"]
-                raw_code_zip = requests.get(code_location_uri).content
+                max_code_size = self.__get_max_code_size__()
+                # Stream the code zip, stopping once it is bigger than the maximum size
+                raw_code_zip = io.BytesIO()
+                response = self.http_session.get(
+                    code_location_uri,
+                    stream=True,
+                    timeout=LAMBDA_CODE_DOWNLOAD_TIMEOUT,
+                )
+                try:
+                    response.raise_for_status()
+                    for chunk in response.iter_content(
+                        chunk_size=LAMBDA_CODE_CHUNK_SIZE
+                    ):
+                        raw_code_zip.write(chunk)
+                        if raw_code_zip.tell() > max_code_size:
+                            logger.warning(
+                                f"{function_region} -- Lambda function {function_name} code is not downloaded since it is bigger than {max_code_size} bytes."
+                            )
+                            return None
+                finally:
+                    response.close()
                 return LambdaCode(
                     location=code_location_uri,
-                    code_zip=zipfile.ZipFile(io.BytesIO(raw_code_zip)),
+                    code_zip=zipfile.ZipFile(raw_code_zip),
                 )
         except Exception as error:
             logger.error(
@@ -199,6 +250,8 @@ class Function(BaseModel):
     runtime: Optional[str]
     environment: dict = None
     region: str
+    code_sha256: Optional[str]
+    code_size: Optional[int]
     policy: dict = None
     code: LambdaCode = None
     url_config: URLConfig = None
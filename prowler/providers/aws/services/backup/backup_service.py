@@ -31,7 +31,7 @@ class Backup(AWSService):
                     if not self.audit_resources or (
                         is_resource_filtered(
                             configuration.get("BackupVaultArn"),
-                            self.audit_resources,
+                            self.audit_resources_filter,
                         )
                     ):
                         self.backup_vaults.append(
@@ -69,7 +69,7 @@ class Backup(AWSService):
                     if not self.audit_resources or (
                         is_resource_filtered(
                             configuration.get("BackupPlanArn"),
-                            self.audit_resources,
+                            self.audit_resources_filter,
                         )
                     ):
                         self.backup_plans.append(
@@ -104,7 +104,7 @@ class Backup(AWSService):
                 if not self.audit_resources or (
                     is_resource_filtered(
                         backup_report_plan.get("ReportPlanArn"),
-                        self.audit_resources,
+                        self.audit_resources_filter,
                     )
                 ):
                     self.backup_report_plans.append(
@@ -25,7 +25,9 @@ class CloudFormation(AWSService):
             for page in describe_stacks_paginator.paginate():
                 for stack in page["Stacks"]:
                     if not self.audit_resources or (
-                        is_resource_filtered(stack["StackId"], self.audit_resources)
+                        is_resource_filtered(
+                            stack["StackId"], self.audit_resources_filter
+                        )
                     ):
                         outputs = []
                         if "Outputs" in stack:
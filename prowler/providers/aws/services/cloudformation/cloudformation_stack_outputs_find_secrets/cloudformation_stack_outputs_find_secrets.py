@@ -1,10 +1,5 @@
-import os
-import tempfile
-
-from detect_secrets import SecretsCollection
-from detect_secrets.settings import default_settings
-
 from prowler.lib.check.models import Check, Check_Report_AWS
+from prowler.lib.secrets.secrets import scan_secrets_batch
 from prowler.providers.aws.services.cloudformation.cloudformation_client import (
     cloudformation_client,
 )
@@ -16,6 +11,16 @@ class cloudformation_stack_outputs_find_secrets(Check):
     def execute(self):
         """Execute the cloudformation_stack_outputs_find_secrets check"""
         findings = []
+        # Scan the CloudFormation Stacks Outputs at once
+        outputs_secrets = iter(
+            scan_secrets_batch(
+                [
+                    "".join(f"{output}" for output in stack.outputs)
+                    for stack in cloudformation_client.stacks
+                    if stack.outputs
+                ]
+            )
+        )
         for stack in cloudformation_client.stacks:
             report = Check_Report_AWS(self.metadata())
             report.region = stack.region
@@ -25,26 +30,11 @@ class cloudformation_stack_outputs_find_secrets(Check):
             report.status = "PASS"
             report.status_extended = f"No secrets found in Stack {stack.name} Outputs."
             if stack.outputs:
-                temp_output_file = tempfile.NamedTemporaryFile(delete=False)
-
-                # Store the CloudFormation Stack Outputs into a file
-                for output in stack.outputs:
-                    temp_output_file.write(f"{output}".encode())
-                temp_output_file.close()
-
-                # Init detect_secrets
-                secrets = SecretsCollection()
-                # Scan file for secrets
-                with default_settings():
-                    secrets.scan_file(temp_output_file.name)
-
-                if secrets.json():
+                if next(outputs_secrets):
                     report.status = "FAIL"
                     report.status_extended = (
                         f"Potential secret found in Stack {stack.name} Outputs."
                     )
-
-                os.remove(temp_output_file.name)
             else:
                 report.status = "PASS"
                 report.status_extended = f"CloudFormation {stack.name} has no Outputs."
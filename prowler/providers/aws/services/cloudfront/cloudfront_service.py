@@ -26,7 +26,9 @@ class CloudFront(AWSService):
                 if "Items" in page["DistributionList"]:
                     for item in page["DistributionList"]["Items"]:
                         if not self.audit_resources or (
-                            is_resource_filtered(item["ARN"], self.audit_resources)
+                            is_resource_filtered(
+                                item["ARN"], self.audit_resources_filter
+                            )
                         ):
                             distribution_id = item["Id"]
                             distribution_arn = item["ARN"]
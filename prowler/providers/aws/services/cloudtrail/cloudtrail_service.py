@@ -28,7 +28,7 @@ class Cloudtrail(AWSService):
             trails_count = 0
             for trail in describe_trails:
                 if not self.audit_resources or (
-                    is_resource_filtered(trail["TrailARN"], self.audit_resources)
+                    is_resource_filtered(trail["TrailARN"], self.audit_resources_filter)
                 ):
                     trails_count += 1
                     kms_key_id = None
@@ -1,4 +1,3 @@
-from datetime import datetime, timezone
 from typing import Optional
 
 from botocore.exceptions import ClientError
@@ -6,7 +5,18 @@ from pydantic import BaseModel
 
 from prowler.lib.logger import logger
 from prowler.lib.scan_filters.scan_filters import is_resource_filtered
+from prowler.lib.secrets.secrets import read_secrets_cache, write_secrets_cache
 from prowler.providers.aws.lib.service.service import AWSService
+from prowler.providers.aws.services.cloudwatch.lib.log_events import (
+    get_log_events_secrets,
+    load_log_streams_secrets,
+    merge_log_streams_secrets,
+)
+
+# Maximum number of events returned by each filter_log_events call
+LOG_EVENTS_PAGE_SIZE = 10000
+# Maximum number of filter_log_events calls per log group, since the pages can be empty while the log group is searched
+LOG_EVENTS_MAX_PAGES = 100
 
 
 ################## CloudWatch
@@ -25,7 +35,9 @@ class CloudWatch(AWSService):
             for page in describe_alarms_paginator.paginate():
                 for alarm in page["MetricAlarms"]:
                     if not self.audit_resources or (
-                        is_resource_filtered(alarm["AlarmArn"], self.audit_resources)
+                        is_resource_filtered(
+                            alarm["AlarmArn"], self.audit_resources_filter
+                        )
                     ):
                         metric_name = None
                         if "MetricName" in alarm:
@@ -76,9 +88,37 @@ class Logs(AWSService):
             in audit_info.audit_metadata.expected_checks
         ):
             self.events_per_log_group_threshold = (
-                1000  # The threshold for number of events to return per log group.
+                1000  # The threshold for number of events to scan per log group.
             )
-            self.__threading_call__(self.__get_log_events__)
+            self.log_events_incremental_scan = False
+            if self.audit_config:
+                self.events_per_log_group_threshold = self.audit_config.get(
+                    "max_log_events_per_log_group", self.events_per_log_group_threshold
+                )
+                self.log_events_incremental_scan = self.audit_config.get(
+                    "log_events_incremental_scan", False
+                )
+            # Last event timestamp and secrets found by log group ARN in the previous scans
+            self.log_events_scan_state = {}
+            if self.log_events_incremental_scan:
+                self.log_events_scan_state = (
+                    read_secrets_cache(f"cloudwatch_log_events_{self.audited_account}")
+                    or {}
+                )
+            # Page and scan the events of each log group concurrently, limited by the API scheduler
+            self.__threading_call__(self.__get_log_events__, self.log_groups)
+            if self.log_events_incremental_scan:
+                write_secrets_cache(
+                    f"cloudwatch_log_events_{self.audited_account}",
+                    {
+                        log_group.arn: {
+                            "timestamp": log_group.last_event_timestamp,
+                            "secrets": log_group.log_streams_secrets,
+                        }
+                        for log_group in self.log_groups
+                        if log_group.last_event_timestamp
+                    },
+                )
         self.__list_tags_for_resource__()
 
     def __describe_metric_filters__(self, regional_client):
@@ -91,7 +131,7 @@ class Logs(AWSService):
                 for filter in page["metricFilters"]:
                     arn = f"arn:{self.audited_partition}:logs:{regional_client.region}:{self.audited_account}:metric-filter/{filter['filterName']}"
                     if not self.audit_resources or (
-                        is_resource_filtered(arn, self.audit_resources)
+                        is_resource_filtered(arn, self.audit_resources_filter)
                     ):
                         self.metric_filters.append(
                             MetricFilter(
@@ -117,7 +157,9 @@ class Logs(AWSService):
             for page in describe_log_groups_paginator.paginate():
                 for log_group in page["logGroups"]:
                     if not self.audit_resources or (
-                        is_resource_filtered(log_group["arn"], self.audit_resources)
+                        is_resource_filtered(
+                            log_group["arn"], self.audit_resources_filter
+                        )
                     ):
                         never_expire = False
                         kms = log_group.get("kmsKeyId")
@@ -140,37 +182,47 @@ class Logs(AWSService):
                 f"{regional_client.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
             )
 
-    def __get_log_events__(self, regional_client):
-        regional_log_groups = [
-            log_group
-            for log_group in self.log_groups
-            if log_group.region == regional_client.region
-        ]
-        total_log_groups = len(regional_log_groups)
+    def __get_log_events__(self, log_group):
         logger.info(
-            f"CloudWatch Logs - Retrieving log events for {total_log_groups} log groups in {regional_client.region}..."
+            f"CloudWatch Logs - Retrieving log events for log group {log_group.name}..."
         )
         try:
-            for count, log_group in enumerate(regional_log_groups, start=1):
-                events = regional_client.filter_log_events(
-                    logGroupName=log_group.name,
-                    limit=self.events_per_log_group_threshold,
-                )["events"]
-                for event in events:
-                    if event["logStreamName"] not in log_group.log_streams:
-                        log_group.log_streams[event["logStreamName"]] = []
-                    log_group.log_streams[event["logStreamName"]].append(event)
-                if count % 10 == 0:
-                    logger.info(
-                        f"CloudWatch Logs - Retrieved log events for {count}/{total_log_groups} log groups in {regional_client.region}..."
+            regional_client = self.regional_clients[log_group.region]
+            filter_log_events_args = {"logGroupName": log_group.name}
+            scan_state = self.log_events_scan_state.get(log_group.arn)
+            if scan_state:
+                # Scan only the events newer than the ones scanned by the previous run
+                filter_log_events_args["startTime"] = scan_state["timestamp"] + 1
+                log_group.last_event_timestamp = scan_state["timestamp"]
+                log_group.log_streams_secrets = load_log_streams_secrets(
+                    scan_state["secrets"]
+                )
+            events_left = self.events_per_log_group_threshold
+            for _ in range(LOG_EVENTS_MAX_PAGES):
+                if events_left <= 0:
+                    break
+                response = regional_client.filter_log_events(
+                    **filter_log_events_args,
+                    limit=min(events_left, LOG_EVENTS_PAGE_SIZE),
+                )
+                events = response["events"]
+                if events:
+                    # Scan each page as it arrives, keeping only the secrets found and not the events
+                    merge_log_streams_secrets(
+                        log_group.log_streams_secrets, get_log_events_secrets(events)
                     )
+                    log_group.last_event_timestamp = max(
+                        log_group.last_event_timestamp or 0,
+                        max(event["timestamp"] for event in events),
+                    )
+                    events_left -= len(events)
+                if not response.get("nextToken"):
+                    break
+                filter_log_events_args["nextToken"] = response["nextToken"]
         except Exception as error:
             logger.error(
-                f"{regional_client.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                f"{log_group.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
             )
-        logger.info(
-            f"CloudWatch Logs - Finished retrieving log events in {regional_client.region}..."
-        )
 
     def __list_tags_for_resource__(self):
         logger.info("CloudWatch Logs - List Tags...")
@@ -218,24 +270,7 @@ class LogGroup(BaseModel):
     never_expire: bool
     kms_id: Optional[str]
     region: str
-    log_streams: dict[str, list[str]] = (
-        {}
-    )  # Log stream name as the key, array of events as the value
+    # Log stream name as the key, secrets found by CloudWatch timestamp as the value
+    log_streams_secrets: dict = {}
+    last_event_timestamp: Optional[int]
     tags: Optional[list] = []
-
-
-def convert_to_cloudwatch_timestamp_format(epoch_time):
-    date_time = datetime.fromtimestamp(
-        epoch_time / 1000, datetime.now(timezone.utc).astimezone().tzinfo
-    )
-    datetime_str = date_time.strftime(
-        "%Y-%m-%dT%H:%M:%S.!%f!%z"
-    )  # use exclamation marks as placeholders to convert datetime str to cloudwatch timestamp str
-    datetime_parts = datetime_str.split("!")
-    return (
-        datetime_parts[0]
-        + datetime_parts[1][:-3]
-        + datetime_parts[2][:-2]
-        + ":"
-        + datetime_parts[2][-2:]
-    )  # Removes the microseconds, and places a ':' character in the timezone offset
@@ -0,0 +1,114 @@
+from datetime import datetime, timezone
+from json import dumps, loads
+
+from prowler.lib.secrets.secrets import scan_secrets, scan_secrets_batch
+
+
+class SecretsDict(dict):
+    # Using this dict to remove duplicates of the secret type showing up multiple times on the same line
+    # Also includes the to_string method
+    def add_secret(self, line_number, secret_type):
+        if line_number not in self.keys():
+            self[line_number] = [secret_type]
+        else:
+            if secret_type not in self[line_number]:
+                self[line_number] += [secret_type]
+
+    def to_string(self):
+        return ", ".join(
+            [
+                f"{', '.join(secret_types)} on line {line_number}"
+                for line_number, secret_types in sorted(self.items())
+            ]
+        )
+
+
+def get_log_events_secrets(events: list) -> dict:
+    """get_log_events_secrets returns the secrets found in the log events by log stream and CloudWatch timestamp, scanning the events of each log stream at once"""
+    log_streams = {}
+    for event in events:
+        log_streams.setdefault(event["logStreamName"], []).append(event)
+    log_streams_secrets = {}
+    for (log_stream_name, log_stream_events), log_stream_secrets_output in zip(
+        log_streams.items(),
+        scan_secrets_batch(
+            [
+                "\n".join([dumps(event["message"]) for event in log_stream_events])
+                for log_stream_events in log_streams.values()
+            ]
+        ),
+    ):
+        if log_stream_secrets_output:
+            log_stream_secrets = log_streams_secrets.setdefault(log_stream_name, {})
+            for secret in log_stream_secrets_output:
+                flagged_event = log_stream_events[secret["line_number"] - 1]
+                cloudwatch_timestamp = convert_to_cloudwatch_timestamp_format(
+                    flagged_event["timestamp"]
+                )
+                if cloudwatch_timestamp not in log_stream_secrets.keys():
+                    log_stream_secrets[cloudwatch_timestamp] = SecretsDict()
+
+                try:
+                    log_event_data = dumps(loads(flagged_event["message"]), indent=2)
+                except Exception:
+                    log_event_data = dumps(flagged_event["message"], indent=2)
+                if len(log_event_data.split("\n")) > 1:
+                    # Can get more informative output if there is more than 1 line.
+                    # Will rescan just this event to get the type of secret and the line number
+                    event_detect_secrets_output = scan_secrets(log_event_data)
+                    if event_detect_secrets_output:
+                        for secret in event_detect_secrets_output:
+                            log_stream_secrets[cloudwatch_timestamp].add_secret(
+                                secret["line_number"], secret["type"]
+                            )
+                else:
+                    log_stream_secrets[cloudwatch_timestamp].add_secret(
+                        1, secret["type"]
+                    )
+    return log_streams_secrets
+
+
+def merge_log_streams_secrets(log_streams_secrets: dict, new_secrets: dict):
+    """merge_log_streams_secrets adds the secrets found in a new page of log events to the secrets found by log stream and CloudWatch timestamp"""
+    for log_stream_name, log_stream_secrets in new_secrets.items():
+        merged_log_stream_secrets = log_streams_secrets.setdefault(log_stream_name, {})
+        for cloudwatch_timestamp, secrets in log_stream_secrets.items():
+            merged_secrets = merged_log_stream_secrets.setdefault(
+                cloudwatch_timestamp, SecretsDict()
+            )
+            for line_number, secret_types in secrets.items():
+                for secret_type in secret_types:
+                    merged_secrets.add_secret(line_number, secret_type)
+
+
+def load_log_streams_secrets(log_streams_secrets: dict) -> dict:
+    """load_log_streams_secrets returns the log streams secrets read from JSON, where the line numbers are strings"""
+    return {
+        log_stream_name: {
+            cloudwatch_timestamp: SecretsDict(
+                {
+                    int(line_number): secret_types
+                    for line_number, secret_types in secrets.items()
+                }
+            )
+            for cloudwatch_timestamp, secrets in log_stream_secrets.items()
+        }
+        for log_stream_name, log_stream_secrets in log_streams_secrets.items()
+    }
+
+
+def convert_to_cloudwatch_timestamp_format(epoch_time):
+    date_time = datetime.fromtimestamp(
+        epoch_time / 1000, datetime.now(timezone.utc).astimezone().tzinfo
+    )
+    datetime_str = date_time.strftime(
+        "%Y-%m-%dT%H:%M:%S.!%f!%z"
+    )  # use exclamation marks as placeholders to convert datetime str to cloudwatch timestamp str
+    datetime_parts = datetime_str.split("!")
+    return (
+        datetime_parts[0]
+        + datetime_parts[1][:-3]
+        + datetime_parts[2][:-2]
+        + ":"
+        + datetime_parts[2][-2:]
+    )  # Removes the microseconds, and places a ':' character in the timezone offset
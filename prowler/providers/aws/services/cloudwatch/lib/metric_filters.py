@@ -2,6 +2,72 @@ import re
 
 from prowler.lib.check.models import Check_Report_AWS
 
+# Index of the last trails, metric filters and metric alarms, shared by the checks using the same clients
+metric_filters_indexes = []
+
+
+class Metric_Filters_Index:
+    """
+    The Metric_Filters_Index class indexes once the CloudTrail trails, CloudWatch Logs metric filters and CloudWatch metric alarms:
+    - trail_log_groups: set with the log groups of the trails
+    - trail_metric_filters: metric filters of the trails log groups
+    - alarm_metrics: set with the metrics with an alarm
+    The metric filter found for each pattern is cached for the other checks.
+    """
+
+    def __init__(self, trails: list, metric_filters: list, metric_alarms: list):
+        self.trails = trails
+        self.metric_filters = metric_filters
+        self.metric_alarms = metric_alarms
+        self.sizes = (len(trails), len(metric_filters), len(metric_alarms))
+        self.trail_log_groups = {
+            trail.log_group_arn.split(":")[6] for trail in trails if trail.log_group_arn
+        }
+        # Keep the metric filters order, since the last one matching the pattern is reported
+        self.trail_metric_filters = [
+            metric_filter
+            for metric_filter in metric_filters
+            if metric_filter.log_group in self.trail_log_groups
+        ]
+        self.alarm_metrics = {alarm.metric for alarm in metric_alarms}
+        self.patterns = {}
+
+    def is_indexed(self, trails: list, metric_filters: list, metric_alarms: list):
+        """is_indexed returns True if the index was built with the same trails, metric filters and metric alarms"""
+        return (
+            self.trails is trails
+            and self.metric_filters is metric_filters
+            and self.metric_alarms is metric_alarms
+            and self.sizes == (len(trails), len(metric_filters), len(metric_alarms))
+        )
+
+    def get_metric_filter(self, metric_filter_pattern: str):
+        """get_metric_filter returns the last metric filter of the trails log groups matching the pattern, or None"""
+        if metric_filter_pattern not in self.patterns:
+            pattern = re.compile(metric_filter_pattern, flags=re.DOTALL)
+            self.patterns[metric_filter_pattern] = next(
+                (
+                    metric_filter
+                    for metric_filter in reversed(self.trail_metric_filters)
+                    if pattern.search(metric_filter.pattern)
+                ),
+                None,
+            )
+        return self.patterns[metric_filter_pattern]
+
+
+def get_metric_filters_index(
+    trails: list, metric_filters: list, metric_alarms: list
+) -> Metric_Filters_Index:
+    """get_metric_filters_index returns the Metric_Filters_Index of the trails, metric filters and metric alarms, building it only if they changed"""
+    if not metric_filters_indexes or not metric_filters_indexes[0].is_indexed(
+        trails, metric_filters, metric_alarms
+    ):
+        metric_filters_indexes[:] = [
+            Metric_Filters_Index(trails, metric_filters, metric_alarms)
+        ]
+    return metric_filters_indexes[0]
+
 
 def check_cloudwatch_log_metric_filter(
     metric_filter_pattern: str,
@@ -10,25 +76,21 @@ def check_cloudwatch_log_metric_filter(
     metric_alarms: list,
     report: Check_Report_AWS,
 ):
-    # 1. Iterate for CloudWatch Log Group in CloudTrail trails
-    log_groups = []
-    for trail in trails:
-        if trail.log_group_arn:
-            log_groups.append(trail.log_group_arn.split(":")[6])
-    # 2. Describe metric filters for previous log groups
-    for metric_filter in metric_filters:
-        if metric_filter.log_group in log_groups:
-            if re.search(metric_filter_pattern, metric_filter.pattern, flags=re.DOTALL):
-                report.resource_id = metric_filter.log_group
-                report.resource_arn = metric_filter.arn
-                report.region = metric_filter.region
-                report.status = "FAIL"
-                report.status_extended = f"CloudWatch log group {metric_filter.log_group} found with metric filter {metric_filter.name} but no alarms associated."
-                # 3. Check if there is an alarm for the metric
-                for alarm in metric_alarms:
-                    if alarm.metric == metric_filter.metric:
-                        report.status = "PASS"
-                        report.status_extended = f"CloudWatch log group {metric_filter.log_group} found with metric filter {metric_filter.name} and alarms set."
-                        break
+    # 1. Index the CloudWatch Log Groups in CloudTrail trails, their metric filters and the metrics with alarms
+    metric_filters_index = get_metric_filters_index(
+        trails, metric_filters, metric_alarms
+    )
+    # 2. Find the metric filter for previous log groups
+    metric_filter = metric_filters_index.get_metric_filter(metric_filter_pattern)
+    if metric_filter:
+        report.resource_id = metric_filter.log_group
+        report.resource_arn = metric_filter.arn
+        report.region = metric_filter.region
+        report.status = "FAIL"
+        report.status_extended = f"CloudWatch log group {metric_filter.log_group} found with metric filter {metric_filter.name} but no alarms associated."
+        # 3. Check if there is an alarm for the metric
+        if metric_filter.metric in metric_filters_index.alarm_metrics:
+            report.status = "PASS"
+            report.status_extended = f"CloudWatch log group {metric_filter.log_group} found with metric filter {metric_filter.name} and alarms set."
 
     return report
@@ -29,7 +29,9 @@ class CodeArtifact(AWSService):
             for page in list_repositories_paginator.paginate():
                 for repository in page["repositories"]:
                     if not self.audit_resources or (
-                        is_resource_filtered(repository["arn"], self.audit_resources)
+                        is_resource_filtered(
+                            repository["arn"], self.audit_resources_filter
+                        )
                     ):
                         package_name = repository["name"]
                         package_domain_name = repository["domainName"]
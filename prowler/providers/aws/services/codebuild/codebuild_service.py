@@ -24,7 +24,7 @@ class Codebuild(AWSService):
                 for project in page["projects"]:
                     project_arn = f"arn:{self.audited_partition}:codebuild:{regional_client.region}:{self.audited_account}:project/{project}"
                     if not self.audit_resources or (
-                        is_resource_filtered(project_arn, self.audit_resources)
+                        is_resource_filtered(project_arn, self.audit_resources_filter)
                     ):
                         self.projects.append(
                             Project(
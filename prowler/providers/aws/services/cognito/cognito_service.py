@@ -25,7 +25,7 @@ class CognitoIDP(AWSService):
                 for user_pool in page["UserPools"]:
                     arn = f"arn:{self.audited_partition}:cognito-idp:{regional_client.region}:{self.audited_account}:userpool/{user_pool['Id']}"
                     if not self.audit_resources or (
-                        is_resource_filtered(arn, self.audit_resources)
+                        is_resource_filtered(arn, self.audit_resources_filter)
                     ):
                         try:
                             self.user_pools[arn] = UserPool(
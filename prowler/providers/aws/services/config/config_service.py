@@ -24,7 +24,7 @@ class Config(AWSService):
             recorders_count = 0
             for recorder in recorders:
                 if not self.audit_resources or (
-                    is_resource_filtered(recorder["name"], self.audit_resources)
+                    is_resource_filtered(recorder["name"], self.audit_resources_filter)
                 ):
                     recorders_count += 1
                     if "lastStatus" in recorder:
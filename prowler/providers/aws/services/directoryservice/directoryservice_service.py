@@ -33,7 +33,7 @@ class DirectoryService(AWSService):
                 for directory in page["DirectoryDescriptions"]:
                     if not self.audit_resources or (
                         is_resource_filtered(
-                            directory["DirectoryId"], self.audit_resources
+                            directory["DirectoryId"], self.audit_resources_filter
                         )
                     ):
                         directory_id = directory["DirectoryId"]
@@ -36,7 +36,7 @@ class DocumentDB(AWSService):
                 for instance in page["DBInstances"]:
                     instance_arn = instance["DBInstanceArn"]
                     if not self.audit_resources or (
-                        is_resource_filtered(instance_arn, self.audit_resources)
+                        is_resource_filtered(instance_arn, self.audit_resources_filter)
                     ):
                         self.db_instances[instance_arn] = Instance(
                             id=instance["DBInstanceIdentifier"],
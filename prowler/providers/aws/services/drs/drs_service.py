@@ -23,7 +23,9 @@ class DRS(AWSService):
                     drs_jobs = []
                     for drs_job in page["items"]:
                         if not self.audit_resources or (
-                            is_resource_filtered(drs_job["arn"], self.audit_resources)
+                            is_resource_filtered(
+                                drs_job["arn"], self.audit_resources_filter
+                            )
                         ):
                             job = Job(
                                 arn=drs_job.get("arn"),
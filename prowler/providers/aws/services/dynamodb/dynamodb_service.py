@@ -27,7 +27,7 @@ class DynamoDB(AWSService):
                 for table in page["TableNames"]:
                     arn = f"arn:{self.audited_partition}:dynamodb:{regional_client.region}:{self.audited_account}:table/{table}"
                     if not self.audit_resources or (
-                        is_resource_filtered(arn, self.audit_resources)
+                        is_resource_filtered(arn, self.audit_resources_filter)
                     ):
                         self.tables.append(
                             Table(
@@ -138,7 +138,7 @@ class DAX(AWSService):
                 for cluster in page["Clusters"]:
                     if not self.audit_resources or (
                         is_resource_filtered(
-                            cluster["ClusterArn"], self.audit_resources
+                            cluster["ClusterArn"], self.audit_resources_filter
                         )
                     ):
                         encryption = False
@@ -2,16 +2,34 @@ from datetime import datetime
 from typing import Optional
 
 from botocore.client import ClientError
-from pydantic import BaseModel
+from pydantic import BaseModel, PrivateAttr
 
 from prowler.lib.logger import logger
 from prowler.lib.scan_filters.scan_filters import is_resource_filtered
 from prowler.providers.aws.lib.service.service import AWSService
-from prowler.providers.aws.services.ec2.lib.security_groups import check_security_group
+from prowler.providers.aws.services.ec2.lib.network_snapshot import (
+    get_regional_network_snapshot,
+)
+from prowler.providers.aws.services.ec2.lib.security_groups import (
+    Security_Group_Exposure,
+)
 
 
 ################## EC2
 class EC2(AWSService):
+    # Checks consuming the data of the discovery methods only needed by some checks
+    discovery_checks = {
+        "__get_instance_user_data__": ["ec2_instance_secrets_user_data"],
+        "__describe_network_acls__": [
+            "ec2_networkacl_allow_ingress_any_port",
+            "ec2_networkacl_allow_ingress_tcp_port_22",
+            "ec2_networkacl_allow_ingress_tcp_port_3389",
+        ],
+        "__determine_public_snapshots__": ["ec2_ebs_public_snapshot"],
+        "__describe_images__": ["ec2_ami_public"],
+        "__get_ebs_encryption_settings__": ["ec2_ebs_default_encryption"],
+    }
+
     def __init__(self, audit_info):
         # Call AWSService's __init__
         super().__init__(__class__.__name__, audit_info)
@@ -50,7 +68,7 @@ class EC2(AWSService):
                     for instance in reservation["Instances"]:
                         arn = f"arn:{self.audited_partition}:ec2:{regional_client.region}:{self.audited_account}:instance/{instance['InstanceId']}"
                         if not self.audit_resources or (
-                            is_resource_filtered(arn, self.audit_resources)
+                            is_resource_filtered(arn, self.audit_resources_filter)
                         ):
                             http_tokens = None
                             http_endpoint = None
@@ -113,38 +131,33 @@ class EC2(AWSService):
                 for sg in page["SecurityGroups"]:
                     arn = f"arn:{self.audited_partition}:ec2:{regional_client.region}:{self.audited_account}:security-group/{sg['GroupId']}"
                     if not self.audit_resources or (
-                        is_resource_filtered(arn, self.audit_resources)
+                        is_resource_filtered(arn, self.audit_resources_filter)
                     ):
                         associated_sgs = []
-                        # check if sg has public access to all ports
-                        all_public_ports = False
                         for ingress_rule in sg["IpPermissions"]:
-                            if (
-                                check_security_group(
-                                    ingress_rule, "-1", any_address=True
-                                )
-                                and "ec2_securitygroup_allow_ingress_from_internet_to_any_port"
-                                in self.audited_checks
-                            ):
-                                all_public_ports = True
                             # check associated security groups
                             for sg_group in ingress_rule.get("UserIdGroupPairs", []):
                                 if sg_group.get("GroupId"):
                                     associated_sgs.append(sg_group["GroupId"])
-                        self.security_groups.append(
-                            SecurityGroup(
-                                name=sg["GroupName"],
-                                arn=arn,
-                                region=regional_client.region,
-                                id=sg["GroupId"],
-                                ingress_rules=sg["IpPermissions"],
-                                egress_rules=sg["IpPermissionsEgress"],
-                                public_ports=all_public_ports,
-                                associated_sgs=associated_sgs,
-                                vpc_id=sg["VpcId"],
-                                tags=sg.get("Tags"),
-                            )
+                        security_group = SecurityGroup(
+                            name=sg["GroupName"],
+                            arn=arn,
+                            region=regional_client.region,
+                            id=sg["GroupId"],
+                            ingress_rules=sg["IpPermissions"],
+                            egress_rules=sg["IpPermissionsEgress"],
+                            public_ports=False,
+                            associated_sgs=associated_sgs,
+                            vpc_id=sg["VpcId"],
+                            tags=sg.get("Tags"),
+                        )
+                        # check if sg has public access to all ports, indexing once its ports open to the Internet
+                        security_group.public_ports = (
+                            security_group.exposure.is_exposed("-1", any_address=True)
+                            and "ec2_securitygroup_allow_ingress_from_internet_to_any_port"
+                            in self.audited_checks
                         )
+                        self.security_groups.append(security_group)
                         if sg["GroupName"] != "default":
                             self.regions_with_sgs.append(regional_client.region)
         except Exception as error:
@@ -161,7 +174,7 @@ class EC2(AWSService):
                 for nacl in page["NetworkAcls"]:
                     arn = f"arn:{self.audited_partition}:ec2:{regional_client.region}:{self.audited_account}:network-acl/{nacl['NetworkAclId']}"
                     if not self.audit_resources or (
-                        is_resource_filtered(arn, self.audit_resources)
+                        is_resource_filtered(arn, self.audit_resources_filter)
                     ):
                         nacl_name = ""
                         for tag in nacl.get("Tags", []):
@@ -192,7 +205,7 @@ class EC2(AWSService):
                 for snapshot in page["Snapshots"]:
                     arn = f"arn:{self.audited_partition}:ec2:{regional_client.region}:{self.audited_account}:snapshot/{snapshot['SnapshotId']}"
                     if not self.audit_resources or (
-                        is_resource_filtered(arn, self.audit_resources)
+                        is_resource_filtered(arn, self.audit_resources_filter)
                     ):
                         if snapshots_in_region is False:
                             snapshots_in_region = True
@@ -241,23 +254,21 @@ class EC2(AWSService):
     def __describe_public_network_interfaces__(self, regional_client):
         try:
             # Get Network Interfaces with Public IPs
-            describe_network_interfaces_paginator = regional_client.get_paginator(
-                "describe_network_interfaces"
-            )
-            for page in describe_network_interfaces_paginator.paginate():
-                for interface in page["NetworkInterfaces"]:
-                    if interface.get("Association"):
-                        self.network_interfaces.append(
-                            NetworkInterface(
-                                public_ip=interface["Association"]["PublicIp"],
-                                type=interface["InterfaceType"],
-                                private_ip=interface["PrivateIpAddress"],
-                                subnet_id=interface["SubnetId"],
-                                vpc_id=interface["VpcId"],
-                                region=regional_client.region,
-                                tags=interface.get("TagSet"),
-                            )
+            for interface in get_regional_network_snapshot(
+                self.session, regional_client
+            ).get_network_interfaces():
+                if interface.get("Association"):
+                    self.network_interfaces.append(
+                        NetworkInterface(
+                            public_ip=interface["Association"]["PublicIp"],
+                            type=interface["InterfaceType"],
+                            private_ip=interface["PrivateIpAddress"],
+                            subnet_id=interface["SubnetId"],
+                            vpc_id=interface["VpcId"],
+                            region=regional_client.region,
+                            tags=interface.get("TagSet"),
                         )
+                    )
 
         except Exception as error:
             logger.error(
@@ -266,24 +277,15 @@ class EC2(AWSService):
 
     def __describe_sg_network_interfaces__(self, regional_client):
         try:
-            # Get Network Interfaces for Security Groups
+            # Get Network Interfaces for the Security Groups of the region
+            security_groups_network_interfaces = get_regional_network_snapshot(
+                self.session, regional_client
+            ).get_security_groups_network_interfaces()
             for sg in self.security_groups:
-                regional_client = self.regional_clients[sg.region]
-                describe_network_interfaces_paginator = regional_client.get_paginator(
-                    "describe_network_interfaces"
-                )
-                for page in describe_network_interfaces_paginator.paginate(
-                    Filters=[
-                        {
-                            "Name": "group-id",
-                            "Values": [
-                                sg.id,
-                            ],
-                        },
-                    ],
-                ):
-                    for interface in page["NetworkInterfaces"]:
-                        sg.network_interfaces.append(interface["NetworkInterfaceId"])
+                if sg.region == regional_client.region:
+                    sg.network_interfaces = list(
+                        security_groups_network_interfaces.get(sg.id, [])
+                    )
         except Exception as error:
             logger.error(
                 f"{regional_client.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
@@ -312,7 +314,7 @@ class EC2(AWSService):
             for image in regional_client.describe_images(Owners=["self"])["Images"]:
                 arn = f"arn:{self.audited_partition}:ec2:{regional_client.region}:{self.audited_account}:image/{image['ImageId']}"
                 if not self.audit_resources or (
-                    is_resource_filtered(arn, self.audit_resources)
+                    is_resource_filtered(arn, self.audit_resources_filter)
                 ):
                     self.images.append(
                         Image(
@@ -338,7 +340,7 @@ class EC2(AWSService):
                 for volume in page["Volumes"]:
                     arn = f"arn:{self.audited_partition}:ec2:{regional_client.region}:{self.audited_account}:volume/{volume['VolumeId']}"
                     if not self.audit_resources or (
-                        is_resource_filtered(arn, self.audit_resources)
+                        is_resource_filtered(arn, self.audit_resources_filter)
                     ):
                         self.volumes.append(
                             Volume(
@@ -368,7 +370,7 @@ class EC2(AWSService):
                     allocation_id = address["AllocationId"]
                 elastic_ip_arn = f"arn:{self.audited_partition}:ec2:{regional_client.region}:{self.audited_account}:eip-allocation/{allocation_id}"
                 if not self.audit_resources or (
-                    is_resource_filtered(elastic_ip_arn, self.audit_resources)
+                    is_resource_filtered(elastic_ip_arn, self.audit_resources_filter)
                 ):
                     self.elastic_ips.append(
                         ElasticIP(
@@ -456,6 +458,14 @@ class SecurityGroup(BaseModel):
     ingress_rules: list[dict]
     egress_rules: list[dict]
     tags: Optional[list] = []
+    _exposure: Optional[Security_Group_Exposure] = PrivateAttr(default=None)
+
+    @property
+    def exposure(self) -> Security_Group_Exposure:
+        """exposure returns the index of the ingress rules open to the Internet, built once from the ingress rules"""
+        if self._exposure is None:
+            self._exposure = Security_Group_Exposure(self.ingress_rules)
+        return self._exposure
 
 
 class NetworkACL(BaseModel):
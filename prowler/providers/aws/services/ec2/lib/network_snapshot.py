@@ -0,0 +1,112 @@
+import threading
+from weakref import WeakKeyDictionary
+
+from boto3 import session
+
+from prowler.lib.logger import logger
+
+
+################## Regional Network Snapshot
+class Regional_Network_Snapshot:
+    """
+    The Regional_Network_Snapshot class describes once the network interfaces and the flow logs of a region
+    with unfiltered paginated calls, indexing them by security group, VPC and flow log resource so the
+    EC2 and VPC services join them with their resources instead of describing them per resource.
+
+    Each part is described the first time it is requested, and the threads requesting it meanwhile wait for it.
+    """
+
+    def __init__(self, regional_client):
+        self.regional_client = regional_client
+        self.network_interfaces_lock = threading.Lock()
+        self.flow_logs_lock = threading.Lock()
+        self._network_interfaces = None
+        self._security_groups_network_interfaces = None
+        self._vpcs_network_interfaces = None
+        self._flow_logs = None
+
+    def __describe_network_interfaces__(self):
+        self._network_interfaces = []
+        self._security_groups_network_interfaces = {}
+        self._vpcs_network_interfaces = {}
+        try:
+            describe_network_interfaces_paginator = self.regional_client.get_paginator(
+                "describe_network_interfaces"
+            )
+            for page in describe_network_interfaces_paginator.paginate():
+                for interface in page["NetworkInterfaces"]:
+                    self._network_interfaces.append(interface)
+                    for group in interface.get("Groups", []):
+                        self._security_groups_network_interfaces.setdefault(
+                            group["GroupId"], []
+                        ).append(interface["NetworkInterfaceId"])
+                    if interface.get("VpcId"):
+                        self._vpcs_network_interfaces.setdefault(
+                            interface["VpcId"], []
+                        ).append(interface["NetworkInterfaceId"])
+        except Exception as error:
+            logger.error(
+                f"{self.regional_client.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
+
+    def __describe_flow_logs__(self):
+        self._flow_logs = {}
+        try:
+            describe_flow_logs_paginator = self.regional_client.get_paginator(
+                "describe_flow_logs"
+            )
+            for page in describe_flow_logs_paginator.paginate():
+                for flow_log in page["FlowLogs"]:
+                    self._flow_logs.setdefault(flow_log["ResourceId"], []).append(
+                        flow_log
+                    )
+        except Exception as error:
+            logger.error(
+                f"{self.regional_client.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
+
+    def get_network_interfaces(self) -> list:
+        """get_network_interfaces returns the network interfaces of the region"""
+        with self.network_interfaces_lock:
+            if self._network_interfaces is None:
+                self.__describe_network_interfaces__()
+        return self._network_interfaces
+
+    def get_security_groups_network_interfaces(self) -> dict:
+        """get_security_groups_network_interfaces returns the IDs of the network interfaces of the region by security group ID"""
+        with self.network_interfaces_lock:
+            if self._network_interfaces is None:
+                self.__describe_network_interfaces__()
+        return self._security_groups_network_interfaces
+
+    def get_vpcs_network_interfaces(self) -> dict:
+        """get_vpcs_network_interfaces returns the IDs of the network interfaces of the region by VPC ID"""
+        with self.network_interfaces_lock:
+            if self._network_interfaces is None:
+                self.__describe_network_interfaces__()
+        return self._vpcs_network_interfaces
+
+    def get_flow_logs(self) -> dict:
+        """get_flow_logs returns the flow logs of the region by the ID of their resource, e.g. a VPC"""
+        with self.flow_logs_lock:
+            if self._flow_logs is None:
+                self.__describe_flow_logs__()
+        return self._flow_logs
+
+
+# Snapshots of each region by session, shared by the services created from the same session and released with it
+regional_network_snapshots = WeakKeyDictionary()
+regional_network_snapshots_lock = threading.Lock()
+
+
+def get_regional_network_snapshot(
+    aws_session: session.Session, regional_client
+) -> Regional_Network_Snapshot:
+    """get_regional_network_snapshot returns the network snapshot of the client's region shared by the services of the session"""
+    with regional_network_snapshots_lock:
+        session_snapshots = regional_network_snapshots.setdefault(aws_session, {})
+        if regional_client.region not in session_snapshots:
+            session_snapshots[regional_client.region] = Regional_Network_Snapshot(
+                regional_client
+            )
+        return session_snapshots[regional_client.region]
@@ -1,6 +1,11 @@
 import ipaddress
+from bisect import bisect_right
+from functools import lru_cache
 from typing import Any
 
+# Number of ports in the 0-65535 range
+ALL_PORTS = 65536
+
 
 ################## Security Groups
 def check_security_group(
@@ -46,22 +51,14 @@ def check_security_group(
 
     # Check for specific ports in ingress rules
     if "FromPort" in ingress_rule:
-        # If there is a port range
-        if ingress_rule["FromPort"] != ingress_rule["ToPort"]:
-            # Calculate port range, adding 1
-            diff = (ingress_rule["ToPort"] - ingress_rule["FromPort"]) + 1
-            ingress_port_range = []
-            for x in range(diff):
-                ingress_port_range.append(int(ingress_rule["FromPort"]) + x)
-        # If FromPort and ToPort are the same
-        else:
-            ingress_port_range = []
-            ingress_port_range.append(int(ingress_rule["FromPort"]))
+        ingress_port_range = range(
+            int(ingress_rule["FromPort"]), int(ingress_rule["ToPort"]) + 1
+        )
 
         # Test Security Group
-        # IPv4
-        for ip_ingress_rule in ingress_rule["IpRanges"]:
-            if _is_cidr_public(ip_ingress_rule["CidrIp"], any_address):
+        # IPv4 and IPv6
+        for cidr in _get_ingress_rule_cidrs(ingress_rule):
+            if _is_cidr_public(cidr, any_address):
                 # If there are input ports to check
                 if ports:
                     for port in ports:
@@ -71,25 +68,89 @@ def check_security_group(
                         ):
                             return True
                 # If no input ports check if all ports are open
-                if len(set(ingress_port_range)) == 65536:
+                if len(ingress_port_range) == ALL_PORTS:
                     return True
 
-        # IPv6
-        for ip_ingress_rule in ingress_rule["Ipv6Ranges"]:
-            if _is_cidr_public(ip_ingress_rule["CidrIpv6"], any_address):
-                # If there are input ports to check
-                if ports:
-                    for port in ports:
-                        if (
-                            port in ingress_port_range
-                            and ingress_rule["IpProtocol"] == protocol
-                        ):
-                            return True
-                # If no input ports check if all ports are open
-                if len(set(ingress_port_range)) == 65536:
+    return False
+
+
+class Security_Group_Exposure:
+    """
+    The Security_Group_Exposure class indexes once the security group ingress rules open to the Internet, both to 0.0.0.0/0 or ::/0 (any_address) and to any public CIDR:
+    - all_ports: if all the ports are open, either with the all traffic protocol or with the 0-65535 range
+    - port_ranges: merged and sorted port ranges by protocol, to look up the ports with a binary search
+    Each index is built the first time it is looked up, so only 0.0.0.0/0 or ::/0 are searched if the public CIDRs are never checked.
+    """
+
+    def __init__(self, ingress_rules: list):
+        self.ingress_rules = ingress_rules
+        self.all_ports = {}
+        self.port_ranges = {}
+
+    def index(self, any_address: bool = False):
+        """index builds the all_ports and port_ranges of the ingress rules open to the Internet, once per any_address"""
+        if any_address in self.port_ranges:
+            return
+        all_ports = False
+        port_ranges = {}
+        for ingress_rule in self.ingress_rules:
+            if not any(
+                _is_cidr_public(cidr, any_address)
+                for cidr in _get_ingress_rule_cidrs(ingress_rule)
+            ):
+                continue
+            # Check for all traffic ingress rules regardless of the protocol
+            if ingress_rule["IpProtocol"] == "-1":
+                all_ports = True
+            if "FromPort" in ingress_rule:
+                from_port = int(ingress_rule["FromPort"])
+                to_port = int(ingress_rule["ToPort"])
+                if to_port - from_port + 1 == ALL_PORTS:
+                    all_ports = True
+                port_ranges.setdefault(ingress_rule["IpProtocol"], []).append(
+                    (from_port, to_port)
+                )
+        self.all_ports[any_address] = all_ports
+        self.port_ranges[any_address] = {
+            protocol: _merge_port_ranges(protocol_port_ranges)
+            for protocol, protocol_port_ranges in port_ranges.items()
+        }
+
+    def is_exposed(
+        self, protocol: str, ports: list = [], any_address: bool = False
+    ) -> bool:
+        """is_exposed returns True like check_security_group for any of the security group ingress rules, looking up the ports in the merged port ranges"""
+        self.index(any_address)
+        if self.all_ports[any_address]:
+            return True
+        port_ranges = self.port_ranges[any_address].get(protocol)
+        if port_ranges:
+            from_ports, to_ports = port_ranges
+            for port in ports:
+                index = bisect_right(from_ports, port) - 1
+                if index >= 0 and port <= to_ports[index]:
                     return True
+        return False
+
+
+def _merge_port_ranges(port_ranges: list) -> tuple:
+    """_merge_port_ranges returns the sorted lists of the first and last ports of the merged port ranges"""
+    from_ports = []
+    to_ports = []
+    for from_port, to_port in sorted(port_ranges):
+        if to_ports and from_port <= to_ports[-1] + 1:
+            to_ports[-1] = max(to_ports[-1], to_port)
+        else:
+            from_ports.append(from_port)
+            to_ports.append(to_port)
+    return from_ports, to_ports
 
-    return False
+
+def _get_ingress_rule_cidrs(ingress_rule: Any) -> list:
+    """_get_ingress_rule_cidrs returns the IPv4 and IPv6 CIDRs of the security group ingress rule"""
+    return [ip_range["CidrIp"] for ip_range in ingress_rule.get("IpRanges", [])] + [
+        ip_range["CidrIpv6"] for ip_range in ingress_rule.get("Ipv6Ranges", [])
+    ]
 
 
 def _is_cidr_public(cidr: str, any_address: bool = False) -> bool:
@@ -105,4 +166,10 @@ def _is_cidr_public(cidr: str, any_address: bool = False) -> bool:
     if cidr in (public_IPv4, public_IPv6):
         return True
     if not any_address:
-        return ipaddress.ip_network(cidr).is_global
+        return _is_cidr_global(cidr)
+
+
+@lru_cache(maxsize=None)
+def _is_cidr_global(cidr: str) -> bool:
+    """_is_cidr_global returns if the CIDR is global, parsing every CIDR only once"""
+    return ipaddress.ip_network(cidr).is_global
@@ -0,0 +1,15 @@
+import zlib
+from base64 import b64decode
+
+
+################## User Data
+def decode_user_data(user_data: str) -> str:
+    """
+    Decode the base64 User Data of an EC2 instance or launch configuration
+
+    @param user_data: base64 User Data, decompressed if it is GZIP
+    """
+    user_data = b64decode(user_data)
+    if user_data[0:2] == b"\x1f\x8b":  # GZIP magic number
+        return zlib.decompress(user_data, zlib.MAX_WBITS | 32).decode("utf-8")
+    return user_data.decode("utf-8")
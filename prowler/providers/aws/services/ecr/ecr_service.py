@@ -35,7 +35,7 @@ class ECR(AWSService):
                 for repository in page["repositories"]:
                     if not self.audit_resources or (
                         is_resource_filtered(
-                            repository["repositoryArn"], self.audit_resources
+                            repository["repositoryArn"], self.audit_resources_filter
                         )
                     ):
                         regional_registry_repositories.append(
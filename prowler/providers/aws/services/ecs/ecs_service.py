@@ -24,7 +24,9 @@ class ECS(AWSService):
             for page in list_ecs_paginator.paginate():
                 for task_definition in page["taskDefinitionArns"]:
                     if not self.audit_resources or (
-                        is_resource_filtered(task_definition, self.audit_resources)
+                        is_resource_filtered(
+                            task_definition, self.audit_resources_filter
+                        )
                     ):
                         self.task_definitions.append(
                             TaskDefinition(
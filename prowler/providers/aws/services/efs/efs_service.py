@@ -29,7 +29,7 @@ class EFS(AWSService):
                     efs_id = efs["FileSystemId"]
                     efs_arn = f"arn:{self.audited_partition}:elasticfilesystem:{regional_client.region}:{self.audited_account}:file-system/{efs_id}"
                     if not self.audit_resources or (
-                        is_resource_filtered(efs_arn, self.audit_resources)
+                        is_resource_filtered(efs_arn, self.audit_resources_filter)
                     ):
                         self.filesystems.append(
                             FileSystem(
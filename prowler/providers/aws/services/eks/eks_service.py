@@ -24,7 +24,7 @@ class EKS(AWSService):
                 for cluster in page["clusters"]:
                     arn = f"arn:{self.audited_partition}:eks:{regional_client.region}:{self.audited_account}:cluster/{cluster}"
                     if not self.audit_resources or (
-                        is_resource_filtered(arn, self.audit_resources)
+                        is_resource_filtered(arn, self.audit_resources_filter)
                     ):
                         self.clusters.append(
                             EKSCluster(
@@ -26,7 +26,7 @@ class ElastiCache(AWSService):
             ]:
                 cluster_arn = cache_cluster["ARN"]
                 if not self.audit_resources or (
-                    is_resource_filtered(cluster_arn, self.audit_resources)
+                    is_resource_filtered(cluster_arn, self.audit_resources_filter)
                 ):
                     self.clusters[cluster_arn] = Cluster(
                         id=cache_cluster["CacheClusterId"],
@@ -27,7 +27,7 @@ class ELB(AWSService):
                 for elb in page["LoadBalancerDescriptions"]:
                     arn = f"arn:{self.audited_partition}:elasticloadbalancing:{regional_client.region}:{self.audited_account}:loadbalancer/{elb['LoadBalancerName']}"
                     if not self.audit_resources or (
-                        is_resource_filtered(arn, self.audit_resources)
+                        is_resource_filtered(arn, self.audit_resources_filter)
                     ):
                         listeners = []
                         for listener in elb["ListenerDescriptions"]:
@@ -31,7 +31,7 @@ class ELBv2(AWSService):
                 for elbv2 in page["LoadBalancers"]:
                     if not self.audit_resources or (
                         is_resource_filtered(
-                            elbv2["LoadBalancerArn"], self.audit_resources
+                            elbv2["LoadBalancerArn"], self.audit_resources_filter
                         )
                     ):
                         lb = LoadBalancerv2(
@@ -28,7 +28,7 @@ class EMR(AWSService):
                 for cluster in page["Clusters"]:
                     if not self.audit_resources or (
                         is_resource_filtered(
-                            cluster["ClusterArn"], self.audit_resources
+                            cluster["ClusterArn"], self.audit_resources_filter
                         )
                     ):
                         cluster_name = cluster["Name"]
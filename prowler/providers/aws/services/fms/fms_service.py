@@ -25,7 +25,7 @@ class FMS(AWSService):
                     for fms_policy in page["PolicyList"]:
                         if not self.audit_resources or (
                             is_resource_filtered(
-                                fms_policy["PolicyArn"], self.audit_resources
+                                fms_policy["PolicyArn"], self.audit_resources_filter
                             )
                         ):
                             self.fms_policies.append(
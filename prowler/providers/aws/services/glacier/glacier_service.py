@@ -26,7 +26,9 @@ class Glacier(AWSService):
             for page in list_vaults_paginator.paginate():
                 for vault in page["VaultList"]:
                     if not self.audit_resources or (
-                        is_resource_filtered(vault["VaultARN"], self.audit_resources)
+                        is_resource_filtered(
+                            vault["VaultARN"], self.audit_resources_filter
+                        )
                     ):
                         vault_name = vault["VaultName"]
                         vault_arn = vault["VaultARN"]
@@ -27,7 +27,7 @@ class GlobalAccelerator(AWSService):
                 for accelerator in page["Accelerators"]:
                     if not self.audit_resources or (
                         is_resource_filtered(
-                            accelerator["AcceleratorArn"], self.audit_resources
+                            accelerator["AcceleratorArn"], self.audit_resources_filter
                         )
                     ):
                         accelerator_arn = accelerator["AcceleratorArn"]
@@ -33,7 +33,7 @@ class Glue(AWSService):
                 for conn in page["ConnectionList"]:
                     arn = f"arn:{self.audited_partition}:glue:{regional_client.region}:{self.audited_account}:connection/{conn['Name']}"
                     if not self.audit_resources or (
-                        is_resource_filtered(arn, self.audit_resources)
+                        is_resource_filtered(arn, self.audit_resources_filter)
                     ):
                         self.connections.append(
                             Connection(
@@ -59,7 +59,7 @@ class Glue(AWSService):
                 for endpoint in page["DevEndpoints"]:
                     arn = f"arn:{self.audited_partition}:glue:{regional_client.region}:{self.audited_account}:devEndpoint/{endpoint['EndpointName']}"
                     if not self.audit_resources or (
-                        is_resource_filtered(arn, self.audit_resources)
+                        is_resource_filtered(arn, self.audit_resources_filter)
                     ):
                         self.dev_endpoints.append(
                             DevEndpoint(
@@ -82,7 +82,7 @@ class Glue(AWSService):
                 for job in page["Jobs"]:
                     arn = f"arn:{self.audited_partition}:glue:{regional_client.region}:{self.audited_account}:job/{job['Name']}"
                     if not self.audit_resources or (
-                        is_resource_filtered(arn, self.audit_resources)
+                        is_resource_filtered(arn, self.audit_resources_filter)
                     ):
                         self.jobs.append(
                             Job(
@@ -107,7 +107,9 @@ class Glue(AWSService):
             for page in get_security_configurations_paginator.paginate():
                 for config in page["SecurityConfigurations"]:
                     if not self.audit_resources or (
-                        is_resource_filtered(config["Name"], self.audit_resources)
+                        is_resource_filtered(
+                            config["Name"], self.audit_resources_filter
+                        )
                     ):
                         self.security_configs.append(
                             SecurityConfig(
@@ -144,7 +146,7 @@ class Glue(AWSService):
             for table in regional_client.search_tables()["TableList"]:
                 arn = f"arn:{self.audited_partition}:glue:{regional_client.region}:{self.audited_account}:table/{table['DatabaseName']}/{table['Name']}"
                 if not self.audit_resources or (
-                    is_resource_filtered(arn, self.audit_resources)
+                    is_resource_filtered(arn, self.audit_resources_filter)
                 ):
                     self.tables.append(
                         Table(
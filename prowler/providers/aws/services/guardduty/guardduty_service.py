@@ -30,7 +30,7 @@ class GuardDuty(AWSService):
                     detectors = True
                     arn = f"arn:{self.audited_partition}:guardduty:{regional_client.region}:{self.audited_account}:detector/{detector}"
                     if not self.audit_resources or (
-                        is_resource_filtered(arn, self.audit_resources)
+                        is_resource_filtered(arn, self.audit_resources_filter)
                     ):
                         self.detectors.append(
                             Detector(
@@ -48,19 +48,39 @@ def is_service_role(role):
 
 ################## IAM
 class IAM(AWSService):
+    # Checks consuming the data of the per-user discovery methods only needed by some checks
+    discovery_checks = {
+        "__get_user_access_keys_metadata__": ["iam_user_with_temporary_credentials"],
+        "__get_user_last_accessed_services__": ["iam_user_with_temporary_credentials"],
+    }
+
     def __init__(self, audit_info):
         # Call AWSService's __init__
         super().__init__(__class__.__name__, audit_info)
         self.users = self.__get_users__()
-        self.roles = self.__get_roles__()
         self.account_summary = self.__get_account_summary__()
         self.virtual_mfa_devices = self.__list_virtual_mfa_devices__()
         self.credential_report = self.__get_credential_report__()
-        self.groups = self.__get_groups__()
-        self.__get_group_users__()
-        self.__list_attached_group_policies__()
-        self.__list_attached_user_policies__()
-        self.__list_attached_role_policies__()
+        if self.audit_config and self.audit_config.get("iam_bulk_discovery", False):
+            # Users, groups, roles and policies in a few GetAccountAuthorizationDetails calls
+            self.__get_account_authorization_details__()
+            self.__list_policies_tags__()
+        else:
+            self.roles = self.__get_roles__()
+            self.groups = self.__get_groups__()
+            self.__get_group_users__()
+            self.__list_attached_group_policies__()
+            self.__list_attached_user_policies__()
+            self.__list_attached_role_policies__()
+            # List both Customer (attached and unattached) and AWS Managed (only attached) policies
+            self.policies = []
+            self.policies.extend(self.__list_policies__("AWS"))
+            self.policies.extend(self.__list_policies__("Local"))
+            self.__list_policies_version__(self.policies)
+            self.__list_inline_user_policies__()
+            self.__list_inline_group_policies__()
+            self.__list_inline_role_policies__()
+            self.__list_tags_for_resource__()
         self.__list_mfa_devices__()
         self.password_policy = self.__get_password_policy__()
         support_policy_arn = (
@@ -73,17 +93,8 @@ class IAM(AWSService):
         self.entities_role_attached_to_securityaudit_policy = (
             self.__list_entities_role_for_policy__(securityaudit_policy_arn)
         )
-        # List both Customer (attached and unattached) and AWS Managed (only attached) policies
-        self.policies = []
-        self.policies.extend(self.__list_policies__("AWS"))
-        self.policies.extend(self.__list_policies__("Local"))
-        self.__list_policies_version__(self.policies)
-        self.__list_inline_user_policies__()
-        self.__list_inline_group_policies__()
-        self.__list_inline_role_policies__()
         self.saml_providers = self.__list_saml_providers__()
         self.server_certificates = self.__list_server_certificates__()
-        self.__list_tags_for_resource__()
         self.access_keys_metadata = {}
         self.__get_access_keys_metadata__()
         self.last_accessed_services = {}
@@ -102,7 +113,7 @@ class IAM(AWSService):
             for page in get_roles_paginator.paginate():
                 for role in page["Roles"]:
                     if not self.audit_resources or (
-                        is_resource_filtered(role["Arn"], self.audit_resources)
+                        is_resource_filtered(role["Arn"], self.audit_resources_filter)
                     ):
                         roles.append(
                             Role(
@@ -158,7 +169,7 @@ class IAM(AWSService):
             for page in get_groups_paginator.paginate():
                 for group in page["Groups"]:
                     if not self.audit_resources or (
-                        is_resource_filtered(group["Arn"], self.audit_resources)
+                        is_resource_filtered(group["Arn"], self.audit_resources_filter)
                     ):
                         groups.append(Group(name=group["GroupName"], arn=group["Arn"]))
 
@@ -240,7 +251,7 @@ class IAM(AWSService):
             for page in get_users_paginator.paginate():
                 for user in page["Users"]:
                     if not self.audit_resources or (
-                        is_resource_filtered(user["Arn"], self.audit_resources)
+                        is_resource_filtered(user["Arn"], self.audit_resources_filter)
                     ):
                         if "PasswordLastUsed" not in user:
                             users.append(User(name=user["UserName"], arn=user["Arn"]))
@@ -330,22 +341,20 @@ class IAM(AWSService):
 
     def __list_mfa_devices__(self):
         logger.info("IAM - List MFA Devices...")
+        self.__threading_call__(self.__list_user_mfa_devices__, self.users)
+
+    def __list_user_mfa_devices__(self, user):
         try:
-            for user in self.users:
-                list_mfa_devices_paginator = self.client.get_paginator(
-                    "list_mfa_devices"
-                )
-                mfa_devices = []
-                for page in list_mfa_devices_paginator.paginate(UserName=user.name):
-                    for mfa_device in page["MFADevices"]:
-                        mfa_serial_number = mfa_device["SerialNumber"]
-                        mfa_type = (
-                            mfa_device["SerialNumber"].split(":")[5].split("/")[0]
-                        )
-                        mfa_devices.append(
-                            MFADevice(serial_number=mfa_serial_number, type=mfa_type)
-                        )
-                user.mfa_devices = mfa_devices
+            list_mfa_devices_paginator = self.client.get_paginator("list_mfa_devices")
+            mfa_devices = []
+            for page in list_mfa_devices_paginator.paginate(UserName=user.name):
+                for mfa_device in page["MFADevices"]:
+                    mfa_serial_number = mfa_device["SerialNumber"]
+                    mfa_type = mfa_device["SerialNumber"].split(":")[5].split("/")[0]
+                    mfa_devices.append(
+                        MFADevice(serial_number=mfa_serial_number, type=mfa_type)
+                    )
+            user.mfa_devices = mfa_devices
         except Exception as error:
             logger.error(
                 f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
@@ -627,7 +636,7 @@ class IAM(AWSService):
             ):  # Look for only Attached policies when AWS Managed
                 for policy in page["Policies"]:
                     if not self.audit_resources or (
-                        is_resource_filtered(policy["Arn"], self.audit_resources)
+                        is_resource_filtered(policy["Arn"], self.audit_resources_filter)
                     ):
                         policies.append(
                             Policy(
@@ -692,7 +701,9 @@ class IAM(AWSService):
                 "ServerCertificateMetadataList"
             ]:
                 if not self.audit_resources or (
-                    is_resource_filtered(certificate["Arn"], self.audit_resources)
+                    is_resource_filtered(
+                        certificate["Arn"], self.audit_resources_filter
+                    )
                 ):
                     server_certificates.append(
                         Certificate(
@@ -776,39 +787,219 @@ class IAM(AWSService):
                 f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
             )
 
-    def __get_last_accessed_services__(self):
-        logger.info("IAM - Getting Last Accessed Services ...")
+    def __get_account_authorization_details__(self):
+        logger.info("IAM - Get Account Authorization Details...")
+        self.roles = []
+        self.groups = []
+        self.policies = []
         try:
-            for user in self.users:
-                try:
-                    details = self.client.generate_service_last_accessed_details(
-                        Arn=user.arn
-                    )
-                    response = self.client.get_service_last_accessed_details(
-                        JobId=details["JobId"]
+            users = {user.name: user for user in self.users}
+            group_users = {}
+            group_details = []
+            role_details = []
+            policy_details = []
+            attached_policies_arns = set()
+            get_account_authorization_details_paginator = self.client.get_paginator(
+                "get_account_authorization_details"
+            )
+            for page in get_account_authorization_details_paginator.paginate(
+                Filter=[
+                    "User",
+                    "Role",
+                    "Group",
+                    "LocalManagedPolicy",
+                    "AWSManagedPolicy",
+                ]
+            ):
+                for user_detail in page["UserDetailList"]:
+                    attached_policies_arns.update(
+                        policy["PolicyArn"]
+                        for policy in user_detail.get("AttachedManagedPolicies", [])
                     )
-                    while response["JobStatus"] == "IN_PROGRESS":
-                        response = self.client.get_service_last_accessed_details(
-                            JobId=details["JobId"]
+                    user = users.get(user_detail["UserName"])
+                    for group_name in user_detail.get("GroupList", []):
+                        group_users.setdefault(group_name, []).append(
+                            User(
+                                name=user_detail["UserName"],
+                                arn=user_detail["Arn"],
+                                password_last_used=(
+                                    user.password_last_used if user else None
+                                ),
+                            )
                         )
-                    self.last_accessed_services[(user.name, user.arn)] = response[
-                        "ServicesLastAccessed"
-                    ]
-
-                except ClientError as error:
-                    if error.response["Error"]["Code"] == "NoSuchEntity":
-                        logger.warning(
-                            f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                    if user:
+                        user.attached_policies = user_detail.get(
+                            "AttachedManagedPolicies", []
                         )
-                    else:
-                        logger.error(
-                            f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                        user.inline_policies = self.__get_inline_policies__(
+                            user.name, user.arn, user_detail.get("UserPolicyList", [])
                         )
-                except Exception as error:
-                    logger.error(
-                        f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                        user.tags = user_detail.get("Tags", [])
+                for group_detail in page["GroupDetailList"]:
+                    attached_policies_arns.update(
+                        policy["PolicyArn"]
+                        for policy in group_detail.get("AttachedManagedPolicies", [])
                     )
+                    group_details.append(group_detail)
+                for role_detail in page["RoleDetailList"]:
+                    attached_policies_arns.update(
+                        policy["PolicyArn"]
+                        for policy in role_detail.get("AttachedManagedPolicies", [])
+                    )
+                    role_details.append(role_detail)
+                policy_details.extend(page["Policies"])
+
+            # Customer (attached and unattached) and AWS Managed (only attached) policies
+            aws_policies = []
+            customer_policies = []
+            for policy in policy_details:
+                is_aws_policy = policy["Arn"].startswith(
+                    f"arn:{self.audited_partition}:iam::aws:policy/"
+                )
+                if is_aws_policy and policy["Arn"] not in attached_policies_arns:
+                    continue
+                if not self.audit_resources or (
+                    is_resource_filtered(policy["Arn"], self.audit_resources_filter)
+                ):
+                    (aws_policies if is_aws_policy else customer_policies).append(
+                        Policy(
+                            name=policy["PolicyName"],
+                            arn=policy["Arn"],
+                            entity=policy["PolicyId"],
+                            version_id=policy["DefaultVersionId"],
+                            type="AWS" if is_aws_policy else "Custom",
+                            attached=(
+                                True
+                                if is_aws_policy or policy["AttachmentCount"] > 0
+                                else False
+                            ),
+                            document=next(
+                                (
+                                    policy_version["Document"]
+                                    for policy_version in policy.get(
+                                        "PolicyVersionList", []
+                                    )
+                                    if policy_version["IsDefaultVersion"]
+                                ),
+                                None,
+                            ),
+                        )
+                    )
+            # Keep the inline policies after the managed ones, ordered by users, groups and roles
+            inline_user_policies = self.policies
+            self.policies = aws_policies + customer_policies + inline_user_policies
 
+            for group_detail in group_details:
+                if not self.audit_resources or (
+                    is_resource_filtered(
+                        group_detail["Arn"], self.audit_resources_filter
+                    )
+                ):
+                    group = Group(
+                        name=group_detail["GroupName"],
+                        arn=group_detail["Arn"],
+                        attached_policies=group_detail.get(
+                            "AttachedManagedPolicies", []
+                        ),
+                        users=group_users.get(group_detail["GroupName"], []),
+                    )
+                    group.inline_policies = self.__get_inline_policies__(
+                        group.name, group.arn, group_detail.get("GroupPolicyList", [])
+                    )
+                    self.groups.append(group)
+
+            for role_detail in role_details:
+                if not self.audit_resources or (
+                    is_resource_filtered(
+                        role_detail["Arn"], self.audit_resources_filter
+                    )
+                ):
+                    role = Role(
+                        name=role_detail["RoleName"],
+                        arn=role_detail["Arn"],
+                        assume_role_policy=role_detail["AssumeRolePolicyDocument"],
+                        is_service_role=is_service_role(role_detail),
+                        attached_policies=role_detail.get(
+                            "AttachedManagedPolicies", []
+                        ),
+                        tags=role_detail.get("Tags", []),
+                    )
+                    role.inline_policies = self.__get_inline_policies__(
+                        role.name, role.arn, role_detail.get("RolePolicyList", [])
+                    )
+                    self.roles.append(role)
+        except Exception as error:
+            logger.error(
+                f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
+
+    def __get_inline_policies__(self, entity, arn, inline_policies):
+        """__get_inline_policies__ stores the inline policies of an user, group or role and returns their names"""
+        inline_policies_names = []
+        for inline_policy in inline_policies:
+            inline_policies_names.append(inline_policy["PolicyName"])
+            self.policies.append(
+                Policy(
+                    name=inline_policy["PolicyName"],
+                    arn=arn,
+                    entity=entity,
+                    type="Inline",
+                    attached=True,
+                    version_id="v1",
+                    document=inline_policy["PolicyDocument"],
+                )
+            )
+        return inline_policies_names
+
+    def __list_policies_tags__(self):
+        logger.info("IAM - List Policies Tags...")
+        self.__threading_call__(
+            self.__list_policy_tags__,
+            [policy for policy in self.policies if policy.type != "Inline"],
+        )
+
+    def __list_policy_tags__(self, policy):
+        try:
+            policy.tags = self.client.list_policy_tags(PolicyArn=policy.arn)["Tags"]
+        except ClientError as error:
+            if error.response["Error"]["Code"] == "NoSuchEntity":
+                policy.tags = []
+            else:
+                logger.error(
+                    f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                )
+        except Exception as error:
+            logger.error(
+                f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
+
+    def __get_last_accessed_services__(self):
+        logger.info("IAM - Getting Last Accessed Services ...")
+        self.__threading_call__(self.__get_user_last_accessed_services__, self.users)
+
+    def __get_user_last_accessed_services__(self, user):
+        try:
+            details = self.client.generate_service_last_accessed_details(Arn=user.arn)
+            response = self.client.get_service_last_accessed_details(
+                JobId=details["JobId"]
+            )
+            while response["JobStatus"] == "IN_PROGRESS":
+                response = self.client.get_service_last_accessed_details(
+                    JobId=details["JobId"]
+                )
+            self.last_accessed_services[(user.name, user.arn)] = response[
+                "ServicesLastAccessed"
+            ]
+
+        except ClientError as error:
+            if error.response["Error"]["Code"] == "NoSuchEntity":
+                logger.warning(
+                    f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                )
+            else:
+                logger.error(
+                    f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                )
         except Exception as error:
             logger.error(
                 f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
@@ -816,28 +1007,25 @@ class IAM(AWSService):
 
     def __get_access_keys_metadata__(self):
         logger.info("IAM - Getting Access Keys Metadata ...")
+        self.__threading_call__(self.__get_user_access_keys_metadata__, self.users)
+
+    def __get_user_access_keys_metadata__(self, user):
         try:
-            for user in self.users:
-                try:
-                    paginator = self.client.get_paginator("list_access_keys")
-                    self.access_keys_metadata[(user.name, user.arn)] = []
-                    for response in paginator.paginate(UserName=user.name):
-                        self.access_keys_metadata[(user.name, user.arn)] = response[
-                            "AccessKeyMetadata"
-                        ]
-                except ClientError as error:
-                    if error.response["Error"]["Code"] == "NoSuchEntity":
-                        logger.warning(
-                            f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-                        )
-                    else:
-                        logger.error(
-                            f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-                        )
-                except Exception as error:
-                    logger.error(
-                        f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-                    )
+            paginator = self.client.get_paginator("list_access_keys")
+            self.access_keys_metadata[(user.name, user.arn)] = []
+            for response in paginator.paginate(UserName=user.name):
+                self.access_keys_metadata[(user.name, user.arn)] = response[
+                    "AccessKeyMetadata"
+                ]
+        except ClientError as error:
+            if error.response["Error"]["Code"] == "NoSuchEntity":
+                logger.warning(
+                    f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                )
+            else:
+                logger.error(
+                    f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                )
         except Exception as error:
             logger.error(
                 f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
@@ -47,7 +47,7 @@ class Inspector2(AWSService):
                         for finding in page["findings"]:
                             if not self.audit_resources or (
                                 is_resource_filtered(
-                                    finding["findingArn"], self.audit_resources
+                                    finding["findingArn"], self.audit_resources_filter
                                 )
                             ):
                                 inspector.findings.append(
@@ -28,7 +28,7 @@ class KMS(AWSService):
             for page in list_keys_paginator.paginate():
                 for key in page["Keys"]:
                     if not self.audit_resources or (
-                        is_resource_filtered(key["KeyArn"], self.audit_resources)
+                        is_resource_filtered(key["KeyArn"], self.audit_resources_filter)
                     ):
                         self.keys.append(
                             Key(
@@ -33,7 +33,7 @@ class Neptune(AWSService):
             )["DBClusters"]:
                 cluster_arn = cluster["DBClusterArn"]
                 if not self.audit_resources or (
-                    is_resource_filtered(cluster_arn, self.audit_resources)
+                    is_resource_filtered(cluster_arn, self.audit_resources_filter)
                 ):
                     self.clusters[cluster_arn] = Cluster(
                         arn=cluster_arn,
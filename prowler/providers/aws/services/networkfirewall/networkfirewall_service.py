@@ -24,7 +24,7 @@ class NetworkFirewall(AWSService):
                 for network_firewall in page["Firewalls"]:
                     if not self.audit_resources or (
                         is_resource_filtered(
-                            network_firewall["FirewallArn"], self.audit_resources
+                            network_firewall["FirewallArn"], self.audit_resources_filter
                         )
                     ):
                         self.network_firewalls.append(
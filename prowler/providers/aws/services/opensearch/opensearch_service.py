@@ -26,7 +26,7 @@ class OpenSearchService(AWSService):
             for domain in domains["DomainNames"]:
                 arn = f"arn:{self.audited_partition}:opensearch:{regional_client.region}:{self.audited_account}:domain/{domain['DomainName']}"
                 if not self.audit_resources or (
-                    is_resource_filtered(arn, self.audit_resources)
+                    is_resource_filtered(arn, self.audit_resources_filter)
                 ):
                     self.opensearch_domains.append(
                         OpenSearchDomain(
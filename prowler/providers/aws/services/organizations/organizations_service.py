@@ -61,7 +61,7 @@ class Organizations(AWSService):
                     )
             else:
                 if not self.audit_resources or (
-                    is_resource_filtered(organization_arn, self.audit_resources)
+                    is_resource_filtered(organization_arn, self.audit_resources_filter)
                 ):
                     self.organizations.append(
                         Organization(
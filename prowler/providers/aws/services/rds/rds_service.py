@@ -37,7 +37,7 @@ class RDS(AWSService):
                 for instance in page["DBInstances"]:
                     arn = f"arn:{self.audited_partition}:rds:{regional_client.region}:{self.audited_account}:db:{instance['DBInstanceIdentifier']}"
                     if not self.audit_resources or (
-                        is_resource_filtered(arn, self.audit_resources)
+                        is_resource_filtered(arn, self.audit_resources_filter)
                     ):
                         if instance["Engine"] != "docdb":
                             self.db_instances.append(
@@ -114,7 +114,7 @@ class RDS(AWSService):
                 for snapshot in page["DBSnapshots"]:
                     arn = f"arn:{self.audited_partition}:rds:{regional_client.region}:{self.audited_account}:snapshot:{snapshot['DBSnapshotIdentifier']}"
                     if not self.audit_resources or (
-                        is_resource_filtered(arn, self.audit_resources)
+                        is_resource_filtered(arn, self.audit_resources_filter)
                     ):
                         if snapshot["Engine"] != "docdb":
                             self.db_snapshots.append(
@@ -163,7 +163,9 @@ class RDS(AWSService):
                 for cluster in page["DBClusters"]:
                     db_cluster_arn = f"arn:{self.audited_partition}:rds:{regional_client.region}:{self.audited_account}:cluster:{cluster['DBClusterIdentifier']}"
                     if not self.audit_resources or (
-                        is_resource_filtered(db_cluster_arn, self.audit_resources)
+                        is_resource_filtered(
+                            db_cluster_arn, self.audit_resources_filter
+                        )
                     ):
                         if cluster["Engine"] != "docdb":
                             db_cluster = DBCluster(
@@ -208,7 +210,7 @@ class RDS(AWSService):
                     if not self.audit_resources or (
                         is_resource_filtered(
                             arn,
-                            self.audit_resources,
+                            self.audit_resources_filter,
                         )
                     ):
                         if snapshot["Engine"] != "docdb":
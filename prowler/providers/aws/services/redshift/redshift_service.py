@@ -25,7 +25,7 @@ class Redshift(AWSService):
                 for cluster in page["Clusters"]:
                     arn = f"arn:{self.audited_partition}:redshift:{regional_client.region}:{self.audited_account}:cluster:{cluster['ClusterIdentifier']}"
                     if not self.audit_resources or (
-                        is_resource_filtered(arn, self.audit_resources)
+                        is_resource_filtered(arn, self.audit_resources_filter)
                     ):
                         cluster_to_append = Cluster(
                             arn=arn,
@@ -20,7 +20,7 @@ class ResourceExplorer2(AWSService):
             for page in list_indexes_paginator.paginate():
                 for index in page.get("Indexes"):
                     if not self.audit_resources or (
-                        is_resource_filtered(index["Arn"], self.audit_resources)
+                        is_resource_filtered(index["Arn"], self.audit_resources_filter)
                     ):
                         self.indexes.append(
                             Indexes(
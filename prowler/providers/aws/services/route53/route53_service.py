@@ -28,7 +28,7 @@ class Route53(AWSService):
                     hosted_zone_id = hosted_zone["Id"].replace("/hostedzone/", "")
                     arn = f"arn:{self.audited_partition}:route53:::hostedzone/{hosted_zone_id}"
                     if not self.audit_resources or (
-                        is_resource_filtered(arn, self.audit_resources)
+                        is_resource_filtered(arn, self.audit_resources_filter)
                     ):
                         hosted_zone_name = hosted_zone["Name"]
                         private_zone = hosted_zone["Config"]["PrivateZone"]
@@ -1,5 +1,4 @@
 import json
-import threading
 from typing import Optional
 
 from botocore.client import ClientError
@@ -12,76 +11,86 @@ from prowler.providers.aws.lib.service.service import AWSService
 
 ################## S3
 class S3(AWSService):
+    # Checks consuming the data of each per-bucket discovery method, the tags are always needed for the findings
+    discovery_checks = {
+        "__get_bucket_versioning__": [
+            "s3_bucket_object_versioning",
+            "s3_bucket_no_mfa_delete",
+            "cloudtrail_bucket_requires_mfa_delete",
+        ],
+        "__get_bucket_logging__": [
+            "s3_bucket_server_access_logging_enabled",
+            "cloudtrail_logs_s3_bucket_access_logging_enabled",
+        ],
+        "__get_bucket_policy__": [
+            "s3_bucket_policy_public_write_access",
+            "s3_bucket_public_access",
+            "s3_bucket_secure_transport_policy",
+        ],
+        "__get_bucket_acl__": [
+            "s3_bucket_public_access",
+            "s3_bucket_public_list_acl",
+            "s3_bucket_public_write_acl",
+            "cloudtrail_logs_s3_bucket_is_not_publicly_accessible",
+        ],
+        "__get_public_access_block__": [
+            "s3_bucket_level_public_access_block",
+            "s3_bucket_policy_public_write_access",
+            "s3_bucket_public_access",
+            "s3_bucket_public_list_acl",
+            "s3_bucket_public_write_acl",
+        ],
+        "__get_bucket_encryption__": [
+            "s3_bucket_default_encryption",
+            "s3_bucket_kms_encryption",
+        ],
+        "__get_bucket_ownership_controls__": ["s3_bucket_acl_prohibited"],
+        "__get_object_lock_configuration__": ["s3_bucket_object_lock"],
+    }
+
     def __init__(self, audit_info):
         # Call AWSService's __init__
         super().__init__(__class__.__name__, audit_info)
         self.regions_with_buckets = []
         self.buckets = self.__list_buckets__(audit_info)
-        self.__threading_call__(self.__get_bucket_versioning__)
-        self.__threading_call__(self.__get_bucket_logging__)
-        self.__threading_call__(self.__get_bucket_policy__)
-        self.__threading_call__(self.__get_bucket_acl__)
-        self.__threading_call__(self.__get_public_access_block__)
-        self.__threading_call__(self.__get_bucket_encryption__)
-        self.__threading_call__(self.__get_bucket_ownership_controls__)
-        self.__threading_call__(self.__get_object_lock_configuration__)
-        self.__threading_call__(self.__get_bucket_tagging__)
-
-    # In the S3 service we override the "__threading_call__" method because we spawn a process per bucket instead of per region
-    # TODO: Replace the above function with the service __threading_call__ using the buckets as the iterator
-    def __threading_call__(self, call):
-        threads = []
-        for bucket in self.buckets:
-            threads.append(threading.Thread(target=call, args=(bucket,)))
-        for t in threads:
-            t.start()
-        for t in threads:
-            t.join()
+        self.__threading_call__(self.__get_bucket_attributes__, self.buckets)
 
     def __list_buckets__(self, audit_info):
         logger.info("S3 - Listing buckets...")
         buckets = []
         try:
             list_buckets = self.client.list_buckets()
-            for bucket in list_buckets["Buckets"]:
-                try:
-                    bucket_region = self.client.get_bucket_location(
-                        Bucket=bucket["Name"]
-                    )["LocationConstraint"]
-                    if bucket_region == "EU":  # If EU, bucket_region is eu-west-1
-                        bucket_region = "eu-west-1"
-                    if not bucket_region:  # If None, bucket_region is us-east-1
-                        bucket_region = "us-east-1"
-                    # Arn
-                    arn = f"arn:{self.audited_partition}:s3:::{bucket['Name']}"
-                    if not self.audit_resources or (
-                        is_resource_filtered(arn, self.audit_resources)
-                    ):
-                        self.regions_with_buckets.append(bucket_region)
-                        # Check if there are filter regions
-                        if audit_info.audited_regions:
-                            if bucket_region in audit_info.audited_regions:
-                                buckets.append(
-                                    Bucket(
-                                        name=bucket["Name"],
-                                        arn=arn,
-                                        region=bucket_region,
-                                    )
-                                )
-                        else:
-                            buckets.append(
-                                Bucket(
-                                    name=bucket["Name"], arn=arn, region=bucket_region
-                                )
-                            )
-                except ClientError as error:
-                    if error.response["Error"]["Code"] == "NoSuchBucket":
-                        logger.warning(
-                            f"{bucket['Name']} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-                        )
-                except Exception as error:
-                    logger.error(
-                        f"{bucket['Name']} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            audited_buckets = [
+                bucket
+                for bucket in list_buckets["Buckets"]
+                if not self.audit_resources
+                or (
+                    is_resource_filtered(
+                        f"arn:{self.audited_partition}:s3:::{bucket['Name']}",
+                        self.audit_resources_filter,
+                    )
+                )
+            ]
+            # Resolve the buckets region concurrently, within the API Scheduler limits of the S3 client region
+            bucket_regions = [
+                self.api_scheduler.submit(
+                    self.service, self.region, self.__get_bucket_region__, bucket
+                )
+                for bucket in audited_buckets
+            ]
+            for bucket, bucket_region in zip(audited_buckets, bucket_regions):
+                bucket_region = bucket_region.result()
+                if not bucket_region:
+                    continue
+                arn = f"arn:{self.audited_partition}:s3:::{bucket['Name']}"
+                self.regions_with_buckets.append(bucket_region)
+                # Check if there are filter regions
+                if (
+                    not audit_info.audited_regions
+                    or bucket_region in audit_info.audited_regions
+                ):
+                    buckets.append(
+                        Bucket(name=bucket["Name"], arn=arn, region=bucket_region)
                     )
         except Exception as error:
             logger.error(
@@ -89,6 +98,50 @@ class S3(AWSService):
             )
         return buckets
 
+    def __get_bucket_region__(self, bucket):
+        try:
+            # The ListBuckets response includes the BucketRegion in the recent API versions
+            if bucket.get("BucketRegion"):
+                return bucket["BucketRegion"]
+            bucket_region = self.client.get_bucket_location(Bucket=bucket["Name"])[
+                "LocationConstraint"
+            ]
+            if bucket_region == "EU":  # If EU, bucket_region is eu-west-1
+                bucket_region = "eu-west-1"
+            if not bucket_region:  # If None, bucket_region is us-east-1
+                bucket_region = "us-east-1"
+            return bucket_region
+        except ClientError as error:
+            if error.response["Error"]["Code"] == "NoSuchBucket":
+                logger.warning(
+                    f"{bucket['Name']} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                )
+            else:
+                logger.error(
+                    f"{bucket['Name']} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                )
+        except Exception as error:
+            logger.error(
+                f"{bucket['Name']} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
+        return None
+
+    def __get_bucket_attributes__(self, bucket):
+        """__get_bucket_attributes__ gets all the attributes of a bucket in one task, skipping the ones not needed by the audited checks"""
+        for get_bucket_attribute in (
+            self.__get_bucket_versioning__,
+            self.__get_bucket_logging__,
+            self.__get_bucket_policy__,
+            self.__get_bucket_acl__,
+            self.__get_public_access_block__,
+            self.__get_bucket_encryption__,
+            self.__get_bucket_ownership_controls__,
+            self.__get_object_lock_configuration__,
+            self.__get_bucket_tagging__,
+        ):
+            if self.__is_discovery_needed__(get_bucket_attribute):
+                get_bucket_attribute(bucket)
+
     def __get_bucket_versioning__(self, bucket):
         logger.info("S3 - Get buckets versioning...")
         try:
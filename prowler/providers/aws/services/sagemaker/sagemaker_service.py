@@ -35,7 +35,7 @@ class SageMaker(AWSService):
                     if not self.audit_resources or (
                         is_resource_filtered(
                             notebook_instance["NotebookInstanceArn"],
-                            self.audit_resources,
+                            self.audit_resources_filter,
                         )
                     ):
                         self.sagemaker_notebook_instances.append(
@@ -57,7 +57,9 @@ class SageMaker(AWSService):
             for page in list_models_paginator.paginate():
                 for model in page["Models"]:
                     if not self.audit_resources or (
-                        is_resource_filtered(model["ModelArn"], self.audit_resources)
+                        is_resource_filtered(
+                            model["ModelArn"], self.audit_resources_filter
+                        )
                     ):
                         self.sagemaker_models.append(
                             Model(
@@ -81,7 +83,7 @@ class SageMaker(AWSService):
                 for training_job in page["TrainingJobSummaries"]:
                     if not self.audit_resources or (
                         is_resource_filtered(
-                            training_job["TrainingJobArn"], self.audit_resources
+                            training_job["TrainingJobArn"], self.audit_resources_filter
                         )
                     ):
                         self.sagemaker_training_jobs.append(
@@ -22,7 +22,7 @@ class SecretsManager(AWSService):
             for page in list_secrets_paginator.paginate():
                 for secret in page["SecretList"]:
                     if not self.audit_resources or (
-                        is_resource_filtered(secret["ARN"], self.audit_resources)
+                        is_resource_filtered(secret["ARN"], self.audit_resources_filter)
                     ):
                         # We must use the Secret ARN as the dict key to have unique keys
                         self.secrets[secret["ARN"]] = Secret(
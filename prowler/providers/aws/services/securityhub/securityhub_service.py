@@ -35,7 +35,7 @@ class SecurityHub(AWSService):
                     )
             else:
                 if not self.audit_resources or (
-                    is_resource_filtered(hub_arn, self.audit_resources)
+                    is_resource_filtered(hub_arn, self.audit_resources_filter)
                 ):
                     hub_id = hub_arn.split("/")[1]
                     get_enabled_standards_paginator = regional_client.get_paginator(
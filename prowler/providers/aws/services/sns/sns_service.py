@@ -26,7 +26,7 @@ class SNS(AWSService):
                 for topic_arn in page["Topics"]:
                     if not self.audit_resources or (
                         is_resource_filtered(
-                            topic_arn["TopicArn"], self.audit_resources
+                            topic_arn["TopicArn"], self.audit_resources_filter
                         )
                     ):
                         self.topics.append(
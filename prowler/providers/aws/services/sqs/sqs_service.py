@@ -34,7 +34,7 @@ class SQS(AWSService):
                         queue_name = queue.split("/")[-1]
                         arn = f"arn:{self.audited_partition}:sqs:{regional_client.region}:{self.audited_account}:{queue_name}"
                         if not self.audit_resources or (
-                            is_resource_filtered(arn, self.audit_resources)
+                            is_resource_filtered(arn, self.audit_resources_filter)
                         ):
                             self.queues.append(
                                 Queue(
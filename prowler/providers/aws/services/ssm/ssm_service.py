@@ -44,7 +44,7 @@ class SSM(AWSService):
                     document_name = document["Name"]
                     document_arn = f"arn:{self.audited_partition}:ssm:{regional_client.region}:{self.audited_account}:document/{document_name}"
                     if not self.audit_resources or (
-                        is_resource_filtered(document_arn, self.audit_resources)
+                        is_resource_filtered(document_arn, self.audit_resources_filter)
                     ):
                         # We must use the Document ARN as the dict key to have unique keys
                         self.documents[document_arn] = Document(
@@ -37,7 +37,9 @@ class SSMIncidents(AWSService):
                 if list_replication_sets:
                     replication_set = list_replication_sets[0]
                     if not self.audit_resources or (
-                        is_resource_filtered(replication_set, self.audit_resources)
+                        is_resource_filtered(
+                            replication_set, self.audit_resources_filter
+                        )
                     ):
                         self.replication_set = [
                             ReplicationSet(
@@ -7,6 +7,9 @@ from pydantic import BaseModel
 from prowler.lib.logger import logger
 from prowler.lib.scan_filters.scan_filters import is_resource_filtered
 from prowler.providers.aws.lib.service.service import AWSService
+from prowler.providers.aws.services.ec2.lib.network_snapshot import (
+    get_regional_network_snapshot,
+)
 
 
 ################## VPC
@@ -22,10 +25,10 @@ class VPC(AWSService):
         self.__threading_call__(self.__describe_vpc_peering_connections__)
         self.__threading_call__(self.__describe_vpc_endpoints__)
         self.__threading_call__(self.__describe_vpc_endpoint_services__)
-        self.__describe_flow_logs__()
+        self.__threading_call__(self.__describe_flow_logs__)
         self.__describe_peering_route_tables__()
         self.__describe_vpc_endpoint_service_permissions__()
-        self.__describe_network_interfaces__()
+        self.__threading_call__(self.__describe_network_interfaces__)
         self.vpc_subnets = {}
         self.__threading_call__(self.__describe_vpc_subnets__)
 
@@ -38,7 +41,7 @@ class VPC(AWSService):
                     try:
                         arn = f"arn:{self.audited_partition}:ec2:{regional_client.region}:{self.audited_account}:vpc/{vpc['VpcId']}"
                         if not self.audit_resources or (
-                            is_resource_filtered(arn, self.audit_resources)
+                            is_resource_filtered(arn, self.audit_resources_filter)
                         ):
                             vpc_name = ""
                             for tag in vpc.get("Tags", []):
@@ -72,7 +75,7 @@ class VPC(AWSService):
                 for conn in page["VpcPeeringConnections"]:
                     arn = f"arn:{self.audited_partition}:ec2:{regional_client.region}:{self.audited_account}:vpc-peering-connection/{conn['VpcPeeringConnectionId']}"
                     if not self.audit_resources or (
-                        is_resource_filtered(arn, self.audit_resources)
+                        is_resource_filtered(arn, self.audit_resources_filter)
                     ):
                         try:
                             conn["AccepterVpcInfo"]["CidrBlock"] = None
@@ -144,58 +147,35 @@ class VPC(AWSService):
                 f"{error.__class__.__name__}:{error.__traceback__.tb_lineno} -- {error}"
             )
 
-    def __describe_flow_logs__(self):
+    def __describe_flow_logs__(self, regional_client):
         logger.info("VPC - Describing flow logs...")
         try:
+            flow_logs = get_regional_network_snapshot(
+                self.session, regional_client
+            ).get_flow_logs()
             for vpc in self.vpcs.values():
-                try:
-                    regional_client = self.regional_clients[vpc.region]
-                    flow_logs = regional_client.describe_flow_logs(
-                        Filters=[
-                            {
-                                "Name": "resource-id",
-                                "Values": [
-                                    vpc.id,
-                                ],
-                            },
-                        ]
-                    )["FlowLogs"]
-                    if flow_logs:
-                        vpc.flow_log = True
-                except Exception as error:
-                    logger.error(
-                        f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-                    )
+                if vpc.region == regional_client.region and flow_logs.get(vpc.id):
+                    vpc.flow_log = True
         except Exception as error:
             logger.error(
-                f"{error.__class__.__name__}:{error.__traceback__.tb_lineno} -- {error}"
+                f"{regional_client.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
             )
 
-    def __describe_network_interfaces__(self):
-        logger.info("VPC - Describing flow logs...")
+    def __describe_network_interfaces__(self, regional_client):
+        logger.info("VPC - Describing network interfaces...")
         try:
+            vpcs_network_interfaces = get_regional_network_snapshot(
+                self.session, regional_client
+            ).get_vpcs_network_interfaces()
             for vpc in self.vpcs.values():
-                try:
-                    regional_client = self.regional_clients[vpc.region]
-                    enis = regional_client.describe_network_interfaces(
-                        Filters=[
-                            {
-                                "Name": "vpc-id",
-                                "Values": [
-                                    vpc.id,
-                                ],
-                            },
-                        ]
-                    )["NetworkInterfaces"]
-                    if enis:
-                        vpc.in_use = True
-                except Exception as error:
-                    logger.error(
-                        f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-                    )
+                if (
+                    vpc.region == regional_client.region
+                    and vpcs_network_interfaces.get(vpc.id)
+                ):
+                    vpc.in_use = True
         except Exception as error:
             logger.error(
-                f"{error.__class__.__name__}:{error.__traceback__.tb_lineno} -- {error}"
+                f"{regional_client.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
             )
 
     def __describe_vpc_endpoints__(self, regional_client):
@@ -209,7 +189,7 @@ class VPC(AWSService):
                     try:
                         arn = f"arn:{self.audited_partition}:ec2:{regional_client.region}:{self.audited_account}:vpc-endpoint/{endpoint['VpcEndpointId']}"
                         if not self.audit_resources or (
-                            is_resource_filtered(arn, self.audit_resources)
+                            is_resource_filtered(arn, self.audit_resources_filter)
                         ):
                             endpoint_policy = None
                             if endpoint.get("PolicyDocument"):
@@ -248,7 +228,7 @@ class VPC(AWSService):
                         if endpoint["Owner"] != "amazon":
                             arn = f"arn:{self.audited_partition}:ec2:{regional_client.region}:{self.audited_account}:vpc-endpoint-service/{endpoint['ServiceId']}"
                             if not self.audit_resources or (
-                                is_resource_filtered(arn, self.audit_resources)
+                                is_resource_filtered(arn, self.audit_resources_filter)
                             ):
                                 self.vpc_endpoint_services.append(
                                     VpcEndpointService(
@@ -305,7 +285,9 @@ class VPC(AWSService):
             for page in describe_subnets_paginator.paginate():
                 for subnet in page["Subnets"]:
                     if not self.audit_resources or (
-                        is_resource_filtered(subnet["SubnetArn"], self.audit_resources)
+                        is_resource_filtered(
+                            subnet["SubnetArn"], self.audit_resources_filter
+                        )
                     ):
                         try:
                             # Check the route table associated with the subnet to see if it's public
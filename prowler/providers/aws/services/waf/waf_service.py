@@ -19,7 +19,7 @@ class WAF(AWSService):
         try:
             for waf in regional_client.list_web_acls()["WebACLs"]:
                 if not self.audit_resources or (
-                    is_resource_filtered(waf["WebACLId"], self.audit_resources)
+                    is_resource_filtered(waf["WebACLId"], self.audit_resources_filter)
                 ):
                     self.web_acls.append(
                         WebAcl(
@@ -20,7 +20,7 @@ class WAFv2(AWSService):
         try:
             for wafv2 in regional_client.list_web_acls(Scope="REGIONAL")["WebACLs"]:
                 if not self.audit_resources or (
-                    is_resource_filtered(wafv2["ARN"], self.audit_resources)
+                    is_resource_filtered(wafv2["ARN"], self.audit_resources_filter)
                 ):
                     self.web_acls.append(
                         WebAclv2(
@@ -22,7 +22,9 @@ class WellArchitected(AWSService):
         try:
             for workload in regional_client.list_workloads()["WorkloadSummaries"]:
                 if not self.audit_resources or (
-                    is_resource_filtered(workload["WorkloadArn"], self.audit_resources)
+                    is_resource_filtered(
+                        workload["WorkloadArn"], self.audit_resources_filter
+                    )
                 ):
                     self.workloads.append(
                         Workload(
@@ -26,7 +26,7 @@ class WorkSpaces(AWSService):
                 for workspace in page["Workspaces"]:
                     arn = f"arn:{self.audited_partition}:workspaces:{regional_client.region}:{self.audited_account}:workspace/{workspace['WorkspaceId']}"
                     if not self.audit_resources or (
-                        is_resource_filtered(arn, self.audit_resources)
+                        is_resource_filtered(arn, self.audit_resources_filter)
                     ):
                         workspace_to_append = WorkSpace(
                             arn=arn,
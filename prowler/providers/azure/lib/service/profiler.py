@@ -0,0 +1,58 @@
+from functools import partial
+from time import perf_counter
+from urllib.parse import urlparse
+
+from prowler.lib.logger import logger
+from prowler.lib.profiler.profiler import get_profiler
+
+# Key of the pipeline request context where each attempt of an API call keeps its start time
+PROFILER_START_TIME = "prowler_profiler_start_time"
+
+
+def get_profiler_hooks(service: str, subscription: str) -> dict:
+    """get_profiler_hooks returns the hooks of the management client of the subscription that record its API calls with the Profiler"""
+    return {
+        "raw_request_hook": start_api_call,
+        "raw_response_hook": partial(record_api_call, service, subscription),
+    }
+
+
+def get_operation(method: str, url: str) -> str:
+    """get_operation returns the operation of the request from its method and its resource types, e.g. GET Microsoft.Storage/storageAccounts/blobServices"""
+    path = urlparse(url).path.strip("/").split("/")
+    lowercase_path = [part.lower() for part in path]
+    if "providers" in lowercase_path:
+        providers_index = len(path) - 1 - lowercase_path[::-1].index("providers")
+        resource_types = (
+            path[providers_index + 1 : providers_index + 2]
+            + path[providers_index + 2 :: 2]
+        )
+    else:
+        resource_types = path[::2]
+    return f"{method} {'/'.join(resource_types)}"
+
+
+def start_api_call(request):
+    # The hooks run for each attempt, after the retry policy
+    request.context[PROFILER_START_TIME] = perf_counter()
+
+
+def record_api_call(service: str, subscription: str, response):
+    profiler = get_profiler()
+    if profiler and PROFILER_START_TIME in response.context:
+        try:
+            http_response = response.http_response
+            profiler.record_api_call(
+                service,
+                get_operation(http_response.request.method, http_response.request.url),
+                subscription,
+                perf_counter() - response.context[PROFILER_START_TIME],
+                retries=int(response.context.get("retry_count", 0) > 0),
+                throttles=int(http_response.status_code == 429),
+                bytes_received=int(http_response.headers.get("content-length", 0)),
+                error=http_response.status_code >= 400,
+            )
+        except Exception as error:
+            logger.error(
+                f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
@@ -1,5 +1,12 @@
+from concurrent.futures import ThreadPoolExecutor
+
 from prowler.lib.logger import logger
+from prowler.lib.profiler.profiler import get_profiler
 from prowler.providers.azure.lib.audit_info.models import Azure_Audit_Info
+from prowler.providers.azure.lib.service.profiler import get_profiler_hooks
+
+# Maximum number of concurrent requests of each __threading_call__
+MAX_WORKERS = 10
 
 
 class AzureService:
@@ -18,6 +25,48 @@ class AzureService:
         self.subscriptions = audit_info.identity.subscriptions
         self.locations = audit_info.locations
 
+    def __threading_call__(self, call, iterator=None) -> list:
+        """
+        __threading_call__ runs the call concurrently for each item, by default each (subscription, client) of the service,
+        unpacking the items that are tuples, and returns the results in the order of the items
+
+        The results of the calls that raise an exception are None, the calls are expected to handle their own errors.
+        """
+        items = list(iterator if iterator is not None else self.clients.items())
+        if not items:
+            return []
+
+        # Trim leading and trailing underscores from the call's name
+        call_name = " ".join(
+            [word.capitalize() for word in call.__name__.strip("_").split("_")]
+        )
+        logger.info(
+            f"{self.__class__.__name__} - Starting threads for '{call_name}' function to process {len(items)} items..."
+        )
+
+        with ThreadPoolExecutor(
+            max_workers=min(MAX_WORKERS, len(items)),
+            thread_name_prefix="prowler-azure",
+        ) as executor:
+            futures = [
+                (
+                    executor.submit(call, *item)
+                    if isinstance(item, tuple)
+                    else executor.submit(call, item)
+                )
+                for item in items
+            ]
+        results = []
+        for future in futures:
+            try:
+                results.append(future.result())
+            except Exception as error:
+                logger.error(
+                    f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                )
+                results.append(None)
+        return results
+
     def __set_clients__(self, subscriptions, credentials, service, region_config):
         clients = {}
         try:
@@ -29,6 +78,14 @@ class AzureService:
                             subscription_id=id,
                             base_url=region_config.base_url,
                             credential_scopes=region_config.credential_scopes,
+                            # Record the API calls of the client with the Profiler when the scan is profiled
+                            **(
+                                get_profiler_hooks(
+                                    self.__class__.__name__, display_name
+                                )
+                                if get_profiler()
+                                else {}
+                            ),
                         )
                     }
                 )
@@ -15,26 +15,29 @@ class AppInsights(AzureService):
 
     def __get_components__(self):
         logger.info("AppInsights - Getting components...")
+        return dict(
+            zip(
+                self.clients,
+                self.__threading_call__(self.__get_subscription_components__),
+            )
+        )
+
+    def __get_subscription_components__(self, subscription_name, client):
         components = {}
-
-        for subscription_name, client in self.clients.items():
-            try:
-                components_list = client.components.list()
-                components.update({subscription_name: {}})
-
-                for component in components_list:
-                    components[subscription_name].update(
-                        {
-                            component.app_id: Component(
-                                resource_id=component.id, resource_name=component.name
-                            )
-                        }
-                    )
-            except Exception as error:
-                logger.error(
-                    f"Subscription name: {subscription_name} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+        try:
+            components_list = client.components.list()
+            for component in components_list:
+                components.update(
+                    {
+                        component.app_id: Component(
+                            resource_id=component.id, resource_name=component.name
+                        )
+                    }
                 )
-
+        except Exception as error:
+            logger.error(
+                f"Subscription name: {subscription_name} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
         return components
 
 
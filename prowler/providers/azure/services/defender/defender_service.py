@@ -22,169 +22,211 @@ class Defender(AzureService):
 
     def __get_pricings__(self):
         logger.info("Defender - Getting pricings...")
+        return dict(
+            zip(
+                self.clients,
+                self.__threading_call__(self.__get_subscription_pricings__),
+            )
+        )
+
+    def __get_subscription_pricings__(self, subscription_name, client):
         pricings = {}
-        for subscription_name, client in self.clients.items():
-            try:
-                pricings_list = client.pricings.list()
-                pricings.update({subscription_name: {}})
-                for pricing in pricings_list.value:
-                    pricings[subscription_name].update(
-                        {
-                            pricing.name: Pricing(
-                                resource_id=pricing.id,
-                                pricing_tier=pricing.pricing_tier,
-                                free_trial_remaining_time=pricing.free_trial_remaining_time,
-                            )
-                        }
-                    )
-            except Exception as error:
-                logger.error(
-                    f"Subscription name: {subscription_name} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+        try:
+            pricings_list = client.pricings.list()
+            for pricing in pricings_list.value:
+                pricings.update(
+                    {
+                        pricing.name: Pricing(
+                            resource_id=pricing.id,
+                            pricing_tier=pricing.pricing_tier,
+                            free_trial_remaining_time=pricing.free_trial_remaining_time,
+                        )
+                    }
                 )
+        except Exception as error:
+            logger.error(
+                f"Subscription name: {subscription_name} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
         return pricings
 
     def __get_auto_provisioning_settings__(self):
         logger.info("Defender - Getting auto provisioning settings...")
+        return dict(
+            zip(
+                self.clients,
+                self.__threading_call__(
+                    self.__get_subscription_auto_provisioning_settings__
+                ),
+            )
+        )
+
+    def __get_subscription_auto_provisioning_settings__(
+        self, subscription_name, client
+    ):
         auto_provisioning = {}
-        for subscription_name, client in self.clients.items():
-            try:
-                auto_provisioning_settings = client.auto_provisioning_settings.list()
-                auto_provisioning.update({subscription_name: {}})
-                for ap in auto_provisioning_settings:
-                    auto_provisioning[subscription_name].update(
-                        {
-                            ap.name: AutoProvisioningSetting(
-                                resource_id=ap.id,
-                                resource_name=ap.name,
-                                resource_type=ap.type,
-                                auto_provision=ap.auto_provision,
-                            )
-                        }
-                    )
-            except Exception as error:
-                logger.error(f"Subscription name: {subscription_name}")
-                logger.error(
-                    f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+        try:
+            auto_provisioning_settings = client.auto_provisioning_settings.list()
+            for ap in auto_provisioning_settings:
+                auto_provisioning.update(
+                    {
+                        ap.name: AutoProvisioningSetting(
+                            resource_id=ap.id,
+                            resource_name=ap.name,
+                            resource_type=ap.type,
+                            auto_provision=ap.auto_provision,
+                        )
+                    }
                 )
+        except Exception as error:
+            logger.error(f"Subscription name: {subscription_name}")
+            logger.error(
+                f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
         return auto_provisioning
 
     def __get_assessments__(self):
         logger.info("Defender - Getting assessments...")
+        return dict(
+            zip(
+                self.clients,
+                self.__threading_call__(self.__get_subscription_assessments__),
+            )
+        )
+
+    def __get_subscription_assessments__(self, subscription_name, client):
         assessments = {}
-        for subscription_name, client in self.clients.items():
-            try:
-                assessments_list = client.assessments.list(
-                    f"subscriptions/{self.subscriptions[subscription_name]}"
-                )
-                assessments.update({subscription_name: {}})
-                for assessment in assessments_list:
-                    assessments[subscription_name].update(
-                        {
-                            assessment.display_name: Assesment(
-                                resource_id=assessment.id,
-                                resource_name=assessment.name,
-                                status=assessment.status.code,
-                            )
-                        }
-                    )
-            except Exception as error:
-                logger.error(
-                    f"Subscription name: {subscription_name} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+        try:
+            assessments_list = client.assessments.list(
+                f"subscriptions/{self.subscriptions[subscription_name]}"
+            )
+            for assessment in assessments_list:
+                assessments.update(
+                    {
+                        assessment.display_name: Assesment(
+                            resource_id=assessment.id,
+                            resource_name=assessment.name,
+                            status=assessment.status.code,
+                        )
+                    }
                 )
+        except Exception as error:
+            logger.error(
+                f"Subscription name: {subscription_name} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
         return assessments
 
     def __get_settings__(self):
         logger.info("Defender - Getting settings...")
+        return dict(
+            zip(
+                self.clients,
+                self.__threading_call__(self.__get_subscription_settings__),
+            )
+        )
+
+    def __get_subscription_settings__(self, subscription_name, client):
         settings = {}
-        for subscription_name, client in self.clients.items():
-            try:
-                settings_list = client.settings.list()
-                settings.update({subscription_name: {}})
-                for setting in settings_list:
-                    settings[subscription_name].update(
-                        {
-                            setting.name: Setting(
-                                resource_id=setting.id,
-                                resource_type=setting.type,
-                                kind=setting.kind,
-                                enabled=setting.enabled,
-                            )
-                        }
-                    )
-            except Exception as error:
-                logger.error(
-                    f"Subscription name: {subscription_name} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+        try:
+            settings_list = client.settings.list()
+            for setting in settings_list:
+                settings.update(
+                    {
+                        setting.name: Setting(
+                            resource_id=setting.id,
+                            resource_type=setting.type,
+                            kind=setting.kind,
+                            enabled=setting.enabled,
+                        )
+                    }
                 )
+        except Exception as error:
+            logger.error(
+                f"Subscription name: {subscription_name} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
         return settings
 
     def __get_security_contacts__(self):
         logger.info("Defender - Getting security contacts...")
+        return dict(
+            zip(
+                self.clients,
+                self.__threading_call__(self.__get_subscription_security_contacts__),
+            )
+        )
+
+    def __get_subscription_security_contacts__(self, subscription_name, client):
         security_contacts = {}
-        for subscription_name, client in self.clients.items():
-            try:
-                security_contacts.update({subscription_name: {}})
-                # TODO: List all security contacts. For now, the list method is not working.
-                security_contact_default = client.security_contacts.get("default")
-                security_contacts[subscription_name].update(
+        try:
+            # TODO: List all security contacts. For now, the list method is not working.
+            security_contact_default = client.security_contacts.get("default")
+            security_contacts.update(
+                {
+                    security_contact_default.name: SecurityContacts(
+                        resource_id=security_contact_default.id,
+                        emails=security_contact_default.emails,
+                        phone=security_contact_default.phone,
+                        alert_notifications_minimal_severity=security_contact_default.alert_notifications.minimal_severity,
+                        alert_notifications_state=security_contact_default.alert_notifications.state,
+                        notified_roles=security_contact_default.notifications_by_role.roles,
+                        notified_roles_state=security_contact_default.notifications_by_role.state,
+                    )
+                }
+            )
+        except HttpResponseError as error:
+            if error.status_code == 404:
+                security_contacts.update(
                     {
-                        security_contact_default.name: SecurityContacts(
-                            resource_id=security_contact_default.id,
-                            emails=security_contact_default.emails,
-                            phone=security_contact_default.phone,
-                            alert_notifications_minimal_severity=security_contact_default.alert_notifications.minimal_severity,
-                            alert_notifications_state=security_contact_default.alert_notifications.state,
-                            notified_roles=security_contact_default.notifications_by_role.roles,
-                            notified_roles_state=security_contact_default.notifications_by_role.state,
+                        "default": SecurityContacts(
+                            resource_id=f"/subscriptions/{self.subscriptions[subscription_name]}/providers/Microsoft.Security/securityContacts/default",
+                            emails="",
+                            phone="",
+                            alert_notifications_minimal_severity="",
+                            alert_notifications_state="",
+                            notified_roles=[""],
+                            notified_roles_state="",
                         )
                     }
                 )
-            except HttpResponseError as error:
-                if error.status_code == 404:
-                    security_contacts[subscription_name].update(
-                        {
-                            "default": SecurityContacts(
-                                resource_id=f"/subscriptions/{self.subscriptions[subscription_name]}/providers/Microsoft.Security/securityContacts/default",
-                                emails="",
-                                phone="",
-                                alert_notifications_minimal_severity="",
-                                alert_notifications_state="",
-                                notified_roles=[""],
-                                notified_roles_state="",
-                            )
-                        }
-                    )
-                else:
-                    logger.error(
-                        f"Subscription name: {subscription_name} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-                    )
-            except Exception as error:
+            else:
                 logger.error(
                     f"Subscription name: {subscription_name} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
                 )
+        except Exception as error:
+            logger.error(
+                f"Subscription name: {subscription_name} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
         return security_contacts
 
     def __get_iot_security_solutions__(self):
         logger.info("Defender - Getting IoT Security Solutions...")
+        return dict(
+            zip(
+                self.clients,
+                self.__threading_call__(
+                    self.__get_subscription_iot_security_solutions__
+                ),
+            )
+        )
+
+    def __get_subscription_iot_security_solutions__(self, subscription_name, client):
         iot_security_solutions = {}
-        for subscription_name, client in self.clients.items():
-            try:
-                iot_security_solutions_list = (
-                    client.iot_security_solution.list_by_subscription()
-                )
-                iot_security_solutions.update({subscription_name: {}})
-                for iot_security_solution in iot_security_solutions_list:
-                    iot_security_solutions[subscription_name].update(
-                        {
-                            iot_security_solution.name: IoTSecuritySolution(
-                                resource_id=iot_security_solution.id,
-                                status=iot_security_solution.status,
-                            )
-                        }
-                    )
-            except Exception as error:
-                logger.error(
-                    f"Subscription name: {subscription_name} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+        try:
+            iot_security_solutions_list = (
+                client.iot_security_solution.list_by_subscription()
+            )
+            for iot_security_solution in iot_security_solutions_list:
+                iot_security_solutions.update(
+                    {
+                        iot_security_solution.name: IoTSecuritySolution(
+                            resource_id=iot_security_solution.id,
+                            status=iot_security_solution.status,
+                        )
+                    }
                 )
+        except Exception as error:
+            logger.error(
+                f"Subscription name: {subscription_name} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
         return iot_security_solutions
 
 
@@ -17,39 +17,45 @@ class IAM(AzureService):
         logger.info("IAM - Getting roles...")
         builtin_roles = {}
         custom_roles = {}
-        for subscription, client in self.clients.items():
-            try:
-                builtin_roles.update({subscription: []})
-                custom_roles.update({subscription: []})
-                all_roles = client.role_definitions.list(
-                    scope=f"/subscriptions/{self.subscriptions[subscription]}",
-                )
-                for role in all_roles:
-                    if role.role_type == "CustomRole":
-                        custom_roles[subscription].append(
-                            Role(
-                                id=role.id,
-                                name=role.role_name,
-                                type=role.role_type,
-                                assignable_scopes=role.assignable_scopes,
-                                permissions=role.permissions,
-                            )
+        for subscription, roles in zip(
+            self.clients, self.__threading_call__(self.__get_subscription_roles__)
+        ):
+            builtin_roles[subscription], custom_roles[subscription] = roles or ([], [])
+        return builtin_roles, custom_roles
+
+    def __get_subscription_roles__(self, subscription, client):
+        builtin_roles = []
+        custom_roles = []
+        try:
+            all_roles = client.role_definitions.list(
+                scope=f"/subscriptions/{self.subscriptions[subscription]}",
+            )
+            for role in all_roles:
+                if role.role_type == "CustomRole":
+                    custom_roles.append(
+                        Role(
+                            id=role.id,
+                            name=role.role_name,
+                            type=role.role_type,
+                            assignable_scopes=role.assignable_scopes,
+                            permissions=role.permissions,
                         )
-                    else:
-                        builtin_roles[subscription].append(
-                            Role(
-                                id=role.id,
-                                name=role.role_name,
-                                type=role.role_type,
-                                assignable_scopes=role.assignable_scopes,
-                                permissions=role.permissions,
-                            )
+                    )
+                else:
+                    builtin_roles.append(
+                        Role(
+                            id=role.id,
+                            name=role.role_name,
+                            type=role.role_type,
+                            assignable_scopes=role.assignable_scopes,
+                            permissions=role.permissions,
                         )
-            except Exception as error:
-                logger.error(f"Subscription name: {subscription}")
-                logger.error(
-                    f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-                )
+                    )
+        except Exception as error:
+            logger.error(f"Subscription name: {subscription}")
+            logger.error(
+                f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
         return builtin_roles, custom_roles
 
 
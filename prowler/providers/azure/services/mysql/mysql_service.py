@@ -15,28 +15,50 @@ class MySQL(AzureService):
 
     def __get_flexible_servers__(self):
         logger.info("MySQL - Getting servers...")
-        servers = {}
-        for subscription_name, client in self.clients.items():
-            try:
-                servers_list = client.servers.list()
-                servers.update({subscription_name: {}})
-                for server in servers_list:
-                    servers[subscription_name].update(
-                        {
-                            server.name: FlexibleServer(
-                                resource_id=server.id,
-                                location=server.location,
-                                version=server.version,
-                                configurations=self.__get_configurations__(
-                                    client, server.id.split("/")[4], server.name
-                                ),
-                            )
-                        }
+        # List the servers of all the subscriptions, then get the configurations of all the servers concurrently
+        servers_list = [
+            (subscription_name, server)
+            for subscription_name, subscription_servers in zip(
+                self.clients,
+                self.__threading_call__(self.__list_subscription_flexible_servers__),
+            )
+            for server in subscription_servers or []
+        ]
+        servers = {subscription_name: {} for subscription_name in self.clients}
+        for (subscription_name, server), configurations in zip(
+            servers_list,
+            self.__threading_call__(
+                self.__get_configurations__,
+                [
+                    (
+                        self.clients[subscription_name],
+                        server.id.split("/")[4],
+                        server.name,
                     )
-            except Exception as error:
-                logger.error(
-                    f"Subscription name: {subscription_name} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-                )
+                    for subscription_name, server in servers_list
+                ],
+            ),
+        ):
+            servers[subscription_name].update(
+                {
+                    server.name: FlexibleServer(
+                        resource_id=server.id,
+                        location=server.location,
+                        version=server.version,
+                        configurations=configurations or {},
+                    )
+                }
+            )
+        return servers
+
+    def __list_subscription_flexible_servers__(self, subscription_name, client):
+        servers = []
+        try:
+            servers = list(client.servers.list())
+        except Exception as error:
+            logger.error(
+                f"Subscription name: {subscription_name} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
         return servers
 
     def __get_configurations__(self, client, resource_group, server_name):
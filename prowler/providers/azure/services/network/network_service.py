@@ -16,51 +16,61 @@ class Network(AzureService):
 
     def __get_security_groups__(self):
         logger.info("Network - Getting Network Security Groups...")
-        security_groups = {}
-        for subscription, client in self.clients.items():
-            try:
-                security_groups.update({subscription: []})
-                security_groups_list = client.network_security_groups.list_all()
-                for security_group in security_groups_list:
-                    security_groups[subscription].append(
-                        SecurityGroup(
-                            id=security_group.id,
-                            name=security_group.name,
-                            location=security_group.location,
-                            security_rules=security_group.security_rules,
-                        )
+        return dict(
+            zip(
+                self.clients,
+                self.__threading_call__(self.__get_subscription_security_groups__),
+            )
+        )
+
+    def __get_subscription_security_groups__(self, subscription, client):
+        security_groups = []
+        try:
+            security_groups_list = client.network_security_groups.list_all()
+            for security_group in security_groups_list:
+                security_groups.append(
+                    SecurityGroup(
+                        id=security_group.id,
+                        name=security_group.name,
+                        location=security_group.location,
+                        security_rules=security_group.security_rules,
                     )
-
-            except Exception as error:
-                logger.error(
-                    f"Subscription name: {subscription} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
                 )
+
+        except Exception as error:
+            logger.error(
+                f"Subscription name: {subscription} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
         return security_groups
 
     def __get_network_watchers__(self):
         logger.info("Network - Getting Network Watchers...")
-        network_watchers = {}
-        for subscription, client in self.clients.items():
-            try:
-                network_watchers.update({subscription: []})
-                network_watchers_list = client.network_watchers.list_all()
-                for network_watcher in network_watchers_list:
-                    flow_logs = self.__get_flow_logs__(
-                        subscription, network_watcher.name
+        return dict(
+            zip(
+                self.clients,
+                self.__threading_call__(self.__get_subscription_network_watchers__),
+            )
+        )
+
+    def __get_subscription_network_watchers__(self, subscription, client):
+        network_watchers = []
+        try:
+            network_watchers_list = client.network_watchers.list_all()
+            for network_watcher in network_watchers_list:
+                flow_logs = self.__get_flow_logs__(subscription, network_watcher.name)
+                network_watchers.append(
+                    NetworkWatcher(
+                        id=network_watcher.id,
+                        name=network_watcher.name,
+                        location=network_watcher.location,
+                        flow_logs=flow_logs,
                     )
-                    network_watchers[subscription].append(
-                        NetworkWatcher(
-                            id=network_watcher.id,
-                            name=network_watcher.name,
-                            location=network_watcher.location,
-                            flow_logs=flow_logs,
-                        )
-                    )
-
-            except Exception as error:
-                logger.error(
-                    f"Subscription name: {subscription} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
                 )
+
+        except Exception as error:
+            logger.error(
+                f"Subscription name: {subscription} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
         return network_watchers
 
     def __get_flow_logs__(self, subscription, network_watcher_name):
@@ -72,24 +82,30 @@ class Network(AzureService):
 
     def __get_bastion_hosts__(self):
         logger.info("Network - Getting Bastion Hosts...")
-        bastion_hosts = {}
-        for subscription, client in self.clients.items():
-            try:
-                bastion_hosts.update({subscription: []})
-                bastion_hosts_list = client.bastion_hosts.list()
-                for bastion_host in bastion_hosts_list:
-                    bastion_hosts[subscription].append(
-                        BastionHost(
-                            id=bastion_host.id,
-                            name=bastion_host.name,
-                            location=bastion_host.location,
-                        )
+        return dict(
+            zip(
+                self.clients,
+                self.__threading_call__(self.__get_subscription_bastion_hosts__),
+            )
+        )
+
+    def __get_subscription_bastion_hosts__(self, subscription, client):
+        bastion_hosts = []
+        try:
+            bastion_hosts_list = client.bastion_hosts.list()
+            for bastion_host in bastion_hosts_list:
+                bastion_hosts.append(
+                    BastionHost(
+                        id=bastion_host.id,
+                        name=bastion_host.name,
+                        location=bastion_host.location,
                     )
-
-            except Exception as error:
-                logger.error(
-                    f"Subscription name: {subscription} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
                 )
+
+        except Exception as error:
+            logger.error(
+                f"Subscription name: {subscription} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
         return bastion_hosts
 
 
@@ -23,53 +23,71 @@ class SQLServer(AzureService):
 
     def __get_sql_servers__(self):
         logger.info("SQL Server - Getting SQL servers...")
-        sql_servers = {}
-        for subscription, client in self.clients.items():
-            try:
-                sql_servers.update({subscription: []})
-                sql_servers_list = client.servers.list()
-                for sql_server in sql_servers_list:
-                    resource_group = self.__get_resource_group__(sql_server.id)
-                    auditing_policies = self.__get_server_blob_auditing_policies__(
-                        subscription, resource_group, sql_server.name
-                    )
-                    firewall_rules = self.__get_firewall_rules__(
-                        subscription, resource_group, sql_server.name
-                    )
-                    encryption_protector = self.__get_enctyption_protectors__(
-                        subscription, resource_group, sql_server.name
-                    )
-                    vulnerability_assessment = self.__get_vulnerability_assesments__(
-                        subscription, resource_group, sql_server.name
-                    )
-                    security_alert_policies = (
-                        self.__get_server_security_alert_policies__(
-                            subscription, resource_group, sql_server.name
-                        )
-                    )
-                    sql_servers[subscription].append(
-                        Server(
-                            id=sql_server.id,
-                            name=sql_server.name,
-                            public_network_access=sql_server.public_network_access,
-                            minimal_tls_version=sql_server.minimal_tls_version,
-                            administrators=sql_server.administrators,
-                            auditing_policies=auditing_policies,
-                            firewall_rules=firewall_rules,
-                            encryption_protector=encryption_protector,
-                            databases=self.__get_databases__(
-                                subscription, resource_group, sql_server.name
-                            ),
-                            vulnerability_assessment=vulnerability_assessment,
-                            security_alert_policies=security_alert_policies,
-                        )
-                    )
-            except Exception as error:
-                logger.error(
-                    f"Subscription name: {subscription} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-                )
+        # List the servers of all the subscriptions, then get the details of all the servers concurrently
+        servers = [
+            (subscription, sql_server)
+            for subscription, sql_servers_list in zip(
+                self.clients,
+                self.__threading_call__(self.__list_subscription_sql_servers__),
+            )
+            for sql_server in sql_servers_list or []
+        ]
+        sql_servers = {subscription: [] for subscription in self.clients}
+        for (subscription, _), sql_server in zip(
+            servers, self.__threading_call__(self.__get_sql_server__, servers)
+        ):
+            if sql_server:
+                sql_servers[subscription].append(sql_server)
         return sql_servers
 
+    def __list_subscription_sql_servers__(self, subscription, client):
+        sql_servers = []
+        try:
+            sql_servers = list(client.servers.list())
+        except Exception as error:
+            logger.error(
+                f"Subscription name: {subscription} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
+        return sql_servers
+
+    def __get_sql_server__(self, subscription, sql_server):
+        try:
+            resource_group = self.__get_resource_group__(sql_server.id)
+            auditing_policies = self.__get_server_blob_auditing_policies__(
+                subscription, resource_group, sql_server.name
+            )
+            firewall_rules = self.__get_firewall_rules__(
+                subscription, resource_group, sql_server.name
+            )
+            encryption_protector = self.__get_enctyption_protectors__(
+                subscription, resource_group, sql_server.name
+            )
+            vulnerability_assessment = self.__get_vulnerability_assesments__(
+                subscription, resource_group, sql_server.name
+            )
+            security_alert_policies = self.__get_server_security_alert_policies__(
+                subscription, resource_group, sql_server.name
+            )
+            return Server(
+                id=sql_server.id,
+                name=sql_server.name,
+                public_network_access=sql_server.public_network_access,
+                minimal_tls_version=sql_server.minimal_tls_version,
+                administrators=sql_server.administrators,
+                auditing_policies=auditing_policies,
+                firewall_rules=firewall_rules,
+                encryption_protector=encryption_protector,
+                databases=self.__get_databases__(
+                    subscription, resource_group, sql_server.name
+                ),
+                vulnerability_assessment=vulnerability_assessment,
+                security_alert_policies=security_alert_policies,
+            )
+        except Exception as error:
+            logger.error(
+                f"Subscription name: {subscription} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
+
     def __get_resource_group__(self, id):
         resource_group = id.split("/")[4]
         return resource_group
@@ -5,6 +5,7 @@ from colorama import Fore, Style
 
 from prowler.config.config import load_and_validate_config_file
 from prowler.lib.logger import logger
+from prowler.lib.scan_filters.scan_filters import Resource_Filter
 from prowler.providers.aws.aws_provider import (
     AWS_Provider,
     assume_role,
@@ -25,6 +26,7 @@ from prowler.providers.aws.lib.organizations.organizations import (
 from prowler.providers.aws.lib.resource_api_tagging.resource_api_tagging import (
     get_tagged_resources,
 )
+from prowler.providers.aws.lib.service.scheduler import set_api_scheduler
 from prowler.providers.azure.azure_provider import Azure_Provider
 from prowler.providers.azure.lib.audit_info.audit_info import azure_audit_info
 from prowler.providers.azure.lib.audit_info.models import (
@@ -115,6 +117,11 @@ Azure Identity Type: {Fore.YELLOW}[{audit_info.identity.identity_type}]{Style.RE
             new_boto3_config = current_audit_info.session_config.merge(config)
             current_audit_info.session_config = new_boto3_config
 
+        # Set the maximum in-flight requests of the shared API Scheduler
+        aws_max_concurrent_requests = arguments.get("aws_max_concurrent_requests")
+        if aws_max_concurrent_requests:
+            set_api_scheduler(max_concurrent_requests=aws_max_concurrent_requests)
+
         # Set ignore unused services argument
         current_audit_info.ignore_unused_services = arguments.get(
             "ignore_unused_services"
@@ -147,7 +154,8 @@ Azure Identity Type: {Fore.YELLOW}[{audit_info.identity.identity_type}]{Style.RE
         current_audit_info.audited_account_arn = f"arn:{current_audit_info.audited_partition}:iam::{current_audit_info.audited_account}:root"
 
         logger.info("Checking if role assumption is needed ...")
-        if input_role:
+        # With --organization-accounts the role is assumed in each account of the organization
+        if input_role and not arguments.get("organization_accounts"):
             current_audit_info.assumed_role_info.role_arn = input_role
             current_audit_info.assumed_role_info.session_duration = (
                 input_session_duration
@@ -262,6 +270,12 @@ Azure Identity Type: {Fore.YELLOW}[{audit_info.identity.identity_type}]{Style.RE
         if arguments.get("resource_arn"):
             current_audit_info.audit_resources = arguments.get("resource_arn")
 
+        # Index the resources to audit once for all the services
+        current_audit_info.audit_resources_filter = Resource_Filter(
+            current_audit_info.audit_resources,
+            substring_match=arguments.get("resource_substring_match", False),
+        )
+
         # Get Enabled Regions
         current_audit_info.enabled_regions = get_aws_enabled_regions(current_audit_info)
 
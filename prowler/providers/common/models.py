@@ -8,3 +8,6 @@ class Audit_Metadata(BaseModel):
     expected_checks: list
     completed_checks: int
     audit_progress: int
+    # Discovery time in seconds of each service client module
+    # prefetched before executing the checks
+    services_discovery_time: dict = {}
@@ -3,6 +3,7 @@ import sys
 from dataclasses import dataclass
 from os import makedirs
 from os.path import isdir
+from typing import Any
 
 from prowler.config.config import change_config_var, output_file_timestamp
 from prowler.lib.logger import logger
@@ -55,6 +56,8 @@ class Provider_Output_Options:
     output_filename: str
     only_logs: bool
     unix_timestamp: bool
+    output_compression: str
+    output_writers: Any
 
     def __init__(self, arguments, allowlist_file, bulk_checks_metadata):
         self.is_quiet = arguments.quiet
@@ -65,6 +68,9 @@ class Provider_Output_Options:
         self.allowlist_file = allowlist_file
         self.only_logs = arguments.only_logs
         self.unix_timestamp = arguments.unix_timestamp
+        self.output_compression = getattr(arguments, "output_compression", None)
+        # Output files of the scan, created with the first findings reported
+        self.output_writers = None
         # Check output directory, if it is not created -> create it
         if arguments.output_directory:
             if not isdir(arguments.output_directory):
@@ -0,0 +1,62 @@
+import re
+from time import perf_counter
+
+from googleapiclient.http import HttpRequest
+
+from prowler.lib.profiler.profiler import get_profiler
+
+# Location of the requests of the regional and zonal resources, e.g. .../zones/us-central1-a/instances
+LOCATION_PATTERN = re.compile(r"/(?:zones|regions|locations)/([^/?]+)")
+
+
+class ProfiledHttp:
+    """The ProfiledHttp class wraps the HTTP transport of a request to count its attempts, throttles and bytes received"""
+
+    def __init__(self, http):
+        self.http = http
+        self.attempts = 0
+        self.throttles = 0
+        self.bytes_received = 0
+
+    def request(self, *args, **kwargs):
+        self.attempts += 1
+        response, content = self.http.request(*args, **kwargs)
+        self.throttles += int(response.status == 429)
+        self.bytes_received += len(content or b"")
+        return response, content
+
+    def __getattr__(self, name):
+        return getattr(self.http, name)
+
+
+class ProfiledHttpRequest(HttpRequest):
+    """The ProfiledHttpRequest class records the execution of the requests with the Profiler when the scan is profiled"""
+
+    def execute(self, http=None, num_retries=0):
+        profiler = get_profiler()
+        if not profiler:
+            return super().execute(http=http, num_retries=num_retries)
+
+        profiled_http = ProfiledHttp(http or self.http)
+        start_time = perf_counter()
+        error = True
+        try:
+            response = super().execute(http=profiled_http, num_retries=num_retries)
+            error = False
+            return response
+        finally:
+            # The method ID is the service and the operation, e.g. compute.instances.list
+            service, _, operation = (
+                self.methodId or f"unknown.{self.method}"
+            ).partition(".")
+            location = LOCATION_PATTERN.search(self.uri)
+            profiler.record_api_call(
+                service,
+                operation,
+                location.group(1) if location else "global",
+                perf_counter() - start_time,
+                retries=max(profiled_http.attempts - 1, 0),
+                throttles=profiled_http.throttles,
+                bytes_received=profiled_http.bytes_received,
+                error=error,
+            )
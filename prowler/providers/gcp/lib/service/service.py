@@ -1,4 +1,6 @@
+import json
 import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 import google_auth_httplib2
 import httplib2
@@ -6,9 +8,30 @@ from colorama import Fore, Style
 from google.oauth2.credentials import Credentials
 from googleapiclient import discovery
 from googleapiclient.discovery import Resource
+from googleapiclient.discovery_cache import get_static_doc
 
 from prowler.lib.logger import logger
 from prowler.providers.gcp.lib.audit_info.models import GCP_Audit_Info
+from prowler.providers.gcp.lib.service.profiler import ProfiledHttpRequest
+
+# Maximum number of in-flight requests shared by all the GCP services
+MAX_CONCURRENT_REQUESTS = 50
+# Maximum number of requests sent in each batch HTTP request
+BATCH_MAX_REQUESTS = 100
+
+# Pool of workers shared by all the GCP services, its threads keep their authorized HTTP transports between requests
+gcp_thread_pool = ThreadPoolExecutor(
+    max_workers=MAX_CONCURRENT_REQUESTS, thread_name_prefix="prowler-gcp"
+)
+# Authorized HTTP transports of each thread by credentials, since httplib2.Http is not thread-safe
+authorized_http_clients = threading.local()
+# Discovery documents parsed once by (service, API version)
+discovery_documents = {}
+# Serviceusage client shared to query the APIs state, always executed with the transport of the thread
+serviceusage_clients = {}
+discovery_lock = threading.Lock()
+# State of the API of each (project ID, service), queried once for all the audited projects
+api_states = {}
 
 
 class GCPService:
@@ -36,39 +59,91 @@ class GCPService:
         return self.client
 
     def __threading_call__(self, call, iterator):
-        threads = []
-        for value in iterator:
-            threads.append(threading.Thread(target=call, args=(value,)))
-        for t in threads:
-            t.start()
-        for t in threads:
-            t.join()
+        """__threading_call__ runs the call for each item in the pool shared by the GCP services, unpacking the items that are tuples, e.g. (project_id, zone)"""
+        futures = [
+            (
+                gcp_thread_pool.submit(call, *item)
+                if isinstance(item, tuple)
+                else gcp_thread_pool.submit(call, item)
+            )
+            for item in iterator
+        ]
+        for future in as_completed(futures):
+            try:
+                future.result()
+            except Exception as error:
+                logger.error(
+                    f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                )
 
     def __get_AuthorizedHttp_client__(self):
-        return google_auth_httplib2.AuthorizedHttp(
-            self.credentials, http=httplib2.Http()
-        )
+        """__get_AuthorizedHttp_client__ returns the authorized HTTP transport of the current thread, which keeps its connections open between requests"""
+        http_clients = authorized_http_clients.__dict__.setdefault("clients", {})
+        credentials, http = http_clients.get(id(self.credentials), (None, None))
+        if credentials is not self.credentials:
+            http = google_auth_httplib2.AuthorizedHttp(
+                self.credentials, http=httplib2.Http()
+            )
+            http_clients[id(self.credentials)] = (self.credentials, http)
+        return http
 
     def __is_api_active__(self, audited_project_ids):
+        # Query at once the state of the API in the projects not queried before by other services
+        self.__get_api_states__(
+            [
+                project_id
+                for project_id in audited_project_ids
+                if (project_id, self.service) not in api_states
+            ]
+        )
         project_ids = []
         for project_id in audited_project_ids:
-            try:
-                client = discovery.build("serviceusage", "v1")
-                request = client.services().get(
-                    name=f"projects/{project_id}/services/{self.service}.googleapis.com"
+            # The projects whose API state could not be retrieved are not scanned
+            if (project_id, self.service) not in api_states:
+                continue
+            if api_states[(project_id, self.service)] != "DISABLED":
+                project_ids.append(project_id)
+            else:
+                print(
+                    f"\n{Fore.YELLOW}{self.service} API {Style.RESET_ALL}has not been used in project {project_id} before or it is disabled.\nEnable it by visiting https://console.developers.google.com/apis/api/{self.service}.googleapis.com/overview?project={project_id} then retry."
                 )
-                response = request.execute()
-                if response.get("state") != "DISABLED":
-                    project_ids.append(project_id)
+        return project_ids
+
+    def __get_api_states__(self, project_ids):
+        """__get_api_states__ stores the state of the service API in the projects, sending the requests in concurrent batch HTTP requests"""
+        try:
+            client = get_serviceusage_client(self.credentials)
+
+            def store_api_state(project_id, response, exception):
+                if exception:
+                    logger.error(
+                        f"{project_id} -- {exception.__class__.__name__}: {exception}"
+                    )
                 else:
-                    print(
-                        f"\n{Fore.YELLOW}{self.service} API {Style.RESET_ALL}has not been used in project {project_id} before or it is disabled.\nEnable it by visiting https://console.developers.google.com/apis/api/{self.service}.googleapis.com/overview?project={project_id} then retry."
+                    api_states[(project_id, self.service)] = response.get("state")
+
+            def get_api_states(batch_project_ids):
+                batch = client.new_batch_http_request(callback=store_api_state)
+                for project_id in batch_project_ids:
+                    batch.add(
+                        client.services().get(
+                            name=f"projects/{project_id}/services/{self.service}.googleapis.com"
+                        ),
+                        request_id=project_id,
                     )
-            except Exception as error:
-                logger.error(
-                    f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-                )
-        return project_ids
+                batch.execute(http=self.__get_AuthorizedHttp_client__())
+
+            self.__threading_call__(
+                get_api_states,
+                [
+                    project_ids[index : index + BATCH_MAX_REQUESTS]
+                    for index in range(0, len(project_ids), BATCH_MAX_REQUESTS)
+                ],
+            )
+        except Exception as error:
+            logger.error(
+                f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
 
     def __generate_client__(
         self,
@@ -77,8 +152,58 @@ class GCPService:
         credentials: Credentials,
     ) -> Resource:
         try:
-            return discovery.build(service, api_version, credentials=credentials)
+            discovery_document = get_discovery_document(service, api_version)
+            if discovery_document:
+                return discovery.build_from_document(
+                    discovery_document,
+                    credentials=credentials,
+                    requestBuilder=ProfiledHttpRequest,
+                )
+            return discovery.build(
+                service,
+                api_version,
+                credentials=credentials,
+                requestBuilder=ProfiledHttpRequest,
+            )
         except Exception as error:
             logger.error(
                 f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
             )
+
+
+def get_discovery_document(service: str, api_version: str) -> dict:
+    """get_discovery_document returns the parsed discovery document of the service and API version bundled with the client library, or None"""
+    with discovery_lock:
+        if (service, api_version) not in discovery_documents:
+            discovery_document = get_static_doc(service, api_version)
+            discovery_documents[(service, api_version)] = (
+                json.loads(discovery_document) if discovery_document else None
+            )
+        return discovery_documents[(service, api_version)]
+
+
+def get_serviceusage_client(credentials: Credentials) -> Resource:
+    """get_serviceusage_client returns the serviceusage client of the credentials, built only once"""
+    with discovery_lock:
+        serviceusage_credentials, client = serviceusage_clients.get(
+            id(credentials), (None, None)
+        )
+    if client is None or serviceusage_credentials is not credentials:
+        discovery_document = get_discovery_document("serviceusage", "v1")
+        client = (
+            discovery.build_from_document(
+                discovery_document,
+                credentials=credentials,
+                requestBuilder=ProfiledHttpRequest,
+            )
+            if discovery_document
+            else discovery.build(
+                "serviceusage",
+                "v1",
+                credentials=credentials,
+                requestBuilder=ProfiledHttpRequest,
+            )
+        )
+        with discovery_lock:
+            serviceusage_clients[id(credentials)] = (credentials, client)
+    return client
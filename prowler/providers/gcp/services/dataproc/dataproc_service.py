@@ -1,3 +1,5 @@
+from itertools import product
+
 from pydantic import BaseModel
 
 from prowler.lib.logger import logger
@@ -11,42 +13,41 @@ class Dataproc(GCPService):
         super().__init__(__class__.__name__, audit_info)
         self.regions = compute_client.regions
         self.clusters = []
-        self.__threading_call__(self.__get_clusters__, self.regions)
+        self.__threading_call__(
+            self.__get_clusters__, product(self.project_ids, self.regions)
+        )
+
+    def __get_clusters__(self, project_id, region):
+        try:
+            request = (
+                self.client.projects()
+                .regions()
+                .clusters()
+                .list(projectId=project_id, region=region)
+            )
+            while request is not None:
+                response = request.execute(http=self.__get_AuthorizedHttp_client__())
+
+                for cluster in response.get("clusters", []):
+                    self.clusters.append(
+                        Cluster(
+                            name=cluster["clusterName"],
+                            id=cluster["clusterUuid"],
+                            encryption_config=cluster["config"]["encryptionConfig"],
+                            project_id=project_id,
+                        )
+                    )
 
-    def __get_clusters__(self, region):
-        for project_id in self.project_ids:
-            try:
                 request = (
                     self.client.projects()
                     .regions()
                     .clusters()
-                    .list(projectId=project_id, region=region)
-                )
-                while request is not None:
-                    response = request.execute(
-                        http=self.__get_AuthorizedHttp_client__()
-                    )
-
-                    for cluster in response.get("clusters", []):
-                        self.clusters.append(
-                            Cluster(
-                                name=cluster["clusterName"],
-                                id=cluster["clusterUuid"],
-                                encryption_config=cluster["config"]["encryptionConfig"],
-                                project_id=project_id,
-                            )
-                        )
-
-                    request = (
-                        self.client.projects()
-                        .regions()
-                        .clusters()
-                        .list_next(previous_request=request, previous_response=response)
-                    )
-            except Exception as error:
-                logger.error(
-                    f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                    .list_next(previous_request=request, previous_response=response)
                 )
+        except Exception as error:
+            logger.error(
+                f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
 
 
 class Cluster(BaseModel):
@@ -13,36 +13,33 @@ class KMS(GCPService):
         self.locations = []
         self.key_rings = []
         self.crypto_keys = []
-        self.__get_locations__()
+        self.__threading_call__(self.__get_locations__, self.project_ids)
         self.__threading_call__(self.__get_key_rings__, self.locations)
-        self.__get_crypto_keys__()
-        self.__get_crypto_keys_iam_policy__()
+        self.__threading_call__(self.__get_crypto_keys__, self.key_rings)
+        self.__threading_call__(self.__get_crypto_keys_iam_policy__, self.crypto_keys)
+
+    def __get_locations__(self, project_id):
+        try:
+            request = (
+                self.client.projects().locations().list(name="projects/" + project_id)
+            )
+            while request is not None:
+                response = request.execute(http=self.__get_AuthorizedHttp_client__())
+
+                for location in response["locations"]:
+                    self.locations.append(
+                        KeyLocation(name=location["name"], project_id=project_id)
+                    )
 
-    def __get_locations__(self):
-        for project_id in self.project_ids:
-            try:
                 request = (
                     self.client.projects()
                     .locations()
-                    .list(name="projects/" + project_id)
-                )
-                while request is not None:
-                    response = request.execute()
-
-                    for location in response["locations"]:
-                        self.locations.append(
-                            KeyLocation(name=location["name"], project_id=project_id)
-                        )
-
-                    request = (
-                        self.client.projects()
-                        .locations()
-                        .list_next(previous_request=request, previous_response=response)
-                    )
-            except Exception as error:
-                logger.error(
-                    f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                    .list_next(previous_request=request, previous_response=response)
                 )
+        except Exception as error:
+            logger.error(
+                f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
 
     def __get_key_rings__(self, location):
         try:
@@ -71,60 +68,58 @@ class KMS(GCPService):
                 f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
             )
 
-    def __get_crypto_keys__(self):
-        for ring in self.key_rings:
-            try:
-                request = (
-                    self.client.projects()
-                    .locations()
-                    .keyRings()
-                    .cryptoKeys()
-                    .list(parent=ring.name)
-                )
-                while request is not None:
-                    response = request.execute()
-
-                    for key in response.get("cryptoKeys", []):
-                        self.crypto_keys.append(
-                            CriptoKey(
-                                name=key["name"].split("/")[-1],
-                                location=key["name"].split("/")[3],
-                                rotation_period=key.get("rotationPeriod"),
-                                key_ring=ring.name,
-                                project_id=ring.project_id,
-                            )
-                        )
+    def __get_crypto_keys__(self, ring):
+        try:
+            request = (
+                self.client.projects()
+                .locations()
+                .keyRings()
+                .cryptoKeys()
+                .list(parent=ring.name)
+            )
+            while request is not None:
+                response = request.execute(http=self.__get_AuthorizedHttp_client__())
 
-                    request = (
-                        self.client.projects()
-                        .locations()
-                        .keyRings()
-                        .cryptoKeys()
-                        .list_next(previous_request=request, previous_response=response)
+                for key in response.get("cryptoKeys", []):
+                    self.crypto_keys.append(
+                        CriptoKey(
+                            name=key["name"].split("/")[-1],
+                            location=key["name"].split("/")[3],
+                            rotation_period=key.get("rotationPeriod"),
+                            key_ring=ring.name,
+                            project_id=ring.project_id,
+                        )
                     )
-            except Exception as error:
-                logger.error(
-                    f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-                )
 
-    def __get_crypto_keys_iam_policy__(self):
-        for key in self.crypto_keys:
-            try:
                 request = (
                     self.client.projects()
                     .locations()
                     .keyRings()
                     .cryptoKeys()
-                    .getIamPolicy(resource=key.key_ring + "/cryptoKeys/" + key.name)
+                    .list_next(previous_request=request, previous_response=response)
                 )
-                response = request.execute()
+        except Exception as error:
+            logger.error(
+                f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
 
-                for binding in response.get("bindings", []):
-                    key.members.extend(binding.get("members", []))
-            except Exception as error:
-                logger.error(
-                    f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-                )
+    def __get_crypto_keys_iam_policy__(self, key):
+        try:
+            request = (
+                self.client.projects()
+                .locations()
+                .keyRings()
+                .cryptoKeys()
+                .getIamPolicy(resource=key.key_ring + "/cryptoKeys/" + key.name)
+            )
+            response = request.execute(http=self.__get_AuthorizedHttp_client__())
+
+            for binding in response.get("bindings", []):
+                key.members.extend(binding.get("members", []))
+        except Exception as error:
+            logger.error(
+                f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
 
 
 class KeyLocation(BaseModel):
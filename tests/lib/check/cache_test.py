@@ -0,0 +1,95 @@
+import os
+
+from prowler.lib.check import cache
+from prowler.lib.check.cache import (
+    get_checks_catalogue_file,
+    get_checks_catalogue_key,
+    get_checks_catalogue_section,
+)
+
+PROVIDER = "azure"
+
+
+class Test_Checks_Catalogue_Cache:
+    def test_get_checks_catalogue_section(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(cache, "cache_directory", str(tmp_path))
+        monkeypatch.setattr(cache, "checks_catalogues", {})
+        built_catalogues = []
+
+        def build_checks_catalogue(provider):
+            built_catalogues.append(provider)
+            return {"checks": [("check", "/path/check")], "bulk_checks_metadata": {}}
+
+        checks = get_checks_catalogue_section(
+            PROVIDER, "checks", build_checks_catalogue
+        )
+        assert checks == [("check", "/path/check")]
+        assert os.path.isfile(get_checks_catalogue_file(PROVIDER))
+
+        # Every call returns a new copy of the section
+        checks.append(("other_check", "/path/other_check"))
+        assert get_checks_catalogue_section(
+            PROVIDER, "checks", build_checks_catalogue
+        ) == [("check", "/path/check")]
+
+        # A new process loads the catalogue from the cache directory
+        monkeypatch.setattr(cache, "checks_catalogues", {})
+        assert (
+            get_checks_catalogue_section(
+                PROVIDER, "bulk_checks_metadata", build_checks_catalogue
+            )
+            == {}
+        )
+        assert built_catalogues == [PROVIDER]
+
+    def test_get_checks_catalogue_section_stale(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(cache, "cache_directory", str(tmp_path))
+        monkeypatch.setattr(cache, "checks_catalogues", {})
+        catalogue_keys = iter(["key_1", "key_2"])
+        monkeypatch.setattr(
+            cache, "get_checks_catalogue_key", lambda _: next(catalogue_keys)
+        )
+        built_catalogues = []
+
+        def build_checks_catalogue(provider):
+            built_catalogues.append(provider)
+            return {"checks": len(built_catalogues)}
+
+        assert (
+            get_checks_catalogue_section(PROVIDER, "checks", build_checks_catalogue)
+            == 1
+        )
+        # Any change in the checks or compliance files builds the catalogue again
+        assert (
+            get_checks_catalogue_section(PROVIDER, "checks", build_checks_catalogue)
+            == 2
+        )
+
+    def test_get_checks_catalogue_section_corrupted(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(cache, "cache_directory", str(tmp_path))
+        monkeypatch.setattr(cache, "checks_catalogues", {})
+        with open(get_checks_catalogue_file(PROVIDER), "wb") as catalogue_file:
+            catalogue_file.write(b"not a pickle")
+
+        assert (
+            get_checks_catalogue_section(PROVIDER, "checks", lambda _: {"checks": []})
+            == []
+        )
+
+    def test_get_checks_catalogue_key(self, tmp_path, monkeypatch):
+        services_directory = tmp_path / "providers" / PROVIDER / "services" / "storage"
+        services_directory.mkdir(parents=True)
+        monkeypatch.setattr(cache, "prowler_directory", str(tmp_path))
+        catalogue_key = get_checks_catalogue_key(PROVIDER)
+
+        # Bytecode does not change the key
+        (services_directory / "__pycache__").mkdir()
+        assert get_checks_catalogue_key(PROVIDER) == catalogue_key
+
+        # A new check or metadata file changes the key
+        check_directory = services_directory / "storage_check"
+        check_directory.mkdir()
+        new_catalogue_key = get_checks_catalogue_key(PROVIDER)
+        assert new_catalogue_key != catalogue_key
+        (check_directory / "storage_check.metadata.json").write_text("{}")
+        assert get_checks_catalogue_key(PROVIDER) != new_catalogue_key
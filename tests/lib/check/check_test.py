@@ -1,22 +1,28 @@
 import os
 import pathlib
+import sys
 from importlib.machinery import FileFinder
 from pkgutil import ModuleInfo
 
 from boto3 import client
 from fixtures.bulk_checks_metadata import test_bulk_checks_metadata
-from mock import patch
+from mock import MagicMock, patch
 from moto import mock_aws
 
 from prowler.lib.check.check import (
     exclude_checks_to_run,
     exclude_services_to_run,
+    execute_checks,
+    execute_checks_in_parallel,
+    get_prefetch_max_workers,
+    group_checks_by_service_clients,
     list_categories,
     list_checks_json,
     list_modules,
     list_services,
     parse_checks_from_file,
     parse_checks_from_folder,
+    recover_check_service_clients,
     recover_checks_from_provider,
     recover_checks_from_service,
     remove_custom_checks_module,
@@ -1104,3 +1110,125 @@ class Test_Check:
             checks_json
             == '{\n  "aws": [\n    "awslambda_function_invoke_api_operations_cloudtrail_logging_enabled",\n    "awslambda_function_no_secrets_in_code",\n    "awslambda_function_no_secrets_in_variables",\n    "awslambda_function_not_publicly_accessible",\n    "awslambda_function_url_cors_policy",\n    "awslambda_function_url_public",\n    "awslambda_function_using_supported_runtimes"\n  ]\n}'
         )
+
+    def test_recover_check_service_clients(self):
+        assert recover_check_service_clients(
+            "aws", "s3", "s3_bucket_public_access"
+        ) == {
+            "prowler.providers.aws.services.s3.s3_client",
+            "prowler.providers.aws.services.s3.s3control_client",
+        }
+
+    def test_recover_check_service_clients_check_not_found(self):
+        assert (
+            recover_check_service_clients("aws", "notfound", "notfound_check") == set()
+        )
+
+    def test_group_checks_by_service_clients(self):
+        checks_to_execute = [
+            "s3_bucket_public_access",
+            "iam_root_mfa_enabled",
+            "s3_account_level_public_access_blocks",
+            "iam_root_hardware_mfa_enabled",
+        ]
+        assert group_checks_by_service_clients(checks_to_execute, "aws") == [
+            ["s3_bucket_public_access", "s3_account_level_public_access_blocks"],
+            ["iam_root_mfa_enabled", "iam_root_hardware_mfa_enabled"],
+        ]
+
+    def test_execute_checks_in_parallel(self):
+        from prowler.providers.common.models import Audit_Metadata
+
+        checks_to_execute = [
+            "s3_bucket_public_access",
+            "iam_root_mfa_enabled",
+            "s3_account_level_public_access_blocks",
+            "iam_root_hardware_mfa_enabled",
+        ]
+        audit_info = set_mocked_aws_audit_info()
+        audit_info.audit_metadata = Audit_Metadata(
+            services_scanned=0,
+            expected_checks=checks_to_execute,
+            completed_checks=0,
+            audit_progress=0,
+        )
+        output_options = MagicMock(verbose=False, allowlist_file=None)
+        reported_checks = []
+
+        def mock_load_check(service, check_name, provider, custom_checks_metadata):
+            return MagicMock(CheckID=check_name)
+
+        def mock_run_check(check, output_options, print_header=True):
+            return [check.CheckID]
+
+        def mock_report(check_findings, output_options, audit_info):
+            reported_checks.extend(check_findings)
+
+        with patch("prowler.lib.check.check.load_check", new=mock_load_check), patch(
+            "prowler.lib.check.check.run_check", new=mock_run_check
+        ), patch("prowler.lib.check.check.report", new=mock_report):
+            findings = execute_checks_in_parallel(
+                checks_to_execute,
+                "aws",
+                audit_info,
+                output_options,
+                set(),
+                set(),
+                None,
+                4,
+            )
+
+        # Findings are reported following the checks_to_execute order
+        assert findings == checks_to_execute
+        assert reported_checks == checks_to_execute
+        assert audit_info.audit_metadata.completed_checks == 4
+        assert audit_info.audit_metadata.services_scanned == 2
+        assert audit_info.audit_metadata.audit_progress == 100
+
+    def test_prefetch_service_clients(self, tmp_path, monkeypatch):
+        # Stub service client module that instantiates its service when imported
+        (tmp_path / "stub_service_client.py").write_text(
+            "from time import sleep\n\n\n"
+            "class Stub_Service:\n"
+            "    def __init__(self):\n"
+            "        sleep(0.1)\n\n\n"
+            "stub_service_client = Stub_Service()\n"
+        )
+        monkeypatch.syspath_prepend(str(tmp_path))
+        monkeypatch.delitem(sys.modules, "stub_service_client", raising=False)
+        checks_to_execute = ["stub_check_one", "stub_check_two"]
+
+        def mock_recover_check_service_clients(provider, service, check_name):
+            return {"stub_service_client", "notfound_client"}
+
+        audit_info = set_mocked_aws_audit_info()
+        with patch(
+            "prowler.lib.check.check.recover_check_service_clients",
+            new=mock_recover_check_service_clients,
+        ), patch("prowler.lib.check.check.execute", return_value=[]) as mock_execute:
+            execute_checks(
+                checks_to_execute,
+                "aws",
+                audit_info,
+                MagicMock(only_logs=True),
+                None,
+            )
+
+        # The service client is discovered once, before the checks are executed
+        assert "stub_service_client" in sys.modules
+        assert mock_execute.call_count == 2
+        # Service clients that cannot be imported are not included
+        services_discovery_time = audit_info.audit_metadata.services_discovery_time
+        assert list(services_discovery_time.keys()) == ["stub_service_client"]
+        assert services_discovery_time["stub_service_client"] >= 0.1
+
+    def test_get_prefetch_max_workers(self):
+        with patch(
+            "prowler.lib.check.check.get_api_scheduler",
+            return_value=MagicMock(max_concurrent_requests=50),
+        ):
+            assert get_prefetch_max_workers("aws") == 50
+            assert get_prefetch_max_workers("aws", 4) == 50
+        assert get_prefetch_max_workers("azure") == 0
+        assert get_prefetch_max_workers("gcp", 1) == 0
+        assert get_prefetch_max_workers("gcp", 4) == 4
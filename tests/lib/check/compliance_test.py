@@ -0,0 +1,89 @@
+from fixtures.bulk_checks_metadata import test_bulk_checks_metadata
+
+from prowler.lib.check.compliance import (
+    get_checks_compliance_index,
+    update_checks_metadata_with_compliance,
+)
+from prowler.lib.check.compliance_models import (
+    Compliance_Base_Model,
+    Compliance_Requirement,
+    Generic_Compliance_Requirement_Attribute,
+)
+
+CHECK_ID = "vpc_peering_routing_tables_with_least_privilege"
+
+
+def generate_requirement(requirement_id: str, checks: list):
+    return Compliance_Requirement(
+        Id=requirement_id,
+        Description=f"Requirement {requirement_id}",
+        Attributes=[Generic_Compliance_Requirement_Attribute(Section="Network")],
+        Checks=checks,
+    )
+
+
+bulk_compliance_frameworks = {
+    "framework_1_aws": Compliance_Base_Model(
+        Framework="Framework-1",
+        Provider="AWS",
+        Version="1",
+        Description="Framework 1",
+        Requirements=[
+            generate_requirement("1.1", [CHECK_ID, CHECK_ID]),
+            generate_requirement("1.2", ["other_check"]),
+            generate_requirement("1.3", []),
+        ],
+    ),
+    "framework_2_aws": Compliance_Base_Model(
+        Framework="Framework-2",
+        Provider="AWS",
+        Version="",
+        Description="Framework 2",
+        Requirements=[generate_requirement("2.1", ["other_check", CHECK_ID])],
+    ),
+}
+
+
+class Test_Compliance:
+    def test_get_checks_compliance_index(self):
+        checks_compliance_index = get_checks_compliance_index(
+            bulk_compliance_frameworks
+        )
+
+        assert sorted(checks_compliance_index.keys()) == [
+            "manual_check",
+            "other_check",
+            CHECK_ID,
+        ]
+        assert [
+            (compliance.Framework, compliance.Requirements[0].Id)
+            for compliance in checks_compliance_index[CHECK_ID]
+        ] == [("Framework-1", "1.1"), ("Framework-2", "2.1")]
+        assert [
+            (compliance.Framework, compliance.Requirements[0].Id)
+            for compliance in checks_compliance_index["manual_check"]
+        ] == [("Framework-1", "1.3")]
+        # The compliance of a requirement is shared by its checks
+        assert (
+            checks_compliance_index[CHECK_ID][1]
+            is checks_compliance_index["other_check"][1]
+        )
+
+    def test_update_checks_metadata_with_compliance(self):
+        bulk_checks_metadata = update_checks_metadata_with_compliance(
+            bulk_compliance_frameworks,
+            {CHECK_ID: test_bulk_checks_metadata[CHECK_ID].copy()},
+        )
+
+        check_compliance = bulk_checks_metadata[CHECK_ID].Compliance
+        assert len(check_compliance) == 2
+        assert check_compliance[0].Framework == "Framework-1"
+        assert check_compliance[0].Provider == "AWS"
+        assert check_compliance[0].Version == "1"
+        assert check_compliance[0].Description == "Framework 1"
+        assert check_compliance[0].Requirements[0].Id == "1.1"
+        assert check_compliance[1].Framework == "Framework-2"
+        assert check_compliance[1].Requirements[0].Id == "2.1"
+        manual_compliance = bulk_checks_metadata["manual_check"].Compliance
+        assert len(manual_compliance) == 1
+        assert manual_compliance[0].Requirements[0].Id == "1.3"
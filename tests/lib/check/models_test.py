@@ -0,0 +1,72 @@
+import os
+
+import pytest
+from pydantic import ValidationError
+
+from prowler.lib.check.models import (
+    Check,
+    Check_Report_AWS,
+    Shared_Check_Metadata_Model,
+    checks_metadata_by_file,
+    load_check_metadata,
+)
+
+
+class check_test_shared_metadata(Check):
+    def execute(self):
+        return [Check_Report_AWS(self.metadata()), Check_Report_AWS(self.metadata())]
+
+
+class Test_Check_Report:
+    def setup_method(self):
+        # The check uses the metadata fixture instead of its own metadata file
+        checks_metadata_by_file[os.path.abspath(__file__)[:-3] + ".metadata.json"] = (
+            load_check_metadata(
+                f"{os.path.dirname(os.path.realpath(__file__))}/fixtures/metadata.json"
+            )
+        )
+
+    def test_findings_share_check_metadata(self):
+        check = check_test_shared_metadata()
+        findings = check.execute()
+
+        assert findings[0].check_metadata is findings[1].check_metadata
+        assert isinstance(findings[0].check_metadata, Shared_Check_Metadata_Model)
+        assert findings[0].check_metadata == check
+        with pytest.raises(TypeError):
+            findings[0].check_metadata.Severity = "low"
+
+    def test_findings_check_metadata_updated(self):
+        check = check_test_shared_metadata()
+        finding = check.execute()[0]
+        # e.g. the --custom-checks-metadata-file updates the check's metadata
+        check.Severity = "critical"
+        updated_finding = check.execute()[0]
+
+        assert finding.check_metadata.Severity != "critical"
+        assert updated_finding.check_metadata.Severity == "critical"
+
+    def test_findings_from_metadata_json(self):
+        check = check_test_shared_metadata()
+        check_metadata = check.copy(update={"Notes": "not shared"})
+        finding = Check_Report_AWS(check_metadata.json())
+
+        assert finding.check_metadata == check_metadata
+        assert not isinstance(finding.check_metadata, Shared_Check_Metadata_Model)
+
+    def test_findings_slots(self):
+        finding = check_test_shared_metadata().execute()[0]
+        finding.status = "PASS"
+        finding.resource_id = "resource"
+        # Other information can be stored in the findings
+        finding.resource_name = "resource_name"
+
+        assert finding.status == "PASS"
+        assert finding.resource_id == "resource"
+        assert finding.resource_name == "resource_name"
+        assert finding.__dict__ == {"resource_name": "resource_name"}
+
+
+def test_invalid_shared_check_metadata():
+    with pytest.raises(ValidationError):
+        Shared_Check_Metadata_Model.parse_raw("{}")
@@ -52,12 +52,14 @@ class Test_Parser:
         assert not parsed.no_banner
         assert not parsed.slack
         assert not parsed.unix_timestamp
+        assert not parsed.profile_scan
         assert parsed.log_level == "CRITICAL"
         assert not parsed.log_file
         assert not parsed.only_logs
         assert not parsed.checks
         assert not parsed.checks_file
         assert not parsed.checks_folder
+        assert not parsed.parallel_checks
         assert not parsed.services
         assert not parsed.severity
         assert not parsed.compliance
@@ -69,12 +71,14 @@ class Test_Parser:
         assert not parsed.list_compliance
         assert not parsed.list_compliance_requirements
         assert not parsed.list_categories
-        assert not parsed.profile
+        assert not parsed.profile_scan
         assert not parsed.role
         assert parsed.session_duration == 3600
         assert not parsed.external_id
         assert not parsed.region
         assert not parsed.organizations_role
+        assert not parsed.organization_accounts
+        assert parsed.organization_accounts_workers == 4
         assert not parsed.security_hub
         assert not parsed.quick_inventory
         assert not parsed.output_bucket
@@ -100,6 +104,7 @@ class Test_Parser:
         assert not parsed.no_banner
         assert not parsed.slack
         assert not parsed.unix_timestamp
+        assert not parsed.profile_scan
         assert parsed.log_level == "CRITICAL"
         assert not parsed.log_file
         assert not parsed.only_logs
@@ -139,6 +144,7 @@ class Test_Parser:
         assert not parsed.no_banner
         assert not parsed.slack
         assert not parsed.unix_timestamp
+        assert not parsed.profile_scan
         assert parsed.log_level == "CRITICAL"
         assert not parsed.log_file
         assert not parsed.only_logs
@@ -248,6 +254,31 @@ class Test_Parser:
         assert len(parsed.output_modes) == 1
         assert "csv" in parsed.output_modes
 
+    def test_root_parser_output_modes_json_lines(self):
+        command = [
+            prowler_command,
+            "--output-modes",
+            "json-lines",
+            "json-asff-lines",
+            "json-ocsf-lines",
+            "--output-compression",
+            "gzip",
+        ]
+        parsed = self.parser.parse(command)
+        assert parsed.output_modes == [
+            "json-lines",
+            "json-asff-lines",
+            "json-ocsf-lines",
+        ]
+        assert parsed.output_compression == "gzip"
+
+    def test_root_parser_output_compression_zstd_not_installed(self):
+        command = [prowler_command, "--output-compression", "zstd"]
+        with patch("prowler.lib.cli.parser.find_spec", return_value=None):
+            with pytest.raises(SystemExit) as wrapped_exit:
+                _ = self.parser.parse(command)
+        assert wrapped_exit.value.code == 2
+
     def test_root_parser_output_filename_short(self):
         filename = "test_output.txt"
         command = [prowler_command, "-F", filename]
@@ -303,6 +334,11 @@ class Test_Parser:
         parsed = self.parser.parse(command)
         assert parsed.unix_timestamp
 
+    def test_root_parser_profile_scan(self):
+        command = [prowler_command, "--profile-scan"]
+        parsed = self.parser.parse(command)
+        assert parsed.profile_scan
+
     def test_logging_parser_only_logs_set(self):
         command = [prowler_command, "--only-logs"]
         parsed = self.parser.parse(command)
@@ -475,6 +511,30 @@ class Test_Parser:
         parsed = self.parser.parse(command)
         assert parsed.checks_folder == filename
 
+    def test_checks_parser_parallel_checks(self):
+        argument = "--parallel-checks"
+        parallel_checks = "8"
+        command = [prowler_command, argument, parallel_checks]
+        parsed = self.parser.parse(command)
+        assert parsed.parallel_checks == 8
+
+    def test_checks_parser_parallel_checks_not_valid(self):
+        argument = "--parallel-checks"
+        parallel_checks = "0"
+        command = [prowler_command, argument, parallel_checks]
+        with pytest.raises(SystemExit) as wrapped_exit:
+            _ = self.parser.parse(command)
+        assert wrapped_exit.type == SystemExit
+        assert wrapped_exit.value.code == 2
+
+    def test_checks_parser_parallel_checks_without_value(self):
+        argument = "--parallel-checks"
+        command = [prowler_command, argument]
+        with pytest.raises(SystemExit) as wrapped_exit:
+            _ = self.parser.parse(command)
+        assert wrapped_exit.type == SystemExit
+        assert wrapped_exit.value.code == 2
+
     def test_checks_parser_services_short(self):
         argument = "-s"
         service_1 = "iam"
@@ -766,7 +826,7 @@ class Test_Parser:
         external_id = ""
         command = [prowler_command, argument, external_id]
         parsed = self.parser.parse(command)
-        assert not parsed.profile
+        assert not parsed.profile_scan
 
     def test_aws_parser_external_id_short(self, capsys):
         argument = "-I"
@@ -869,6 +929,47 @@ class Test_Parser:
         parsed = self.parser.parse(command)
         assert parsed.organizations_role == organizations_role
 
+    def test_aws_parser_organization_accounts(self):
+        command = [
+            prowler_command,
+            "--organization-accounts",
+            "--organization-accounts-workers",
+            "8",
+            "-R",
+            "ProwlerRole",
+        ]
+        parsed = self.parser.parse(command)
+        assert parsed.organization_accounts
+        assert parsed.organization_accounts_workers == 8
+        assert parsed.role == "ProwlerRole"
+
+    def test_aws_parser_organization_accounts_no_role(self, capsys):
+        command = [prowler_command, "--organization-accounts"]
+        with pytest.raises(SystemExit) as wrapped_exit:
+            _ = self.parser.parse(command)
+        assert wrapped_exit.type == SystemExit
+        assert wrapped_exit.value.code == 2
+        assert (
+            capsys.readouterr().err
+            == f"{prowler_default_usage_error}\nprowler: error: aws: To use --organization-accounts option -R/--role option is needed\n"
+        )
+
+    def test_aws_parser_organization_accounts_security_hub(self, capsys):
+        command = [
+            prowler_command,
+            "--organization-accounts",
+            "-R",
+            "ProwlerRole",
+            "-S",
+        ]
+        with pytest.raises(SystemExit) as wrapped_exit:
+            _ = self.parser.parse(command)
+        assert wrapped_exit.value.code == 2
+        assert (
+            capsys.readouterr().err
+            == f"{prowler_default_usage_error}\nprowler: error: aws: --organization-accounts option cannot be used with --mfa, -S/--security-hub, -i/--quick-inventory or --resource-tags options\n"
+        )
+
     def test_aws_parser_security_hub_short(self):
         argument = "-S"
         command = [prowler_command, argument]
@@ -981,6 +1082,12 @@ class Test_Parser:
         assert resource_arn1 in parsed.resource_arn
         assert resource_arn2 in parsed.resource_arn
 
+    def test_aws_parser_resource_substring_match(self):
+        argument = "--resource-substring-match"
+        command = [prowler_command, argument]
+        parsed = self.parser.parse(command)
+        assert parsed.resource_substring_match
+
     def test_aws_parser_wrong_resource_arn(self):
         argument = "--resource-arn"
         resource_arn = "arn:azure:iam::account:user/test"
@@ -996,6 +1103,21 @@ class Test_Parser:
         parsed = self.parser.parse(command)
         assert parsed.aws_retries_max_attempts == int(max_retries)
 
+    def test_aws_parser_aws_max_concurrent_requests(self):
+        argument = "--aws-max-concurrent-requests"
+        max_concurrent_requests = "50"
+        command = [prowler_command, argument, max_concurrent_requests]
+        parsed = self.parser.parse(command)
+        assert parsed.aws_max_concurrent_requests == int(max_concurrent_requests)
+
+    def test_aws_parser_aws_max_concurrent_requests_not_valid(self):
+        argument = "--aws-max-concurrent-requests"
+        max_concurrent_requests = "0"
+        command = [prowler_command, argument, max_concurrent_requests]
+        with pytest.raises(SystemExit) as ex:
+            self.parser.parse(command)
+        assert ex.type == SystemExit
+
     def test_aws_parser_ignore_unused_services(self):
         argument = "--ignore-unused-services"
         command = [prowler_command, argument]
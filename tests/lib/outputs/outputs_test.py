@@ -1,4 +1,8 @@
+import gzip
+import json
 import os
+import zlib
+from io import StringIO
 from os import path, remove
 from time import mktime
 from unittest import mock
@@ -23,7 +27,11 @@ from prowler.lib.check.compliance_models import (
     Compliance_Requirement,
 )
 from prowler.lib.check.models import Check_Report, load_check_metadata
-from prowler.lib.outputs.file_descriptors import fill_file_descriptors
+from prowler.lib.outputs.file_descriptors import (
+    Output_Writers,
+    fill_file_descriptors,
+    get_output_writers,
+)
 from prowler.lib.outputs.json import (
     fill_json_asff,
     fill_json_ocsf,
@@ -38,6 +46,7 @@ from prowler.lib.outputs.models import (
     Check_Output_CSV,
     Check_Output_JSON_ASFF,
     Check_Output_JSON_OCSF,
+    Check_Output_Templates,
     Cloud,
     Compliance,
     Compliance_OCSF,
@@ -53,6 +62,8 @@ from prowler.lib.outputs.models import (
     Resources,
     Severity,
     generate_csv_fields,
+    generate_provider_output_csv,
+    generate_provider_output_json,
     get_check_compliance,
     parse_html_string,
     parse_json_tags,
@@ -63,7 +74,10 @@ from prowler.lib.outputs.models import (
 )
 from prowler.lib.outputs.outputs import extract_findings_statistics, set_report_color
 from prowler.lib.utils.utils import hash_sha512, open_file
-from prowler.providers.aws.lib.audit_info.models import AWS_Audit_Info
+from prowler.providers.aws.lib.audit_info.models import (
+    AWS_Audit_Info,
+    AWS_Organizations_Info,
+)
 from prowler.providers.common.models import Audit_Metadata
 
 AWS_ACCOUNT_ID = "123456789012"
@@ -164,6 +178,192 @@ class Test_Outputs:
                 )
                 remove(expected[index][output_mode].name)
 
+    def test_output_writers(self, tmp_path):
+        audit_info = mock.MagicMock(spec=AWS_Audit_Info)
+        output_filename = f"prowler-output-{AWS_ACCOUNT_ID}-{output_file_timestamp}"
+        output_writers = Output_Writers(
+            ["json", "json-asff", "html"], str(tmp_path), output_filename, audit_info
+        )
+        # The output files are not created until the first findings are reported
+        assert not list(tmp_path.iterdir())
+
+        with mock.patch("prowler.lib.outputs.file_descriptors.add_html_header"):
+            file_descriptors = output_writers.get_file_descriptors()
+        # The output files are opened only once
+        assert output_writers.get_file_descriptors() is file_descriptors
+        for index in range(3):
+            output_writers.write_json("json", {"CheckID": f"check_{index}"})
+        file_descriptors["html"].write("<tr></tr>")
+        output_writers.close()
+
+        with open(f"{tmp_path}/{output_filename}{json_file_suffix}") as json_file:
+            assert json.load(json_file) == [
+                {"CheckID": "check_0"},
+                {"CheckID": "check_1"},
+                {"CheckID": "check_2"},
+            ]
+        with open(f"{tmp_path}/{output_filename}{json_asff_file_suffix}") as json_file:
+            assert json.load(json_file) == []
+        with open(f"{tmp_path}/{output_filename}.html") as html_file:
+            assert html_file.read().strip().endswith("</html>")
+        assert output_writers.closed
+        assert not output_writers.get_file_descriptors()
+        # Closing again, e.g. at exit, does not write the outputs twice
+        output_writers.close()
+        with open(f"{tmp_path}/{output_filename}{json_file_suffix}") as json_file:
+            assert len(json.load(json_file)) == 3
+
+    def test_output_writers_json_lines(self, tmp_path):
+        audit_info = mock.MagicMock(spec=AWS_Audit_Info)
+        output_filename = f"prowler-output-{AWS_ACCOUNT_ID}-{output_file_timestamp}"
+        output_writers = Output_Writers(
+            ["json-lines", "json-asff-lines"],
+            str(tmp_path),
+            output_filename,
+            audit_info,
+        )
+        output_writers.get_file_descriptors()
+        output_writers.write_json_line("json-lines", {"CheckID": "check_0"})
+
+        # Each finding can be read as soon as it is written
+        with open(f"{tmp_path}/{output_filename}.jsonl") as json_lines_file:
+            assert json_lines_file.read() == '{"CheckID":"check_0"}\n'
+
+        output_writers.write_json_line("json-lines", {"CheckID": "check_1"})
+        output_writers.close()
+        with open(f"{tmp_path}/{output_filename}.jsonl") as json_lines_file:
+            assert [json.loads(line) for line in json_lines_file] == [
+                {"CheckID": "check_0"},
+                {"CheckID": "check_1"},
+            ]
+        with open(f"{tmp_path}/{output_filename}.asff.jsonl") as json_lines_file:
+            assert json_lines_file.read() == ""
+
+    def test_output_writers_json_lines_gzip(self, tmp_path):
+        audit_info = mock.MagicMock(spec=AWS_Audit_Info)
+        output_filename = f"prowler-output-{AWS_ACCOUNT_ID}-{output_file_timestamp}"
+        output_writers = Output_Writers(
+            ["json-ocsf-lines"],
+            str(tmp_path),
+            output_filename,
+            audit_info,
+            output_compression="gzip",
+        )
+        output_writers.get_file_descriptors()
+        output_writers.write_json_line("json-ocsf-lines", {"CheckID": "check_0"})
+
+        # The compressed findings can be read while the file is still open
+        filename = f"{tmp_path}/{output_filename}.ocsf.jsonl.gz"
+        with open(filename, "rb") as compressed_file:
+            decompressor = zlib.decompressobj(wbits=zlib.MAX_WBITS | 16)
+            assert (
+                decompressor.decompress(compressed_file.read())
+                == b'{"CheckID":"check_0"}\n'
+            )
+
+        output_writers.close()
+        with gzip.open(filename, "rt") as json_lines_file:
+            assert json.loads(json_lines_file.readline()) == {"CheckID": "check_0"}
+
+    def test_get_output_writers(self):
+        audit_info = mock.MagicMock(spec=AWS_Audit_Info)
+        output_options = mock.MagicMock(
+            output_modes=["csv"],
+            output_directory="output",
+            output_filename="prowler-output",
+            output_compression="gzip",
+        )
+        output_writers = get_output_writers(output_options, audit_info)
+        assert output_writers.output_compression == "gzip"
+        assert output_options.output_writers is output_writers
+        assert output_writers.output_modes == ["csv"]
+        assert output_writers.output_directory == "output"
+        assert output_writers.output_filename == "prowler-output"
+        # The Output_Writers are created once per scan
+        assert get_output_writers(output_options, audit_info) is output_writers
+
+    def test_check_output_templates(self):
+        output_options = mock.MagicMock(unix_timestamp=False, bulk_checks_metadata={})
+        output_templates = Check_Output_Templates(output_options)
+        audit_info = mock.MagicMock(
+            profile="default",
+            audited_account=AWS_ACCOUNT_ID,
+            organizations_metadata=None,
+        )
+        other_account_audit_info = mock.MagicMock(
+            profile="default",
+            audited_account="210987654321",
+            organizations_metadata=AWS_Organizations_Info(
+                account_details_email="test@example.com",
+                account_details_name="other-account",
+                account_details_arn="arn:aws:organizations::210987654321:account",
+                account_details_org="o-test",
+                account_details_tags="",
+            ),
+        )
+        # The checks metadata has no compliance, it is in the bulk_checks_metadata
+        check_metadata = load_check_metadata(
+            f"{path.dirname(path.realpath(__file__))}/fixtures/metadata.json"
+        )
+        check_metadata.Compliance = None
+        findings = []
+        for index in range(3):
+            finding = Check_Report(check_metadata)
+            finding.resource_details = f"Test resource details {index}"
+            finding.resource_id = f"test-resource-{index}"
+            finding.resource_arn = f"test-arn-{index}"
+            finding.resource_tags = [{"Key": "index", "Value": str(index)}]
+            finding.region = "eu-west-1"
+            finding.status = "PASS" if index else "FAIL"
+            finding.status_extended = f"This is a test {index}"
+            findings.append(finding)
+
+        csv_file = StringIO()
+        templated_csv_file = StringIO()
+        for finding_audit_info in (audit_info, other_account_audit_info):
+            for finding in findings:
+                csv_writer, csv_output = generate_provider_output_csv(
+                    "aws", finding, finding_audit_info, "csv", csv_file, output_options
+                )
+                csv_writer.writerow(csv_output.__dict__)
+                templated_csv_writer, templated_csv_output = (
+                    generate_provider_output_csv(
+                        "aws",
+                        finding,
+                        finding_audit_info,
+                        "csv",
+                        templated_csv_file,
+                        output_options,
+                        output_templates,
+                    )
+                )
+                templated_csv_writer.writerow(templated_csv_output.__dict__)
+                # One CSV writer for each output file
+                assert templated_csv_writer is output_templates.get_csv_writer(
+                    templated_csv_file, type(csv_output)
+                )
+                # The outputs filled from the check's templates are the same as the ones filled for each finding
+                assert (
+                    generate_provider_output_json(
+                        "aws",
+                        finding,
+                        finding_audit_info,
+                        "json",
+                        output_options,
+                        output_templates,
+                    ).dict()
+                    == generate_provider_output_json(
+                        "aws", finding, finding_audit_info, "json", output_options
+                    ).dict()
+                )
+        assert templated_csv_file.getvalue() == csv_file.getvalue()
+        assert templated_csv_output.account_name == "other-account"
+        assert templated_csv_output.status_extended == "This is a test 2"
+
+        # The templates are built once per check
+        assert len(output_templates.csv_rows) == 1
+        assert len(output_templates.json_findings) == 1
+
     def test_set_report_color(self):
         test_status = ["PASS", "FAIL", "ERROR", "WARNING"]
         test_colors = [Fore.GREEN, Fore.RED, Fore.BLACK, orange_color]
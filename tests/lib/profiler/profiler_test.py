@@ -0,0 +1,152 @@
+import json
+from os import path
+
+from mock import MagicMock, patch
+
+from prowler.lib.check.check import run_check
+from prowler.lib.profiler import profiler as profiler_module
+from prowler.lib.profiler.profiler import (
+    LATENCY_BUCKETS_MS,
+    Profiler,
+    get_profiler,
+    set_profiler,
+)
+
+
+def set_mocked_profiler() -> Profiler:
+    profiler = Profiler("aws")
+    profiler.record_api_call("ec2", "DescribeInstances", "eu-west-1", 0.003)
+    profiler.record_api_call(
+        "ec2",
+        "DescribeInstances",
+        "eu-west-1",
+        0.2,
+        retries=2,
+        throttles=1,
+        bytes_received=512,
+        error=True,
+    )
+    profiler.record_api_call("s3", "ListBuckets", "global", 20)
+    profiler.record_check("ec2_instance_public_ip", "ec2", 1.5, 3)
+    profiler.record_service_discovery("ec2_client", 2.5)
+    return profiler
+
+
+class Test_Profiler:
+    def test_record_api_call(self):
+        profiler = set_mocked_profiler()
+        describe_instances = profiler.api_calls[
+            ("ec2", "DescribeInstances", "eu-west-1")
+        ]
+        assert describe_instances["calls"] == 2
+        assert describe_instances["errors"] == 1
+        assert describe_instances["retries"] == 2
+        assert describe_instances["throttles"] == 1
+        assert describe_instances["bytes_received"] == 512
+        assert describe_instances["latency_ms"]["total"] == 203
+        assert describe_instances["latency_ms"]["min"] == 3
+        assert describe_instances["latency_ms"]["max"] == 200
+        # 3ms is in the first bucket and 200ms in the (100, 250] bucket
+        histogram = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+        histogram[0] = 1
+        histogram[LATENCY_BUCKETS_MS.index(250)] = 1
+        assert describe_instances["latency_ms"]["histogram"] == histogram
+        # The latencies over the last bound are in the last bucket
+        assert profiler.api_calls[("s3", "ListBuckets", "global")]["latency_ms"][
+            "histogram"
+        ][-1]
+
+    def test_record_check(self):
+        profiler = set_mocked_profiler()
+        profiler.record_check("ec2_instance_public_ip", "ec2", 0.5, 1)
+        assert profiler.checks["ec2_instance_public_ip"] == {
+            "service": "ec2",
+            "executions": 2,
+            "duration": 2.0,
+            "findings": 4,
+        }
+
+    def test_get_profile(self):
+        profile = set_mocked_profiler().get_profile()
+        assert profile["provider"] == "aws"
+        assert profile["latency_buckets_ms"] == list(LATENCY_BUCKETS_MS) + [None]
+        # The API calls are sorted by their total latency
+        assert [
+            (api_call["service"], api_call["operation"], api_call["region"])
+            for api_call in profile["api_calls"]
+        ] == [
+            ("s3", "ListBuckets", "global"),
+            ("ec2", "DescribeInstances", "eu-west-1"),
+        ]
+        assert profile["checks"] == [
+            {
+                "check_id": "ec2_instance_public_ip",
+                "service": "ec2",
+                "executions": 1,
+                "duration": 1.5,
+                "findings": 3,
+            }
+        ]
+        assert profile["services_discovery"] == [
+            {"service": "ec2_client", "duration": 2.5}
+        ]
+        assert json.loads(json.dumps(profile)) == profile
+
+    def test_get_collapsed_stacks(self):
+        assert sorted(set_mocked_profiler().get_collapsed_stacks()) == [
+            "prowler;api_calls;aws;ec2;DescribeInstances;eu-west-1 203",
+            "prowler;api_calls;aws;s3;ListBuckets;global 20000",
+            "prowler;checks;ec2;ec2_instance_public_ip 1500",
+            "prowler;discovery;ec2_client 2500",
+        ]
+
+    def test_pop_and_merge_records(self):
+        profiler = set_mocked_profiler()
+        worker_profiler = set_mocked_profiler()
+        profiler.merge_records(worker_profiler.pop_records())
+
+        assert worker_profiler.get_collapsed_stacks() == []
+        describe_instances = profiler.api_calls[
+            ("ec2", "DescribeInstances", "eu-west-1")
+        ]
+        assert describe_instances["calls"] == 4
+        assert describe_instances["throttles"] == 2
+        assert describe_instances["latency_ms"]["total"] == 406
+        assert describe_instances["latency_ms"]["histogram"][0] == 2
+        assert profiler.checks["ec2_instance_public_ip"]["executions"] == 2
+        assert profiler.services_discovery["ec2_client"] == 5
+
+    def test_write(self, tmp_path):
+        profile_files = set_mocked_profiler().write(str(tmp_path), "prowler-output")
+        assert profile_files == [
+            f"{tmp_path}/prowler-output.profile.json",
+            f"{tmp_path}/prowler-output.profile.folded",
+        ]
+        with open(profile_files[0]) as profile_file:
+            assert json.load(profile_file)["provider"] == "aws"
+        with open(profile_files[1]) as collapsed_file:
+            assert len(collapsed_file.read().splitlines()) == 4
+        assert path.isfile(profile_files[1])
+
+    @patch.object(profiler_module, "profiler", new=None)
+    def test_set_profiler(self):
+        assert get_profiler() is None
+        profiler = set_profiler("azure")
+        assert get_profiler() is profiler
+        assert profiler.provider == "azure"
+
+    @patch.object(profiler_module, "profiler", new=None)
+    def test_run_check(self):
+        check = MagicMock()
+        check.CheckID = "iam_root_mfa_enabled"
+        check.ServiceName = "iam"
+        check.execute.return_value = [MagicMock(), MagicMock()]
+        output_options = MagicMock(verbose=False)
+
+        # The checks are not timed if the scan is not profiled
+        assert len(run_check(check, output_options)) == 2
+        profiler = set_profiler("aws")
+        run_check(check, output_options)
+        assert profiler.checks["iam_root_mfa_enabled"]["service"] == "iam"
+        assert profiler.checks["iam_root_mfa_enabled"]["executions"] == 1
+        assert profiler.checks["iam_root_mfa_enabled"]["findings"] == 2
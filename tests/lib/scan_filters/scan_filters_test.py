@@ -1,4 +1,10 @@
-from prowler.lib.scan_filters.scan_filters import is_resource_filtered
+from mock import MagicMock
+
+from prowler.lib.scan_filters.scan_filters import (
+    Resource_Filter,
+    get_resource_filter,
+    is_resource_filtered,
+)
 
 
 class Test_Scan_Filters:
@@ -15,3 +21,76 @@ class Test_Scan_Filters:
         )
         assert is_resource_filtered("test_bucket", audit_resources)
         assert is_resource_filtered("arn:aws:s3:::test_bucket", audit_resources)
+
+    def test_is_resource_filtered_with_resource_filter(self):
+        audit_resources = Resource_Filter(
+            [
+                "arn:aws:iam::123456789012:user/test_user",
+                "arn:aws:s3:::test_bucket/test_key",
+                "arn:aws:ds:us-east-1:123456789012:directory/d-1234567890",
+            ]
+        )
+        assert is_resource_filtered(
+            "arn:aws:iam::123456789012:user/test_user", audit_resources
+        )
+        assert not is_resource_filtered(
+            "arn:aws:iam::123456789012:user/test1", audit_resources
+        )
+        # Names, IDs and the resource part of the ARN
+        assert is_resource_filtered("test_key", audit_resources)
+        assert is_resource_filtered("d-1234567890", audit_resources)
+        assert is_resource_filtered("user/test_user", audit_resources)
+        # ARN prefixes
+        assert is_resource_filtered("arn:aws:s3:::test_bucket", audit_resources)
+        assert not is_resource_filtered("arn:aws:s3:::test_buck", audit_resources)
+        assert not is_resource_filtered("test_user_2", audit_resources)
+
+    def test_resource_filter_substring_match(self):
+        audit_resources = [
+            "arn:aws:iam::123456789012:user/test_user",
+            "arn:aws:s3:::test_bucket",
+        ]
+        resource_filter = Resource_Filter(audit_resources, substring_match=True)
+        for resource in [
+            "arn:aws:iam::123456789012:user/test_user",
+            "arn:aws:iam::123456789012:user/test1",
+            "test_bucket",
+            "test_buck",
+            "arn:aws:s3:::test_bucket",
+        ]:
+            assert is_resource_filtered(
+                resource, resource_filter
+            ) == is_resource_filtered(resource, audit_resources)
+
+    def test_resource_filter_empty(self):
+        assert not Resource_Filter([])
+        assert not Resource_Filter(None)
+        assert Resource_Filter(["arn:aws:s3:::test_bucket"])
+
+    def test_get_resource_filter(self):
+        audit_info = MagicMock()
+        audit_info.audit_resources = ["arn:aws:s3:::test_bucket"]
+        audit_info.audit_resources_filter = None
+        resource_filter = get_resource_filter(audit_info)
+        assert audit_info.audit_resources_filter == resource_filter
+        assert get_resource_filter(audit_info) is resource_filter
+        assert resource_filter.is_resource_filtered("test_bucket")
+
+        # The Resource_Filter is built again if the audit_resources change
+        audit_info.audit_resources = ["arn:aws:s3:::other_bucket"]
+        resource_filter = get_resource_filter(audit_info)
+        assert resource_filter.is_resource_filtered("other_bucket")
+        assert not resource_filter.is_resource_filtered("test_bucket")
+
+    def test_get_resource_filter_keeps_substring_match(self):
+        audit_info = MagicMock()
+        audit_info.audit_resources = ["arn:aws:s3:::test_bucket"]
+        audit_info.audit_resources_filter = Resource_Filter(
+            audit_info.audit_resources, substring_match=True
+        )
+
+        # The Resource_Filter is built again with the same matching
+        audit_info.audit_resources = ["arn:aws:s3:::other_bucket"]
+        resource_filter = get_resource_filter(audit_info)
+        assert resource_filter.substring_match
+        assert resource_filter.is_resource_filtered("other_buck")
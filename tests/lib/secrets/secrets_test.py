@@ -0,0 +1,72 @@
+from mock import patch
+
+from prowler.lib.secrets import secrets
+from prowler.lib.secrets.secrets import (
+    get_payload_hash,
+    get_secrets_cache_file,
+    read_secrets_cache,
+    scan_secrets,
+    scan_secrets_batch,
+    write_secrets_cache,
+)
+
+
+class Test_Secrets:
+    def test_scan_secrets(self):
+        secrets_detected = scan_secrets("password=password")
+        assert len(secrets_detected) == 1
+        assert secrets_detected[0]["line_number"] == 1
+        assert secrets_detected[0]["type"] == "Secret Keyword"
+
+    def test_scan_secrets_no_secrets(self):
+        assert scan_secrets("") is None
+        assert scan_secrets("#!/bin/bash\nyum update -y") is None
+
+    def test_scan_secrets_with_filename(self):
+        data = "[database]\npassword = Sup3rS3cr3tPassw0rd"
+        assert get_payload_hash(data, "config.ini") != get_payload_hash(data)
+        secrets_detected = scan_secrets(data, "config.ini")
+        assert secrets_detected[0]["filename"] == "config.ini"
+        assert secrets_detected[0]["line_number"] == 2
+
+    def test_scan_secrets_batch_deduplicates_payloads(self):
+        payloads = [
+            "DB_PASSWORD=foobar123",
+            "#!/bin/bash\nDB_USER=admin\nDB_PASSWORD=foobar1234",
+            "DB_PASSWORD=foobar123",
+            "",
+        ]
+        with patch.object(
+            secrets, "_scan_payload", wraps=secrets._scan_payload
+        ) as scan_payload:
+            results = scan_secrets_batch(payloads)
+            assert scan_secrets_batch(payloads[:2]) == results[:2]
+        # Only the payloads not scanned before are scanned once
+        assert scan_payload.call_count <= 3
+        assert results[0] == results[2]
+        assert results[0][0]["line_number"] == 1
+        assert results[1][0]["line_number"] == 3
+        assert results[3] is None
+
+    def test_scan_secrets_batch_process_pool(self):
+        payloads = [
+            f"DB_USER=user{index}\nDB_PASSWORD=pass{index}" for index in range(4)
+        ]
+        with patch.object(secrets, "SECRETS_PROCESS_POOL_THRESHOLD", 1):
+            results = scan_secrets_batch(payloads, processes=2)
+        assert len(results) == 4
+        for result in results:
+            assert result[0]["type"] == "Secret Keyword"
+            assert result[0]["line_number"] == 2
+
+    def test_secrets_cache(self, tmp_path):
+        key = "awslambda_code_kHN+WVQbYAUBq3ZL6mJ2J4qgOxs8uXmUo/sYHmOzsnw="
+        code_secrets = {"lambda_function.py": "Secret Keyword on line 3"}
+        with patch.object(secrets, "secrets_cache_directory", str(tmp_path)):
+            assert read_secrets_cache(key) is None
+            write_secrets_cache(key, code_secrets)
+            assert get_secrets_cache_file(key).startswith(str(tmp_path))
+            assert read_secrets_cache(key) == code_secrets
+            # The secrets found by another detect-secrets version are scanned again
+            with patch.object(secrets, "detect_secrets_version", "0.0.0"):
+                assert read_secrets_cache(key) is None
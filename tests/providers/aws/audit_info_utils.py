@@ -51,17 +51,19 @@ def set_mocked_aws_audit_info(
     audit_config: dict = {},
     ignore_unused_services: bool = False,
     assumed_role_info: AWS_Assume_Role = None,
-    audit_session: session.Session = session.Session(
-        profile_name=None,
-        botocore_session=None,
-    ),
+    audit_session: session.Session = None,
     original_session: session.Session = None,
     enabled_regions: set = None,
 ):
     audit_info = AWS_Audit_Info(
         session_config=None,
         original_session=original_session,
-        audit_session=audit_session,
+        # A new session for each audit, so nothing cached by session is shared between tests
+        audit_session=audit_session
+        or session.Session(
+            profile_name=None,
+            botocore_session=None,
+        ),
         audited_account=audited_account,
         audited_account_arn=audited_account_arn,
         audited_user_id=None,
@@ -5,8 +5,12 @@ from moto import mock_aws
 
 from prowler.providers.aws.lib.allowlist.allowlist import (
     allowlist_findings,
+    compile_allowlist,
+    compile_allowlist_items,
+    get_allowlist_index,
     is_allowlisted,
     is_allowlisted_in_check,
+    is_allowlisted_in_index,
     is_allowlisted_in_region,
     is_allowlisted_in_resource,
     is_allowlisted_in_tags,
@@ -1283,3 +1287,232 @@ class Test_Allowlist:
         assert is_allowlisted_in_resource(allowlist_resources, "prowler-test")
         assert is_allowlisted_in_resource(allowlist_resources, "test-prowler")
         assert not is_allowlisted_in_resource(allowlist_resources, "random")
+
+    def test_compile_allowlist_items(self):
+        patterns = compile_allowlist_items(["*", "prowler", "^test"])
+        assert len(patterns) == 1
+        assert patterns[0].search("any-resource")
+
+        patterns = compile_allowlist_items(["^test", "test-(a)-\\1"])
+        assert len(patterns) == 2
+        assert patterns[1].search("test-a-a")
+
+        # Patterns reusing a named group are compiled separately
+        patterns = compile_allowlist_items(["(?P<env>dev)-a", "(?P<env>prod)-b"])
+        assert len(patterns) == 2
+        assert patterns[1].search("prod-b")
+
+    def test_is_allowlisted_in_index_named_groups(self):
+        allowlist = {
+            "Accounts": {
+                "*": {
+                    "Checks": {
+                        "ec2_ami_public": {
+                            "Regions": ["*"],
+                            "Resources": ["(?P<env>dev)-a", "(?P<env>prod)-b"],
+                        }
+                    }
+                }
+            }
+        }
+        for finding_resource in ["dev-a", "prod-b", "test-c"]:
+            assert is_allowlisted_in_index(
+                compile_allowlist(allowlist),
+                AWS_ACCOUNT_NUMBER,
+                "ec2_ami_public",
+                AWS_REGION_US_EAST_1,
+                finding_resource,
+                "",
+            ) == is_allowlisted(
+                allowlist,
+                AWS_ACCOUNT_NUMBER,
+                "ec2_ami_public",
+                AWS_REGION_US_EAST_1,
+                finding_resource,
+                "",
+            )
+
+    def test_compile_allowlist(self):
+        allowlist = {
+            "Accounts": {
+                "*": {
+                    "Checks": {
+                        "lambda_*": {
+                            "Regions": ["*"],
+                            "Resources": ["*"],
+                        },
+                        "*": {
+                            "Regions": [AWS_REGION_US_EAST_1],
+                            "Resources": ["*"],
+                            "Exceptions": {"Resources": ["test"]},
+                        },
+                    }
+                }
+            }
+        }
+
+        allowlist_index = compile_allowlist(allowlist)
+
+        allowlist_account = allowlist_index.accounts["*"]
+        assert len(allowlist_account.entries) == 2
+        assert allowlist_account.entries[0].check == "awslambda_*"
+        assert allowlist_account.entries[0].exceptions is None
+        assert allowlist_account.entries[1].check == "*"
+        assert allowlist_account.entries[1].check_pattern is None
+        assert allowlist_account.exceptions == [1]
+
+    def test_get_allowlist_index_compiled_once(self):
+        allowlist = {
+            "Accounts": {
+                "*": {
+                    "Checks": {
+                        "*": {
+                            "Regions": ["*"],
+                            "Resources": ["*"],
+                        },
+                    }
+                }
+            }
+        }
+
+        allowlist_index = get_allowlist_index(allowlist)
+
+        assert get_allowlist_index(allowlist) is allowlist_index
+        assert get_allowlist_index(allowlist_index) is allowlist_index
+
+    def test_is_allowlisted_in_index_previous_entry_excepted(self):
+        # The Exceptions of an entry stop the evaluation of the following entries
+        allowlist = {
+            "Accounts": {
+                "*": {
+                    "Checks": {
+                        "s3_*": {
+                            "Regions": ["*"],
+                            "Resources": ["*"],
+                            "Exceptions": {"Resources": ["test"]},
+                        },
+                        "ec2_*": {
+                            "Regions": ["*"],
+                            "Resources": ["*"],
+                        },
+                    }
+                }
+            }
+        }
+
+        for finding_resource in ["test", "prowler"]:
+            assert is_allowlisted_in_index(
+                compile_allowlist(allowlist),
+                AWS_ACCOUNT_NUMBER,
+                "ec2_ami_public",
+                AWS_REGION_US_EAST_1,
+                finding_resource,
+                "",
+            ) == is_allowlisted(
+                allowlist,
+                AWS_ACCOUNT_NUMBER,
+                "ec2_ami_public",
+                AWS_REGION_US_EAST_1,
+                finding_resource,
+                "",
+            )
+        assert not is_allowlisted_in_index(
+            compile_allowlist(allowlist),
+            AWS_ACCOUNT_NUMBER,
+            "ec2_ami_public",
+            AWS_REGION_US_EAST_1,
+            "test",
+            "",
+        )
+
+    def test_is_allowlisted_in_index_same_as_is_allowlisted(self):
+        allowlist = {
+            "Accounts": {
+                "*": {
+                    "Checks": {
+                        "s3_bucket_object_versioning": {
+                            "Regions": [AWS_REGION_EU_WEST_1, AWS_REGION_US_EAST_1],
+                            "Resources": ["ci-logs", "logs", ".+-logs"],
+                        },
+                        "ecs_task_definitions_no_environment_secrets": {
+                            "Regions": ["*"],
+                            "Resources": ["*"],
+                            "Exceptions": {
+                                "Accounts": [AWS_ACCOUNT_NUMBER],
+                                "Regions": [
+                                    AWS_REGION_EU_WEST_1,
+                                    AWS_REGION_EU_SOUTH_3,
+                                ],
+                            },
+                        },
+                        "lambda_function": {
+                            "Regions": [AWS_REGION_EU_CENTRAL_1],
+                            "Resources": ["^prowler"],
+                        },
+                        "*": {
+                            "Regions": ["*"],
+                            "Resources": ["*"],
+                            "Tags": ["environment=dev", "project=.*"],
+                        },
+                    }
+                },
+                AWS_ACCOUNT_NUMBER: {
+                    "Checks": {
+                        "iam_*": {
+                            "Regions": ["*"],
+                            "Resources": ["*"],
+                            "Exceptions": {
+                                "Resources": ["test"],
+                                "Tags": ["environment=prod"],
+                            },
+                        }
+                    }
+                },
+                "111122223333": {
+                    "Checks": {
+                        "*": {
+                            "Regions": ["*"],
+                            "Resources": ["*"],
+                        }
+                    }
+                },
+            }
+        }
+        allowlist_index = compile_allowlist(allowlist)
+
+        for check in [
+            "s3_bucket_object_versioning",
+            "ecs_task_definitions_no_environment_secrets",
+            "awslambda_function_url_public",
+            "iam_root_mfa_enabled",
+            "ec2_ami_public",
+        ]:
+            for region in [
+                AWS_REGION_US_EAST_1,
+                AWS_REGION_EU_WEST_1,
+                AWS_REGION_EU_CENTRAL_1,
+                AWS_REGION_EU_SOUTH_3,
+            ]:
+                for finding_resource in ["prowler-logs", "logs", "prowler", "test", ""]:
+                    for tags in [
+                        "",
+                        "environment=dev",
+                        "environment=prod",
+                        "project=prowler | environment=prod",
+                    ]:
+                        for account in [AWS_ACCOUNT_NUMBER, "111122223333"]:
+                            assert is_allowlisted_in_index(
+                                allowlist_index,
+                                account,
+                                check,
+                                region,
+                                finding_resource,
+                                tags,
+                            ) == is_allowlisted(
+                                allowlist,
+                                account,
+                                check,
+                                region,
+                                finding_resource,
+                                tags,
+                            )
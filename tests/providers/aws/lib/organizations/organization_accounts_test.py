@@ -0,0 +1,116 @@
+import sys
+from types import SimpleNamespace
+
+import boto3
+from mock import patch
+from moto import mock_aws
+
+from prowler.providers.aws.lib.organizations import organization_accounts
+from prowler.providers.aws.lib.organizations.organization_accounts import (
+    execute_organization_accounts_checks,
+    get_organization_account_role,
+)
+from tests.providers.aws.audit_info_utils import (
+    AWS_ACCOUNT_NUMBER,
+    AWS_REGION_US_EAST_1,
+    set_mocked_aws_audit_info,
+)
+
+
+def create_organization_accounts() -> list:
+    client = boto3.client("organizations", region_name=AWS_REGION_US_EAST_1)
+    client.create_organization(FeatureSet="ALL")
+    return [AWS_ACCOUNT_NUMBER] + [
+        client.create_account(
+            AccountName=f"mock-account-{index}",
+            Email=f"mock-account-{index}@moto-example.org",
+        )["CreateAccountStatus"]["AccountId"]
+        for index in range(2)
+    ]
+
+
+class Test_AWS_Organization_Accounts:
+    def test_get_organization_account_role(self):
+        assert (
+            get_organization_account_role("ProwlerRole", "aws", "111122223333")
+            == "arn:aws:iam::111122223333:role/ProwlerRole"
+        )
+        assert (
+            get_organization_account_role(
+                f"arn:aws:iam::{AWS_ACCOUNT_NUMBER}:role/prowler/ProwlerRole",
+                "aws",
+                "111122223333",
+            )
+            == "arn:aws:iam::111122223333:role/prowler/ProwlerRole"
+        )
+
+    def execute_organization_accounts_checks(self, workers: int) -> tuple:
+        audit_info = set_mocked_aws_audit_info(
+            [AWS_REGION_US_EAST_1],
+            original_session=boto3.session.Session(region_name=AWS_REGION_US_EAST_1),
+        )
+        audit_info.profile_region = AWS_REGION_US_EAST_1
+        audit_output_options = SimpleNamespace(
+            output_modes=[],
+            only_logs=True,
+            verbose=False,
+            is_quiet=False,
+            allowlist_file=None,
+        )
+        with patch(
+            "prowler.providers.aws.lib.audit_info.audit_info.current_audit_info",
+            new=audit_info,
+        ), patch.object(organization_accounts, "report") as report, patch.dict(
+            sys.modules
+        ):
+            findings = execute_organization_accounts_checks(
+                ["ec2_ebs_default_encryption"],
+                audit_info,
+                audit_output_options,
+                None,
+                {
+                    "role": "ProwlerRole",
+                    "session_duration": 3600,
+                    "role_session_name": "ProwlerAssessmentSession",
+                    "organization_accounts_workers": workers,
+                },
+            )
+        return audit_info, findings, report
+
+    @mock_aws
+    def test_execute_organization_accounts_checks(self):
+        account_ids = create_organization_accounts()
+        audit_info, findings, report = self.execute_organization_accounts_checks(1)
+
+        # One finding per account, reported with the audit info of its account
+        assert sorted(finding.resource_id for finding in findings) == sorted(
+            account_ids
+        )
+        assert report.call_count == 3
+        for call in report.call_args_list:
+            account_findings, _, account_audit_info = call.args
+            assert account_findings[0].resource_id == account_audit_info.audited_account
+            assert (
+                account_audit_info.assumed_role_info.role_arn
+                == f"arn:aws:iam::{account_audit_info.audited_account}:role/ProwlerRole"
+            )
+            assert account_audit_info.organizations_metadata.account_details_arn
+        # The audit info of the scan is restored
+        assert audit_info.audited_account == AWS_ACCOUNT_NUMBER
+        assert audit_info.credentials is None
+        assert audit_info.audit_metadata.expected_checks == [
+            "ec2_ebs_default_encryption"
+        ]
+
+    @mock_aws
+    def test_execute_organization_accounts_checks_workers(self):
+        account_ids = create_organization_accounts()
+        audit_info, findings, report = self.execute_organization_accounts_checks(2)
+
+        assert sorted(finding.resource_id for finding in findings) == sorted(
+            account_ids
+        )
+        assert sorted(
+            call.args[2].audited_account for call in report.call_args_list
+        ) == sorted(account_ids)
+        assert audit_info.audited_account == AWS_ACCOUNT_NUMBER
@@ -4,6 +4,7 @@ import boto3
 from moto import mock_aws
 
 from prowler.providers.aws.lib.organizations.organizations import (
+    get_organization_accounts,
     get_organizations_metadata,
 )
 
@@ -57,3 +58,27 @@ class Test_AWS_Organizations:
         )
         assert org.account_details_org == org_id
         assert org.account_details_tags == "key:value,"
+
+    @mock_aws
+    def test_get_organization_accounts(self):
+        client = boto3.client("organizations", region_name="us-east-1")
+        org_id = client.create_organization(FeatureSet="ALL")["Organization"]["Id"]
+        account_id = client.create_account(
+            AccountName="mock-account", Email="mock-account@moto-example.org"
+        )["CreateAccountStatus"]["AccountId"]
+        client.tag_resource(
+            ResourceId=account_id, Tags=[{"Key": "key", "Value": "value"}]
+        )
+
+        organization_accounts = get_organization_accounts(
+            boto3.session.Session(region_name="us-east-1")
+        )
+
+        # The management account and the member account
+        assert len(organization_accounts) == 2
+        assert AWS_ACCOUNT_NUMBER in organization_accounts
+        account = organization_accounts[account_id]
+        assert account.account_details_name == "mock-account"
+        assert account.account_details_email == "mock-account@moto-example.org"
+        assert account.account_details_org == org_id
+        assert account.account_details_tags == "key:value,"
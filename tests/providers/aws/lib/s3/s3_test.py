@@ -97,6 +97,29 @@ class TestS3:
             == "binary/octet-stream"
         )
 
+    @mock_aws
+    def test_send_to_s3_bucket_json_lines_gzip(self, tmp_path):
+        audit_session = boto3.session.Session(region_name=AWS_REGION)
+        client = audit_session.client("s3")
+        client.create_bucket(Bucket=S3_BUCKET_NAME)
+
+        # Mocked compressed JSON Lines output file
+        filename = f"prowler-output-{AWS_ACCOUNT_ID}"
+        (tmp_path / f"{filename}.jsonl.gz").write_bytes(b"")
+
+        send_to_s3_bucket(
+            filename,
+            str(tmp_path),
+            "json-lines",
+            S3_BUCKET_NAME,
+            audit_session,
+            "gzip",
+        )
+
+        bucket_directory = get_s3_object_path(str(tmp_path))
+        object_name = f"{bucket_directory}/json-lines/{filename}.jsonl.gz"
+        assert client.get_object(Bucket=S3_BUCKET_NAME, Key=object_name)
+
     def test_get_s3_object_path_with_prowler(self):
         output_directory = "/Users/admin/prowler/"
         assert (
@@ -11,6 +11,7 @@ from prowler.lib.check.models import Check_Report, load_check_metadata
 from prowler.providers.aws.lib.security_hub.security_hub import (
     batch_send_to_security_hub,
     prepare_security_hub_findings,
+    resolve_security_hub_previous_findings,
     verify_security_hub_integration_enabled_per_region,
 )
 from tests.providers.aws.audit_info_utils import (
@@ -92,6 +93,25 @@ def mock_make_api_call(self, operation_name, kwarg):
     return make_api_call(self, operation_name, kwarg)
 
 
+# Mocking Security Hub with the previous findings of both regions
+def mock_make_api_call_previous_findings(self, operation_name, kwarg):
+    if operation_name == "BatchImportFindings":
+        return {
+            "FailedCount": 0,
+            "SuccessCount": len(kwarg["Findings"]),
+        }
+    if operation_name == "GetFindings":
+        region = kwarg["Filters"]["Region"][0]["Value"]
+        return {
+            "Findings": [
+                {**get_security_hub_finding("FAILED"), "Id": f"{region}-current"},
+                {**get_security_hub_finding("FAILED"), "Id": f"{region}-previous"},
+            ]
+        }
+
+    return make_api_call(self, operation_name, kwarg)
+
+
 class Test_SecurityHub:
     def generate_finding(self, status, region):
         finding = Check_Report(
@@ -276,3 +296,72 @@ class Test_SecurityHub:
             )
             == 1
         )
+
+    def test_prepare_security_hub_findings_reuse_json_asff(self):
+        enabled_regions = [AWS_REGION_EU_WEST_1]
+        output_options = self.set_mocked_output_options(is_quiet=False)
+        finding = self.generate_finding("PASS", AWS_REGION_EU_WEST_1)
+        # The JSON ASFF finding already rendered for the json-asff output
+        finding.json_asff = get_security_hub_finding("PASSED")
+        audit_info = set_mocked_aws_audit_info()
+
+        with patch(
+            "prowler.providers.aws.lib.security_hub.security_hub.fill_json_asff"
+        ) as fill_json_asff:
+            assert prepare_security_hub_findings(
+                [finding],
+                audit_info,
+                output_options,
+                enabled_regions,
+            ) == {
+                AWS_REGION_EU_WEST_1: [finding.json_asff],
+            }
+            fill_json_asff.assert_not_called()
+
+    @patch(
+        "botocore.client.BaseClient._make_api_call",
+        new=mock_make_api_call_previous_findings,
+    )
+    def test_batch_send_to_security_hub_batches_and_regions(self):
+        session = self.set_mocked_session(AWS_REGION_EU_WEST_1)
+        security_hub_findings = {
+            AWS_REGION_EU_WEST_1: [get_security_hub_finding("FAILED")] * 250,
+            AWS_REGION_EU_WEST_2: [get_security_hub_finding("FAILED")] * 101,
+        }
+
+        # The findings of all the regions are added up
+        assert batch_send_to_security_hub(security_hub_findings, session) == 351
+
+    @patch(
+        "botocore.client.BaseClient._make_api_call",
+        new=mock_make_api_call_previous_findings,
+    )
+    def test_resolve_security_hub_previous_findings(self):
+        audit_info = set_mocked_aws_audit_info(
+            audited_regions=[AWS_REGION_EU_WEST_1, AWS_REGION_EU_WEST_2]
+        )
+        security_hub_findings = {
+            AWS_REGION_EU_WEST_1: [{"Id": f"{AWS_REGION_EU_WEST_1}-current"}],
+            AWS_REGION_EU_WEST_2: [{"Id": f"{AWS_REGION_EU_WEST_2}-current"}],
+        }
+
+        with patch(
+            "prowler.providers.aws.lib.security_hub.security_hub.__send_findings_to_security_hub__",
+            side_effect=lambda findings, region, client: len(findings),
+        ) as send_findings:
+            # Only the previous finding of each region is archived
+            assert (
+                resolve_security_hub_previous_findings(
+                    security_hub_findings, audit_info
+                )
+                == 2
+            )
+            archived_findings = sorted(
+                (call.args[1], finding["Id"], finding["RecordState"])
+                for call in send_findings.call_args_list
+                for finding in call.args[0]
+            )
+        assert archived_findings == [
+            (AWS_REGION_EU_WEST_1, f"{AWS_REGION_EU_WEST_1}-previous", "ARCHIVED"),
+            (AWS_REGION_EU_WEST_2, f"{AWS_REGION_EU_WEST_2}-previous", "ARCHIVED"),
+        ]
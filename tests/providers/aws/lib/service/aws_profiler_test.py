@@ -0,0 +1,119 @@
+import boto3
+from mock import patch
+from moto import mock_aws
+
+from prowler.lib.profiler import profiler
+from prowler.lib.profiler.profiler import Profiler
+from prowler.providers.aws.lib.service.profiler import (
+    PROFILER_THROTTLES,
+    count_throttled_attempt,
+    record_api_call_error,
+    start_api_call,
+)
+from prowler.providers.aws.lib.service.service import AWSService
+from tests.providers.aws.audit_info_utils import (
+    AWS_REGION_EU_WEST_1,
+    AWS_REGION_US_EAST_1,
+    set_mocked_aws_audit_info,
+)
+
+
+def mock_generate_regional_clients(service, audit_info):
+    regional_client = audit_info.audit_session.client(
+        service, region_name=AWS_REGION_EU_WEST_1
+    )
+    regional_client.region = AWS_REGION_EU_WEST_1
+    return {AWS_REGION_EU_WEST_1: regional_client}
+
+
+@patch(
+    "prowler.providers.aws.lib.service.service.generate_regional_clients",
+    new=mock_generate_regional_clients,
+)
+class Test_AWS_Profiler:
+    @mock_aws
+    def test_api_calls_not_profiled(self):
+        audit_info = set_mocked_aws_audit_info(
+            [AWS_REGION_EU_WEST_1, AWS_REGION_US_EAST_1]
+        )
+        with patch.object(profiler, "profiler", new=None):
+            service = AWSService("ec2", audit_info)
+        # The handlers are only registered if the scan is profiled
+        scan_profiler = Profiler("aws")
+        with patch.object(profiler, "profiler", new=scan_profiler):
+            service.regional_clients[AWS_REGION_EU_WEST_1].describe_vpcs()
+        assert scan_profiler.api_calls == {}
+
+    @mock_aws
+    def test_api_calls_profiled(self):
+        scan_profiler = Profiler("aws")
+        with patch.object(profiler, "profiler", new=scan_profiler):
+            audit_info = set_mocked_aws_audit_info(
+                [AWS_REGION_EU_WEST_1, AWS_REGION_US_EAST_1]
+            )
+            # The handlers are registered once however many services share the session
+            AWSService("ec2", audit_info)
+            service = AWSService("ec2", audit_info)
+            service.regional_clients[AWS_REGION_EU_WEST_1].describe_vpcs()
+            service.regional_clients[AWS_REGION_EU_WEST_1].describe_vpcs()
+            # The clients created afterwards from the session are also profiled
+            try:
+                audit_info.audit_session.client(
+                    "ec2", region_name=AWS_REGION_US_EAST_1
+                ).describe_vpcs(VpcIds=["vpc-unknown"])
+            except Exception:
+                pass
+
+        describe_vpcs = scan_profiler.api_calls[
+            ("ec2", "DescribeVpcs", AWS_REGION_EU_WEST_1)
+        ]
+        assert describe_vpcs["calls"] == 2
+        assert describe_vpcs["errors"] == 0
+        assert describe_vpcs["bytes_received"] > 0
+        assert sum(describe_vpcs["latency_ms"]["histogram"]) == 2
+        assert (
+            scan_profiler.api_calls[("ec2", "DescribeVpcs", AWS_REGION_US_EAST_1)][
+                "errors"
+            ]
+            == 1
+        )
+
+    def test_count_throttled_attempt(self):
+        context = {}
+        start_api_call(context)
+        request_dict = {"context": context}
+        count_throttled_attempt(
+            request_dict, response=(None, {"Error": {"Code": "Throttling"}})
+        )
+        count_throttled_attempt(
+            request_dict, response=(None, {"Error": {"Code": "AccessDenied"}})
+        )
+        count_throttled_attempt(request_dict, response=None)
+        count_throttled_attempt(request_dict, response=(None, {}))
+        assert context[PROFILER_THROTTLES] == 1
+
+    def test_record_api_call_error(self):
+        scan_profiler = Profiler("aws")
+        context = {"client_region": AWS_REGION_EU_WEST_1}
+        start_api_call(context)
+        with patch.object(profiler, "profiler", new=scan_profiler):
+            record_api_call_error(
+                context=context,
+                event_name="after-call-error.ec2.DescribeVpcs",
+                exception=ConnectionError(),
+            )
+        assert (
+            scan_profiler.api_calls[("ec2", "DescribeVpcs", AWS_REGION_EU_WEST_1)][
+                "errors"
+            ]
+            == 1
+        )
+
+    @mock_aws
+    def test_api_calls_of_other_sessions_not_profiled(self):
+        scan_profiler = Profiler("aws")
+        with patch.object(profiler, "profiler", new=scan_profiler):
+            boto3.session.Session().client(
+                "ec2", region_name=AWS_REGION_EU_WEST_1
+            ).describe_vpcs()
+        assert scan_profiler.api_calls == {}
@@ -0,0 +1,130 @@
+import threading
+from time import perf_counter, sleep
+
+import pytest
+from boto3 import client
+from botocore.awsrequest import AWSResponse
+from botocore.config import Config
+
+from prowler.providers.aws.lib.service.scheduler import (
+    MIN_BACKOFF,
+    APIScheduler,
+    get_api_scheduler,
+    set_api_scheduler,
+)
+from tests.providers.aws.audit_info_utils import AWS_REGION_US_EAST_1
+
+
+class Mock_Raw_Body:
+    def __init__(self, body):
+        self.body = body
+
+    def stream(self, **kwargs):
+        yield self.body
+
+
+def mock_throttled_response(request, **kwargs):
+    return AWSResponse(
+        request.url,
+        400,
+        {"x-amzn-ErrorType": "TooManyRequestsException"},
+        Mock_Raw_Body(b'{"message": "Rate exceeded"}'),
+    )
+
+
+class Test_APIScheduler:
+    def test_submit(self):
+        api_scheduler = APIScheduler()
+        future = api_scheduler.submit(
+            "s3", AWS_REGION_US_EAST_1, lambda x, y: x + y, 1, y=2
+        )
+        assert future.result() == 3
+
+    def test_submit_limited_per_region(self):
+        api_scheduler = APIScheduler(
+            max_concurrent_requests=10, max_concurrent_requests_per_region=2
+        )
+        lock = threading.Lock()
+        in_flight = {"current": 0, "max": 0}
+
+        def call(_):
+            with lock:
+                in_flight["current"] += 1
+                in_flight["max"] = max(in_flight["max"], in_flight["current"])
+            sleep(0.05)
+            with lock:
+                in_flight["current"] -= 1
+
+        futures = [
+            api_scheduler.submit("s3", AWS_REGION_US_EAST_1, call, item)
+            for item in range(8)
+        ]
+        for future in futures:
+            future.result()
+
+        assert in_flight["max"] == 2
+
+    def test_submit_queued_requests_do_not_block_other_services(self):
+        api_scheduler = APIScheduler(
+            max_concurrent_requests=10, max_concurrent_requests_per_region=2
+        )
+        s3_futures = [
+            api_scheduler.submit("s3", AWS_REGION_US_EAST_1, sleep, 0.1)
+            for _ in range(40)
+        ]
+        start_time = perf_counter()
+        iam_future = api_scheduler.submit("iam", AWS_REGION_US_EAST_1, perf_counter)
+
+        # The IAM request does not wait for the queued S3 requests
+        assert iam_future.result() - start_time < 0.5
+        assert not all(future.done() for future in s3_futures)
+        for future in s3_futures:
+            future.result()
+        assert api_scheduler.in_flight_requests[("s3", AWS_REGION_US_EAST_1)] == 0
+
+    def test_submit_exception(self):
+        api_scheduler = APIScheduler()
+
+        def call():
+            raise ValueError("error")
+
+        future = api_scheduler.submit("s3", AWS_REGION_US_EAST_1, call)
+        with pytest.raises(ValueError):
+            future.result()
+
+    def test_register_client_throttling_backoff(self):
+        api_scheduler = APIScheduler()
+        lambda_client = client(
+            "lambda",
+            region_name=AWS_REGION_US_EAST_1,
+            config=Config(retries={"max_attempts": 1, "mode": "standard"}),
+        )
+        lambda_client.meta.events.register("before-send", mock_throttled_response)
+        api_scheduler.register_client("lambda", AWS_REGION_US_EAST_1, lambda_client)
+
+        with pytest.raises(lambda_client.exceptions.TooManyRequestsException):
+            lambda_client.list_functions()
+
+        key = ("lambda", AWS_REGION_US_EAST_1)
+        throttled_requests = api_scheduler.throttled_requests[key]
+        assert throttled_requests >= 1
+        assert api_scheduler.backoff[key] == MIN_BACKOFF * 2 ** (throttled_requests - 1)
+
+        # Successful requests reduce the backoff until it is removed
+        for _ in range(throttled_requests):
+            api_scheduler.__handle_retry__(key, response=(None, {}))
+        assert api_scheduler.backoff[key] == 0
+
+    def test_set_api_scheduler(self):
+        previous_api_scheduler = get_api_scheduler()
+        api_scheduler = set_api_scheduler(max_concurrent_requests=5)
+
+        # The limits are changed in place for the AWS Services already created
+        assert get_api_scheduler() is previous_api_scheduler
+        assert api_scheduler is previous_api_scheduler
+        assert api_scheduler.max_concurrent_requests == 5
+        assert api_scheduler.thread_pool._max_workers == 5
+        future = api_scheduler.submit("s3", AWS_REGION_US_EAST_1, lambda: "result")
+        assert future.result() == "result"
+
+        set_api_scheduler()
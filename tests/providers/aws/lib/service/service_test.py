@@ -60,3 +60,32 @@ class Test_AWSService:
         assert not hasattr(service, "regional_clients")
         assert service.region == AWS_REGION_US_EAST_1
         assert service.client.__class__.__name__ == "CloudFront"
+
+    def test_AWSService_threading_call_discovery_checks(self):
+        class Service(AWSService):
+            discovery_checks = {"__get_tags__": ["service_check"]}
+
+            def __init__(self, audit_info):
+                super().__init__("s3", audit_info)
+                self.discovered = []
+
+            def __get_tags__(self, item):
+                self.discovered.append(("tags", item))
+
+            def __get_items__(self, item):
+                self.discovered.append(("items", item))
+
+        # The discovery methods are skipped if none of their checks is audited
+        service = Service(set_mocked_aws_audit_info(expected_checks=["other_check"]))
+        service.__threading_call__(service.__get_tags__, ["item"])
+        service.__threading_call__(service.__get_items__, ["item"])
+        assert service.discovered == [("items", "item")]
+
+        service = Service(set_mocked_aws_audit_info(expected_checks=["service_check"]))
+        service.__threading_call__(service.__get_tags__, ["item"])
+        assert service.discovered == [("tags", "item")]
+
+        # Without audited checks everything is discovered
+        service = Service(set_mocked_aws_audit_info())
+        service.__threading_call__(service.__get_tags__, ["item"])
+        assert service.discovered == [("tags", "item")]
@@ -30,13 +30,16 @@ def lambda_handler(event, context):
 """
 
 
-def create_lambda_function() -> Function:
+def create_lambda_function(
+    name: str = LAMBDA_FUNCTION_NAME, code_sha256: str = None
+) -> Function:
     return Function(
-        name=LAMBDA_FUNCTION_NAME,
+        name=name,
         security_groups=[],
-        arn=LAMBDA_FUNCTION_ARN,
+        arn=f"arn:aws:lambda:{AWS_REGION_US_EAST_1}:{AWS_ACCOUNT_NUMBER}:function/{name}",
         region=AWS_REGION_US_EAST_1,
         runtime=LAMBDA_FUNCTION_RUNTIME,
+        code_sha256=code_sha256,
     )
 
 
@@ -47,13 +50,13 @@ def get_lambda_code_with_secrets(code):
     )
 
 
-def mock__get_function_code__with_secrets():
+def mock__get_function_code__with_secrets(functions=None):
     yield create_lambda_function(), get_lambda_code_with_secrets(
         LAMBDA_FUNCTION_CODE_WITH_SECRETS
     )
 
 
-def mock__get_function_code__without_secrets():
+def mock__get_function_code__without_secrets(functions=None):
     yield create_lambda_function(), get_lambda_code_with_secrets(
         LAMBDA_FUNCTION_CODE_WITHOUT_SECRETS
     )
@@ -84,6 +87,7 @@ class Test_awslambda_function_no_secrets_in_code:
     def test_function_code_with_secrets(self):
         lambda_client = mock.MagicMock
         lambda_client.functions = {LAMBDA_FUNCTION_ARN: create_lambda_function()}
+        lambda_client.audit_config = {}
         lambda_client.__get_function_code__ = mock__get_function_code__with_secrets
         with mock.patch(
             "prowler.providers.aws.lib.audit_info.audit_info.current_audit_info",
@@ -114,6 +118,7 @@ class Test_awslambda_function_no_secrets_in_code:
     def test_function_code_without_secrets(self):
         lambda_client = mock.MagicMock
         lambda_client.functions = {LAMBDA_FUNCTION_ARN: create_lambda_function()}
+        lambda_client.audit_config = {}
 
         lambda_client.__get_function_code__ = mock__get_function_code__without_secrets
 
@@ -142,3 +147,61 @@ class Test_awslambda_function_no_secrets_in_code:
                 == f"No secrets found in Lambda function {LAMBDA_FUNCTION_NAME} code."
             )
             assert result[0].resource_tags == []
+
+    def test_function_code_secrets_cache(self, tmp_path):
+        code_sha256 = "kHN+WVQbYAUBq3ZL6mJ2J4qgOxs8uXmUo/sYHmOzsnw="
+        lambda_function = create_lambda_function(code_sha256=code_sha256)
+        lambda_function_copy = create_lambda_function(
+            name="test-lambda-copy", code_sha256=code_sha256
+        )
+        fetched_functions = []
+
+        def mock__get_function_code__(functions=None):
+            fetched_functions.extend(functions)
+            for function in functions:
+                yield function, get_lambda_code_with_secrets(
+                    LAMBDA_FUNCTION_CODE_WITH_SECRETS
+                )
+
+        lambda_client = mock.MagicMock
+        lambda_client.functions = {
+            lambda_function.arn: lambda_function,
+            lambda_function_copy.arn: lambda_function_copy,
+        }
+        lambda_client.audit_config = {"lambda_code_secrets_cache": True}
+        lambda_client.__get_function_code__ = mock__get_function_code__
+
+        with mock.patch(
+            "prowler.providers.aws.lib.audit_info.audit_info.current_audit_info",
+            set_mocked_aws_audit_info(),
+        ), mock.patch(
+            "prowler.providers.aws.services.awslambda.awslambda_function_no_secrets_in_code.awslambda_function_no_secrets_in_code.awslambda_client",
+            new=lambda_client,
+        ), mock.patch(
+            "prowler.lib.secrets.secrets.secrets_cache_directory", new=str(tmp_path)
+        ):
+            # Test Check
+            from prowler.providers.aws.services.awslambda.awslambda_function_no_secrets_in_code.awslambda_function_no_secrets_in_code import (
+                awslambda_function_no_secrets_in_code,
+            )
+
+            check = awslambda_function_no_secrets_in_code()
+            # The code shared by both functions is downloaded once
+            result = check.execute()
+            assert fetched_functions == [lambda_function]
+            # The code is not downloaded again since its CodeSha256 did not change
+            cached_result = check.execute()
+            assert fetched_functions == [lambda_function]
+
+            for findings in (result, cached_result):
+                assert len(findings) == 2
+                assert {finding.resource_id for finding in findings} == {
+                    LAMBDA_FUNCTION_NAME,
+                    "test-lambda-copy",
+                }
+                for finding in findings:
+                    assert finding.status == "FAIL"
+                    assert (
+                        finding.status_extended
+                        == f"Potential secret found in Lambda function {finding.resource_id} code -> lambda_function.py: Secret Keyword on line 3."
+                    )
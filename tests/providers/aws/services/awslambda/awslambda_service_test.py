@@ -38,11 +38,12 @@ def create_zip_file(code: str = "") -> io.BytesIO:
     return zip_output
 
 
-def mock_request_get(_):
-    """Mock requests.get() to get the Lambda Code in Zip Format"""
-    mock_resp = mock.MagicMock
+def mock_request_get(_, *args, **kwargs):
+    """Mock requests.Session.get() to stream the Lambda Code in Zip Format"""
+    mock_resp = mock.MagicMock()
     mock_resp.status_code = 200
-    mock_resp.content = create_zip_file().read()
+    code_zip = create_zip_file().read()
+    mock_resp.iter_content.return_value = [code_zip[:100], code_zip[100:]]
     return mock_resp
 
 
@@ -188,7 +189,7 @@ class Test_Lambda_Service:
         lambda_arn_2 = resp_2["FunctionArn"]
 
         with mock.patch(
-            "prowler.providers.aws.services.awslambda.awslambda_service.requests.get",
+            "prowler.providers.aws.services.awslambda.awslambda_service.requests.Session.get",
             new=mock_request_get,
         ):
             awslambda = Lambda(
@@ -255,3 +256,39 @@ class Test_Lambda_Service:
                             f"{tmp_dir_name}/{files_in_zip[0]}", "r"
                         ) as lambda_code_file:
                             assert lambda_code_file.read() == LAMBDA_FUNCTION_CODE
+            assert awslambda.functions[lambda_arn_1].code_sha256
+            assert awslambda.functions[lambda_arn_1].code_size
+
+    @mock_aws
+    def test__get_function_code__max_code_size(self):
+        # Create IAM Lambda Role
+        iam_client = client("iam", region_name=AWS_REGION_EU_WEST_1)
+        iam_role = iam_client.create_role(
+            RoleName="test-lambda-role",
+            AssumeRolePolicyDocument="test-policy",
+            Path="/",
+        )["Role"]["Arn"]
+        # Create Test Lambda
+        lambda_client = client("lambda", region_name=AWS_REGION_US_EAST_1)
+        lambda_arn = lambda_client.create_function(
+            FunctionName="test-lambda",
+            Runtime="python3.7",
+            Role=iam_role,
+            Handler="lambda_function.lambda_handler",
+            Code={"ZipFile": create_zip_file().read()},
+            PackageType="ZIP",
+        )["FunctionArn"]
+
+        audit_info = set_mocked_aws_audit_info(audited_regions=[AWS_REGION_US_EAST_1])
+        audit_info.audit_config = {"max_lambda_code_size": 0}
+        with mock.patch(
+            "prowler.providers.aws.services.awslambda.awslambda_service.requests.Session.get",
+            new=mock_request_get,
+        ):
+            awslambda = Lambda(audit_info)
+            # The code is bigger than the maximum size reported by ListFunctions
+            assert list(awslambda.__get_function_code__()) == []
+
+            # The code is bigger than the maximum size while it is streamed
+            awslambda.functions[lambda_arn].code_size = None
+            assert list(awslambda.__get_function_code__()) == []
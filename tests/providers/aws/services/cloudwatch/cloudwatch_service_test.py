@@ -1,6 +1,9 @@
 from boto3 import client
+from mock import patch
 from moto import mock_aws
+from moto.core.utils import unix_time_millis
 
+from prowler.lib.secrets import secrets
 from prowler.providers.aws.services.cloudwatch.cloudwatch_service import (
     CloudWatch,
     Logs,
@@ -221,3 +224,70 @@ class Test_CloudWatch_Service:
         assert logs.log_groups[0].tags == [
             {"tag_key_1": "tag_value_1", "tag_key_2": "tag_value_2"}
         ]
+
+    @mock_aws
+    def test__get_log_events__max_log_events(self):
+        logs_client = client("logs", region_name=AWS_REGION_US_EAST_1)
+        logs_client.create_log_group(logGroupName="/log-group/test")
+        logs_client.create_log_stream(
+            logGroupName="/log-group/test", logStreamName="test stream"
+        )
+        timestamp = int(unix_time_millis())
+        logs_client.put_log_events(
+            logGroupName="/log-group/test",
+            logStreamName="test stream",
+            logEvents=[
+                {"timestamp": timestamp, "message": "non sensitive message"},
+                {"timestamp": timestamp + 1, "message": "password = password123"},
+            ],
+        )
+        audit_info = set_mocked_aws_audit_info(
+            expected_checks=["cloudwatch_log_group_no_secrets_in_logs"],
+            audit_config={"max_log_events_per_log_group": 1},
+        )
+        logs = Logs(audit_info)
+        assert len(logs.log_groups) == 1
+        # Only the first event is scanned
+        assert logs.log_groups[0].log_streams_secrets == {}
+        assert logs.log_groups[0].last_event_timestamp == timestamp
+
+    @mock_aws
+    def test__get_log_events__incremental_scan(self, tmp_path):
+        logs_client = client("logs", region_name=AWS_REGION_US_EAST_1)
+        logs_client.create_log_group(logGroupName="/log-group/test")
+        logs_client.create_log_stream(
+            logGroupName="/log-group/test", logStreamName="test stream"
+        )
+        timestamp = int(unix_time_millis())
+        logs_client.put_log_events(
+            logGroupName="/log-group/test",
+            logStreamName="test stream",
+            logEvents=[
+                {"timestamp": timestamp, "message": "password = password123"},
+            ],
+        )
+        audit_info = set_mocked_aws_audit_info(
+            expected_checks=["cloudwatch_log_group_no_secrets_in_logs"],
+            audit_config={"log_events_incremental_scan": True},
+        )
+        with patch.object(secrets, "secrets_cache_directory", str(tmp_path)):
+            logs = Logs(audit_info)
+            log_streams_secrets = logs.log_groups[0].log_streams_secrets
+            assert list(log_streams_secrets) == ["test stream"]
+            assert logs.log_groups[0].last_event_timestamp == timestamp
+
+            logs_client.put_log_events(
+                logGroupName="/log-group/test",
+                logStreamName="test stream",
+                logEvents=[
+                    {"timestamp": timestamp + 1, "message": "non sensitive message"},
+                ],
+            )
+            logs = Logs(audit_info)
+            # The secrets of the previous scan are kept and only the new event is scanned
+            assert (
+                logs.log_events_scan_state[logs.log_groups[0].arn]["timestamp"]
+                == timestamp
+            )
+            assert logs.log_groups[0].log_streams_secrets == log_streams_secrets
+            assert logs.log_groups[0].last_event_timestamp == timestamp + 1
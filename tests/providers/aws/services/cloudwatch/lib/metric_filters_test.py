@@ -0,0 +1,137 @@
+from mock import MagicMock
+
+from prowler.providers.aws.services.cloudtrail.cloudtrail_service import Trail
+from prowler.providers.aws.services.cloudwatch.cloudwatch_service import (
+    MetricAlarm,
+    MetricFilter,
+)
+from prowler.providers.aws.services.cloudwatch.lib.metric_filters import (
+    check_cloudwatch_log_metric_filter,
+    get_metric_filters_index,
+)
+from tests.providers.aws.audit_info_utils import (
+    AWS_ACCOUNT_NUMBER,
+    AWS_REGION_US_EAST_1,
+)
+
+ROOT_USAGE_PATTERN = r"\$\.userIdentity\.type\s*=\s*.?Root.+\$\.userIdentity\.invokedBy NOT EXISTS.+\$\.eventType\s*!=\s*.?AwsServiceEvent.?"
+ROOT_USAGE_FILTER_PATTERN = '{$.userIdentity.type = "Root" && $.userIdentity.invokedBy NOT EXISTS && $.eventType != "AwsServiceEvent"}'
+
+
+def create_metric_filter(name: str, log_group: str, pattern: str) -> MetricFilter:
+    return MetricFilter(
+        arn=f"arn:aws:logs:{AWS_REGION_US_EAST_1}:{AWS_ACCOUNT_NUMBER}:metric-filter/{name}",
+        name=name,
+        metric=f"{name}-metric",
+        pattern=pattern,
+        log_group=log_group,
+        region=AWS_REGION_US_EAST_1,
+    )
+
+
+def create_metric_alarm(metric: str) -> MetricAlarm:
+    return MetricAlarm(
+        arn=f"arn:aws:cloudwatch:{AWS_REGION_US_EAST_1}:{AWS_ACCOUNT_NUMBER}:alarm:{metric}-alarm",
+        name=f"{metric}-alarm",
+        metric=metric,
+        name_space="LogMetrics",
+        region=AWS_REGION_US_EAST_1,
+    )
+
+
+def create_report() -> MagicMock:
+    report = MagicMock()
+    report.status = "FAIL"
+    report.status_extended = (
+        "No CloudWatch log groups found with metric filters or alarms associated."
+    )
+    return report
+
+
+trails = [
+    Trail(
+        name="trail",
+        region=AWS_REGION_US_EAST_1,
+        log_group_arn=f"arn:aws:logs:{AWS_REGION_US_EAST_1}:{AWS_ACCOUNT_NUMBER}:log-group:trail-log-group:*",
+    ),
+    Trail(name="trail-without-log-group", region=AWS_REGION_US_EAST_1),
+]
+
+
+class Test_metric_filters:
+    def test_metric_filter_not_in_trail_log_group(self):
+        metric_filters = [
+            create_metric_filter("filter", "other-log-group", ROOT_USAGE_FILTER_PATTERN)
+        ]
+        report = check_cloudwatch_log_metric_filter(
+            ROOT_USAGE_PATTERN, trails, metric_filters, [], create_report()
+        )
+        assert report.status == "FAIL"
+        assert (
+            report.status_extended
+            == "No CloudWatch log groups found with metric filters or alarms associated."
+        )
+
+    def test_metric_filter_without_alarm(self):
+        metric_filters = [
+            create_metric_filter("filter", "trail-log-group", ROOT_USAGE_FILTER_PATTERN)
+        ]
+        metric_alarms = [create_metric_alarm("other-metric")]
+        report = check_cloudwatch_log_metric_filter(
+            ROOT_USAGE_PATTERN, trails, metric_filters, metric_alarms, create_report()
+        )
+        assert report.status == "FAIL"
+        assert (
+            report.status_extended
+            == "CloudWatch log group trail-log-group found with metric filter filter but no alarms associated."
+        )
+        assert report.resource_id == "trail-log-group"
+        assert report.resource_arn == metric_filters[0].arn
+
+    def test_last_metric_filter_with_alarm(self):
+        metric_filters = [
+            create_metric_filter(
+                "filter-1", "trail-log-group", ROOT_USAGE_FILTER_PATTERN
+            ),
+            create_metric_filter("filter-2", "trail-log-group", "{$.eventName = x}"),
+            create_metric_filter(
+                "filter-3", "trail-log-group", ROOT_USAGE_FILTER_PATTERN
+            ),
+        ]
+        metric_alarms = [create_metric_alarm("filter-3-metric")]
+        report = check_cloudwatch_log_metric_filter(
+            ROOT_USAGE_PATTERN, trails, metric_filters, metric_alarms, create_report()
+        )
+        assert report.status == "PASS"
+        assert (
+            report.status_extended
+            == "CloudWatch log group trail-log-group found with metric filter filter-3 and alarms set."
+        )
+
+    def test_get_metric_filters_index(self):
+        metric_filters = [
+            create_metric_filter("filter", "trail-log-group", ROOT_USAGE_FILTER_PATTERN)
+        ]
+        metric_alarms = [create_metric_alarm("filter-metric")]
+        metric_filters_index = get_metric_filters_index(
+            trails, metric_filters, metric_alarms
+        )
+        assert metric_filters_index.trail_log_groups == {"trail-log-group"}
+        assert metric_filters_index.alarm_metrics == {"filter-metric"}
+        assert (
+            metric_filters_index.get_metric_filter(ROOT_USAGE_PATTERN)
+            == metric_filters[0]
+        )
+        assert ROOT_USAGE_PATTERN in metric_filters_index.patterns
+        # The index is reused by the other checks until the metric filters change
+        assert (
+            get_metric_filters_index(trails, metric_filters, metric_alarms)
+            is metric_filters_index
+        )
+        metric_filters.append(
+            create_metric_filter("filter-2", "trail-log-group", "{$.eventName = x}")
+        )
+        assert (
+            get_metric_filters_index(trails, metric_filters, metric_alarms)
+            is not metric_filters_index
+        )
@@ -0,0 +1,127 @@
+from boto3 import client, resource
+from moto import mock_aws
+
+from prowler.providers.aws.services.ec2.ec2_service import EC2
+from prowler.providers.aws.services.ec2.lib.network_snapshot import (
+    Regional_Network_Snapshot,
+    get_regional_network_snapshot,
+)
+from prowler.providers.aws.services.vpc.vpc_service import VPC
+from tests.providers.aws.audit_info_utils import (
+    AWS_ACCOUNT_NUMBER,
+    AWS_REGION_EU_WEST_1,
+    AWS_REGION_US_EAST_1,
+    set_mocked_aws_audit_info,
+)
+
+
+class Test_Regional_Network_Snapshot:
+    @mock_aws
+    def test_get_network_interfaces(self):
+        ec2_client = client("ec2", region_name=AWS_REGION_US_EAST_1)
+        ec2_resource = resource("ec2", region_name=AWS_REGION_US_EAST_1)
+        vpc = ec2_client.create_vpc(CidrBlock="10.0.0.0/16")["Vpc"]
+        subnet = ec2_resource.create_subnet(VpcId=vpc["VpcId"], CidrBlock="10.0.0.0/18")
+        sg = ec2_client.create_security_group(
+            GroupName="sg", Description="test", VpcId=vpc["VpcId"]
+        )
+        eni = subnet.create_network_interface(Groups=[sg["GroupId"]])
+
+        snapshot = Regional_Network_Snapshot(ec2_client)
+
+        assert eni.id in [
+            interface["NetworkInterfaceId"]
+            for interface in snapshot.get_network_interfaces()
+        ]
+        assert snapshot.get_security_groups_network_interfaces()[sg["GroupId"]] == [
+            eni.id
+        ]
+        assert snapshot.get_vpcs_network_interfaces()[vpc["VpcId"]] == [eni.id]
+
+    @mock_aws
+    def test_get_flow_logs(self):
+        ec2_client = client("ec2", region_name=AWS_REGION_US_EAST_1)
+        vpc = ec2_client.create_vpc(CidrBlock="10.0.0.0/16")["Vpc"]
+        ec2_client.create_flow_logs(
+            ResourceType="VPC",
+            ResourceIds=[vpc["VpcId"]],
+            TrafficType="ALL",
+            LogDestinationType="cloud-watch-logs",
+            LogGroupName="test_logs",
+            DeliverLogsPermissionArn=f"arn:aws:iam::{AWS_ACCOUNT_NUMBER}:role/test-role",
+        )
+
+        flow_logs = Regional_Network_Snapshot(ec2_client).get_flow_logs()
+
+        assert len(flow_logs[vpc["VpcId"]]) == 1
+
+    @mock_aws
+    def test_get_regional_network_snapshot(self):
+        audit_info = set_mocked_aws_audit_info(
+            [AWS_REGION_US_EAST_1, AWS_REGION_EU_WEST_1]
+        )
+        us_east_1_client = audit_info.audit_session.client(
+            "ec2", region_name=AWS_REGION_US_EAST_1
+        )
+        eu_west_1_client = audit_info.audit_session.client(
+            "ec2", region_name=AWS_REGION_EU_WEST_1
+        )
+        us_east_1_client.region = AWS_REGION_US_EAST_1
+        eu_west_1_client.region = AWS_REGION_EU_WEST_1
+
+        snapshot = get_regional_network_snapshot(
+            audit_info.audit_session, us_east_1_client
+        )
+
+        assert (
+            get_regional_network_snapshot(audit_info.audit_session, us_east_1_client)
+            is snapshot
+        )
+        assert (
+            get_regional_network_snapshot(audit_info.audit_session, eu_west_1_client)
+            is not snapshot
+        )
+        # Another audit, e.g. of another account, has its own snapshots
+        assert (
+            get_regional_network_snapshot(
+                set_mocked_aws_audit_info([AWS_REGION_US_EAST_1]).audit_session,
+                us_east_1_client,
+            )
+            is not snapshot
+        )
+
+    @mock_aws
+    def test_shared_by_ec2_and_vpc(self):
+        ec2_client = client("ec2", region_name=AWS_REGION_US_EAST_1)
+        ec2_resource = resource("ec2", region_name=AWS_REGION_US_EAST_1)
+        vpc = ec2_client.create_vpc(CidrBlock="10.0.0.0/16")["Vpc"]
+        subnet = ec2_resource.create_subnet(VpcId=vpc["VpcId"], CidrBlock="10.0.0.0/18")
+        sg = ec2_client.create_security_group(
+            GroupName="sg", Description="test", VpcId=vpc["VpcId"]
+        )
+        eni = subnet.create_network_interface(Groups=[sg["GroupId"]])
+
+        audit_info = set_mocked_aws_audit_info(
+            [AWS_REGION_US_EAST_1, AWS_REGION_EU_WEST_1]
+        )
+        describe_network_interfaces_regions = []
+        audit_info.audit_session.events.register(
+            "before-call.ec2.DescribeNetworkInterfaces",
+            lambda model, context, **kwargs: describe_network_interfaces_regions.append(
+                context["client_region"]
+            ),
+        )
+        ec2 = EC2(audit_info)
+        vpc_service = VPC(audit_info)
+
+        # One unfiltered call by region for all the security groups and VPCs
+        assert sorted(describe_network_interfaces_regions) == [
+            AWS_REGION_EU_WEST_1,
+            AWS_REGION_US_EAST_1,
+        ]
+        for security_group in ec2.security_groups:
+            if security_group.id == sg["GroupId"]:
+                assert security_group.network_interfaces == [eni.id]
+            else:
+                assert eni.id not in security_group.network_interfaces
+        assert vpc_service.vpcs[vpc["VpcId"]].in_use
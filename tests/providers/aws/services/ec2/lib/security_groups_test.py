@@ -1,6 +1,7 @@
 import pytest
 
 from prowler.providers.aws.services.ec2.lib.security_groups import (
+    Security_Group_Exposure,
     _is_cidr_public,
     check_security_group,
 )
@@ -348,3 +349,103 @@ class Test_check_security_group:
             0, 65535, TRANSPORT_PROTOCOL_TCP, [], [IP_V6_ALL_CIDRS]
         )
         assert check_security_group(ingress_rule, TRANSPORT_PROTOCOL_TCP, None, True)
+
+
+class Test_Security_Group_Exposure:
+    generate_ip_ranges_list = Test_check_security_group.generate_ip_ranges_list
+    ingress_rule_generator = Test_check_security_group.ingress_rule_generator
+
+    # TCP Protocol - IP_V4_ALL_CIDRS - Ingress 20 to 21 and 22 to 25 - check 21, 23 and 26 - Any Address
+    def test_all_public_ipv4_address_merged_port_ranges_tcp_any_address(self):
+        exposure = Security_Group_Exposure(
+            [
+                self.ingress_rule_generator(
+                    22, 25, TRANSPORT_PROTOCOL_TCP, [IP_V4_ALL_CIDRS], []
+                ),
+                self.ingress_rule_generator(
+                    20, 21, TRANSPORT_PROTOCOL_TCP, [IP_V4_ALL_CIDRS], []
+                ),
+            ]
+        )
+        assert exposure.is_exposed(TRANSPORT_PROTOCOL_TCP, [21], True)
+        assert exposure.port_ranges[True][TRANSPORT_PROTOCOL_TCP] == ([20], [25])
+        assert exposure.is_exposed(TRANSPORT_PROTOCOL_TCP, [26, 23], True)
+        assert not exposure.is_exposed(TRANSPORT_PROTOCOL_TCP, [19, 26], True)
+        assert not exposure.is_exposed(TRANSPORT_PROTOCOL_TCP, [], True)
+
+    # UDP Protocol - IP_V4_ALL_CIDRS - Ingress 22 to 22 - check 22 TCP - Any Address - Closed
+    def test_all_public_ipv4_address_open_22_udp_check_tcp_any_address(self):
+        exposure = Security_Group_Exposure(
+            [self.ingress_rule_generator(22, 22, "udp", [IP_V4_ALL_CIDRS], [])]
+        )
+        assert exposure.is_exposed("udp", [22], True)
+        assert not exposure.is_exposed(TRANSPORT_PROTOCOL_TCP, [22], True)
+
+    # All Protocols - IP_V6_ALL_CIDRS - check all ports - Any Address - Open
+    def test_all_public_ipv6_address_all_protocols_any_address(self):
+        exposure = Security_Group_Exposure(
+            [
+                {
+                    "IpProtocol": TRANSPORT_PROTOCOL_ALL,
+                    "IpRanges": [],
+                    "Ipv6Ranges": [{"CidrIpv6": IP_V6_ALL_CIDRS}],
+                }
+            ]
+        )
+        assert exposure.is_exposed(TRANSPORT_PROTOCOL_ALL, any_address=True)
+        assert exposure.is_exposed(TRANSPORT_PROTOCOL_TCP, [3389], True)
+
+    # TCP Protocol - IP_V4_PUBLIC_CIDR - All Ports - Any Address - Closed, Public - Open
+    def test_public_ipv4_address_open_all_ports_tcp(self):
+        exposure = Security_Group_Exposure(
+            [
+                self.ingress_rule_generator(
+                    0, 65535, TRANSPORT_PROTOCOL_TCP, [IP_V4_PUBLIC_CIDR], []
+                )
+            ]
+        )
+        assert not exposure.is_exposed(TRANSPORT_PROTOCOL_ALL, any_address=True)
+        assert not exposure.is_exposed(TRANSPORT_PROTOCOL_TCP, [22], True)
+        assert exposure.is_exposed(TRANSPORT_PROTOCOL_ALL)
+        assert exposure.is_exposed(TRANSPORT_PROTOCOL_TCP, [22])
+
+    # TCP Protocol - IP_V4_PRIVATE_CIDR and IP_V6_PRIVATE_CIDR - Ingress 22 to 22 - Closed
+    def test_private_address_open_22_tcp(self):
+        exposure = Security_Group_Exposure(
+            [
+                self.ingress_rule_generator(
+                    22,
+                    22,
+                    TRANSPORT_PROTOCOL_TCP,
+                    [IP_V4_PRIVATE_CIDR],
+                    [IP_V6_PRIVATE_CIDR],
+                )
+            ]
+        )
+        assert not exposure.is_exposed(TRANSPORT_PROTOCOL_TCP, [22])
+        assert not exposure.is_exposed(TRANSPORT_PROTOCOL_TCP, [22], True)
+
+    # Same results as check_security_group for every ingress rule
+    def test_same_results_as_check_security_group(self):
+        ingress_rules = [
+            self.ingress_rule_generator(
+                20, 21, TRANSPORT_PROTOCOL_TCP, [IP_V4_PUBLIC_CIDR], []
+            ),
+            self.ingress_rule_generator(
+                3306, 3306, TRANSPORT_PROTOCOL_TCP, [IP_V4_PRIVATE_CIDR], []
+            ),
+            self.ingress_rule_generator(
+                5432, 5432, TRANSPORT_PROTOCOL_TCP, [], [IP_V6_ALL_CIDRS]
+            ),
+        ]
+        exposure = Security_Group_Exposure(ingress_rules)
+        for any_address in (True, False):
+            for ports in ([20], [21, 22], [3306], [5432], [9200, 9300]):
+                assert exposure.is_exposed(
+                    TRANSPORT_PROTOCOL_TCP, ports, any_address
+                ) == any(
+                    check_security_group(
+                        ingress_rule, TRANSPORT_PROTOCOL_TCP, ports, any_address
+                    )
+                    for ingress_rule in ingress_rules
+                )
@@ -958,3 +958,104 @@ nTTxU4a7x1naFxzYXK1iQ1vMARKMjDb19QEJIEJKZlDK4uS7yMlf1nFS
         )
 
         assert iam.user_temporary_credentials_usage[(username, user_arn)]
+
+    # Test IAM Bulk Discovery with GetAccountAuthorizationDetails
+    @mock_aws(config={"iam": {"load_aws_managed_policies": True}})
+    def test__get_account_authorization_details__(self):
+        iam_client = client("iam")
+        # Users, groups, roles and policies
+        user_name = "test_user"
+        user_arn = iam_client.create_user(
+            UserName=user_name, Tags=[{"Key": "test", "Value": "test"}]
+        )["User"]["Arn"]
+        iam_client.put_user_policy(
+            UserName=user_name,
+            PolicyName="test_user_inline_policy",
+            PolicyDocument=dumps(INLINE_POLICY_NOT_ADMIN),
+        )
+        group_name = "test_group"
+        iam_client.create_group(GroupName=group_name)
+        iam_client.add_user_to_group(GroupName=group_name, UserName=user_name)
+        iam_client.put_group_policy(
+            GroupName=group_name,
+            PolicyName="test_group_inline_policy",
+            PolicyDocument=dumps(INLINE_POLICY_NOT_ADMIN),
+        )
+        role_name = "test_role"
+        role_arn = iam_client.create_role(
+            RoleName=role_name,
+            AssumeRolePolicyDocument=dumps(ASSUME_ROLE_POLICY_DOCUMENT),
+            Tags=[{"Key": "test", "Value": "test"}],
+        )["Role"]["Arn"]
+        iam_client.attach_role_policy(
+            RoleName=role_name, PolicyArn=SECURITY_AUDIT_POLICY_ARN
+        )
+        iam_client.put_role_policy(
+            RoleName=role_name,
+            PolicyName="test_role_inline_policy",
+            PolicyDocument=dumps(INLINE_POLICY_NOT_ADMIN),
+        )
+        policy_arn = iam_client.create_policy(
+            PolicyName="test_policy",
+            PolicyDocument=dumps(INLINE_POLICY_NOT_ADMIN),
+            Tags=[{"Key": "test", "Value": "test"}],
+        )["Policy"]["Arn"]
+        iam_client.attach_group_policy(GroupName=group_name, PolicyArn=policy_arn)
+
+        audit_info = set_mocked_aws_audit_info(
+            [AWS_REGION_US_EAST_1], audit_config={"iam_bulk_discovery": True}
+        )
+        iam = IAM(audit_info)
+
+        assert len(iam.users) == 1
+        assert iam.users[0].arn == user_arn
+        assert iam.users[0].inline_policies == ["test_user_inline_policy"]
+        assert iam.users[0].tags == [{"Key": "test", "Value": "test"}]
+
+        assert len(iam.groups) == 1
+        assert iam.groups[0].name == group_name
+        assert iam.groups[0].attached_policies == [
+            {"PolicyName": "test_policy", "PolicyArn": policy_arn}
+        ]
+        assert iam.groups[0].inline_policies == ["test_group_inline_policy"]
+        assert [user.arn for user in iam.groups[0].users] == [user_arn]
+
+        assert len(iam.roles) == 1
+        assert iam.roles[0].arn == role_arn
+        assert iam.roles[0].assume_role_policy == ASSUME_ROLE_POLICY_DOCUMENT
+        assert not iam.roles[0].is_service_role
+        assert iam.roles[0].attached_policies == [
+            {"PolicyName": "SecurityAudit", "PolicyArn": SECURITY_AUDIT_POLICY_ARN}
+        ]
+        assert iam.roles[0].inline_policies == ["test_role_inline_policy"]
+        assert iam.roles[0].tags == [{"Key": "test", "Value": "test"}]
+
+        # Only the attached AWS Managed policies, then the Customer and the Inline ones
+        assert [(policy.type, policy.name) for policy in iam.policies] == [
+            ("AWS", "SecurityAudit"),
+            ("Custom", "test_policy"),
+            ("Inline", "test_user_inline_policy"),
+            ("Inline", "test_group_inline_policy"),
+            ("Inline", "test_role_inline_policy"),
+        ]
+        assert iam.policies[0].attached
+        assert iam.policies[0].document
+        assert iam.policies[1] == Policy(
+            name="test_policy",
+            arn=policy_arn,
+            entity=iam.policies[1].entity,
+            version_id="v1",
+            type="Custom",
+            attached=True,
+            document=INLINE_POLICY_NOT_ADMIN,
+            tags=[{"Key": "test", "Value": "test"}],
+        )
+        assert iam.policies[4] == Policy(
+            name="test_role_inline_policy",
+            arn=role_arn,
+            entity=role_name,
+            version_id="v1",
+            type="Inline",
+            attached=True,
+            document=INLINE_POLICY_NOT_ADMIN,
+        )
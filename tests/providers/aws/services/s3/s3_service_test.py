@@ -6,6 +6,7 @@ from moto import mock_aws
 from prowler.providers.aws.services.s3.s3_service import S3, S3Control
 from tests.providers.aws.audit_info_utils import (
     AWS_ACCOUNT_NUMBER,
+    AWS_REGION_EU_WEST_1,
     AWS_REGION_US_EAST_1,
     set_mocked_aws_audit_info,
 )
@@ -66,6 +67,58 @@ class Test_S3_Service:
         )
         assert not s3.buckets[0].object_lock
 
+    # Test S3 List Buckets resolving their regions
+    @mock_aws
+    def test__list_buckets__regions(self):
+        # Generate S3 Client
+        s3_client = client("s3")
+        # Create S3 Buckets in both regions
+        for bucket_index in range(10):
+            s3_client.create_bucket(Bucket=f"us-bucket-{bucket_index}")
+            s3_client.create_bucket(
+                Bucket=f"eu-bucket-{bucket_index}",
+                CreateBucketConfiguration={"LocationConstraint": AWS_REGION_EU_WEST_1},
+            )
+
+        # S3 client for this test class
+        audit_info = set_mocked_aws_audit_info(
+            [AWS_REGION_US_EAST_1, AWS_REGION_EU_WEST_1]
+        )
+        s3 = S3(audit_info)
+
+        assert len(s3.buckets) == 20
+        for bucket in s3.buckets:
+            if bucket.name.startswith("eu-"):
+                assert bucket.region == AWS_REGION_EU_WEST_1
+            else:
+                assert bucket.region == AWS_REGION_US_EAST_1
+        assert sorted(set(s3.regions_with_buckets)) == [
+            AWS_REGION_EU_WEST_1,
+            AWS_REGION_US_EAST_1,
+        ]
+
+        # Only the buckets of the audited regions are listed
+        s3 = S3(set_mocked_aws_audit_info([AWS_REGION_EU_WEST_1]))
+        assert len(s3.buckets) == 10
+        assert len(s3.regions_with_buckets) == 20
+
+    # Test S3 Get Bucket Region from the ListBuckets response
+    @mock_aws
+    def test__get_bucket_region__(self):
+        # S3 client for this test class
+        audit_info = set_mocked_aws_audit_info([AWS_REGION_US_EAST_1])
+        s3 = S3(audit_info)
+
+        # The BucketRegion is used without calling GetBucketLocation
+        assert (
+            s3.__get_bucket_region__(
+                {"Name": "test-bucket", "BucketRegion": AWS_REGION_EU_WEST_1}
+            )
+            == AWS_REGION_EU_WEST_1
+        )
+        # A bucket that does not exist has no region
+        assert s3.__get_bucket_region__({"Name": "test-bucket"}) is None
+
     # Test S3 Get Bucket Versioning
     @mock_aws
     def test__get_bucket_versioning__(self):
@@ -382,3 +435,31 @@ class Test_S3_Service:
             == f"arn:{audit_info.audited_partition}:s3:::{bucket_name}"
         )
         assert s3.buckets[0].object_lock
+
+    # Test S3 only discovering the data of the audited checks
+    @mock_aws
+    def test__discovery_checks__(self):
+        # Generate S3 Client
+        s3_client = client("s3")
+        # Create S3 Bucket
+        bucket_name = "test-bucket"
+        s3_client.create_bucket(
+            Bucket=bucket_name,
+            ObjectOwnership="BucketOwnerEnforced",
+            ObjectLockEnabledForBucket=True,
+        )
+        s3_client.put_bucket_tagging(
+            Bucket=bucket_name,
+            Tagging={"TagSet": [{"Key": "test", "Value": "test"}]},
+        )
+
+        # S3 client for this test class
+        audit_info = set_mocked_aws_audit_info(
+            [AWS_REGION_US_EAST_1], expected_checks=["s3_bucket_acl_prohibited"]
+        )
+        s3 = S3(audit_info)
+        assert len(s3.buckets) == 1
+        assert s3.buckets[0].ownership == "BucketOwnerEnforced"
+        assert s3.buckets[0].tags == [{"Key": "test", "Value": "test"}]
+        # The object lock is only discovered for s3_bucket_object_lock
+        assert not s3.buckets[0].object_lock
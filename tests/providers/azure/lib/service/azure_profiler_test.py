@@ -0,0 +1,112 @@
+from time import time
+
+import requests
+from azure.core.credentials import AccessToken
+from azure.core.pipeline.transport import HttpTransport
+from azure.core.pipeline.transport._requests_basic import RequestsTransportResponse
+from azure.mgmt.storage import StorageManagementClient
+from mock import MagicMock, patch
+
+from prowler.lib.profiler import profiler
+from prowler.lib.profiler.profiler import Profiler
+from prowler.providers.azure.lib.service.profiler import (
+    get_operation,
+    get_profiler_hooks,
+)
+from prowler.providers.azure.lib.service.service import AzureService
+from tests.providers.azure.azure_fixtures import (
+    AZURE_SUBSCRIPTION,
+    set_mocked_azure_audit_info,
+)
+
+
+class Credential_Mock:
+    def get_token(self, *scopes, **kwargs):
+        return AccessToken("token", int(time()) + 3600)
+
+
+class HTTP_Transport_Mock(HttpTransport):
+    """HTTP transport answering the requests with the given status codes"""
+
+    def __init__(self, status_codes):
+        self.status_codes = status_codes
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        pass
+
+    def open(self):
+        pass
+
+    def close(self):
+        pass
+
+    def send(self, request, **kwargs):
+        response = requests.Response()
+        response.status_code = self.status_codes.pop(0)
+        response._content = b'{"value": []}'
+        response.headers["content-type"] = "application/json"
+        response.headers["content-length"] = str(len(response._content))
+        response.headers["retry-after"] = "0"
+        return RequestsTransportResponse(request, response)
+
+
+class Test_Azure_Profiler:
+    def test_get_operation(self):
+        assert (
+            get_operation(
+                "GET",
+                "https://management.azure.com/subscriptions/id/resourceGroups/rg/providers/Microsoft.Storage/storageAccounts/account/blobServices/default?api-version=2022-09-01",
+            )
+            == "GET Microsoft.Storage/storageAccounts/blobServices"
+        )
+        assert (
+            get_operation(
+                "GET",
+                "https://management.azure.com/subscriptions/id/providers/Microsoft.Security/pricings",
+            )
+            == "GET Microsoft.Security/pricings"
+        )
+        assert (
+            get_operation(
+                "GET", "https://management.azure.com/subscriptions/id/resourcegroups"
+            )
+            == "GET subscriptions/resourcegroups"
+        )
+
+    def test_api_calls_profiled(self):
+        scan_profiler = Profiler("azure")
+        client = StorageManagementClient(
+            credential=Credential_Mock(),
+            subscription_id="id_subscription",
+            transport=HTTP_Transport_Mock([429, 200]),
+            **get_profiler_hooks("Storage", AZURE_SUBSCRIPTION),
+        )
+        with patch.object(profiler, "profiler", new=scan_profiler):
+            assert list(client.storage_accounts.list()) == []
+
+        # Each attempt of the throttled call is recorded
+        storage_accounts = scan_profiler.api_calls[
+            ("Storage", "GET Microsoft.Storage/storageAccounts", AZURE_SUBSCRIPTION)
+        ]
+        assert storage_accounts["calls"] == 2
+        assert storage_accounts["errors"] == 1
+        assert storage_accounts["retries"] == 1
+        assert storage_accounts["throttles"] == 1
+        assert storage_accounts["bytes_received"] == 26
+
+    def test_service_clients_profiled(self):
+        service_client = MagicMock()
+        with patch.object(profiler, "profiler", new=None):
+            AzureService(service_client, set_mocked_azure_audit_info())
+        assert "raw_response_hook" not in service_client.call_args.kwargs
+
+        with patch.object(profiler, "profiler", new=Profiler("azure")):
+            AzureService(service_client, set_mocked_azure_audit_info())
+        assert service_client.call_args.kwargs["raw_request_hook"]
+        assert service_client.call_args.kwargs["raw_response_hook"].args == (
+            "AzureService",
+            AZURE_SUBSCRIPTION,
+        )
@@ -0,0 +1,89 @@
+import threading
+from time import sleep
+
+from mock import MagicMock
+
+from prowler.providers.azure.lib.audit_info.models import Azure_Identity_Info
+from prowler.providers.azure.lib.service.service import MAX_WORKERS, AzureService
+from tests.providers.azure.azure_fixtures import (
+    DOMAIN,
+    IDENTITY_ID,
+    IDENTITY_TYPE,
+    TENANT_IDS,
+    set_mocked_azure_audit_info,
+)
+
+AZURE_SUBSCRIPTIONS = {
+    f"subscription-{index}": f"id_subscription_{index}" for index in range(25)
+}
+
+
+def set_mocked_azure_service() -> AzureService:
+    return AzureService(
+        MagicMock(side_effect=lambda **kwargs: kwargs["subscription_id"]),
+        set_mocked_azure_audit_info(
+            identity=Azure_Identity_Info(
+                identity_id=IDENTITY_ID,
+                identity_type=IDENTITY_TYPE,
+                tenant_ids=TENANT_IDS,
+                domain=DOMAIN,
+                subscriptions=AZURE_SUBSCRIPTIONS,
+            )
+        ),
+    )
+
+
+class Test_AzureService:
+    def test__set_clients__(self):
+        service = set_mocked_azure_service()
+        assert service.clients == {
+            subscription: subscription_id
+            for subscription, subscription_id in AZURE_SUBSCRIPTIONS.items()
+        }
+        assert service.subscriptions == AZURE_SUBSCRIPTIONS
+
+    def test__threading_call__subscriptions(self):
+        service = set_mocked_azure_service()
+        # The results are returned in the order of the subscriptions
+        assert service.__threading_call__(
+            lambda subscription, client: f"{subscription}:{client}"
+        ) == [
+            f"{subscription}:{subscription_id}"
+            for subscription, subscription_id in AZURE_SUBSCRIPTIONS.items()
+        ]
+
+    def test__threading_call__items(self):
+        service = set_mocked_azure_service()
+
+        def get_resource(subscription, resource):
+            if resource == "error":
+                raise Exception("Resource not found")
+            return resource.upper()
+
+        assert service.__threading_call__(
+            get_resource,
+            [
+                ("subscription-0", "a"),
+                ("subscription-1", "error"),
+                ("subscription-2", "b"),
+            ],
+        ) == ["A", None, "B"]
+        assert service.__threading_call__(str.upper, ["c", "d"]) == ["C", "D"]
+        assert service.__threading_call__(str.upper, []) == []
+
+    def test__threading_call__max_workers(self):
+        service = set_mocked_azure_service()
+        lock = threading.Lock()
+        running = []
+        max_running = []
+
+        def get_subscription(subscription, client):
+            with lock:
+                running.append(subscription)
+                max_running.append(len(running))
+            sleep(0.01)
+            with lock:
+                running.remove(subscription)
+
+        service.__threading_call__(get_subscription)
+        assert 1 < max(max_running) <= MAX_WORKERS
@@ -0,0 +1,70 @@
+import json
+
+from googleapiclient.http import HttpMockSequence
+from mock import patch
+
+from prowler.lib.profiler import profiler
+from prowler.lib.profiler.profiler import Profiler
+from prowler.providers.gcp.lib.service.profiler import ProfiledHttpRequest
+
+GCP_PROJECT_ID = "123456789012"
+INSTANCES_URI = f"https://compute.googleapis.com/compute/v1/projects/{GCP_PROJECT_ID}/zones/us-central1-a/instances"
+INSTANCES_RESPONSE = json.dumps({"items": []})
+
+
+def set_mocked_request(http) -> ProfiledHttpRequest:
+    request = ProfiledHttpRequest(
+        http,
+        lambda response, content: json.loads(content),
+        INSTANCES_URI,
+        method="GET",
+        methodId="compute.instances.list",
+    )
+    # Do not wait between the retries
+    request._sleep = lambda seconds: None
+    return request
+
+
+class Test_GCP_Profiler:
+    def test_request_not_profiled(self):
+        with patch.object(profiler, "profiler", new=None):
+            assert set_mocked_request(
+                HttpMockSequence([({"status": "200"}, INSTANCES_RESPONSE)])
+            ).execute() == {"items": []}
+
+    def test_request_profiled(self):
+        scan_profiler = Profiler("gcp")
+        with patch.object(profiler, "profiler", new=scan_profiler):
+            assert set_mocked_request(
+                HttpMockSequence(
+                    [
+                        ({"status": "429"}, ""),
+                        ({"status": "200"}, INSTANCES_RESPONSE),
+                    ]
+                )
+            ).execute(num_retries=1) == {"items": []}
+
+        instances_list = scan_profiler.api_calls[
+            ("compute", "instances.list", "us-central1-a")
+        ]
+        assert instances_list["calls"] == 1
+        assert instances_list["errors"] == 0
+        assert instances_list["retries"] == 1
+        assert instances_list["throttles"] == 1
+        assert instances_list["bytes_received"] == len(INSTANCES_RESPONSE)
+
+    def test_request_error_profiled(self):
+        scan_profiler = Profiler("gcp")
+        with patch.object(profiler, "profiler", new=scan_profiler):
+            request = set_mocked_request(HttpMockSequence([({"status": "403"}, "")]))
+            request.uri = f"https://compute.googleapis.com/compute/v1/projects/{GCP_PROJECT_ID}/global/networks"
+            request.methodId = "compute.networks.list"
+            try:
+                request.execute()
+            except Exception:
+                pass
+
+        assert (
+            scan_profiler.api_calls[("compute", "networks.list", "global")]["errors"]
+            == 1
+        )
@@ -0,0 +1,118 @@
+import threading
+from types import SimpleNamespace
+
+from google.auth.credentials import AnonymousCredentials
+from googleapiclient.errors import HttpError
+from mock import MagicMock, patch
+
+from prowler.providers.gcp.lib.service import service
+from prowler.providers.gcp.lib.service.service import (
+    GCPService,
+    get_discovery_document,
+)
+
+GCP_PROJECT_IDS = ["project-enabled", "project-disabled", "project-error"]
+
+
+class Batch_HTTP_Request_Mock:
+    """Batch HTTP request answering the API state of each project"""
+
+    def __init__(self, callback):
+        self.callback = callback
+        self.project_ids = []
+
+    def add(self, request, request_id):
+        self.project_ids.append(request_id)
+
+    def execute(self, http):
+        for project_id in self.project_ids:
+            if project_id == "project-error":
+                self.callback(
+                    project_id,
+                    None,
+                    HttpError(SimpleNamespace(status=403, reason="Forbidden"), b""),
+                )
+            else:
+                self.callback(
+                    project_id,
+                    {"state": project_id.split("-")[1].upper()},
+                    None,
+                )
+
+
+def mock_serviceusage_client(credentials):
+    client = MagicMock()
+    client.new_batch_http_request.side_effect = (
+        lambda callback: Batch_HTTP_Request_Mock(callback)
+    )
+    return client
+
+
+def set_mocked_gcp_audit_info():
+    return SimpleNamespace(
+        credentials=AnonymousCredentials(),
+        default_project_id=GCP_PROJECT_IDS[0],
+        project_ids=GCP_PROJECT_IDS,
+    )
+
+
+class Test_GCPService:
+    def test_get_discovery_document(self):
+        discovery_document = get_discovery_document("compute", "v1")
+        assert discovery_document["name"] == "compute"
+        # The document is parsed only once
+        assert get_discovery_document("compute", "v1") is discovery_document
+
+    @patch.object(service, "get_serviceusage_client", new=mock_serviceusage_client)
+    @patch.object(service, "api_states", new={})
+    def test_is_api_active(self):
+        compute = GCPService("Compute", set_mocked_gcp_audit_info())
+        assert compute.service == "compute"
+        assert compute.client._baseUrl == "https://compute.googleapis.com/compute/v1/"
+        # The projects with the API disabled or whose state is unknown are not scanned
+        assert compute.project_ids == ["project-enabled"]
+        assert service.api_states == {
+            ("project-enabled", "compute"): "ENABLED",
+            ("project-disabled", "compute"): "DISABLED",
+        }
+
+    @patch.object(service, "api_states", new={})
+    def test_is_api_active_queried_once(self):
+        serviceusage_client = MagicMock(side_effect=mock_serviceusage_client)
+        with patch.object(service, "get_serviceusage_client", new=serviceusage_client):
+            GCPService("Compute", set_mocked_gcp_audit_info())
+            GCPService("Compute", set_mocked_gcp_audit_info())
+        # Only the project whose state could not be retrieved is queried again
+        assert serviceusage_client.call_count == 2
+        assert len(service.api_states) == 2
+
+    @patch.object(service, "get_serviceusage_client", new=mock_serviceusage_client)
+    @patch.object(service, "api_states", new={})
+    def test_threading_call(self):
+        compute = GCPService("Compute", set_mocked_gcp_audit_info())
+        calls = []
+        compute.__threading_call__(
+            lambda project_id, zone: calls.append((project_id, zone)),
+            [("project-1", "zone-a"), ("project-2", "zone-b")],
+        )
+        compute.__threading_call__(lambda region: calls.append(region), ["region-a"])
+        assert sorted(calls, key=str) == sorted(
+            [("project-1", "zone-a"), ("project-2", "zone-b"), "region-a"], key=str
+        )
+
+    @patch.object(service, "get_serviceusage_client", new=mock_serviceusage_client)
+    @patch.object(service, "api_states", new={})
+    def test_get_AuthorizedHttp_client(self):
+        compute = GCPService("Compute", set_mocked_gcp_audit_info())
+        http = compute.__get_AuthorizedHttp_client__()
+        # The transport is reused by the requests of the same thread
+        assert compute.__get_AuthorizedHttp_client__() is http
+        other_thread_http = []
+        thread = threading.Thread(
+            target=lambda: other_thread_http.append(
+                compute.__get_AuthorizedHttp_client__()
+            )
+        )
+        thread.start()
+        thread.join()
+        assert other_thread_http[0] is not http
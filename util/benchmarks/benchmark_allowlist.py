@@ -0,0 +1,115 @@
+"""
+Benchmark of the Allowlist evaluation, comparing is_allowlisted with the Allowlist_Index used by allowlist_findings.
+
+Usage: python util/benchmarks/benchmark_allowlist.py [--entries 2000] [--findings 2000] [--checks 300]
+"""
+
+import argparse
+import random
+import time
+
+from prowler.providers.aws.lib.allowlist.allowlist import (
+    compile_allowlist,
+    is_allowlisted,
+    is_allowlisted_in_index,
+)
+
+AUDITED_ACCOUNT = "123456789012"
+REGIONS = ["us-east-1", "us-west-2", "eu-west-1", "eu-central-1", "ap-south-1"]
+SERVICES = ["s3", "ec2", "iam", "rds", "awslambda", "cloudtrail", "kms", "vpc"]
+
+
+def generate_allowlist(entries: int) -> dict:
+    checks = {}
+    for index in range(entries):
+        service = random.choice(SERVICES)
+        check = f"{service}_check_{index}"
+        # Some entries use regular expressions for the check name
+        if index % 10 == 0:
+            check = f"{service}_check_{index}.*"
+        checks[check] = {
+            "Regions": random.sample(REGIONS, 2),
+            "Resources": [f"resource-{index}", f"^prefix-{index}-.*"],
+            "Tags": [f"environment=env-{index}"],
+        }
+        if index % 50 == 0:
+            checks[check]["Exceptions"] = {
+                "Accounts": ["111122223333"],
+                "Regions": [random.choice(REGIONS)],
+            }
+    return {
+        "Accounts": {
+            "*": {"Checks": checks},
+            AUDITED_ACCOUNT: {
+                "Checks": {
+                    "*": {
+                        "Regions": ["*"],
+                        "Resources": ["^allowlisted-"],
+                    }
+                }
+            },
+        }
+    }
+
+
+def generate_findings(findings: int, entries: int, checks: int) -> list:
+    # Like in a scan, the findings come from a few hundred checks
+    check_names = [
+        f"{random.choice(SERVICES)}_check_{random.randrange(entries)}"
+        for _ in range(checks)
+    ]
+    return [
+        (
+            random.choice(check_names),
+            random.choice(REGIONS),
+            random.choice(
+                [f"resource-{index}", f"allowlisted-{index}", f"other-{index}"]
+            ),
+            f"environment=env-{random.randrange(entries)}",
+        )
+        for index in range(findings)
+    ]
+
+
+def benchmark(name: str, is_finding_allowlisted, findings: list) -> list:
+    start_time = time.perf_counter()
+    results = [is_finding_allowlisted(*finding) for finding in findings]
+    elapsed_time = time.perf_counter() - start_time
+    print(
+        f"{name}: {len(findings)} findings in {elapsed_time:.2f} seconds ({len(findings) / elapsed_time:.0f} findings/s)"
+    )
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--entries", type=int, default=2000)
+    parser.add_argument("--findings", type=int, default=2000)
+    parser.add_argument("--checks", type=int, default=300)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    random.seed(args.seed)
+    allowlist = generate_allowlist(args.entries)
+    findings = generate_findings(args.findings, args.entries, args.checks)
+
+    start_time = time.perf_counter()
+    allowlist_index = compile_allowlist(allowlist)
+    print(
+        f"Allowlist with {args.entries} entries compiled in {time.perf_counter() - start_time:.2f} seconds"
+    )
+
+    allowlisted = benchmark(
+        "is_allowlisted",
+        lambda *finding: is_allowlisted(allowlist, AUDITED_ACCOUNT, *finding),
+        findings,
+    )
+    allowlisted_in_index = benchmark(
+        "is_allowlisted_in_index",
+        lambda *finding: is_allowlisted_in_index(
+            allowlist_index, AUDITED_ACCOUNT, *finding
+        ),
+        findings,
+    )
+    assert allowlisted == allowlisted_in_index, "Allowlist results are different"
+    print(f"{sum(allowlisted)} findings allowlisted with both implementations")
@@ -0,0 +1,75 @@
+"""
+Benchmark of the findings construction, comparing the findings that parse the check's metadata JSON with the ones sharing the check's metadata.
+
+Usage: python util/benchmarks/benchmark_check_report.py [--findings 1000000] [--memory-findings 10000] [--check iam_root_mfa_enabled]
+"""
+
+import argparse
+import os
+import time
+import tracemalloc
+from glob import glob
+
+import prowler
+from prowler.lib.check.models import (
+    Check,
+    Check_Report_AWS,
+    checks_metadata_by_file,
+    load_check_metadata,
+)
+
+
+class benchmark_check_report(Check):
+    def execute(self):
+        return [Check_Report_AWS(self.metadata())]
+
+
+def load_benchmark_check(check_name: str) -> Check:
+    # The check uses the metadata of the given check instead of its own metadata file
+    metadata_file = glob(
+        f"{os.path.dirname(prowler.__file__)}/providers/*/services/*/{check_name}/{check_name}.metadata.json"
+    )[0]
+    checks_metadata_by_file[os.path.abspath(__file__)[:-3] + ".metadata.json"] = (
+        load_check_metadata(metadata_file)
+    )
+    return benchmark_check_report()
+
+
+def generate_findings(generate_metadata, findings: int) -> list:
+    check_findings = []
+    for index in range(findings):
+        report = Check_Report_AWS(generate_metadata())
+        report.status = "PASS"
+        report.status_extended = f"Finding {index}"
+        report.resource_id = f"resource-{index}"
+        report.resource_arn = f"arn:aws:iam::123456789012:resource-{index}"
+        report.region = "us-east-1"
+        check_findings.append(report)
+    return check_findings
+
+
+def benchmark(name: str, generate_metadata, findings: int, memory_findings: int):
+    start_time = time.perf_counter()
+    generate_findings(generate_metadata, findings)
+    elapsed_time = time.perf_counter() - start_time
+    # The memory is traced apart since tracing slows down the findings construction
+    tracemalloc.start()
+    check_findings = generate_findings(generate_metadata, memory_findings)
+    finding_memory = tracemalloc.get_traced_memory()[0] / len(check_findings)
+    tracemalloc.stop()
+    print(
+        f"{name}: {findings} findings in {elapsed_time:.2f} seconds ({findings / elapsed_time:.0f} findings/s), {finding_memory:.0f} bytes per finding ({finding_memory * findings / 1024 / 1024:.0f} MiB)"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--findings", type=int, default=1000000)
+    parser.add_argument("--memory-findings", type=int, default=10000)
+    parser.add_argument("--check", default="iam_root_mfa_enabled")
+    args = parser.parse_args()
+
+    check = load_benchmark_check(args.check)
+    # A new JSON each time is parsed for every finding, like the findings built before sharing the metadata
+    benchmark("Parsed metadata", check.json, args.findings, args.memory_findings)
+    benchmark("Shared metadata", check.metadata, args.findings, args.memory_findings)
@@ -0,0 +1,106 @@
+"""
+Benchmark of the compliance frameworks loading at startup, comparing the check x framework x requirement loop with the checks compliance index used by update_checks_metadata_with_compliance.
+
+Usage: python util/benchmarks/benchmark_compliance.py [--provider aws] [--iterations 5]
+"""
+
+import argparse
+import time
+
+from prowler.lib.check.check import (
+    bulk_load_checks_metadata,
+    bulk_load_compliance_frameworks,
+)
+from prowler.lib.check.compliance import get_checks_compliance_index
+from prowler.lib.check.compliance_models import Compliance_Base_Model
+
+
+def get_checks_compliance_loop(
+    bulk_compliance_frameworks: dict, bulk_checks_metadata: dict
+) -> dict:
+    # Check x framework x requirement loop, validating a Compliance_Base_Model per match
+    checks_compliance = {}
+    for check in bulk_checks_metadata:
+        check_compliance = []
+        for framework in bulk_compliance_frameworks.values():
+            for requirement in framework.Requirements:
+                if check in requirement.Checks:
+                    check_compliance.append(
+                        Compliance_Base_Model(
+                            Framework=framework.Framework,
+                            Provider=framework.Provider,
+                            Version=framework.Version,
+                            Description=framework.Description,
+                            Requirements=[requirement],
+                        )
+                    )
+        checks_compliance[check] = check_compliance
+    return checks_compliance
+
+
+def get_checks_compliance_from_index(
+    bulk_compliance_frameworks: dict, bulk_checks_metadata: dict
+) -> dict:
+    checks_compliance_index = get_checks_compliance_index(bulk_compliance_frameworks)
+    return {
+        check: checks_compliance_index.get(check, []) for check in bulk_checks_metadata
+    }
+
+
+def summarize(checks_compliance: dict) -> dict:
+    return {
+        check: [
+            (compliance.Framework, compliance.Version, compliance.Requirements[0].Id)
+            for compliance in check_compliance
+        ]
+        for check, check_compliance in checks_compliance.items()
+    }
+
+
+def benchmark(
+    name: str,
+    get_checks_compliance,
+    bulk_compliance_frameworks: dict,
+    bulk_checks_metadata: dict,
+    iterations: int,
+) -> dict:
+    start_time = time.perf_counter()
+    for _ in range(iterations):
+        checks_compliance = get_checks_compliance(
+            bulk_compliance_frameworks, bulk_checks_metadata
+        )
+    elapsed_time = (time.perf_counter() - start_time) / iterations
+    print(f"{name}: {len(bulk_checks_metadata)} checks in {elapsed_time:.3f} seconds")
+    return checks_compliance
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--provider", default="aws")
+    parser.add_argument("--iterations", type=int, default=5)
+    args = parser.parse_args()
+
+    start_time = time.perf_counter()
+    bulk_checks_metadata = bulk_load_checks_metadata(args.provider)
+    bulk_compliance_frameworks = bulk_load_compliance_frameworks(args.provider)
+    print(
+        f"{len(bulk_checks_metadata)} checks and {len(bulk_compliance_frameworks)} compliance frameworks loaded in {time.perf_counter() - start_time:.2f} seconds"
+    )
+
+    checks_compliance_loop = benchmark(
+        "check x framework x requirement loop",
+        get_checks_compliance_loop,
+        bulk_compliance_frameworks,
+        bulk_checks_metadata,
+        args.iterations,
+    )
+    checks_compliance_index = benchmark(
+        "get_checks_compliance_index",
+        get_checks_compliance_from_index,
+        bulk_compliance_frameworks,
+        bulk_checks_metadata,
+        args.iterations,
+    )
+    assert summarize(checks_compliance_loop) == summarize(
+        checks_compliance_index
+    ), "Compliance requirements are different"
@@ -0,0 +1,149 @@
+"""
+Benchmark of the CloudWatch CIS checks metric filters, comparing the metric filters x alarms loop of every check with the Metric_Filters_Index shared by the checks.
+
+Usage: python util/benchmarks/benchmark_metric_filters.py [--metric-filters 100000] [--alarms 100000]
+"""
+
+import argparse
+import re
+import time
+
+from prowler.providers.aws.services.cloudtrail.cloudtrail_service import Trail
+from prowler.providers.aws.services.cloudwatch.cloudwatch_service import (
+    MetricAlarm,
+    MetricFilter,
+)
+from prowler.providers.aws.services.cloudwatch.lib.metric_filters import (
+    get_metric_filters_index,
+)
+
+# Patterns of some of the CIS checks
+PATTERNS = [
+    r"\$\.userIdentity\.type\s*=\s*.?Root.+\$\.userIdentity\.invokedBy NOT EXISTS.+\$\.eventType\s*!=\s*.?AwsServiceEvent.?",
+    r"\$\.errorCode\s*=\s*\"?\*UnauthorizedOperation(\"|\)|\s)",
+    r"\$\.eventName\s*=\s*.?ConsoleLogin.+\$\.additionalEventData\.MFAUsed\s*!=\s*.?Yes",
+    r"\$\.eventName\s*=\s*.?CreateTrail.+\$\.eventName\s*=\s*.?UpdateTrail.+\$\.eventName\s*=\s*.?DeleteTrail.+\$\.eventName\s*=\s*.?StartLogging.+\$\.eventName\s*=\s*.?StopLogging.?",
+    r"\$\.eventSource\s*=\s*.?config.amazonaws.com.+\$\.eventName\s*=\s*.?StopConfigurationRecorder.+\$\.eventName\s*=\s*.?DeleteDeliveryChannel.+\$\.eventName\s*=\s*.?PutDeliveryChannel.+\$\.eventName\s*=\s*.?PutConfigurationRecorder.?",
+    r"\$\.eventName\s*=\s*.?CreateNetworkAcl.+\$\.eventName\s*=\s*.?CreateNetworkAclEntry.+\$\.eventName\s*=\s*.?DeleteNetworkAcl.+\$\.eventName\s*=\s*.?DeleteNetworkAclEntry.+\$\.eventName\s*=\s*.?ReplaceNetworkAclEntry.+\$\.eventName\s*=\s*.?ReplaceNetworkAclAssociation.?",
+]
+
+
+def generate_resources(metric_filters: int, alarms: int) -> tuple:
+    trails = [
+        Trail(
+            name=f"trail-{index}",
+            region="us-east-1",
+            log_group_arn=f"arn:aws:logs:us-east-1:123456789012:log-group:trail-{index}:*",
+        )
+        for index in range(10)
+    ]
+    metric_filters = [
+        MetricFilter(
+            arn=f"arn:aws:logs:us-east-1:123456789012:metric-filter/filter-{index}",
+            name=f"filter-{index}",
+            metric=f"metric-{index}",
+            # Some of the metric filters are copies of the CIS ones without alarms
+            pattern=(
+                '{$.userIdentity.type = "Root" && $.userIdentity.invokedBy NOT EXISTS && $.eventType != "AwsServiceEvent"}'
+                if index % 1000 == 0
+                else f'{{($.eventName = "Event{index}") || ($.errorCode = "Error{index}")}}'
+            ),
+            log_group=f"trail-{index % 20}",
+            region="us-east-1",
+        )
+        for index in range(metric_filters)
+    ]
+    metric_filters.append(
+        MetricFilter(
+            arn="arn:aws:logs:us-east-1:123456789012:metric-filter/root-usage",
+            name="root-usage",
+            metric="root-usage-metric",
+            pattern='{$.userIdentity.type = "Root" && $.userIdentity.invokedBy NOT EXISTS && $.eventType != "AwsServiceEvent"}',
+            log_group="trail-1",
+            region="us-east-1",
+        )
+    )
+    metric_alarms = [
+        MetricAlarm(
+            arn=f"arn:aws:cloudwatch:us-east-1:123456789012:alarm:alarm-{index}",
+            name=f"alarm-{index}",
+            metric=f"other-metric-{index}",
+            name_space="LogMetrics",
+            region="us-east-1",
+        )
+        for index in range(alarms)
+    ]
+    metric_alarms.append(
+        MetricAlarm(
+            arn="arn:aws:cloudwatch:us-east-1:123456789012:alarm:root-usage",
+            name="root-usage",
+            metric="root-usage-metric",
+            name_space="LogMetrics",
+            region="us-east-1",
+        )
+    )
+    return trails, metric_filters, metric_alarms
+
+
+def check_metric_filter_loop(
+    pattern: str, trails: list, metric_filters: list, metric_alarms: list
+) -> tuple:
+    # Previous check_cloudwatch_log_metric_filter, building the log groups and looping the alarms for every check
+    result = None
+    log_groups = []
+    for trail in trails:
+        if trail.log_group_arn:
+            log_groups.append(trail.log_group_arn.split(":")[6])
+    for metric_filter in metric_filters:
+        if metric_filter.log_group in log_groups:
+            if re.search(pattern, metric_filter.pattern, flags=re.DOTALL):
+                result = (metric_filter.name, False)
+                for alarm in metric_alarms:
+                    if alarm.metric == metric_filter.metric:
+                        result = (metric_filter.name, True)
+                        break
+    return result
+
+
+def check_metric_filter_index(
+    pattern: str, trails: list, metric_filters: list, metric_alarms: list
+) -> tuple:
+    metric_filters_index = get_metric_filters_index(
+        trails, metric_filters, metric_alarms
+    )
+    metric_filter = metric_filters_index.get_metric_filter(pattern)
+    if metric_filter:
+        return (
+            metric_filter.name,
+            metric_filter.metric in metric_filters_index.alarm_metrics,
+        )
+    return None
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--metric-filters", type=int, default=100000)
+    parser.add_argument("--alarms", type=int, default=100000)
+    args = parser.parse_args()
+
+    trails, metric_filters, metric_alarms = generate_resources(
+        args.metric_filters, args.alarms
+    )
+
+    results = {}
+    for name, check_metric_filter in (
+        ("metric filters x alarms loop", check_metric_filter_loop),
+        ("Metric_Filters_Index", check_metric_filter_index),
+    ):
+        start_time = time.perf_counter()
+        results[name] = [
+            check_metric_filter(pattern, trails, metric_filters, metric_alarms)
+            for pattern in PATTERNS
+        ]
+        print(
+            f"{name}: {len(PATTERNS)} checks with {len(metric_filters)} metric filters and {len(metric_alarms)} alarms in {time.perf_counter() - start_time:.2f} seconds"
+        )
+
+    assert (
+        results["metric filters x alarms loop"] == results["Metric_Filters_Index"]
+    ), "Metric filters found are different"
@@ -0,0 +1,101 @@
+"""
+Benchmark of the CSV and JSON outputs of the findings, comparing the outputs filled for each finding with the ones filled from the templates of their check.
+
+Usage: python util/benchmarks/benchmark_outputs.py [--findings 100000] [--checks 10]
+"""
+
+import argparse
+import time
+from io import StringIO
+from types import SimpleNamespace
+
+from prowler.lib.check.check import (
+    bulk_load_checks_metadata,
+    bulk_load_compliance_frameworks,
+)
+from prowler.lib.check.compliance import update_checks_metadata_with_compliance
+from prowler.lib.check.models import Check_Report_AWS
+from prowler.lib.outputs.models import (
+    Check_Output_Templates,
+    generate_provider_output_csv,
+    generate_provider_output_json,
+)
+
+
+def load_bulk_checks_metadata(provider: str) -> dict:
+    # The checks metadata with their compliance requirements, like in a scan
+    return update_checks_metadata_with_compliance(
+        bulk_load_compliance_frameworks(provider),
+        bulk_load_checks_metadata(provider),
+    )
+
+
+def generate_findings(bulk_checks_metadata: dict, checks: int, findings: int) -> list:
+    checks_metadata = list(bulk_checks_metadata.values())[:checks]
+    check_findings = []
+    for index in range(findings):
+        # The findings metadata has no compliance, it is in the bulk_checks_metadata
+        report = Check_Report_AWS(
+            checks_metadata[index % len(checks_metadata)].copy(
+                update={"Compliance": None}
+            )
+        )
+        report.status = "PASS"
+        report.status_extended = f"Finding {index}"
+        report.resource_id = f"resource-{index}"
+        report.resource_arn = f"arn:aws:iam::123456789012:resource-{index}"
+        report.resource_tags = [{"Key": "index", "Value": str(index)}]
+        report.region = "us-east-1"
+        check_findings.append(report)
+    return check_findings
+
+
+def benchmark(name: str, check_findings: list, output_options, output_templates):
+    audit_info = SimpleNamespace(
+        profile="default", audited_account="123456789012", organizations_metadata=None
+    )
+    csv_file = StringIO()
+    start_time = time.perf_counter()
+    for finding in check_findings:
+        csv_writer, finding_output = generate_provider_output_csv(
+            "aws",
+            finding,
+            audit_info,
+            "csv",
+            csv_file,
+            output_options,
+            output_templates,
+        )
+        csv_writer.writerow(finding_output.__dict__)
+    csv_time = time.perf_counter() - start_time
+    start_time = time.perf_counter()
+    for finding in check_findings:
+        generate_provider_output_json(
+            "aws", finding, audit_info, "json", output_options, output_templates
+        ).dict()
+    json_time = time.perf_counter() - start_time
+    print(
+        f"{name}: CSV {len(check_findings) / csv_time:.0f} findings/s, JSON {len(check_findings) / json_time:.0f} findings/s"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--findings", type=int, default=100000)
+    parser.add_argument("--checks", type=int, default=10)
+    args = parser.parse_args()
+
+    output_options = SimpleNamespace(
+        unix_timestamp=False,
+        bulk_checks_metadata=load_bulk_checks_metadata("aws"),
+    )
+    check_findings = generate_findings(
+        output_options.bulk_checks_metadata, args.checks, args.findings
+    )
+    benchmark("Filled for each finding", check_findings, output_options, None)
+    benchmark(
+        "Filled from the check templates",
+        check_findings,
+        output_options,
+        Check_Output_Templates(output_options),
+    )
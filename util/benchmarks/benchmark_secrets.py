@@ -0,0 +1,94 @@
+"""
+Benchmark of the secrets scanning of the EC2 instances User Data, comparing one temporary file and default_settings per instance with the in-memory batch of scan_secrets_batch.
+
+Usage: python util/benchmarks/benchmark_secrets.py [--instances 2000] [--templates 20]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+from detect_secrets import SecretsCollection
+from detect_secrets.settings import default_settings
+
+from prowler.lib.secrets import secrets
+
+
+def generate_user_data(instances: int, templates: int) -> list:
+    # The instances are launched from a few launch templates, some of them with secrets
+    user_data_templates = []
+    for template in range(templates):
+        lines = [
+            "#!/bin/bash",
+            "yum update -y",
+            f"echo 'template {template}' > /etc/motd",
+            "export AWS_DEFAULT_REGION=eu-west-1",
+        ]
+        if template % 4 == 0:
+            lines.append(f"DB_PASSWORD=Sup3rS3cr3t{template}")
+        user_data_templates.append("\n".join(lines * 10))
+    return [user_data_templates[index % templates] for index in range(instances)]
+
+
+def scan_temporary_files(user_data: list) -> list:
+    # One temporary file, SecretsCollection and default_settings per instance
+    results = []
+    for data in user_data:
+        temp_user_data_file = tempfile.NamedTemporaryFile(delete=False)
+        temp_user_data_file.write(bytes(data, encoding="raw_unicode_escape"))
+        temp_user_data_file.close()
+        secrets_collection = SecretsCollection()
+        with default_settings():
+            secrets_collection.scan_file(temp_user_data_file.name)
+        os.remove(temp_user_data_file.name)
+        detect_secrets_output = secrets_collection.json()
+        results.append(
+            detect_secrets_output[temp_user_data_file.name]
+            if detect_secrets_output
+            else None
+        )
+    return results
+
+
+def summarize(results: list) -> list:
+    return [
+        [(secret["type"], secret["line_number"]) for secret in result or []]
+        for result in results
+    ]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--instances", type=int, default=2000)
+    parser.add_argument("--templates", type=int, default=20)
+    args = parser.parse_args()
+
+    user_data = generate_user_data(args.instances, args.templates)
+
+    start_time = time.perf_counter()
+    temporary_files_results = scan_temporary_files(user_data)
+    print(
+        f"temporary file per instance: {args.instances} instances in {time.perf_counter() - start_time:.2f} seconds"
+    )
+
+    start_time = time.perf_counter()
+    batch_results = secrets.scan_secrets_batch(user_data)
+    print(
+        f"scan_secrets_batch: {args.instances} instances in {time.perf_counter() - start_time:.2f} seconds"
+    )
+
+    # Distinct payloads across the process pool
+    secrets.secrets_scan_results.clear()
+    distinct_user_data = [
+        f"{data}\n# instance {index}" for index, data in enumerate(user_data)
+    ]
+    start_time = time.perf_counter()
+    secrets.scan_secrets_batch(distinct_user_data)
+    print(
+        f"scan_secrets_batch with distinct User Data: {args.instances} instances in {time.perf_counter() - start_time:.2f} seconds"
+    )
+
+    assert summarize(temporary_files_results) == summarize(
+        batch_results
+    ), "Secrets found are different"